@@ -19,7 +19,7 @@ async def get_config() -> dict:
 @router.post("", summary="Update configuration")
 async def update_config(payload: dict) -> dict:
     data_mode = payload.get("data_mode")
-    if data_mode not in {"wind", "open", "mock"}:
+    if data_mode not in {"wind", "open", "mock", "replay"}:
         raise HTTPException(status_code=400, detail="Invalid data_mode")
     _current_config["data_mode"] = data_mode
     return _current_config
@@ -1,9 +1,13 @@
 """Endpoints for data snapshots."""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, Query
+from datetime import datetime
 from typing import Dict, Any
 
 from ..services.data_manager import get_data_manager
+from ..services.history import METHODS
+from ..services.movers import CAP_BUCKETS, METRICS
+from ..services.universe import BOARDS
 
 router = APIRouter()
 
@@ -27,6 +31,89 @@ async def a_share_indices() -> Dict[str, Any]:
     }
 
 
+@router.get("/series/{code}", summary="Recent price history for one instrument")
+async def series(code: str, points: int | None = Query(None, ge=1)) -> Dict[str, Any]:
+    """Get the newest points recorded for ``code`` by snapshot refreshes."""
+    data_manager = get_data_manager()
+    if code not in data_manager.timeseries:
+        raise HTTPException(status_code=404, detail=f"No history for {code}")
+    return data_manager.get_series(code, points)
+
+
+@router.get("/history", summary="Downsampled price history for many instruments")
+async def history(
+    codes: str = Query(..., description="Comma-separated instrument codes"),
+    window: float = Query(3600.0, gt=0, description="Seconds back from each code's newest point"),
+    points: int = Query(300, ge=2, le=5000),
+    method: str = "lttb",
+) -> Dict[str, Any]:
+    """Get sparkline-sized series (LTTB or min/max envelope) for several codes at once."""
+    if method not in METHODS:
+        raise HTTPException(status_code=400, detail=f"Unsupported method {method}")
+    requested = [code.strip() for code in codes.split(",") if code.strip()]
+    data_manager = get_data_manager()
+    return {
+        "window": window,
+        "points": points,
+        "method": method,
+        "series": data_manager.history.many(requested, window, points, method),
+    }
+
+
+@router.get("/bars/{code}", summary="OHLC bars for one instrument")
+async def bars(
+    code: str, interval: str = "1m", limit: int | None = Query(None, ge=1)
+) -> Dict[str, Any]:
+    """Get completed bars (oldest first) plus the bar still forming."""
+    data_manager = get_data_manager()
+    if interval not in data_manager.bars.intervals:
+        raise HTTPException(status_code=400, detail=f"Unsupported interval {interval}")
+    rows = data_manager.bars.bars(code, interval, limit)
+    return {"code": code, "interval": interval, "bars": rows}
+
+
+@router.get("/archive/{category}", summary="Archived quotes as of a point in time")
+async def archive(category: str, at: datetime) -> Dict[str, Any]:
+    """Get the last archived quote per code in ``category`` at or before ``at``."""
+    data_manager = get_data_manager()
+    if data_manager.archive is None:
+        raise HTTPException(status_code=404, detail="Tick archive is disabled")
+    records = await data_manager.get_archived_snapshot(category, at)
+    return {"category": category, "at": at.isoformat(), "records": records}
+
+
+@router.get("/movers", summary="Top A-share movers over the whole universe")
+async def movers(
+    metric: str = Query("gainers", description=f"One of {', '.join(METRICS)}"),
+    k: int | None = Query(None, ge=1, le=100),
+    board: str | None = Query(None, description=f"One of {', '.join(BOARDS)}"),
+    cap: str | None = Query(None, description=f"One of {', '.join(CAP_BUCKETS)}"),
+) -> Dict[str, Any]:
+    """Top ``k`` stocks by % change, turnover rate or amount, optionally filtered."""
+    data_manager = get_data_manager()
+    try:
+        result = data_manager.get_top_movers(metric, k, board, cap)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    if result is None:
+        raise HTTPException(status_code=404, detail="No A-share universe loaded yet")
+    return result
+
+
+@router.get("/heatmap", summary="Sector/industry/stock heatmap with treemap layout")
+async def sector_heatmap(
+    aspect: float | None = Query(
+        None, gt=0.2, le=5.0, description="Screen width / height (default from settings)"
+    ),
+) -> Dict[str, Any]:
+    """Cap-weighted heatmap tree; each node carries its ``rect`` as canvas fractions."""
+    data_manager = get_data_manager()
+    result = data_manager.get_sector_heatmap(aspect)
+    if result is None:
+        raise HTTPException(status_code=404, detail="No A-share universe loaded yet")
+    return result
+
+
 @router.get("/latest", summary="Latest market data for display")
 async def latest() -> Dict[str, Any]:
     """Get latest market data optimized for wallboard display."""
@@ -48,4 +135,7 @@ async def latest() -> Dict[str, Any]:
         "calendar": snapshot.get("calendar", {}),
         "heatmap": snapshot.get("heatmap", []),
         "summary": snapshot.get("summary", {}),
+        "breadth": snapshot.get("breadth"),
+        "top_movers": snapshot.get("top_movers"),
+        "sector_heatmap": snapshot.get("sector_heatmap"),
     }
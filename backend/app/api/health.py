@@ -4,6 +4,7 @@ from fastapi import APIRouter
 
 from ..core.cache import cache
 from ..core.settings import settings
+from ..services.data_manager import get_data_manager
 
 router = APIRouter()
 
@@ -20,3 +21,39 @@ def ready() -> dict[str, str | bool]:
         "data_mode": settings.data_mode,
         "cache_enabled": cache.enabled,
     }
+
+
+@router.get("/cache", summary="In-process provider cache statistics")
+def cache_stats() -> dict:
+    provider = get_data_manager().provider
+    stats = getattr(provider, "cache_stats", None)
+    return {
+        "data_mode": settings.data_mode,
+        "namespaces": stats() if callable(stats) else {},
+    }
+
+
+@router.get("/archive", summary="Tick archive writer state")
+def archive_status() -> dict:
+    archive = get_data_manager().archive
+    return {"enabled": archive is not None, **(archive.stats() if archive else {})}
+
+
+@router.get("/replay", summary="Replay clock and recorded session")
+def replay_status() -> dict:
+    provider = get_data_manager().provider
+    status = getattr(provider, "replay_status", None)
+    return {
+        "data_mode": settings.data_mode,
+        "replay": status() if callable(status) else None,
+    }
+
+
+@router.get("/wind", summary="Wind session supervisor state")
+def wind_status() -> dict:
+    provider = get_data_manager().provider
+    status = getattr(provider, "connection_status", None)
+    return {
+        "data_mode": settings.data_mode,
+        "wind": status() if callable(status) else None,
+    }
@@ -0,0 +1,21 @@
+"""Upstream telemetry endpoints (Prometheus text and JSON summary)."""
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from ..core.telemetry import upstream_telemetry
+
+router = APIRouter()
+
+
+@router.get("", summary="Prometheus metrics", response_class=PlainTextResponse)
+def prometheus_metrics() -> PlainTextResponse:
+    return PlainTextResponse(
+        upstream_telemetry.render_prometheus(),
+        media_type="text/plain; version=0.0.4",
+    )
+
+
+@router.get("/upstreams", summary="Per-upstream latency/error/size summary")
+def upstream_summary() -> dict:
+    return {"upstreams": upstream_telemetry.snapshot()}
@@ -19,8 +19,17 @@ class ConnectionManager:
 
     def __init__(self):
         self.active_connections: Set[WebSocket] = set()
-        self.data_manager = get_data_manager()
+        self._data_manager = None
         self.broadcast_task = None
+        self._tick_listener_registered = False
+        self._bar_listener_registered = False
+
+    @property
+    def data_manager(self):
+        """Resolve the data manager on first use, not when this module is imported."""
+        if self._data_manager is None:
+            self._data_manager = get_data_manager()
+        return self._data_manager
 
     async def connect(self, websocket: WebSocket) -> None:
         """Accept new WebSocket connection."""
@@ -74,6 +83,8 @@ class ConnectionManager:
             return
 
         logger.info("Starting WebSocket data broadcasting")
+        self._register_tick_listener()
+        self._register_bar_listener()
 
         async def broadcast_loop():
             while self.active_connections:
@@ -87,8 +98,8 @@ class ConnectionManager:
                         "data": market_data
                     })
 
-                    # Wait before next broadcast
-                    await asyncio.sleep(15)  # 15 seconds interval
+                    # Wait before next broadcast: 15 seconds of session time
+                    await asyncio.sleep(self.data_manager.wall_seconds(15))
 
                 except Exception as e:
                     logger.error(f"Error in broadcast loop: {e}")
@@ -98,6 +109,41 @@ class ConnectionManager:
 
         self.broadcast_task = asyncio.create_task(broadcast_loop())
 
+    def _register_tick_listener(self) -> None:
+        """Forward streamed quote updates to clients between periodic snapshots."""
+        stream = getattr(self.data_manager.provider, "crypto_stream", None)
+        if stream is None or self._tick_listener_registered:
+            return
+
+        def on_tick(code: str, quote) -> None:
+            if not self.active_connections:
+                return
+            asyncio.get_running_loop().create_task(self.send_to_all({
+                "type": "tick",
+                "category": "crypto",
+                "code": code,
+                "data": dict(quote),
+            }))
+
+        stream.add_listener(on_tick)
+        self._tick_listener_registered = True
+
+    def _register_bar_listener(self) -> None:
+        """Push each completed OHLC bar to clients as soon as it closes."""
+        if self._bar_listener_registered:
+            return
+
+        def on_bar(bar) -> None:
+            if not self.active_connections:
+                return
+            asyncio.get_running_loop().create_task(self.send_to_all({
+                "type": "bar",
+                "data": bar.to_dict(),
+            }))
+
+        self.data_manager.bars.add_listener(on_bar)
+        self._bar_listener_registered = True
+
     async def stop_broadcasting(self) -> None:
         """Stop periodic data broadcasting."""
         if self.broadcast_task:
@@ -0,0 +1,147 @@
+"""Hedged/raced execution helpers for multi-source fallback chains."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Awaitable, Callable, Sequence, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class LatencyTracker:
+    """Rolling window of observed latencies used to derive hedge delays."""
+
+    def __init__(
+        self,
+        window: int = 50,
+        percentile: float = 90.0,
+        default: float = 1.5,
+        floor: float = 0.2,
+        min_samples: int = 5,
+    ) -> None:
+        self._samples: deque[float] = deque(maxlen=window)
+        self.percentile = percentile
+        self.default = default
+        self.floor = floor
+        self.min_samples = min_samples
+
+    def observe(self, seconds: float) -> None:
+        self._samples.append(max(0.0, seconds))
+
+    def threshold(self, ceiling: float | None = None) -> float:
+        """Return the configured latency percentile (or the default until warmed up)."""
+        if len(self._samples) < self.min_samples:
+            value = self.default
+        else:
+            ordered = sorted(self._samples)
+            rank = round(self.percentile / 100 * (len(ordered) - 1))
+            value = ordered[min(len(ordered) - 1, max(0, rank))]
+        value = max(self.floor, value)
+        if ceiling is not None:
+            value = min(value, ceiling)
+        return value
+
+
+def timed(
+    tracker: LatencyTracker,
+    factory: Callable[[], Awaitable[T]],
+    is_valid: Callable[[T], bool] = bool,
+) -> Callable[[], Awaitable[T]]:
+    """Wrap an attempt factory so valid completions feed the latency tracker."""
+
+    async def runner() -> T:
+        started = time.perf_counter()
+        result = await factory()
+        if is_valid(result):
+            tracker.observe(time.perf_counter() - started)
+        return result
+
+    return runner
+
+
+async def hedged(
+    attempts: Sequence[Callable[[], Awaitable[T]]],
+    *,
+    delays: Sequence[float] | float = 0.0,
+    timeout: float | None = None,
+    is_valid: Callable[[T], bool] = bool,
+    labels: Sequence[str] | None = None,
+) -> T | None:
+    """Run attempts in priority order and return the first valid result.
+
+    Attempt ``i + 1`` is started ``delays[i]`` seconds after attempt ``i`` or as soon as
+    every running attempt has finished without a valid result, whichever comes first.
+    All outstanding attempts are cancelled once a winner is found or ``timeout`` elapses,
+    so the chain is bounded by ``timeout`` instead of the sum of its members.
+    """
+    if not attempts:
+        return None
+    if isinstance(delays, (int, float)):
+        delays = [float(delays)] * (len(attempts) - 1)
+    names = list(labels) if labels else [f"attempt-{i}" for i in range(len(attempts))]
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout if timeout is not None else None
+    order: dict[asyncio.Task, int] = {}
+    pending: set[asyncio.Task] = set()
+    next_index = 0
+    next_launch_at = loop.time()
+
+    try:
+        while True:
+            now = loop.time()
+            if next_index < len(attempts) and (now >= next_launch_at or not pending):
+                task = asyncio.ensure_future(attempts[next_index]())
+                order[task] = next_index
+                pending.add(task)
+                next_index += 1
+                if next_index < len(attempts):
+                    next_launch_at = now + max(0.0, delays[next_index - 1])
+                continue
+            if not pending:
+                return None
+
+            wait_for: float | None = None
+            if next_index < len(attempts):
+                wait_for = max(0.0, next_launch_at - now)
+            if deadline is not None:
+                remaining = deadline - now
+                if remaining <= 0:
+                    logger.warning("Hedged chain timed out after %.1fs", timeout)
+                    return None
+                wait_for = remaining if wait_for is None else min(wait_for, remaining)
+
+            done, pending = await asyncio.wait(
+                pending, timeout=wait_for, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in sorted(done, key=order.__getitem__):
+                try:
+                    result = task.result()
+                    valid = is_valid(result)
+                except Exception as exc:
+                    logger.warning("Hedged %s failed: %s", names[order[task]], exc)
+                    continue
+                if valid:
+                    return result
+            if done and next_index < len(attempts):
+                # Fail fast: an invalid answer releases the next source immediately.
+                next_launch_at = loop.time()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def race(
+    attempts: Sequence[Callable[[], Awaitable[T]]],
+    *,
+    timeout: float | None = None,
+    is_valid: Callable[[T], bool] = bool,
+    labels: Sequence[str] | None = None,
+) -> T | None:
+    """Start every attempt at once and return the first valid result."""
+    return await hedged(attempts, delays=0.0, timeout=timeout, is_valid=is_valid, labels=labels)
@@ -9,13 +9,50 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 class Settings(BaseSettings):
     """Global application settings."""
 
-    data_mode: Literal["wind", "open", "mock"] = "mock"
+    data_mode: Literal["wind", "open", "mock", "replay"] = "mock"
     redis_url: str = "redis://localhost:6379/0"
     redis_enabled: bool = False
     snapshot_cache_ttl: int = 15
     api_title: str = "Wind Market Wallboard API"
     api_version: str = "0.1.0"
     alphavantage_api_key: str = "demo"
+    open_cache_max_entries: int = 4096
+    open_cache_max_bytes: int = 32 * 1024 * 1024
+    crypto_stream_enabled: bool = False
+    crypto_stream_url: str = "wss://stream.binance.com:9443/stream"
+    crypto_stream_stale_after: float = 30.0
+    wind_heartbeat_interval: float = 15.0
+    wind_start_timeout: float = 60.0
+    wind_reconnect_max_backoff: float = 120.0
+    wind_stable_after: float = 60.0
+    wind_batch_window: float = 0.02
+    wind_subscription_enabled: bool = False
+    wind_push_max_age: float = 30.0
+    wind_spark_points: int = 60
+    timeseries_capacity: int = 1800
+    timeseries_max_codes: int = 2048
+    tick_archive_enabled: bool = False
+    tick_archive_dir: str = "data/ticks"
+    tick_archive_fsync_interval: float = 1.0
+    tick_archive_retention_days: int = 30
+    tick_archive_compact_after_days: int = 1
+    bar_history_size: int = 500
+    analytics_window: int = 120
+    analytics_zscore_threshold: float = 3.0
+    movers_top_k: int = 10
+    heatmap_aspect_ratio: float = 16 / 9
+    heatmap_stocks_per_industry: int = 8
+    replay_dir: str = ""
+    replay_day: str = ""
+    replay_speed: float = 1.0
+    replay_loop: bool = True
+    mock_universe_size: int = 0
+    mock_category_scale: int = 1
+    mock_update_rate: float = 0.5
+    mock_volatility: float = 0.0005
+    mock_latency: float = 0.0
+    mock_error_rate: float = 0.0
+    mock_seed: int = 0
 
     model_config = SettingsConfigDict(env_file=(".env",), env_file_encoding="utf-8", case_sensitive=False)
 
@@ -0,0 +1,192 @@
+"""In-process upstream call telemetry (latency/size histograms and status counters)."""
+
+from __future__ import annotations
+
+import bisect
+import math
+import threading
+from typing import Any, Iterable, Sequence
+
+LATENCY_BUCKETS: tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+SIZE_BUCKETS: tuple[float, ...] = (
+    256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304,
+)
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus sense."""
+
+    __slots__ = ("buckets", "counts", "total", "count")
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def cumulative(self) -> list[tuple[float, int]]:
+        running = 0
+        pairs: list[tuple[float, int]] = []
+        for bound, count in zip((*self.buckets, math.inf), self.counts, strict=True):
+            running += count
+            pairs.append((bound, running))
+        return pairs
+
+    def quantile(self, q: float) -> float | None:
+        """Upper bucket bound containing the ``q`` quantile (coarse, bucket resolution)."""
+        if not self.count:
+            return None
+        target = q * self.count
+        for bound, running in self.cumulative():
+            if running >= target:
+                return bound if math.isfinite(bound) else self.buckets[-1]
+        return self.buckets[-1]
+
+
+class UpstreamTelemetry:
+    """Registry of outbound calls keyed by ``(provider, host, endpoint)``.
+
+    Every call lands in a status counter, a latency histogram and a payload-size
+    histogram; attempts beyond the first are counted as retries.
+    """
+
+    def __init__(
+        self,
+        latency_buckets: Sequence[float] = LATENCY_BUCKETS,
+        size_buckets: Sequence[float] = SIZE_BUCKETS,
+    ) -> None:
+        self._latency_buckets = tuple(latency_buckets)
+        self._size_buckets = tuple(size_buckets)
+        self._lock = threading.Lock()
+        self._calls: dict[tuple[str, str, str, str], int] = {}
+        self._retries: dict[tuple[str, str, str], int] = {}
+        self._latency: dict[tuple[str, str, str], Histogram] = {}
+        self._sizes: dict[tuple[str, str, str], Histogram] = {}
+
+    def record(
+        self,
+        provider: str,
+        host: str,
+        endpoint: str,
+        status: str | int,
+        latency: float,
+        nbytes: int = 0,
+        attempt: int = 1,
+    ) -> None:
+        key = (provider, host or "unknown", endpoint or "/")
+        with self._lock:
+            call_key = (*key, str(status))
+            self._calls[call_key] = self._calls.get(call_key, 0) + 1
+            if attempt > 1:
+                self._retries[key] = self._retries.get(key, 0) + 1
+            latency_hist = self._latency.get(key)
+            if latency_hist is None:
+                latency_hist = self._latency[key] = Histogram(self._latency_buckets)
+                self._sizes[key] = Histogram(self._size_buckets)
+            latency_hist.observe(max(latency, 0.0))
+            self._sizes[key].observe(max(nbytes, 0))
+
+    def reset(self) -> None:
+        with self._lock:
+            self._calls.clear()
+            self._retries.clear()
+            self._latency.clear()
+            self._sizes.clear()
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        """One summary row per upstream endpoint, slowest p90 first."""
+        with self._lock:
+            rows = []
+            for key, latency_hist in self._latency.items():
+                provider, host, endpoint = key
+                statuses = {
+                    status: count
+                    for (p, h, e, status), count in self._calls.items()
+                    if (p, h, e) == key
+                }
+                errors = sum(count for status, count in statuses.items() if not _is_success(status))
+                sizes = self._sizes[key]
+                rows.append({
+                    "provider": provider,
+                    "host": host,
+                    "endpoint": endpoint,
+                    "calls": latency_hist.count,
+                    "errors": errors,
+                    "retries": self._retries.get(key, 0),
+                    "statuses": statuses,
+                    "latency_avg": round(latency_hist.total / latency_hist.count, 4),
+                    "latency_p50": latency_hist.quantile(0.5),
+                    "latency_p90": latency_hist.quantile(0.9),
+                    "bytes_total": int(sizes.total),
+                    "bytes_avg": int(sizes.total / sizes.count),
+                })
+        rows.sort(key=lambda row: (-(row["latency_p90"] or 0.0), row["host"], row["endpoint"]))
+        return rows
+
+    def render_prometheus(self) -> str:
+        """Prometheus text exposition (format 0.0.4)."""
+        lines: list[str] = []
+        with self._lock:
+            lines += [
+                "# HELP upstream_requests_total Outbound upstream calls by status.",
+                "# TYPE upstream_requests_total counter",
+            ]
+            for (provider, host, endpoint, status), count in sorted(self._calls.items()):
+                labels = _labels(provider=provider, host=host, endpoint=endpoint, status=status)
+                lines.append(f"upstream_requests_total{{{labels}}} {count}")
+            lines += [
+                "# HELP upstream_retries_total Outbound calls made as a retry attempt.",
+                "# TYPE upstream_retries_total counter",
+            ]
+            for (provider, host, endpoint), count in sorted(self._retries.items()):
+                labels = _labels(provider=provider, host=host, endpoint=endpoint)
+                lines.append(f"upstream_retries_total{{{labels}}} {count}")
+            lines += _histogram_lines(
+                "upstream_request_duration_seconds",
+                "Outbound call latency in seconds.",
+                self._latency.items(),
+            )
+            lines += _histogram_lines(
+                "upstream_response_bytes",
+                "Outbound response payload size in bytes.",
+                self._sizes.items(),
+            )
+        return "\n".join(lines) + "\n"
+
+
+def _is_success(status: str) -> bool:
+    return status.isdigit() and (200 <= int(status) < 400 or status == "0")
+
+
+def _labels(**labels: str) -> str:
+    return ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items())
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _histogram_lines(
+    name: str,
+    help_text: str,
+    items: Iterable[tuple[tuple[str, str, str], Histogram]],
+) -> list[str]:
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+    for (provider, host, endpoint), hist in sorted(items, key=lambda item: item[0]):
+        base = _labels(provider=provider, host=host, endpoint=endpoint)
+        for bound, running in hist.cumulative():
+            le = "+Inf" if math.isinf(bound) else repr(float(bound))
+            lines.append(f'{name}_bucket{{{base},le="{le}"}} {running}')
+        lines.append(f"{name}_sum{{{base}}} {hist.total}")
+        lines.append(f"{name}_count{{{base}}} {hist.count}")
+    return lines
+
+
+upstream_telemetry = UpstreamTelemetry()
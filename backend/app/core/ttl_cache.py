@@ -0,0 +1,278 @@
+"""Bounded in-process TTL cache shared by provider integrations."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Hashable, Iterable, Mapping
+
+MISS: Any = object()
+"""Sentinel returned by :meth:`AsyncTTLCache.get` when nothing usable is cached."""
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Expiry rules for one cache namespace."""
+
+    ttl: float
+    negative_ttl: float | None = None
+    max_stale: float = 0.0
+
+    @property
+    def effective_negative_ttl(self) -> float:
+        return self.ttl if self.negative_ttl is None else self.negative_ttl
+
+
+class _LoadCancelled(Exception):
+    """Set on a shared load whose owning task was cancelled, so waiters retry it."""
+
+
+class _Entry:
+    __slots__ = ("value", "expires_at", "size", "negative")
+
+    def __init__(self, value: Any, expires_at: float, size: int, negative: bool) -> None:
+        self.value = value
+        self.expires_at = expires_at
+        self.size = size
+        self.negative = negative
+
+
+_COUNTERS = ("hits", "negative_hits", "stale_hits", "misses", "stores", "evictions", "expirations")
+
+
+class AsyncTTLCache:
+    """LRU cache with per-namespace TTLs, negative caching and entry/byte bounds.
+
+    Keys are ``(namespace, key)`` pairs. Expired entries stay readable via
+    ``allow_stale=True`` for ``policy.max_stale`` seconds so callers can serve
+    last-known values while an upstream is failing; beyond that they are purged.
+    """
+
+    def __init__(
+        self,
+        policies: Mapping[str, CachePolicy] | None = None,
+        max_entries: int = 4096,
+        max_bytes: int = 32 * 1024 * 1024,
+        default_policy: CachePolicy | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._policies: dict[str, CachePolicy] = dict(policies or {})
+        self._default_policy = default_policy or CachePolicy(ttl=60.0)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._entries: OrderedDict[tuple[str, Hashable], _Entry] = OrderedDict()
+        self._bytes = 0
+        self._inflight: dict[tuple[str, Hashable], asyncio.Future] = {}
+        self._stats: dict[str, dict[str, int]] = {}
+
+    def configure(self, namespace: str, policy: CachePolicy) -> None:
+        self._policies[namespace] = policy
+
+    def policy(self, namespace: str) -> CachePolicy:
+        return self._policies.get(namespace, self._default_policy)
+
+    def get(self, namespace: str, key: Hashable, allow_stale: bool = False) -> Any:
+        """Return the cached value, ``MISS`` if absent/expired."""
+        slot = (namespace, key)
+        entry = self._entries.get(slot)
+        if entry is None:
+            self._count(namespace, "misses")
+            return MISS
+        now = self._clock()
+        if now >= entry.expires_at:
+            if now >= entry.expires_at + self.policy(namespace).max_stale:
+                self._drop(slot)
+                self._count(namespace, "expirations")
+                self._count(namespace, "misses")
+                return MISS
+            if not allow_stale:
+                self._count(namespace, "misses")
+                return MISS
+            self._count(namespace, "stale_hits")
+        else:
+            self._count(namespace, "negative_hits" if entry.negative else "hits")
+        self._entries.move_to_end(slot)
+        return entry.value
+
+    def get_many(
+        self, namespace: str, keys: Iterable[Hashable]
+    ) -> tuple[dict[Hashable, Any], list[Hashable]]:
+        """Split ``keys`` into cached values and keys that still need loading."""
+        found: dict[Hashable, Any] = {}
+        missing: list[Hashable] = []
+        for key in keys:
+            value = self.get(namespace, key)
+            if value is MISS:
+                missing.append(key)
+            else:
+                found[key] = value
+        return found, missing
+
+    def set(self, namespace: str, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        if ttl is None:
+            ttl = self.policy(namespace).ttl
+        self._store(namespace, key, value, ttl, False)
+
+    def set_negative(
+        self, namespace: str, key: Hashable, value: Any = None, ttl: float | None = None
+    ) -> None:
+        """Remember that ``key`` has no data, using the namespace's negative TTL."""
+        policy = self.policy(namespace)
+        self._store(
+            namespace,
+            key,
+            value,
+            ttl if ttl is not None else policy.effective_negative_ttl,
+            True,
+        )
+
+    def invalidate(self, namespace: str, key: Hashable | None = None) -> None:
+        if key is not None:
+            self._drop((namespace, key))
+            return
+        for slot in [slot for slot in self._entries if slot[0] == namespace]:
+            self._drop(slot)
+
+    async def get_or_load(
+        self,
+        namespace: str,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        is_negative: Callable[[Any], bool] = lambda value: not value,
+        ttl: float | None = None,
+    ) -> Any:
+        """Return a cached value or run ``loader`` once for all concurrent callers.
+
+        If the task running the shared load is cancelled, its waiters are not: the
+        first of them to wake up starts a fresh load.
+        """
+        slot = (namespace, key)
+        while True:
+            cached = self.get(namespace, key)
+            if cached is not MISS:
+                return cached
+            inflight = self._inflight.get(slot)
+            if inflight is None:
+                break
+            try:
+                return await asyncio.shield(inflight)
+            except _LoadCancelled:
+                continue
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[slot] = future
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            future.set_exception(_LoadCancelled())
+            future.exception()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            future.exception()  # mark retrieved when nobody else is waiting
+            raise
+        else:
+            if is_negative(value):
+                self.set_negative(namespace, key, value)
+            else:
+                self.set(namespace, key, value, ttl=ttl)
+            future.set_result(value)
+            return value
+        finally:
+            self._inflight.pop(slot, None)
+
+    def purge_expired(self) -> int:
+        """Drop entries past their stale window; returns the number removed."""
+        now = self._clock()
+        removed = 0
+        for slot, entry in list(self._entries.items()):
+            if now >= entry.expires_at + self.policy(slot[0]).max_stale:
+                self._drop(slot)
+                self._count(slot[0], "expirations")
+                removed += 1
+        return removed
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Per-namespace counters plus current entry/byte usage and hit rate."""
+        usage: dict[str, list[int]] = {}
+        for (namespace, _), entry in self._entries.items():
+            bucket = usage.setdefault(namespace, [0, 0])
+            bucket[0] += 1
+            bucket[1] += entry.size
+        report: dict[str, dict[str, Any]] = {}
+        for namespace in sorted(set(self._stats) | set(usage) | set(self._policies)):
+            counters = dict(self._stats.get(namespace) or dict.fromkeys(_COUNTERS, 0))
+            lookups = (
+                counters["hits"] + counters["negative_hits"] + counters["stale_hits"]
+                + counters["misses"]
+            )
+            served = lookups - counters["misses"]
+            entries, size = usage.get(namespace, (0, 0))
+            counters.update(
+                entries=entries,
+                bytes=size,
+                hit_rate=round(served / lookups, 4) if lookups else None,
+                ttl=self.policy(namespace).ttl,
+            )
+            report[namespace] = counters
+        return report
+
+    @property
+    def total_bytes(self) -> int:
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _store(
+        self, namespace: str, key: Hashable, value: Any, ttl: float, negative: bool
+    ) -> None:
+        slot = (namespace, key)
+        self._drop(slot)
+        size = _estimate_size(value) + _estimate_size(key)
+        if size > self.max_bytes:
+            return
+        self._entries[slot] = _Entry(value, self._clock() + ttl, size, negative)
+        self._bytes += size
+        self._count(namespace, "stores")
+        self._enforce_bounds()
+
+    def _enforce_bounds(self) -> None:
+        if len(self._entries) <= self.max_entries and self._bytes <= self.max_bytes:
+            return
+        self.purge_expired()
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            slot, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.size
+            self._count(slot[0], "evictions")
+
+    def _drop(self, slot: tuple[str, Hashable]) -> None:
+        entry = self._entries.pop(slot, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def _count(self, namespace: str, counter: str) -> None:
+        stats = self._stats.get(namespace)
+        if stats is None:
+            stats = self._stats[namespace] = dict.fromkeys(_COUNTERS, 0)
+        stats[counter] += 1
+
+
+def _estimate_size(value: Any, _depth: int = 0) -> int:
+    """Approximate deep size in bytes for JSON-like payloads."""
+    size = sys.getsizeof(value)
+    if _depth > 6:
+        return size
+    if isinstance(value, Mapping):
+        for key, item in value.items():
+            size += _estimate_size(key, _depth + 1) + _estimate_size(item, _depth + 1)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            size += _estimate_size(item, _depth + 1)
+    return size
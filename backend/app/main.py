@@ -1,17 +1,29 @@
 """FastAPI entrypoint for the Wind Market Wallboard backend service."""
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 import os
 
-from .api import config, data, health, websocket
+from .api import config, data, health, metrics, websocket
+from .services.data_manager import get_data_manager
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start provider background tasks with the server and stop them on shutdown."""
+    await get_data_manager().start()
+    yield
+    await websocket.manager.stop_broadcasting()
+    await get_data_manager().close()
 
 
 def create_app() -> FastAPI:
     """Instantiate FastAPI application with router registrations."""
 
-    app = FastAPI(title="Wind Market Wallboard API", version="0.1.0")
+    app = FastAPI(title="Wind Market Wallboard API", version="0.1.0", lifespan=lifespan)
 
     # Add CORS middleware for development
     app.add_middleware(
@@ -26,6 +38,7 @@ def create_app() -> FastAPI:
     app.include_router(health.router, prefix="/health", tags=["health"])
     app.include_router(data.router, prefix="/data", tags=["data"])
     app.include_router(config.router, prefix="/config", tags=["config"])
+    app.include_router(metrics.router, prefix="/metrics", tags=["metrics"])
     app.include_router(websocket.router, tags=["websocket"])
 
     # Serve static files (frontend)
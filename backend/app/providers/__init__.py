@@ -3,6 +3,8 @@
 from .base import MarketDataProvider, NullProvider
 from .mock import MockProvider
 from .open import OpenProvider
+from .replay import ReplayProvider
+from .synthetic import SyntheticMockProvider
 from .wind import WindProvider, create_wind_provider
 
 __all__ = [
@@ -10,6 +12,8 @@ __all__ = [
     "NullProvider",
     "MockProvider",
     "OpenProvider",
+    "ReplayProvider",
+    "SyntheticMockProvider",
     "WindProvider",
     "create_wind_provider",
 ]
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Mapping
+from typing import Any, Mapping, Sequence
 
 
 class MarketDataProvider(ABC):
@@ -40,6 +40,29 @@ class MarketDataProvider(ABC):
     @abstractmethod
     async def fetch_a_share_short_term(self) -> Mapping[str, Any]:
         """Return short-term A-share board/flow insights."""
+
+    async def fetch_intraday_bars(self, codes: Sequence[str] | None = None) -> Mapping[str, Any]:
+        """Return ``{code: {"spark": [...]}}`` intraday series; empty when unsupported."""
+        return {}
+
+    async def fetch_a_share_universe(self) -> Mapping[str, Any]:
+        """Return every listed A-share stock column-wise; empty when unsupported.
+
+        ``{"codes": [...], "names": [...], "last": [...], "prev_close": [...],
+        "volume": [...], "amount": [...], "turnover_rate": [...], "market_cap": [...],
+        "industries": [...], "timestamp": ..., "source": ...}``, with every list
+        aligned with ``codes`` and ``None`` for missing values (``turnover_rate`` in
+        %, ``market_cap`` in yuan).
+        """
+        return {}
+
+    async def start(self) -> None:
+        """Start background tasks and sessions on app startup; no-op by default."""
+        return None
+
+    async def close(self) -> None:
+        """Stop background tasks and sessions on app shutdown; no-op by default."""
+        return None
 
 
 class NullProvider(MarketDataProvider):
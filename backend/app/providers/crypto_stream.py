@@ -0,0 +1,158 @@
+"""Streaming crypto ticker consumer (Binance combined streams) with reconnect/backoff."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import random
+import time
+from datetime import UTC, datetime
+from typing import Any, Callable, Mapping
+
+try:
+    import websockets
+    WEBSOCKETS_AVAILABLE = True
+except ImportError:
+    WEBSOCKETS_AVAILABLE = False
+    websockets = None
+
+logger = logging.getLogger(__name__)
+
+QuoteListener = Callable[[str, Mapping[str, Any]], None]
+
+
+class CryptoStreamConsumer:
+    """Keep last trade and 24h change per asset from a long-lived ticker stream.
+
+    ``symbols`` maps stream symbols (``btcusdt``) to ``(code, label)``. State is
+    updated in place as frames arrive; :meth:`snapshot` returns only entries newer
+    than ``stale_after`` seconds so callers can fall back to REST for the rest.
+    """
+
+    def __init__(
+        self,
+        symbols: Mapping[str, tuple[str, str]],
+        url: str,
+        stale_after: float = 30.0,
+        initial_backoff: float = 1.0,
+        max_backoff: float = 60.0,
+    ) -> None:
+        self.symbols = {symbol.lower(): mapping for symbol, mapping in symbols.items()}
+        self.url = url
+        self.stale_after = stale_after
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.connections = 0
+        self._state: dict[str, dict[str, Any]] = {}
+        self._received_at: dict[str, float] = {}
+        self._listeners: list[QuoteListener] = []
+        self._task: asyncio.Task | None = None
+
+    @property
+    def stream_url(self) -> str:
+        streams = "/".join(f"{symbol}@ticker" for symbol in self.symbols)
+        separator = "&" if "?" in self.url else "?"
+        return f"{self.url}{separator}streams={streams}"
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def add_listener(self, listener: QuoteListener) -> None:
+        """Register a callback invoked with ``(code, snapshot)`` on every update."""
+        self._listeners.append(listener)
+
+    def start(self) -> None:
+        """Start the consumer on the running loop (idempotent)."""
+        if not WEBSOCKETS_AVAILABLE:
+            return
+        loop = asyncio.get_running_loop()
+        if self.running and self._task.get_loop() is loop:
+            return
+        self._task = loop.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except (asyncio.CancelledError, Exception):
+            pass
+        self._task = None
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        now = time.monotonic()
+        return {
+            code: dict(entry)
+            for code, entry in self._state.items()
+            if now - self._received_at.get(code, 0.0) <= self.stale_after
+        }
+
+    async def _run(self) -> None:
+        backoff = self.initial_backoff
+        while True:
+            try:
+                async with websockets.connect(
+                    self.stream_url, open_timeout=10, ping_interval=20
+                ) as ws:
+                    self.connections += 1
+                    logger.info("Crypto stream connected: %s", self.url)
+                    async for message in ws:
+                        if self.handle_message(message):
+                            backoff = self.initial_backoff
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("Crypto stream error: %s", exc)
+            delay = backoff * random.uniform(0.8, 1.2)
+            logger.info("Crypto stream reconnecting in %.1fs", delay)
+            await asyncio.sleep(delay)
+            backoff = min(self.max_backoff, backoff * 2)
+
+    def handle_message(self, message: str | bytes) -> bool:
+        """Apply one stream frame; returns True when it updated an asset."""
+        try:
+            payload = json.loads(message)
+        except (TypeError, ValueError):
+            return False
+        data = payload.get("data", payload) if isinstance(payload, Mapping) else None
+        if not isinstance(data, Mapping) or data.get("e") != "24hrTicker":
+            return False
+        mapping = self.symbols.get(str(data.get("s", "")).lower())
+        if not mapping:
+            return False
+        try:
+            last = float(data["c"])
+            change = float(data.get("p", 0.0))
+            change_pct = float(data.get("P", 0.0))
+        except (KeyError, TypeError, ValueError):
+            return False
+
+        code, label = mapping
+        event_ms = data.get("E")
+        timestamp = (
+            datetime.fromtimestamp(event_ms / 1000, tz=UTC)
+            if isinstance(event_ms, (int, float))
+            else datetime.now(UTC)
+        )
+        snapshot = {
+            "code": code,
+            "name": label,
+            "display_name": label,
+            "last": round(last, 2),
+            "change_pct": round(change_pct, 2),
+            "change": round(change, 2),
+            "prev_close": round(last - change, 2),
+            "timestamp": timestamp.isoformat(),
+            "source": "binance_ws",
+        }
+        self._state[code] = snapshot
+        self._received_at[code] = time.monotonic()
+        for listener in self._listeners:
+            try:
+                listener(code, snapshot)
+            except Exception as exc:
+                logger.warning("Crypto stream listener failed: %s", exc)
+        return True
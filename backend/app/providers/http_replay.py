@@ -0,0 +1,242 @@
+"""Record/replay HTTP transports for deterministic open-provider runs.
+
+``RecordingTransport`` proxies real traffic and captures every response into
+per-host fixture files; ``ReplayTransport`` serves those fixtures from an
+in-process stand-in with configurable latency, jitter and error injection.
+
+Record a fixture set from the live upstreams::
+
+    uv run python -m app.providers.http_replay record ../tests/fixtures/open
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+from collections import Counter
+from pathlib import Path
+from typing import Any, Iterable, Mapping
+from urllib.parse import urlencode
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Query parameters that embed the current date; ignored when no exact match exists.
+VOLATILE_PARAMS = frozenset({"cosd", "date", "d1", "d2", "_"})
+
+
+def request_key(request: httpx.Request, strip_volatile: bool = False) -> str:
+    """Canonical fixture key: method, host, path and sorted query parameters."""
+    params = sorted(
+        (name, value)
+        for name, value in request.url.params.multi_items()
+        if not (strip_volatile and name in VOLATILE_PARAMS)
+    )
+    query = urlencode(params)
+    return f"{request.method} {request.url.host}{request.url.path}?{query}"
+
+
+class _FixtureStore:
+    """Per-host JSON fixture files holding recorded responses."""
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+        self.entries: dict[str, list[dict[str, Any]]] = {}
+
+    def load(self) -> _FixtureStore:
+        for path in sorted(self.directory.glob("*.json")):
+            payload = json.loads(path.read_text(encoding="utf-8"))
+            self.entries[path.stem] = list(payload.get("entries", []))
+        return self
+
+    def add(self, host: str, entry: dict[str, Any]) -> None:
+        bucket = self.entries.setdefault(host, [])
+        bucket[:] = [item for item in bucket if item["key"] != entry["key"]]
+        bucket.append(entry)
+
+    def save(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        for host, entries in self.entries.items():
+            path = self.directory / f"{host}.json"
+            path.write_text(
+                json.dumps({"entries": entries}, ensure_ascii=False, indent=1),
+                encoding="utf-8",
+            )
+
+    def all_entries(self) -> Iterable[dict[str, Any]]:
+        for entries in self.entries.values():
+            yield from entries
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Forward requests to the real network and capture each response as a fixture.
+
+    Providers open a short-lived client per request, so ``aclose`` is a no-op;
+    call :meth:`close` once recording is finished to flush fixtures to disk.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        inner: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self._store = _FixtureStore(directory)
+        self._inner = inner or httpx.AsyncHTTPTransport(retries=0)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = await self._inner.handle_async_request(request)
+        body = await response.aread()
+        await response.aclose()
+        self._store.add(
+            request.url.host,
+            {
+                "key": request_key(request),
+                "url": str(request.url),
+                "status": response.status_code,
+                "content_type": response.headers.get("content-type", ""),
+                "body": body.decode(_charset(response), errors="replace"),
+            },
+        )
+        return httpx.Response(
+            response.status_code,
+            headers={"content-type": response.headers.get("content-type", "")},
+            content=body,
+            request=request,
+        )
+
+    async def aclose(self) -> None:
+        return None
+
+    async def close(self) -> None:
+        self._store.save()
+        await self._inner.aclose()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """Serve recorded fixtures in-process with injectable latency and failures."""
+
+    def __init__(
+        self,
+        fixtures: str | Path | Iterable[Mapping[str, Any]],
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        timeout_rate: float = 0.0,
+        seed: int | None = None,
+    ) -> None:
+        if isinstance(fixtures, str | Path):
+            entries = list(_FixtureStore(fixtures).load().all_entries())
+        else:
+            entries = [dict(entry) for entry in fixtures]
+        self._exact: dict[str, Mapping[str, Any]] = {}
+        self._loose: dict[str, Mapping[str, Any]] = {}
+        for entry in entries:
+            self._exact.setdefault(entry["key"], entry)
+            self._loose.setdefault(_strip_key(entry["key"]), entry)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.timeout_rate = timeout_rate
+        self._random = random.Random(seed)
+        self.request_counts: Counter[str] = Counter()
+        self.unmatched: list[str] = []
+
+    @property
+    def total_requests(self) -> int:
+        return sum(self.request_counts.values())
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.request_counts[request.url.host] += 1
+        delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay:
+            await asyncio.sleep(delay)
+        if self.timeout_rate and self._random.random() < self.timeout_rate:
+            raise httpx.ReadTimeout("replay: injected timeout", request=request)
+        if self.error_rate and self._random.random() < self.error_rate:
+            return httpx.Response(self.error_status, request=request)
+
+        entry = self._exact.get(request_key(request)) or self._loose.get(
+            request_key(request, strip_volatile=True)
+        )
+        if entry is None:
+            self.unmatched.append(str(request.url))
+            return httpx.Response(404, request=request)
+        content_type = entry.get("content_type") or "text/plain"
+        encoding = _declared_charset(content_type) or "utf-8"
+        return httpx.Response(
+            int(entry.get("status", 200)),
+            headers={"content-type": content_type},
+            content=str(entry.get("body", "")).encode(encoding, errors="replace"),
+            request=request,
+        )
+
+    async def aclose(self) -> None:
+        return None
+
+
+def _strip_key(key: str) -> str:
+    prefix, _, query = key.partition("?")
+    kept = [
+        part for part in query.split("&")
+        if part and part.split("=", 1)[0] not in VOLATILE_PARAMS
+    ]
+    return f"{prefix}?{'&'.join(kept)}"
+
+
+def _declared_charset(content_type: str) -> str | None:
+    for part in content_type.split(";")[1:]:
+        name, _, value = part.strip().partition("=")
+        if name.lower() == "charset" and value:
+            return value.strip('"')
+    return None
+
+
+def _charset(response: httpx.Response) -> str:
+    return response.charset_encoding or response.encoding or "utf-8"
+
+
+async def _record(directory: str) -> None:
+    from .open import OpenProvider
+
+    transport = RecordingTransport(directory)
+    provider = OpenProvider(transport=transport)
+    try:
+        for method in (
+            provider.fetch_indices,
+            provider.fetch_fx,
+            provider.fetch_rates,
+            provider.fetch_commodities,
+            provider.fetch_us_stocks,
+            provider.fetch_crypto,
+            provider.fetch_calendar,
+            provider.fetch_a_share_short_term,
+            # The calendar chain stops at the first valid source; record the fallbacks too.
+            provider._fetch_fxstreet_calendar,
+            provider._fetch_forexfactory_calendar,
+            provider._fetch_tradingeconomics_calendar,
+        ):
+            await method()
+    finally:
+        await transport.close()
+    logger.info("Recorded open-provider fixtures into %s", directory)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+    record = sub.add_parser("record", help="capture live upstream responses")
+    record.add_argument("directory")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    if args.command == "record":
+        asyncio.run(_record(args.directory))
+
+
+if __name__ == "__main__":
+    main()
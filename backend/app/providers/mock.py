@@ -2,17 +2,40 @@
 
 from __future__ import annotations
 
+import math
+import random
 from datetime import datetime, timedelta
 from typing import Any, Mapping
 
 from .base import MarketDataProvider
 
+# (first code, exchange) per A-share board: SH main, SZ main, ChiNext, STAR, BJ.
+BOARDS = ((600000, "SH"), (1, "SZ"), (300000, "SZ"), (688000, "SH"), (830000, "BJ"))
+LIMIT_PCTS = (10.0, 10.0, 20.0, 20.0, 30.0)
+INDUSTRIES = (
+    "银行", "证券", "保险", "半导体", "软件开发", "通信设备", "化学制药", "医疗器械", "白酒",
+    "家电行业", "汽车整车", "电池", "光伏设备", "电力行业", "煤炭行业", "钢铁行业", "房地产开发",
+    "工程建设",
+)
+
+
+def universe_codes(size: int) -> list[str]:
+    """``size`` distinct A-share stock codes spread across the boards."""
+    codes = []
+    for index in range(size):
+        base, market = BOARDS[index % len(BOARDS)]
+        codes.append(f"{base + index // len(BOARDS):06d}.{market}")
+    return codes
+
 
 class MockProvider(MarketDataProvider):
     """Provides deterministic mock data that matches the unified snapshot schema."""
 
+    UNIVERSE_SIZE = 500
+
     def __init__(self) -> None:
         self.now = datetime.now()
+        self._universe: dict[str, Any] | None = None
 
     def _ts(self) -> str:
         return (self.now + timedelta(seconds=0)).isoformat()
@@ -104,6 +127,42 @@ class MockProvider(MarketDataProvider):
             },
         ]
 
+    async def fetch_a_share_universe(self) -> Mapping[str, Any]:
+        """Return a fixed, seeded universe of ``UNIVERSE_SIZE`` stocks, a few at their limits."""
+        if self._universe is None:
+            rng = random.Random(20240105)
+            codes = universe_codes(self.UNIVERSE_SIZE)
+            columns: dict[str, list[Any]] = {
+                "last": [], "prev_close": [], "volume": [], "amount": [],
+                "turnover_rate": [], "market_cap": [], "industries": [],
+            }
+            for index in range(len(codes)):
+                prev_cents = rng.randint(300, 8000)
+                limit = LIMIT_PCTS[index % len(BOARDS)]
+                pct = max(-limit, min(limit, rng.gauss(0.3, 2.5)))
+                if rng.random() < 0.02:
+                    pct = limit if rng.random() < 0.7 else -limit
+                # Exchange rounding (half-up to the cent), so limit moves land exactly on the limit.
+                last = math.floor(prev_cents * (1 + pct / 100) + 0.5) / 100
+                prev_close = prev_cents / 100
+                volume = rng.randint(100, 50_000) * 100
+                shares = rng.randint(2, 500) * 10_000_000
+                columns["last"].append(last)
+                columns["prev_close"].append(prev_close)
+                columns["volume"].append(volume)
+                columns["amount"].append(round(volume * last, 2))
+                columns["turnover_rate"].append(round(volume / shares * 100, 2))
+                columns["market_cap"].append(round(shares * last, 2))
+                columns["industries"].append(rng.choice(INDUSTRIES))
+            self._universe = {
+                "timestamp": self._ts(),
+                "source": "mock",
+                "codes": codes,
+                "names": [f"股票{code[:6]}" for code in codes],
+                **columns,
+            }
+        return self._universe
+
     async def fetch_a_share_short_term(self) -> Mapping[str, Any]:
         timestamp = self._ts()
         boards = [
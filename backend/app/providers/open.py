@@ -4,21 +4,29 @@ from __future__ import annotations
 
 import asyncio
 import csv
+import heapq
 import json
 import logging
+import math
 import re
 import time
-from datetime import date, datetime, timedelta, timezone
+from datetime import UTC, date, datetime, timedelta, timezone
 from io import StringIO
-from typing import Any, Mapping, Sequence
+from typing import Any, Awaitable, Callable, Mapping, Sequence
 from urllib.parse import quote
 
 import httpx
 
+from app.core.hedging import LatencyTracker, hedged, timed
 from app.core.settings import settings
+from app.core.telemetry import upstream_telemetry
+from app.core.ttl_cache import MISS, AsyncTTLCache, CachePolicy
 
 from .base import MarketDataProvider
+from .crypto_stream import CryptoStreamConsumer
+from . import tencent_parser
 from .mock import MockProvider
+from .routing import InstrumentRegistry, Route, SourceResolver
 
 logger = logging.getLogger(__name__)
 
@@ -28,10 +36,8 @@ class OpenProvider(MarketDataProvider):
 
     STOOQ_ENDPOINT = "https://stooq.com/q/l/"
     STOOQ_FIELDS = "sd2t2ohlcv"
-    STOOQ_CACHE_TTL = 15.0
     FX_ENDPOINT = "https://open.er-api.com/v6/latest"
     CALENDAR_ENDPOINT = "https://nfs.faireconomy.media/ff_calendar_thisweek.json"
-    CALENDAR_CACHE_TTL = 1200.0
     FOREXFACTORY_COOLDOWN_TTL = 900.0
     CALENDAR_LOOKAHEAD_DAYS = 10
     TRADING_ECONOMICS_ENDPOINT = "https://api.tradingeconomics.com/calendar"
@@ -39,7 +45,6 @@ class OpenProvider(MarketDataProvider):
     TRADING_ECONOMICS_LOOKAHEAD_DAYS = 7
     FRED_ENDPOINT = "https://fred.stlouisfed.org/graph/fredgraph.csv"
     FRED_LOOKBACK_DAYS = 40
-    FRED_CACHE_TTL = 300.0
     COINGECKO_ENDPOINT = "https://api.coingecko.com/api/v3/simple/price"
     COINGECKO_IDS = {
         "bitcoin": ("BTC.CC", "比特币"),
@@ -48,18 +53,26 @@ class OpenProvider(MarketDataProvider):
         "binancecoin": ("BNB.CC", "BNB"),
         "ripple": ("XRP.CC", "XRP"),
     }
-    CRYPTO_CACHE_TTL = 60.0
+    BINANCE_STREAM_SYMBOLS = {
+        "bitcoin": "btcusdt",
+        "ethereum": "ethusdt",
+        "solana": "solusdt",
+        "binancecoin": "bnbusdt",
+        "ripple": "xrpusdt",
+    }
     GOLDPRICE_ENDPOINT = "https://data-asg.goldprice.org/dbXRates/USD"
-    GOLDPRICE_CACHE_TTL = 60.0
     EASTMONEY_BOARD_ENDPOINT = "https://push2.eastmoney.com/api/qt/clist/get"
     EASTMONEY_BOARD_FIELDS = "f12,f14,f3,f62,f184,f204,f205"
     EASTMONEY_BOARD_LIMIT = 60
+    # Whole A-share list (SH/SZ main, ChiNext, STAR, BJ), paged in code order.
+    EASTMONEY_UNIVERSE_FS = "m:0+t:6,m:0+t:80,m:1+t:2,m:1+t:23,m:0+t:81+s:2048"
+    EASTMONEY_UNIVERSE_FIELDS = "f2,f5,f6,f8,f12,f13,f14,f18,f20,f100"
+    EASTMONEY_UNIVERSE_PAGE = 100
+    EASTMONEY_UNIVERSE_CONCURRENCY = 8
     EASTMONEY_HEADERS = {"Referer": "https://quote.eastmoney.com", "User-Agent": "Mozilla/5.0"}
     TENCENT_QUOTE_ENDPOINT = "http://qt.gtimg.cn/q="
     TENCENT_HEADERS = {"User-Agent": "Mozilla/5.0"}
-    TENCENT_CACHE_TTL = 5.0
     ALPHAVANTAGE_ENDPOINT = "https://www.alphavantage.co/query"
-    ALPHAVANTAGE_CACHE_TTL = 3600.0
     ALPHAVANTAGE_COMMODITY_SERIES = {
         "WTI": ("WTI", "CL.NYM", "WTI 原油"),
         "BRENT": ("BRENT", "COIL.BR", "布伦特原油"),
@@ -85,10 +98,8 @@ class OpenProvider(MarketDataProvider):
         "^IRX": ("UST3M.GBM", "美债3M", 4),
     }
     CHINABOND_YIELD_URL = "http://yield.chinabond.com.cn/cbweb-czb-web/czb/moreInfo"
-    CHINABOND_CACHE_TTL = 600.0
     CHINABOND_PARAMS = {"locale": "en_US", "nameType": 1}
     FXSTREET_CALENDAR_URL = "https://www.fxstreet.com/economic-calendar"
-    FXSTREET_CACHE_TTL = 300.0
     FXSTREET_MAX_EVENTS = 15
     NASDAQ_CALENDAR_ENDPOINT = "https://api.nasdaq.com/api/calendar/economicevents"
     NASDAQ_HEADERS = {
@@ -96,6 +107,16 @@ class OpenProvider(MarketDataProvider):
         "Accept": "application/json",
     }
     NASDAQ_LOOKAHEAD_DAYS = 7
+    # Per-day calendar TTLs: today/tomorrow still gain events, later days rarely change.
+    NASDAQ_NEAR_DAYS = 2
+    NASDAQ_NEAR_DAY_TTL = 2400.0
+    NASDAQ_FAR_DAY_TTL = 21600.0
+    # Release watch: poll a day quickly from shortly before a high-importance release
+    # until its actual value shows up (or the window closes).
+    RELEASE_WATCH_BEFORE = 60.0
+    RELEASE_WATCH_AFTER = 600.0
+    RELEASE_WATCH_TTL = 5.0
+    HIGH_IMPORTANCE_LEVELS = frozenset({"high", "3"})
     CHINA_GOVERNMENT_CODES = {
         1: ("M0000001.SH", "中国国债1Y"),
         3: ("M0000007.SH", "中国国债3Y"),
@@ -144,6 +165,21 @@ class OpenProvider(MarketDataProvider):
     }
     REQUEST_TIMEOUT = 10.0
     MAX_RETRIES = 2
+    HEDGE_PERCENTILE = 90.0
+    HEDGE_DEFAULT_DELAY = 1.5
+    # Single place to tune in-process cache lifetimes (seconds) per upstream namespace.
+    CACHE_POLICIES = {
+        "tencent": CachePolicy(ttl=5.0),
+        "eastmoney_universe": CachePolicy(ttl=5.0, negative_ttl=15.0),
+        "stooq": CachePolicy(ttl=15.0),
+        "fred": CachePolicy(ttl=300.0, negative_ttl=60.0),
+        "crypto": CachePolicy(ttl=60.0, negative_ttl=15.0),
+        "goldprice": CachePolicy(ttl=60.0, negative_ttl=30.0),
+        "chinabond": CachePolicy(ttl=600.0, negative_ttl=60.0),
+        "fxstreet": CachePolicy(ttl=300.0, negative_ttl=60.0),
+        "calendar": CachePolicy(ttl=1200.0, max_stale=86400.0),
+        "nasdaq_day": CachePolicy(ttl=NASDAQ_FAR_DAY_TTL, negative_ttl=300.0, max_stale=86400.0),
+    }
 
     STOOQ_INDICES = {
         "^SPX": ("SPX.GI", "标普500"),
@@ -200,37 +236,74 @@ class OpenProvider(MarketDataProvider):
         "IUDSOIA": ("SONIA.IR", "SONIA(英镑)"),
         "EFFR": ("EFFR.IR", "联邦基金有效利率"),
     }
+    # Every FRED series a refresh may need, fetched together in one fredgraph request.
+    FRED_SERIES_IDS = (*FRED_RATE_SERIES, *FRED_COMMODITY_SERIES)
+    LPR_RATE_CODES = {
+        "LPR1Y": ("LPR1Y.IR", "LPR 1Y"),
+        "LPR5Y": ("LPR5Y.IR", "LPR 5Y"),
+    }
+    CHINABOND_TENORS = {
+        "1Y": CHINA_GOVERNMENT_CODES[1],
+        "3Y": CHINA_GOVERNMENT_CODES[3],
+        "5Y": CHINA_GOVERNMENT_CODES[5],
+        "10Y": CHINA_GOVERNMENT_CODES[10],
+    }
 
-    def __init__(self) -> None:
+    # Per-instrument source routing: sources are listed in priority order. Indices
+    # take Tencent first and Stooq for the gaps; rates query every source for a code
+    # at once and keep the freshest quote.
+    INDEX_ROUTES = InstrumentRegistry.from_sources(
+        ("tencent", {**TENCENT_A_INDEX_CODES, **TENCENT_GLOBAL_INDICES}),
+        ("stooq", STOOQ_INDICES),
+    )
+    RATE_ROUTES = InstrumentRegistry.from_sources(
+        ("yahoo", YAHOO_RATE_SYMBOLS),
+        ("chinabond", CHINABOND_TENORS),
+        ("fred", FRED_RATE_SERIES),
+        ("lpr", LPR_RATE_CODES),
+        primaries=3,
+        prefer_recent=True,
+    )
+
+    def __init__(self, transport: httpx.AsyncBaseTransport | None = None) -> None:
         self._mock = MockProvider()
-        self._stooq_cache: dict[str, tuple[float, dict[str, Any]]] = {}
-        self._fred_cache: dict[str, tuple[float, dict[str, Any]]] = {}
-        self._calendar_cache: tuple[float, list[Mapping[str, Any]]] | None = None
+        self._transport = transport
+        self._cache = AsyncTTLCache(
+            self.CACHE_POLICIES,
+            max_entries=settings.open_cache_max_entries,
+            max_bytes=settings.open_cache_max_bytes,
+        )
         self._forexfactory_backoff_until: float = 0.0
-        self._crypto_cache: tuple[float, dict[str, Any]] | None = None
-        self._tencent_cache: dict[str, tuple[float, str]] = {}
-        self._alphavantage_cache: dict[str, tuple[float, list[Mapping[str, Any]]]] = {}
-        self._chinabond_cache: tuple[float, dict[str, Any]] | None = None
-        self._fxstreet_cache: tuple[float, list[Mapping[str, Any]]] | None = None
-        self._goldprice_cache: tuple[float, dict[str, Any]] | None = None
+        self._latency: dict[str, LatencyTracker] = {}
+        self._resolver = SourceResolver(
+            {
+                "tencent": self._route_tencent,
+                "stooq": self._route_stooq,
+                "yahoo": self._route_yahoo,
+                "chinabond": self._route_chinabond,
+                "fred": self._route_fred,
+                "lpr": self._route_lpr,
+            }
+        )
+        self.crypto_stream: CryptoStreamConsumer | None = None
+        if settings.crypto_stream_enabled:
+            self.crypto_stream = CryptoStreamConsumer(
+                {
+                    symbol: self.COINGECKO_IDS[asset_id]
+                    for asset_id, symbol in self.BINANCE_STREAM_SYMBOLS.items()
+                },
+                settings.crypto_stream_url,
+                stale_after=settings.crypto_stream_stale_after,
+            )
 
-    async def fetch_indices(self) -> Mapping[str, Any]:
-        fallback = await self._mock.fetch_indices()
-        payload = dict(fallback)
-        cn_indices = await self._fetch_tencent_indices(self.TENCENT_A_INDEX_CODES)
-        payload.update(cn_indices)
-        global_indices = await self._fetch_tencent_indices(self.TENCENT_GLOBAL_INDICES)
-        payload.update(global_indices)
+    async def close(self) -> None:
+        """Stop the Binance crypto stream, if it was started."""
+        if self.crypto_stream is not None:
+            await self.crypto_stream.stop()
 
-        stooq_targets = {
-            symbol: mapping
-            for symbol, mapping in self.STOOQ_INDICES.items()
-            if mapping[0] not in payload
-        }
-        quotes = await self._fetch_stooq_quotes(stooq_targets)
-        for symbol, raw in quotes.items():
-            code, label = stooq_targets[symbol]
-            payload[code] = self._quote_to_snapshot(raw, code, label)
+    async def fetch_indices(self) -> Mapping[str, Any]:
+        payload = dict(await self._mock.fetch_indices())
+        payload.update(await self._resolver.resolve(self.INDEX_ROUTES))
         return payload
 
     async def fetch_fx(self) -> Mapping[str, Any]:
@@ -239,7 +312,7 @@ class OpenProvider(MarketDataProvider):
             return await self._mock.fetch_fx()
 
         fx_payload: dict[str, Any] = {}
-        timestamp = datetime.utcnow().isoformat()
+        timestamp = datetime.now(UTC).isoformat()
 
         for (base, quote), (code, label) in self.FX_PAIRS.items():
             price = self._resolve_cross(rates, base, quote)
@@ -258,15 +331,7 @@ class OpenProvider(MarketDataProvider):
         return fx_payload or await self._mock.fetch_fx()
 
     async def fetch_rates(self) -> Mapping[str, Any]:
-        payload: dict[str, Any] = {}
-        yahoo_payload = await self._fetch_yahoo_rates()
-        payload.update(yahoo_payload)
-        cgb_payload = await self._fetch_cngb_yields()
-        payload = self._merge_by_recency(payload, cgb_payload)
-        fred_payload = await self._fetch_fred_rates()
-        payload = self._merge_by_recency(payload, fred_payload)
-        lpr_payload = await self._fetch_lpr_rates()
-        payload = self._merge_by_recency(payload, lpr_payload)
+        payload = await self._resolver.resolve(self.RATE_ROUTES)
         if payload:
             return payload
         return await self._mock.fetch_rates()
@@ -306,13 +371,20 @@ class OpenProvider(MarketDataProvider):
         return self._filter_future_events(fallback) or fallback
 
     async def fetch_crypto(self) -> Mapping[str, Any]:
+        streamed: dict[str, Any] = {}
+        if self.crypto_stream is not None:
+            self.crypto_stream.start()
+            streamed = self.crypto_stream.snapshot()
+            if len(streamed) >= len(self.COINGECKO_IDS):
+                return streamed
+
         fallback = await self._mock.fetch_crypto()
         payload = await self._fetch_crypto_prices()
         if not payload:
-            return fallback
+            return {**fallback, **streamed}
 
         snapshot: dict[str, Any] = {}
-        timestamp = datetime.utcnow().isoformat()
+        timestamp = datetime.now(UTC).isoformat()
         for asset_id, raw in payload.items():
             mapping = self.COINGECKO_IDS.get(asset_id)
             if not mapping:
@@ -335,6 +407,7 @@ class OpenProvider(MarketDataProvider):
                 "prev_close": round(float(prev_close), 2),
                 "timestamp": timestamp,
             }
+        snapshot.update(streamed)
         return snapshot or fallback
 
     async def fetch_a_share_short_term(self) -> Mapping[str, Any]:
@@ -351,35 +424,50 @@ class OpenProvider(MarketDataProvider):
             value = entry.get("net_flow")
             return float(value) if isinstance(value, (int, float)) else 0.0
 
-        hot = sorted(boards, key=pct_value, reverse=True)[:6]
-        cold = sorted(boards, key=pct_value)[:6]
+        # Only the top six of each ranking are shown: heap selection, not full sorts.
+        hot = heapq.nlargest(6, boards, key=pct_value)
+        cold = heapq.nsmallest(6, boards, key=pct_value)
         capital_pool = [entry for entry in boards if entry.get("net_flow") is not None]
-        capital_pool.sort(key=flow_value, reverse=True)
-        capital = capital_pool[:6] if capital_pool else hot[:6]
+        capital = heapq.nlargest(6, capital_pool, key=flow_value) if capital_pool else hot
 
         return {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.now(UTC).isoformat(),
             "source": "eastmoney",
             "hot_boards": hot,
             "cold_boards": cold,
             "capital_boards": capital,
         }
 
+    async def fetch_a_share_universe(self) -> Mapping[str, Any]:
+        payload = await self._cache.get_or_load(
+            "eastmoney_universe",
+            "a_share",
+            self._download_a_share_universe,
+            is_negative=lambda data: not data,
+        )
+        return payload or {}
+
+    def cache_stats(self) -> dict[str, dict[str, Any]]:
+        """Expose per-namespace hit/miss/eviction counters for observability."""
+        return self._cache.stats()
+
     async def _fetch_crypto_prices(self) -> dict[str, Any]:
-        now = time.time()
-        if self._crypto_cache and now - self._crypto_cache[0] < self.CRYPTO_CACHE_TTL:
-            return self._crypto_cache[1]
+        payload = await self._cache.get_or_load(
+            "crypto",
+            "simple_price",
+            self._download_crypto_prices,
+            is_negative=lambda data: not isinstance(data, dict),
+        )
+        return payload if isinstance(payload, dict) else {}
 
+    async def _download_crypto_prices(self) -> dict[str, Any] | None:
         ids = ",".join(self.COINGECKO_IDS.keys())
         url = (
             f"{self.COINGECKO_ENDPOINT}"
             f"?ids={ids}&vs_currencies=usd&include_24hr_change=true"
         )
         payload = await self._http_get_json(url)
-        if isinstance(payload, dict):
-            self._crypto_cache = (now, payload)
-            return payload
-        return {}
+        return payload if isinstance(payload, dict) else None
 
     async def _fetch_board_rankings(self) -> list[dict[str, Any]]:
         params = {
@@ -394,19 +482,23 @@ class OpenProvider(MarketDataProvider):
             "fs": "m:90+t:2",
             "fields": self.EASTMONEY_BOARD_FIELDS,
         }
-        payload = await self._http_get_json(
-            self.EASTMONEY_BOARD_ENDPOINT,
-            params=params,
-            headers=self.EASTMONEY_HEADERS,
-            trust_env=False,
+        payload = await self._hedge(
+            {
+                "eastmoney_board": lambda: self._http_get_json(
+                    self.EASTMONEY_BOARD_ENDPOINT,
+                    params=params,
+                    headers=self.EASTMONEY_HEADERS,
+                    trust_env=False,
+                ),
+                "eastmoney_board_proxy": lambda: self._http_get_json(
+                    self._wrap_proxy(self.EASTMONEY_BOARD_ENDPOINT),
+                    params=params,
+                    headers=self.EASTMONEY_HEADERS,
+                    trust_env=False,
+                ),
+            },
+            is_valid=lambda data: isinstance(data, dict),
         )
-        if not isinstance(payload, dict):
-            payload = await self._http_get_json(
-                self._wrap_proxy(self.EASTMONEY_BOARD_ENDPOINT),
-                params=params,
-                headers=self.EASTMONEY_HEADERS,
-                trust_env=False,
-            )
         if not isinstance(payload, dict):
             return []
         data = payload.get("data") or {}
@@ -422,19 +514,144 @@ class OpenProvider(MarketDataProvider):
                 boards.append(entry)
         return boards
 
+    async def _download_a_share_universe(self) -> dict[str, Any] | None:
+        """Page through Eastmoney's full stock list concurrently into aligned columns.
+
+        Returns ``None`` (a failed, negatively cached load) unless every page arrived.
+        """
+        first = await self._fetch_universe_page(1)
+        if first is None:
+            return None
+        total, rows = first
+        pages = math.ceil(total / self.EASTMONEY_UNIVERSE_PAGE)
+        semaphore = asyncio.Semaphore(self.EASTMONEY_UNIVERSE_CONCURRENCY)
+
+        async def page(number: int) -> tuple[int, list[Mapping[str, Any]]] | None:
+            async with semaphore:
+                return await self._fetch_universe_page(number)
+
+        results = await asyncio.gather(*(page(number) for number in range(2, pages + 1)))
+        missing = sum(result is None for result in results)
+        if missing:
+            # A partial list would pass for the whole market in breadth and movers;
+            # fail the load so the previous table stays until the negative TTL lapses.
+            logger.warning("Eastmoney universe: %d of %d pages failed", missing, pages)
+            return None
+        for result in results:
+            rows.extend(result[1])
+
+        columns: dict[str, list[Any]] = {
+            "codes": [], "names": [], "last": [], "prev_close": [], "volume": [], "amount": [],
+            "turnover_rate": [], "market_cap": [], "industries": [],
+        }
+        seen: set[str] = set()
+        for row in rows:
+            code = self._eastmoney_stock_code(row.get("f12"), row.get("f13"))
+            if code is None or code in seen:
+                continue
+            seen.add(code)
+            volume = self._safe_float(row.get("f5"))
+            columns["codes"].append(code)
+            columns["names"].append(str(row.get("f14") or code))
+            columns["last"].append(self._safe_float(row.get("f2")))
+            columns["prev_close"].append(self._safe_float(row.get("f18")))
+            columns["volume"].append(volume * 100 if volume is not None else None)  # lots
+            columns["amount"].append(self._safe_float(row.get("f6")))
+            columns["turnover_rate"].append(self._safe_float(row.get("f8")))
+            columns["market_cap"].append(self._safe_float(row.get("f20")))
+            industry = row.get("f100")
+            columns["industries"].append(industry if industry and industry != "-" else None)
+        if not seen:
+            return None
+        return {"timestamp": datetime.now().isoformat(), "source": "eastmoney", **columns}
+
+    async def _fetch_universe_page(self, number: int) -> tuple[int, list[Mapping[str, Any]]] | None:
+        params = {
+            "pn": number,
+            "pz": self.EASTMONEY_UNIVERSE_PAGE,
+            "po": 0,
+            "np": 1,
+            "ut": "b2884a393a59ad64002292a3e90d46a5",
+            "fltt": 2,
+            "invt": 2,
+            "fid": "f12",
+            "fs": self.EASTMONEY_UNIVERSE_FS,
+            "fields": self.EASTMONEY_UNIVERSE_FIELDS,
+        }
+        payload = await self._http_get_json(
+            self.EASTMONEY_BOARD_ENDPOINT,
+            params=params,
+            headers=self.EASTMONEY_HEADERS,
+            trust_env=False,
+            endpoint="/clist/universe",
+        )
+        data = payload.get("data") if isinstance(payload, dict) else None
+        if not isinstance(data, dict) or not isinstance(data.get("diff"), list):
+            return None
+        rows = [row for row in data["diff"] if isinstance(row, Mapping)]
+        return int(data.get("total") or len(rows)), rows
+
+    @staticmethod
+    def _eastmoney_stock_code(symbol: Any, market: Any) -> str | None:
+        """``600000.SH``-style code from Eastmoney's symbol and market id (1 = SH)."""
+        if not symbol:
+            return None
+        symbol = str(symbol)
+        if market == 1:
+            return f"{symbol}.SH"
+        if symbol.startswith(("4", "8", "92")):
+            return f"{symbol}.BJ"
+        return f"{symbol}.SZ"
+
     async def _fetch_tencent_indices(self, mapping: Mapping[str, tuple[str, str]]) -> dict[str, Any]:
         raw_entries = await self._fetch_tencent_data(mapping.keys())
+        timestamps = tencent_parser.TimestampMemo()
         indices: dict[str, Any] = {}
         for symbol, (code, label) in mapping.items():
             raw = raw_entries.get(symbol)
             if not raw:
                 continue
-            tokens = raw.split("~")
-            snapshot = self._tencent_tokens_to_snapshot(tokens, code, label)
-            if snapshot:
-                indices[code] = snapshot
+            record = tencent_parser.parse_quote(raw, timestamps)
+            if record:
+                indices[code] = tencent_parser.to_snapshot(record, code, label)
         return indices
 
+    async def _route_tencent(self, routes: Mapping[str, Route]) -> dict[str, Any]:
+        return await self._fetch_tencent_indices(
+            {symbol: (route.code, route.label) for symbol, route in routes.items()}
+        )
+
+    async def _route_stooq(self, routes: Mapping[str, Route]) -> dict[str, Any]:
+        quotes = await self._fetch_stooq_quotes(
+            {symbol: (route.code, route.label) for symbol, route in routes.items()}
+        )
+        snapshots: dict[str, Any] = {}
+        for symbol, raw in quotes.items():
+            route = routes.get(symbol)
+            if route:
+                snapshots[route.code] = self._quote_to_snapshot(raw, route.code, route.label)
+        return snapshots
+
+    async def _route_yahoo(self, routes: Mapping[str, Route]) -> dict[str, Any]:
+        return await self._fetch_yahoo_quotes(
+            {symbol: (route.code, route.label, route.decimals) for symbol, route in routes.items()}
+        )
+
+    async def _route_chinabond(self, routes: Mapping[str, Route]) -> dict[str, Any]:
+        codes = {route.code for route in routes.values()}
+        yields = await self._fetch_cngb_yields()
+        return {code: entry for code, entry in yields.items() if code in codes}
+
+    async def _route_fred(self, routes: Mapping[str, Route]) -> dict[str, Any]:
+        return await self._fetch_fred_rates(
+            {symbol: (route.code, route.label) for symbol, route in routes.items()}
+        )
+
+    async def _route_lpr(self, routes: Mapping[str, Route]) -> dict[str, Any]:
+        codes = {route.code for route in routes.values()}
+        rates = await self._fetch_lpr_rates()
+        return {code: entry for code, entry in rates.items() if code in codes}
+
     async def _fetch_tencent_commodities(self) -> dict[str, Any]:
         raw_entries = await self._fetch_tencent_data(self.TENCENT_COMMODITIES.keys())
         payload: dict[str, Any] = {}
@@ -450,15 +667,7 @@ class OpenProvider(MarketDataProvider):
     async def _fetch_tencent_data(self, symbols: Sequence[str]) -> dict[str, str]:
         if not symbols:
             return {}
-        now = time.time()
-        cached: dict[str, str] = {}
-        pending: list[str] = []
-        for symbol in symbols:
-            entry = self._tencent_cache.get(symbol)
-            if entry and now - entry[0] < self.TENCENT_CACHE_TTL:
-                cached[symbol] = entry[1]
-                continue
-            pending.append(symbol)
+        cached, pending = self._cache.get_many("tencent", symbols)
 
         fetched: dict[str, str] = {}
         chunk_size = 15
@@ -468,56 +677,16 @@ class OpenProvider(MarketDataProvider):
             text = await self._http_get_text(
                 f"{self.TENCENT_QUOTE_ENDPOINT}{query}",
                 headers=self.TENCENT_HEADERS,
+                endpoint="/q",
             )
             if not text:
                 continue
             for symbol, value in self._parse_tencent_response(text).items():
                 fetched[symbol] = value
-                self._tencent_cache[symbol] = (now, value)
+                self._cache.set("tencent", symbol, value)
 
         return {**cached, **fetched}
 
-    def _tencent_tokens_to_snapshot(
-        self,
-        tokens: Sequence[str],
-        code: str,
-        label: str,
-        decimals: int = 2,
-    ) -> dict[str, Any] | None:
-        if len(tokens) < 5:
-            return None
-        last = self._safe_float(tokens[3])
-        prev_close = self._safe_float(tokens[4])
-        open_price = self._safe_float(tokens[5])
-        if last is None or prev_close is None:
-            return None
-        change = self._safe_float(tokens[31]) if len(tokens) > 31 else None
-        change_pct = self._safe_float(tokens[32]) if len(tokens) > 32 else None
-        high = self._safe_float(tokens[33]) if len(tokens) > 33 else None
-        low = self._safe_float(tokens[34]) if len(tokens) > 34 else None
-        timestamp_raw = tokens[30] if len(tokens) > 30 else None
-        timestamp = self._parse_tencent_timestamp(timestamp_raw)
-
-        if change is None:
-            change = last - prev_close
-        if change_pct is None and prev_close:
-            change_pct = (change / prev_close * 100) if prev_close else None
-
-        snapshot = {
-            "code": code,
-            "name": label,
-            "display_name": label,
-            "last": round(last, decimals),
-            "change": round(change or 0.0, decimals),
-            "change_pct": round(change_pct or 0.0, 2),
-            "open": round(open_price, decimals) if open_price is not None else None,
-            "high": round(high, decimals) if high is not None else None,
-            "low": round(low, decimals) if low is not None else None,
-            "prev_close": round(prev_close, decimals),
-            "timestamp": timestamp,
-        }
-        return snapshot
-
     def _parse_tencent_commodity_value(self, raw: str, code: str, label: str) -> dict[str, Any] | None:
         parts = raw.split(",")
         if len(parts) < 13:
@@ -551,29 +720,7 @@ class OpenProvider(MarketDataProvider):
         return snapshot
 
     def _parse_tencent_response(self, text: str) -> dict[str, str]:
-        entries: dict[str, str] = {}
-        for line in text.strip().split(";"):
-            line = line.strip()
-            if not line or "=" not in line:
-                continue
-            prefix, rest = line.split("=", 1)
-            symbol = prefix.split("v_")[-1]
-            value = rest.strip().strip(";").strip("\"")
-            if value:
-                entries[symbol] = value
-        return entries
-
-    def _parse_tencent_timestamp(self, raw: str | None) -> str:
-        if not raw:
-            return datetime.utcnow().isoformat()
-        raw = raw.strip()
-        for fmt in ("%Y%m%d%H%M%S", "%Y-%m-%d %H:%M:%S"):
-            try:
-                dt = datetime.strptime(raw, fmt)
-                return dt.isoformat()
-            except Exception:
-                continue
-        return datetime.utcnow().isoformat()
+        return tencent_parser.parse_response(text)
 
     def _parse_tencent_datetime(self, date_part: str | None, time_part: str | None) -> str:
         if date_part and time_part:
@@ -582,7 +729,7 @@ class OpenProvider(MarketDataProvider):
                 return dt.isoformat()
             except Exception:
                 pass
-        return datetime.utcnow().isoformat()
+        return datetime.now(UTC).isoformat()
 
     def _parse_board_row(self, row: Mapping[str, Any]) -> dict[str, Any] | None:
         code = row.get("f12")
@@ -611,10 +758,10 @@ class OpenProvider(MarketDataProvider):
             return None
 
     async def _fetch_goldprice_metals(self) -> dict[str, Any]:
-        now = time.time()
-        if self._goldprice_cache and now - self._goldprice_cache[0] < self.GOLDPRICE_CACHE_TTL:
-            return dict(self._goldprice_cache[1])
+        entries = await self._cache.get_or_load("goldprice", "USD", self._download_goldprice_metals)
+        return dict(entries or {})
 
+    async def _download_goldprice_metals(self) -> dict[str, Any]:
         payload = await self._http_get_json(self.GOLDPRICE_ENDPOINT, headers={"User-Agent": "Mozilla/5.0"})
         if not isinstance(payload, Mapping):
             return {}
@@ -622,7 +769,9 @@ class OpenProvider(MarketDataProvider):
         if not isinstance(items, list) or not items:
             return {}
         row = items[0]
-        timestamp = self._parse_goldprice_timestamp(payload.get("date")) or datetime.utcnow().isoformat()
+        timestamp = (
+            self._parse_goldprice_timestamp(payload.get("date")) or datetime.now(UTC).isoformat()
+        )
         entries: dict[str, Any] = {}
         xau_last = self._safe_float(row.get("xauPrice"))
         if xau_last is not None:
@@ -657,24 +806,19 @@ class OpenProvider(MarketDataProvider):
                 "source": "goldprice.org",
             }
 
-        if entries:
-            self._goldprice_cache = (now, entries)
         return entries
 
     async def _fetch_yahoo_commodities(self) -> dict[str, Any]:
         return await self._fetch_yahoo_quotes(self.YAHOO_COMMODITY_SYMBOLS)
 
-    async def _fetch_yahoo_rates(self) -> dict[str, Any]:
-        return await self._fetch_yahoo_quotes(self.YAHOO_RATE_SYMBOLS)
-
     async def _fetch_yahoo_quotes(self, mapping: Mapping[str, tuple[str, str, int]]) -> dict[str, Any]:
         payload: dict[str, Any] = {}
-        for symbol, (code, label, decimals) in mapping.items():
-            quote = await self._get_yahoo_chart(symbol)
-            if not quote:
+        charts = await asyncio.gather(*(self._get_yahoo_chart(symbol) for symbol in mapping))
+        for (code, label, decimals), chart in zip(mapping.values(), charts, strict=True):
+            if not chart:
                 continue
-            last = quote.get("last")
-            prev_close = quote.get("prev_close")
+            last = chart.get("last")
+            prev_close = chart.get("prev_close")
             if last is None or prev_close is None:
                 continue
             change = last - prev_close
@@ -687,11 +831,11 @@ class OpenProvider(MarketDataProvider):
                 "change": round(change, decimals),
                 "change_pct": round(change_pct, 2),
                 "prev_close": round(prev_close, decimals),
-                "open": round(quote["open"], decimals) if quote.get("open") is not None else None,
-                "high": round(quote["high"], decimals) if quote.get("high") is not None else None,
-                "low": round(quote["low"], decimals) if quote.get("low") is not None else None,
-                "volume": quote.get("volume"),
-                "timestamp": quote.get("timestamp") or datetime.utcnow().isoformat(),
+                "open": round(chart["open"], decimals) if chart.get("open") is not None else None,
+                "high": round(chart["high"], decimals) if chart.get("high") is not None else None,
+                "low": round(chart["low"], decimals) if chart.get("low") is not None else None,
+                "volume": chart.get("volume"),
+                "timestamp": chart.get("timestamp") or datetime.now(UTC).isoformat(),
                 "source": "yahoo_chart",
             }
         return payload
@@ -699,7 +843,12 @@ class OpenProvider(MarketDataProvider):
     async def _get_yahoo_chart(self, symbol: str) -> dict[str, Any] | None:
         url = f"https://query1.finance.yahoo.com/v8/finance/chart/{quote(symbol)}"
         params = {"range": "1d", "interval": "5m"}
-        data = await self._http_get_json(url, params=params, headers={"User-Agent": "Mozilla/5.0"})
+        data = await self._http_get_json(
+            url,
+            params=params,
+            headers={"User-Agent": "Mozilla/5.0"},
+            endpoint="/v8/finance/chart",
+        )
         if not isinstance(data, Mapping):
             return None
         result = (data.get("chart") or {}).get("result")
@@ -713,7 +862,9 @@ class OpenProvider(MarketDataProvider):
         low = meta.get("regularMarketDayLow")
         volume = meta.get("regularMarketVolume")
         ts_raw = meta.get("regularMarketTime")
-        timestamp = datetime.utcfromtimestamp(ts_raw).isoformat() if ts_raw else datetime.utcnow().isoformat()
+        timestamp = (
+            datetime.fromtimestamp(ts_raw, UTC) if ts_raw else datetime.now(UTC)
+        ).isoformat()
         return {
             "last": self._safe_float(last),
             "prev_close": self._safe_float(prev_close),
@@ -733,32 +884,24 @@ class OpenProvider(MarketDataProvider):
         return {}
 
     async def _fetch_cngb_yields(self) -> dict[str, Any]:
-        now = time.time()
-        if self._chinabond_cache and now - self._chinabond_cache[0] < self.CHINABOND_CACHE_TTL:
-            return dict(self._chinabond_cache[1])
+        entries = await self._cache.get_or_load("chinabond", "yields", self._download_cngb_yields)
+        return dict(entries or {})
 
+    async def _download_cngb_yields(self) -> dict[str, Any]:
         text = await self._http_get_text(
             self._wrap_proxy(self.CHINABOND_YIELD_URL),
             params=self.CHINABOND_PARAMS,
             headers={"User-Agent": "Mozilla/5.0"},
             trust_env=False,
         )
-        entries = self._parse_chinabond_table(text)
-        if entries:
-            self._chinabond_cache = (now, entries)
-        return dict(entries)
+        return self._parse_chinabond_table(text)
 
     def _parse_chinabond_table(self, text: str | None) -> dict[str, Any]:
         if not text:
             return {}
 
         lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
-        tenor_map = {
-            "1Y": self.CHINA_GOVERNMENT_CODES[1],
-            "3Y": self.CHINA_GOVERNMENT_CODES[3],
-            "5Y": self.CHINA_GOVERNMENT_CODES[5],
-            "10Y": self.CHINA_GOVERNMENT_CODES[10],
-        }
+        tenor_map = self.CHINABOND_TENORS
         current_date: str | None = None
         entries: dict[str, Any] = {}
 
@@ -793,7 +936,7 @@ class OpenProvider(MarketDataProvider):
 
             change_val = (change_bp or 0.0) / 100
             timestamp = (
-                f"{current_date}T00:00:00" if current_date else datetime.utcnow().isoformat()
+                f"{current_date}T00:00:00" if current_date else datetime.now(UTC).isoformat()
             )
             entries[code] = {
                 "code": code,
@@ -826,27 +969,18 @@ class OpenProvider(MarketDataProvider):
         if not mapping:
             return {}
 
-        now = time.time()
-        cached: dict[str, dict[str, Any]] = {}
-        pending: list[str] = []
-        for symbol in mapping:
-            entry = self._stooq_cache.get(symbol)
-            if entry and now - entry[0] < self.STOOQ_CACHE_TTL:
-                data = entry[1]
-                if data:
-                    cached[symbol] = data
-                continue
-            pending.append(symbol)
+        found, pending = self._cache.get_many("stooq", mapping)
+        cached = {symbol: data for symbol, data in found.items() if data}
 
         fetched: dict[str, dict[str, Any]] = {}
         if pending:
             batch = await self._fetch_stooq_batch(pending)
             for sym, data in batch.items():
                 fetched[sym] = data
-                self._stooq_cache[sym] = (now, data)
+                self._cache.set("stooq", sym, data)
             missing = {sym for sym in pending if sym not in batch}
             for sym in missing:
-                self._stooq_cache[sym] = (now, {})
+                self._cache.set_negative("stooq", sym, {})
 
         return {**cached, **fetched}
 
@@ -860,8 +994,7 @@ class OpenProvider(MarketDataProvider):
             f"&f={self.STOOQ_FIELDS}&e=csv&i=d"
         )
         try:
-            async with httpx.AsyncClient(timeout=self.REQUEST_TIMEOUT) as client:
-                resp = await client.get(url)
+            resp = await self._get(url)
             resp.raise_for_status()
         except Exception as exc:
             logger.warning("Batch Stooq request failed: %s", exc)
@@ -891,21 +1024,67 @@ class OpenProvider(MarketDataProvider):
             }
         return quotes
 
+    def _client(self, **kwargs: Any) -> httpx.AsyncClient:
+        """Create a request client; an injected transport (record/replay) is shared by all."""
+        return httpx.AsyncClient(timeout=self.REQUEST_TIMEOUT, transport=self._transport, **kwargs)
+
+    async def _get(
+        self,
+        url: str,
+        params: Mapping[str, Any] | None = None,
+        endpoint: str | None = None,
+        attempt: int = 1,
+        **client_kwargs: Any,
+    ) -> httpx.Response:
+        """GET through a fresh client, recording latency/status/bytes per upstream."""
+        target = httpx.URL(url)
+        endpoint = endpoint or target.path.rstrip("/") or "/"
+        started = time.perf_counter()
+        try:
+            async with self._client(**client_kwargs) as client:
+                resp = await client.get(url, params=params)
+        except asyncio.CancelledError:
+            upstream_telemetry.record(
+                "open", target.host, endpoint, "cancelled", time.perf_counter() - started,
+                attempt=attempt,
+            )
+            raise
+        except Exception as exc:
+            status = "timeout" if isinstance(exc, httpx.TimeoutException) else "error"
+            upstream_telemetry.record(
+                "open", target.host, endpoint, status, time.perf_counter() - started,
+                attempt=attempt,
+            )
+            raise
+        upstream_telemetry.record(
+            "open",
+            target.host,
+            endpoint,
+            resp.status_code,
+            time.perf_counter() - started,
+            nbytes=len(resp.content),
+            attempt=attempt,
+        )
+        return resp
+
     async def _http_get_json(
         self,
         url: str,
         params: Mapping[str, Any] | None = None,
         headers: Mapping[str, str] | None = None,
         trust_env: bool = True,
+        endpoint: str | None = None,
     ) -> dict[str, Any] | None:
         for attempt in range(1, self.MAX_RETRIES + 1):
             try:
-                async with httpx.AsyncClient(
-                    timeout=self.REQUEST_TIMEOUT,
+                resp = await self._get(
+                    url,
+                    params=params,
+                    endpoint=endpoint,
+                    attempt=attempt,
                     headers=headers,
                     trust_env=trust_env,
-                ) as client:
-                    resp = await client.get(url, params=params)
+                )
                 resp.raise_for_status()
                 try:
                     return resp.json()
@@ -937,16 +1116,19 @@ class OpenProvider(MarketDataProvider):
         headers: Mapping[str, str] | None = None,
         encoding: str | None = None,
         trust_env: bool = True,
+        endpoint: str | None = None,
     ) -> str | None:
         for attempt in range(1, self.MAX_RETRIES + 1):
             try:
-                async with httpx.AsyncClient(
-                    timeout=self.REQUEST_TIMEOUT,
+                resp = await self._get(
+                    url,
+                    params=params,
+                    endpoint=endpoint,
+                    attempt=attempt,
                     headers=headers,
                     max_redirects=2,
                     trust_env=trust_env,
-                ) as client:
-                    resp = await client.get(url, params=params)
+                )
                 resp.raise_for_status()
                 if encoding:
                     resp.encoding = encoding
@@ -1004,7 +1186,7 @@ class OpenProvider(MarketDataProvider):
                 return dt.isoformat()
             except Exception:
                 pass
-        return datetime.utcnow().isoformat()
+        return datetime.now(UTC).isoformat()
 
     def _safe_float(self, value: Any) -> float | None:
         if value in (None, "", "N/D"):
@@ -1035,17 +1217,16 @@ class OpenProvider(MarketDataProvider):
         except Exception:
             return None
 
-    async def _fetch_fred_rates(self) -> dict[str, Any]:
-        tasks = {
-            series_id: asyncio.create_task(self._get_fred_series(series_id))
-            for series_id in self.FRED_RATE_SERIES
-        }
+    async def _fetch_fred_rates(
+        self, mapping: Mapping[str, tuple[str, str]] | None = None
+    ) -> dict[str, Any]:
+        mapping = mapping or self.FRED_RATE_SERIES
+        series = await self._get_fred_series()
         rates: dict[str, Any] = {}
-        for series_id, task in tasks.items():
-            data = await task
+        for series_id, (code, label) in mapping.items():
+            data = series.get(series_id)
             if not data:
                 continue
-            code, label = self.FRED_RATE_SERIES[series_id]
             latest = data["value"]
             prev = data.get("previous")
             change = (latest - prev) if prev is not None else 0.0
@@ -1055,57 +1236,71 @@ class OpenProvider(MarketDataProvider):
                 "display_name": label,
                 "last": round(latest, 4),
                 "change": round(change, 4),
-                "timestamp": data.get("date") or datetime.utcnow().isoformat(),
+                "timestamp": data.get("date") or datetime.now(UTC).isoformat(),
             }
         return rates
 
-    async def _get_fred_series(self, series_id: str) -> dict[str, Any] | None:
-        now = time.time()
-        cached = self._fred_cache.get(series_id)
-        if cached and now - cached[0] < self.FRED_CACHE_TTL:
-            return cached[1]
+    async def _get_fred_series(self) -> dict[str, dict[str, Any]]:
+        """Latest values of every :attr:`FRED_SERIES_IDS` series, shared by rates and commodities.
 
-        text = await self._download_fred_series(series_id)
-        if not text:
-            return None
+        One multi-id download covers them all; concurrent callers wait on the same load
+        and each loader picks its own columns out of the cached result.
+        """
+        payload = await self._cache.get_or_load(
+            "fred", "series", self._load_fred_series, is_negative=lambda data: not data
+        )
+        return payload or {}
+
+    async def _load_fred_series(self) -> dict[str, dict[str, Any]] | None:
+        text = await self._download_fred_series(self.FRED_SERIES_IDS)
+        return self._parse_fred_csv(text) if text else None
 
+    def _parse_fred_csv(self, text: str) -> dict[str, dict[str, Any]]:
+        """Parse a (possibly multi-id) fredgraph CSV into latest/previous values per series."""
         reader = csv.reader(StringIO(text))
-        next(reader, None)
-        samples: list[tuple[str, float]] = []
+        header = next(reader, None)
+        if not header or len(header) < 2:
+            return {}
+        columns = [name.strip() for name in header[1:]]
+        latest: list[tuple[str, float] | None] = [None] * len(columns)
+        previous: list[float | None] = [None] * len(columns)
         for row in reader:
-            if len(row) < 2:
+            if not row:
                 continue
-            value = self._safe_float(row[1])
-            if value is None:
+            observed = row[0]
+            for idx, raw in enumerate(row[1 : len(columns) + 1]):
+                value = self._safe_float(raw)
+                if value is None:
+                    continue
+                current = latest[idx]
+                if current is not None:
+                    previous[idx] = current[1]
+                latest[idx] = (observed, value)
+
+        series: dict[str, dict[str, Any]] = {}
+        for idx, series_id in enumerate(columns):
+            current = latest[idx]
+            if current is None:
                 continue
-            samples.append((row[0], float(value)))
-
-        if not samples:
-            return None
-
-        latest = samples[-1]
-        prev = samples[-2] if len(samples) > 1 else None
-        payload = {
-            "date": latest[0],
-            "value": latest[1],
-            "previous": prev[1] if prev else None,
-        }
-        self._fred_cache[series_id] = (now, payload)
-        return payload
+            series[series_id] = {
+                "date": current[0],
+                "value": current[1],
+                "previous": previous[idx],
+            }
+        return series
 
-    async def _download_fred_series(self, series_id: str) -> str | None:
+    async def _download_fred_series(self, series_ids: Sequence[str]) -> str | None:
         start = (datetime.utcnow() - timedelta(days=self.FRED_LOOKBACK_DAYS)).strftime("%Y-%m-%d")
-        params = {"id": series_id, "cosd": start}
+        params = {"id": ",".join(series_ids), "cosd": ",".join([start] * len(series_ids))}
         for attempt in range(1, self.MAX_RETRIES + 1):
             try:
-                async with httpx.AsyncClient(timeout=self.REQUEST_TIMEOUT) as client:
-                    resp = await client.get(self.FRED_ENDPOINT, params=params)
+                resp = await self._get(self.FRED_ENDPOINT, params=params, attempt=attempt)
                 resp.raise_for_status()
                 return resp.text
             except Exception as exc:
                 logger.warning(
                     "FRED request for %s failed (attempt %s/%s): %s",
-                    series_id,
+                    ",".join(series_ids),
                     attempt,
                     self.MAX_RETRIES,
                     exc,
@@ -1114,29 +1309,32 @@ class OpenProvider(MarketDataProvider):
         return None
 
     async def _fetch_calendar_feed(self) -> list[Mapping[str, Any]]:
-        now = time.time()
-        if self._calendar_cache and now - self._calendar_cache[0] < self.CALENDAR_CACHE_TTL:
-            cached = self._filter_future_events(self._calendar_cache[1])
-            if cached:
+        cached = self._cache.get("calendar", "events")
+        if cached is not MISS:
+            cached = self._filter_future_events(cached)
+            if cached and not self._release_watch_active(cached):
                 return cached
 
-        events = await self._fetch_nasdaq_calendar()
-        if not events:
-            events = await self._fetch_fxstreet_calendar()
-        if not events:
-            events = await self._fetch_forexfactory_calendar()
-        if not events:
-            events = await self._fetch_tradingeconomics_calendar()
+        events = await self._hedge(
+            {
+                "nasdaq_calendar": self._fetch_nasdaq_calendar,
+                "fxstreet_calendar": self._fetch_fxstreet_calendar,
+                "forexfactory_calendar": self._fetch_forexfactory_calendar,
+                "tradingeconomics_calendar": self._fetch_tradingeconomics_calendar,
+            },
+            is_valid=lambda items: bool(self._filter_future_events(items)),
+        )
 
         events = self._filter_future_events(events)
         if events:
-            self._calendar_cache = (now, events)
+            self._cache.set("calendar", "events", events)
             return events
 
-        if self._calendar_cache:
-            cached = self._filter_future_events(self._calendar_cache[1])
-            if cached:
-                return cached
+        stale = self._cache.get("calendar", "events", allow_stale=True)
+        if stale is not MISS:
+            stale = self._filter_future_events(stale)
+            if stale:
+                return stale
         return []
 
     def _filter_future_events(self, events: list[Mapping[str, Any]] | None) -> list[Mapping[str, Any]]:
@@ -1177,8 +1375,7 @@ class OpenProvider(MarketDataProvider):
             return []
 
         try:
-            async with httpx.AsyncClient(timeout=self.REQUEST_TIMEOUT) as client:
-                resp = await client.get(self.CALENDAR_ENDPOINT)
+            resp = await self._get(self.CALENDAR_ENDPOINT)
         except Exception as exc:
             logger.warning("ForexFactory calendar fetch failed: %s", exc)
             return []
@@ -1270,15 +1467,27 @@ class OpenProvider(MarketDataProvider):
         return events
 
     async def _fetch_fxstreet_calendar(self) -> list[Mapping[str, Any]]:
-        now = time.time()
-        if self._fxstreet_cache and now - self._fxstreet_cache[0] < self.FXSTREET_CACHE_TTL:
-            return list(self._fxstreet_cache[1])
-
-        text = await self._http_get_text(self.FXSTREET_CALENDAR_URL, trust_env=False)
-        if not text:
-            text = await self._http_get_text(self._wrap_proxy(self.FXSTREET_CALENDAR_URL), trust_env=False)
+        events = await self._cache.get_or_load(
+            "fxstreet",
+            "events",
+            self._download_fxstreet_calendar,
+            is_negative=lambda items: items is None,
+        )
+        return list(events or [])
+
+    async def _download_fxstreet_calendar(self) -> list[Mapping[str, Any]] | None:
+        text = await self._hedge(
+            {
+                "fxstreet_page": lambda: self._http_get_text(
+                    self.FXSTREET_CALENDAR_URL, trust_env=False
+                ),
+                "fxstreet_page_proxy": lambda: self._http_get_text(
+                    self._wrap_proxy(self.FXSTREET_CALENDAR_URL), trust_env=False
+                ),
+            },
+        )
         if not text:
-            return []
+            return None
 
         events: list[Mapping[str, Any]] = []
         current_date: str | None = None
@@ -1319,43 +1528,84 @@ class OpenProvider(MarketDataProvider):
             if len(events) >= self.FXSTREET_MAX_EVENTS:
                 break
 
-        self._fxstreet_cache = (now, events)
         return events
 
     async def _fetch_nasdaq_calendar(self) -> list[Mapping[str, Any]]:
+        """Assemble the lookahead window from per-day cache entries, fetching only stale days."""
         today = datetime.utcnow().date()
-        tasks = []
-        for offset in range(self.NASDAQ_LOOKAHEAD_DAYS):
-            date_obj = today + timedelta(days=offset)
-            params = {"date": date_obj.isoformat()}
-            tasks.append(
-                asyncio.create_task(
-                    self._http_get_json(
-                        self.NASDAQ_CALENDAR_ENDPOINT,
-                        params=params,
-                        headers=self.NASDAQ_HEADERS,
-                    )
-                )
-            )
+        days = [today + timedelta(days=offset) for offset in range(self.NASDAQ_LOOKAHEAD_DAYS)]
+        events_by_day: dict[date, list[Mapping[str, Any]]] = {}
+        pending: list[date] = []
+        for day in days:
+            cached = self._cache.get("nasdaq_day", day.isoformat())
+            if cached is MISS:
+                pending.append(day)
+                continue
+            fetched_at, day_events = cached
+            if (
+                time.monotonic() - fetched_at >= self.RELEASE_WATCH_TTL
+                and self._release_watch_active(day_events)
+            ):
+                pending.append(day)
+            events_by_day[day] = day_events
+
+        downloads = await asyncio.gather(*(self._download_nasdaq_day(day) for day in pending))
+        for day, day_events in zip(pending, downloads, strict=True):
+            key = day.isoformat()
+            if day_events is None:
+                if day not in events_by_day:
+                    stale = self._cache.get("nasdaq_day", key, allow_stale=True)
+                    if stale is not MISS:
+                        events_by_day[day] = stale[1]
+                    else:
+                        self._cache.set_negative("nasdaq_day", key, (time.monotonic(), []))
+                continue
+            ttl = self.NASDAQ_NEAR_DAY_TTL if (day - today).days < self.NASDAQ_NEAR_DAYS else None
+            self._cache.set("nasdaq_day", key, (time.monotonic(), day_events), ttl=ttl)
+            events_by_day[day] = day_events
 
+        return [event for day in days for event in events_by_day.get(day, [])]
+
+    async def _download_nasdaq_day(self, day: date) -> list[Mapping[str, Any]] | None:
+        payload = await self._http_get_json(
+            self.NASDAQ_CALENDAR_ENDPOINT,
+            params={"date": day.isoformat()},
+            headers=self.NASDAQ_HEADERS,
+        )
+        if not isinstance(payload, Mapping):
+            return None
+        rows = (payload.get("data") or {}).get("rows")
+        if not isinstance(rows, list):
+            return []
         events: list[Mapping[str, Any]] = []
-        for offset, task in enumerate(tasks):
-            payload = await task
-            if not isinstance(payload, Mapping):
-                continue
-            data = payload.get("data") or {}
-            rows = data.get("rows")
-            if not isinstance(rows, list):
+        for row in rows:
+            if not isinstance(row, Mapping):
                 continue
-            event_date = today + timedelta(days=offset)
-            for row in rows:
-                if not isinstance(row, Mapping):
-                    continue
-                parsed = self._parse_nasdaq_event(event_date, row)
-                if parsed:
-                    events.append(parsed)
+            parsed = self._parse_nasdaq_event(day, row)
+            if parsed:
+                events.append(parsed)
         return events
 
+    def _release_watch_active(
+        self, events: Sequence[Mapping[str, Any]], now: datetime | None = None
+    ) -> bool:
+        """True while a high-importance event is due or just released without an actual."""
+        now = now or datetime.now(timezone.utc)
+        window_start = now - timedelta(seconds=self.RELEASE_WATCH_AFTER)
+        window_end = now + timedelta(seconds=self.RELEASE_WATCH_BEFORE)
+        for event in events:
+            if event.get("actual"):
+                continue
+            if str(event.get("importance") or "").lower() not in self.HIGH_IMPORTANCE_LEVELS:
+                continue
+            dt = self._parse_event_datetime(event.get("datetime"))
+            if not dt:
+                continue
+            dt = dt.astimezone(timezone.utc) if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+            if window_start <= dt <= window_end:
+                return True
+        return False
+
     def _parse_nasdaq_event(self, event_date: datetime.date, row: Mapping[str, Any]) -> Mapping[str, Any] | None:
         time_str = str(row.get("gmt") or "").strip()
         timestamp: datetime | None = None
@@ -1408,6 +1658,38 @@ class OpenProvider(MarketDataProvider):
             return None
         return datetime.combine(base_date.date(), time_part, tzinfo=timezone.utc)
 
+    async def _hedge(
+        self,
+        sources: Mapping[str, Callable[[], Awaitable[Any]]],
+        is_valid: Callable[[Any], bool] = bool,
+    ) -> Any:
+        """Run a priority-ordered fallback chain as a hedged race bounded by one timeout.
+
+        Each fallback is released once its predecessor exceeds that source's observed
+        latency percentile, and the first valid answer cancels the rest.
+        """
+        labels = list(sources)
+        trackers = [self._latency_tracker(label) for label in labels]
+        attempts = [
+            timed(tracker, sources[label], is_valid)
+            for label, tracker in zip(labels, trackers, strict=True)
+        ]
+        delays = [tracker.threshold(ceiling=self.REQUEST_TIMEOUT) for tracker in trackers[:-1]]
+        return await hedged(
+            attempts,
+            delays=delays,
+            timeout=self.REQUEST_TIMEOUT,
+            is_valid=is_valid,
+            labels=labels,
+        )
+
+    def _latency_tracker(self, label: str) -> LatencyTracker:
+        tracker = self._latency.get(label)
+        if tracker is None:
+            tracker = LatencyTracker(percentile=self.HEDGE_PERCENTILE, default=self.HEDGE_DEFAULT_DELAY)
+            self._latency[label] = tracker
+        return tracker
+
     def _wrap_proxy(self, url: str) -> str:
         return f"https://r.jina.ai/{url}"
 
@@ -1429,35 +1711,6 @@ class OpenProvider(MarketDataProvider):
                 return None
         return None
 
-    def _merge_by_recency(
-        self,
-        base: Mapping[str, Any],
-        incoming: Mapping[str, Any],
-    ) -> dict[str, Any]:
-        merged = dict(base)
-        for code, snapshot in incoming.items():
-            if not isinstance(snapshot, Mapping):
-                continue
-            existing = merged.get(code)
-            if not existing:
-                merged[code] = snapshot
-                continue
-            existing_ts = self._parse_iso_timestamp(existing.get("timestamp"))
-            incoming_ts = self._parse_iso_timestamp(snapshot.get("timestamp"))
-            if incoming_ts and (not existing_ts or incoming_ts > existing_ts):
-                merged[code] = snapshot
-        return merged
-
-    def _parse_iso_timestamp(self, value: Any) -> datetime | None:
-        if isinstance(value, datetime):
-            return value
-        if isinstance(value, str):
-            try:
-                return datetime.fromisoformat(value)
-            except Exception:
-                return None
-        return None
-
     def _parse_goldprice_timestamp(self, raw: Any) -> str | None:
         if not isinstance(raw, str) or not raw:
             return None
@@ -1470,16 +1723,12 @@ class OpenProvider(MarketDataProvider):
             return None
 
     async def _fetch_fred_commodities(self) -> dict[str, Any]:
-        tasks = {
-            series_id: asyncio.create_task(self._get_fred_series(series_id))
-            for series_id in self.FRED_COMMODITY_SERIES
-        }
+        series = await self._get_fred_series()
         payload: dict[str, Any] = {}
-        for series_id, task in tasks.items():
-            data = await task
+        for series_id, (code, label, decimals) in self.FRED_COMMODITY_SERIES.items():
+            data = series.get(series_id)
             if not data:
                 continue
-            code, label, decimals = self.FRED_COMMODITY_SERIES[series_id]
             latest = data["value"]
             prev = data.get("previous")
             change = (latest - prev) if prev is not None else 0.0
@@ -1490,7 +1739,7 @@ class OpenProvider(MarketDataProvider):
                 "last": round(latest, decimals),
                 "change": round(change, decimals),
                 "change_pct": round((change / prev * 100) if prev else 0.0, 2),
-                "timestamp": data.get("date") or datetime.utcnow().isoformat(),
+                "timestamp": data.get("date") or datetime.now(UTC).isoformat(),
                 "source": "fred",
             }
         return payload
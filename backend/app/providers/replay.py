@@ -0,0 +1,185 @@
+"""Replay a recorded tick-archive session as a live provider.
+
+``ReplayProvider`` loads one day of :class:`~app.services.tick_archive.TickArchive`
+files and answers every ``fetch_*`` call with the quotes in effect at the
+replay clock's current time, so the normal snapshot, history, bar and
+websocket pipeline runs on recorded update patterns without any network.
+
+The clock is a pure function of elapsed monotonic time, ``speed`` and the
+session bounds (wrapping when ``loop`` is set), which makes runs repeatable;
+pass a fake ``monotonic`` to step it by hand. Each wrap starts a new
+:meth:`ReplayClock.lap`, on which the data manager drops the previous pass's
+history, since the replayed quotes go back in time.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import time
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Callable, Mapping
+
+import numpy as np
+
+from ..services.tick_archive import COLUMNS, TickArchive
+from .base import MarketDataProvider
+
+logger = logging.getLogger(__name__)
+
+CATEGORIES = ("indices", "fx", "rates", "commodities", "us_stocks", "crypto")
+
+
+class ReplayClock:
+    """Session time advancing ``speed`` times faster than the monotonic clock."""
+
+    def __init__(
+        self,
+        start: float,
+        end: float,
+        speed: float = 1.0,
+        loop: bool = True,
+        monotonic: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.start = start
+        self.end = max(end, start)
+        self.speed = speed
+        self.loop = loop
+        self._monotonic = monotonic
+        self._origin = monotonic()
+
+    def _elapsed(self) -> tuple[float, float]:
+        """Session seconds elapsed, and the length of one pass when looping (else 0)."""
+        elapsed = (self._monotonic() - self._origin) * self.speed
+        span = self.end - self.start
+        # The extra second holds the final quotes briefly before the session restarts.
+        return elapsed, span + 1.0 if self.loop and span > 0 else 0.0
+
+    def now(self) -> float:
+        elapsed, period = self._elapsed()
+        if period:
+            return self.start + elapsed % period
+        return min(self.start + elapsed, self.end)
+
+    def lap(self) -> int:
+        """Number of times the session has wrapped around so far."""
+        elapsed, period = self._elapsed()
+        return int(elapsed // period) if period else 0
+
+
+class _Track:
+    """One category's recorded rows plus the replay cursor over them."""
+
+    def __init__(self, data: Mapping[str, Any]) -> None:
+        self.ts = np.array(data["ts"], dtype=np.float64)
+        self.quote_ts = np.array(data["quote_ts"], dtype=np.float64)
+        self.code = np.array(data["code"], dtype=np.intp)
+        self.columns = {column: np.array(data[column], dtype=np.float64) for column in COLUMNS}
+        self.codes: list[str] = list(data["codes"])
+        self.labels = list(zip(data["names"], data["display_names"], strict=True))
+        self.cursor = 0
+        self.records: dict[str, dict[str, Any]] = {}
+
+    def advance(self, now: float) -> dict[str, dict[str, Any]]:
+        """Apply every row stamped at or before ``now`` and return the current quotes."""
+        upto = int(np.searchsorted(self.ts, now, side="right"))
+        if upto < self.cursor:  # clock wrapped: start the session over
+            self.cursor = 0
+            self.records = {}
+        if upto > self.cursor:
+            ids = self.code[self.cursor:upto][::-1]
+            _, first = np.unique(ids, return_index=True)
+            for row in (upto - 1 - first).tolist():
+                record: dict[str, Any] = {
+                    column: float(values[row])
+                    for column, values in self.columns.items()
+                    if not math.isnan(values[row])
+                }
+                record["timestamp"] = datetime.fromtimestamp(float(self.quote_ts[row])).isoformat()
+                index = int(self.code[row])
+                code = self.codes[index]
+                name, display_name = self.labels[index]
+                self.records[code] = {
+                    "code": code, "name": name, "display_name": display_name, **record
+                }
+            self.cursor = upto
+        return {code: dict(record) for code, record in self.records.items()}
+
+
+class ReplayProvider(MarketDataProvider):
+    """Serves a recorded session from a tick archive at ``speed``x real time."""
+
+    def __init__(
+        self,
+        root: str | Path,
+        day: date | None = None,
+        speed: float = 1.0,
+        loop: bool = True,
+        monotonic: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.archive = TickArchive(root)
+        self.day = day or self._latest_day()
+        self.tracks: dict[str, _Track] = {}
+        if self.day is not None:
+            for category in CATEGORIES:
+                track = _Track(self.archive.read(category, self.day))
+                if len(track.ts):
+                    self.tracks[category] = track
+        if not self.tracks:
+            logger.warning(f"No recorded ticks to replay under {self.archive.root}")
+        starts = [float(track.ts[0]) for track in self.tracks.values()]
+        ends = [float(track.ts[-1]) for track in self.tracks.values()]
+        start = min(starts, default=time.time())
+        self.clock = ReplayClock(start, max(ends, default=start), speed, loop, monotonic)
+
+    def _latest_day(self) -> date | None:
+        if not self.archive.root.exists():
+            return None
+        days = []
+        for path in self.archive.root.iterdir():
+            try:
+                days.append(date.fromisoformat(path.name))
+            except ValueError:
+                continue
+        return max(days, default=None)
+
+    def _quotes(self, category: str) -> Mapping[str, Any]:
+        track = self.tracks.get(category)
+        return track.advance(self.clock.now()) if track else {}
+
+    async def fetch_indices(self) -> Mapping[str, Any]:
+        return self._quotes("indices")
+
+    async def fetch_fx(self) -> Mapping[str, Any]:
+        return self._quotes("fx")
+
+    async def fetch_rates(self) -> Mapping[str, Any]:
+        return self._quotes("rates")
+
+    async def fetch_commodities(self) -> Mapping[str, Any]:
+        return self._quotes("commodities")
+
+    async def fetch_us_stocks(self) -> Mapping[str, Any]:
+        return self._quotes("us_stocks")
+
+    async def fetch_crypto(self) -> Mapping[str, Any]:
+        return self._quotes("crypto")
+
+    async def fetch_calendar(self) -> list[Mapping[str, Any]]:
+        return []
+
+    async def fetch_a_share_short_term(self) -> Mapping[str, Any]:
+        return {}
+
+    def replay_status(self) -> dict[str, Any]:
+        now = self.clock.now()
+        return {
+            "day": self.day.isoformat() if self.day else None,
+            "speed": self.clock.speed,
+            "loop": self.clock.loop,
+            "clock": datetime.fromtimestamp(now).isoformat(),
+            "lap": self.clock.lap(),
+            "progress": (now - self.clock.start) / max(self.clock.end - self.clock.start, 1e-9),
+            "categories": {name: len(track.ts) for name, track in self.tracks.items()},
+        }
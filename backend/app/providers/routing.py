@@ -0,0 +1,196 @@
+"""Declarative per-instrument source routing with tiered parallel resolution.
+
+An :class:`InstrumentRegistry` lists, for every canonical code, the ordered
+upstream routes able to quote it. :class:`SourceResolver` queries every
+source needed by the primary tier at once (one batched call per source),
+then walks down the secondary tiers only for codes that are still missing.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Iterable, Iterator, Mapping
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Route:
+    """One upstream able to quote an instrument, addressed by its native symbol."""
+
+    source: str
+    symbol: str
+    code: str
+    label: str
+    decimals: int = 2
+
+
+@dataclass(frozen=True)
+class Instrument:
+    """A canonical code with its routes in priority order.
+
+    The first ``primaries`` routes are queried together; with ``prefer_recent``
+    the freshest of them wins, otherwise the earliest route that answered.
+    """
+
+    code: str
+    label: str
+    routes: tuple[Route, ...]
+    primaries: int = 1
+    prefer_recent: bool = False
+
+
+SourceFetcher = Callable[[Mapping[str, Route]], Awaitable[Mapping[str, Mapping[str, Any]]]]
+"""Batched fetcher: ``{symbol: route}`` in, ``{code: snapshot}`` out."""
+
+
+class InstrumentRegistry:
+    """Ordered collection of :class:`Instrument` declarations keyed by code."""
+
+    def __init__(self, instruments: Iterable[Instrument] = ()) -> None:
+        self._instruments: dict[str, Instrument] = {}
+        for instrument in instruments:
+            self.declare(instrument)
+
+    @classmethod
+    def from_sources(
+        cls,
+        *sources: tuple[str, Mapping[str, tuple[Any, ...]]],
+        primaries: int = 1,
+        prefer_recent: bool = False,
+    ) -> InstrumentRegistry:
+        """Build a registry from ``(source, {symbol: (code, label[, decimals])})`` maps.
+
+        Sources are listed in priority order; a code appearing in several maps
+        gets one route per source in that order.
+        """
+        routes: dict[str, list[Route]] = {}
+        labels: dict[str, str] = {}
+        for source, mapping in sources:
+            for symbol, spec in mapping.items():
+                code, label = spec[0], spec[1]
+                decimals = spec[2] if len(spec) > 2 else 2
+                routes.setdefault(code, []).append(Route(source, symbol, code, label, decimals))
+                labels.setdefault(code, label)
+        return cls(
+            Instrument(code, labels[code], tuple(code_routes), primaries, prefer_recent)
+            for code, code_routes in routes.items()
+        )
+
+    def declare(self, instrument: Instrument) -> None:
+        self._instruments[instrument.code] = instrument
+
+    def __getitem__(self, code: str) -> Instrument:
+        return self._instruments[code]
+
+    def __iter__(self) -> Iterator[Instrument]:
+        return iter(self._instruments.values())
+
+    def __len__(self) -> int:
+        return len(self._instruments)
+
+    @property
+    def sources(self) -> set[str]:
+        return {route.source for instrument in self for route in instrument.routes}
+
+
+class SourceResolver:
+    """Resolve a registry against batched source fetchers, tier by tier."""
+
+    def __init__(self, sources: Mapping[str, SourceFetcher]) -> None:
+        self._sources = dict(sources)
+
+    async def resolve(self, registry: Iterable[Instrument]) -> dict[str, Mapping[str, Any]]:
+        resolved: dict[str, Mapping[str, Any]] = {}
+        candidates: dict[str, dict[int, Mapping[str, Any]]] = {}
+        attempted: dict[str, set[int]] = {}
+        pending = list(registry)
+        tier = 0
+
+        while pending:
+            boundary = {
+                instrument.code: instrument.primaries + tier for instrument in pending
+            }
+            batches: dict[str, dict[str, Route]] = {}
+            wanted: dict[tuple[str, str], list[tuple[str, int]]] = {}
+            for instrument in pending:
+                tried = attempted.setdefault(instrument.code, set())
+                for index, route in enumerate(instrument.routes[: boundary[instrument.code]]):
+                    if index not in tried:
+                        batches.setdefault(route.source, {})[route.symbol] = route
+                        wanted.setdefault((route.source, route.symbol), []).append(
+                            (instrument.code, index)
+                        )
+                        tried.add(index)
+            results = await self._fetch_all(batches)
+            for source, quotes in results.items():
+                for symbol, route in batches[source].items():
+                    snapshot = quotes.get(route.code)
+                    if not snapshot:
+                        continue
+                    for code, index in wanted.get((source, symbol), ()):
+                        candidates.setdefault(code, {})[index] = snapshot
+
+            still_pending: list[Instrument] = []
+            for instrument in pending:
+                eligible = {
+                    index: snapshot
+                    for index, snapshot in candidates.get(instrument.code, {}).items()
+                    if index < boundary[instrument.code]
+                }
+                if eligible:
+                    resolved[instrument.code] = _pick(eligible, instrument.prefer_recent)
+                elif boundary[instrument.code] < len(instrument.routes):
+                    still_pending.append(instrument)
+            pending = still_pending
+            tier += 1
+
+        return resolved
+
+    async def _fetch_all(
+        self, batches: Mapping[str, Mapping[str, Route]]
+    ) -> dict[str, Mapping[str, Mapping[str, Any]]]:
+        names = [name for name in batches if name in self._sources]
+        for name in batches:
+            if name not in self._sources:
+                logger.warning("No fetcher registered for source %s", name)
+        outcomes = await asyncio.gather(
+            *(self._sources[name](batches[name]) for name in names),
+            return_exceptions=True,
+        )
+        results: dict[str, Mapping[str, Mapping[str, Any]]] = {}
+        for name, outcome in zip(names, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                logger.warning("Source %s failed: %s", name, outcome)
+                continue
+            results[name] = outcome or {}
+        return results
+
+
+def _pick(candidates: Mapping[int, Mapping[str, Any]], prefer_recent: bool) -> Mapping[str, Any]:
+    ordered = sorted(candidates.items())
+    if not prefer_recent:
+        return ordered[0][1]
+    best = ordered[0][1]
+    best_ts = _timestamp(best)
+    for _, snapshot in ordered[1:]:
+        ts = _timestamp(snapshot)
+        if ts and (best_ts is None or ts > best_ts):
+            best, best_ts = snapshot, ts
+    return best
+
+
+def _timestamp(snapshot: Mapping[str, Any]) -> datetime | None:
+    value = snapshot.get("timestamp")
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, str):
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+        return parsed.replace(tzinfo=None)
+    return None
@@ -0,0 +1,288 @@
+"""Synthetic, scalable variant of :class:`MockProvider` for load and scale tests.
+
+:class:`SyntheticMarket` keeps every instrument's state in NumPy arrays and
+advances a geometric random walk for the wall-clock time elapsed since the
+previous call: each instrument moves with probability ``1 - (1 - rate) ** dt``,
+so ``update_rate`` is the chance of a price change per instrument per second.
+The classic mock fixtures seed the named instruments; ``category_scale`` serves
+that many copies of each of them (``000001.SH``, ``000001_2.SH``, ...) to grow
+the snapshot categories. ``universe_size`` generated A-share stock codes form
+the whole-market universe and are served only by ``fetch_a_share_universe``.
+
+:class:`SyntheticMockProvider` serves those arrays in the unified snapshot
+schema, with optional per-call latency and failure injection.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import random
+import time
+from datetime import datetime
+from typing import Any, Callable, Mapping
+
+import numpy as np
+
+from .mock import INDUSTRIES, MockProvider, universe_codes
+
+CATEGORIES = ("indices", "fx", "rates", "commodities", "us_stocks", "crypto")
+UNIVERSE = len(CATEGORIES)  # category index of the generated stocks
+
+
+def copy_code(code: str, copy: int) -> str:
+    """Code of the ``copy``-th replica of ``code``, keeping the exchange suffix."""
+    if copy == 1:
+        return code
+    stem, dot, suffix = code.rpartition(".")
+    return f"{stem}_{copy}.{suffix}" if dot else f"{code}_{copy}"
+
+
+class SyntheticMarket:
+    """Vectorised random-walk state for every instrument in the universe."""
+
+    def __init__(
+        self,
+        seeds: Mapping[str, Mapping[str, Mapping[str, Any]]],
+        universe_size: int = 0,
+        update_rate: float = 0.5,
+        volatility: float = 0.0005,
+        seed: int = 0,
+        category_scale: int = 1,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._rng = np.random.default_rng(seed)
+        self._clock = clock
+        self.update_rate = update_rate
+        self.volatility = volatility
+
+        codes: list[str] = []
+        names: list[str] = []
+        categories: list[int] = []
+        prev_close: list[float] = []
+        for index, category in enumerate(CATEGORIES):
+            for code, record in (seeds.get(category) or {}).items():
+                last = float(record.get("last") or 0.0)
+                change = float(record.get("change") or 0.0)
+                name = str(record.get("name") or record.get("display_name") or code)
+                for copy in range(1, max(category_scale, 1) + 1):
+                    codes.append(copy_code(code, copy))
+                    names.append(name if copy == 1 else f"{name} #{copy}")
+                    categories.append(index)
+                    prev_close.append(float(record.get("prev_close") or last - change))
+        extra = universe_codes(universe_size)
+        codes.extend(extra)
+        names.extend(extra)
+        categories.extend([UNIVERSE] * universe_size)
+
+        self.codes = codes
+        self.names = names
+        self.category = np.asarray(categories, dtype=np.int8)
+        self.prev_close = np.concatenate(
+            (np.asarray(prev_close), self._rng.uniform(5.0, 100.0, universe_size))
+        )
+        self.prev_close[self.prev_close <= 0] = 1.0
+        self.open = self.prev_close * np.exp(self._rng.normal(0.0, 0.005, len(codes)))
+        self.last = self.open.copy()
+        self.high = self.open.copy()
+        self.low = self.open.copy()
+        self.volume = np.zeros(len(codes), dtype=np.int64)
+        self.amount = np.zeros(len(codes))
+        self.shares = self._rng.integers(2, 500, len(codes)) * 10_000_000
+        self.universe = slice(len(codes) - universe_size, len(codes))
+        picks = self._rng.integers(0, len(INDUSTRIES), universe_size).tolist()
+        self.industries = [INDUSTRIES[pick] for pick in picks]
+        self.updated = np.full(len(codes), self._clock())
+        self._time = self._clock()
+        self.updates = 0
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def advance(self, now: float | None = None) -> int:
+        """Random-walk the instruments for the time since the last call; returns moves."""
+        now = self._clock() if now is None else now
+        dt = now - self._time
+        if dt <= 0:
+            return 0
+        self._time = now
+        chance = 1.0 - (1.0 - min(self.update_rate, 1.0)) ** dt
+        moving = np.flatnonzero(self._rng.random(len(self.codes)) < chance)
+        if not len(moving):
+            return 0
+        shocks = self._rng.normal(0.0, self.volatility * math.sqrt(dt), len(moving))
+        self.last[moving] *= np.exp(shocks)
+        self.high[moving] = np.maximum(self.high[moving], self.last[moving])
+        self.low[moving] = np.minimum(self.low[moving], self.last[moving])
+        traded = self._rng.integers(100, 10_000, len(moving))
+        self.volume[moving] += traded
+        self.amount[moving] += traded * self.last[moving]
+        self.updated[moving] = now
+        self.updates += len(moving)
+        return len(moving)
+
+    def records(self, category: str) -> dict[str, dict[str, Any]]:
+        """Current quotes for one category in the unified snapshot schema."""
+        rows = np.flatnonzero(self.category == CATEGORIES.index(category))
+        last = self.last[rows]
+        prev = self.prev_close[rows]
+        change = last - prev
+        columns = zip(
+            rows.tolist(),
+            np.round(last, 4).tolist(),
+            np.round(change, 4).tolist(),
+            np.round(change / prev * 100, 2).tolist(),
+            np.round(prev, 4).tolist(),
+            np.round(self.open[rows], 4).tolist(),
+            np.round(self.high[rows], 4).tolist(),
+            np.round(self.low[rows], 4).tolist(),
+            self.volume[rows].tolist(),
+            self.updated[rows].tolist(),
+            strict=True,
+        )
+        stamps: dict[float, str] = {}
+        result: dict[str, dict[str, Any]] = {}
+        for row, last_, change_, pct, prev_, open_, high, low, volume, updated in columns:
+            stamp = stamps.get(updated)
+            if stamp is None:
+                stamp = stamps[updated] = datetime.fromtimestamp(updated).isoformat()
+            name = self.names[row]
+            result[self.codes[row]] = {
+                "name": name,
+                "display_name": name,
+                "last": last_,
+                "change": change_,
+                "change_pct": pct,
+                "prev_close": prev_,
+                "open": open_,
+                "high": high,
+                "low": low,
+                "volume": volume,
+                "timestamp": stamp,
+            }
+        return result
+
+    def universe_columns(self) -> dict[str, Any]:
+        """The generated stock universe in the columnar ``fetch_a_share_universe`` form."""
+        rows = self.universe
+        return {
+            "timestamp": datetime.fromtimestamp(self._time).isoformat(),
+            "source": "synthetic",
+            "codes": self.codes[rows],
+            "names": self.names[rows],
+            "last": np.round(self.last[rows], 2).tolist(),
+            "prev_close": np.round(self.prev_close[rows], 2).tolist(),
+            "volume": self.volume[rows].tolist(),
+            "amount": np.round(self.amount[rows], 2).tolist(),
+            "turnover_rate": np.round(self.volume[rows] / self.shares[rows] * 100, 2).tolist(),
+            "market_cap": np.round(self.last[rows] * self.shares[rows], 2).tolist(),
+            "industries": self.industries,
+        }
+
+
+class SyntheticMockProvider(MockProvider):
+    """Mock provider whose quotes random-walk over a configurable universe."""
+
+    def __init__(
+        self,
+        universe_size: int = 1000,
+        update_rate: float = 0.5,
+        volatility: float = 0.0005,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        seed: int = 0,
+        category_scale: int = 1,
+    ) -> None:
+        super().__init__()
+        self.universe_size = universe_size
+        self.category_scale = category_scale
+        self.update_rate = update_rate
+        self.volatility = volatility
+        self.latency = latency
+        self.error_rate = error_rate
+        self.seed = seed
+        self._random = random.Random(seed)
+        self._market: SyntheticMarket | None = None
+        self.calls = 0
+        self.failures = 0
+
+    async def market(self) -> SyntheticMarket:
+        """The random-walk state, seeded from the classic fixtures on first use."""
+        if self._market is None:
+            seeds = {
+                "indices": await super().fetch_indices(),
+                "fx": await super().fetch_fx(),
+                "rates": await super().fetch_rates(),
+                "commodities": await super().fetch_commodities(),
+                "us_stocks": await super().fetch_us_stocks(),
+                "crypto": await super().fetch_crypto(),
+            }
+            self._market = SyntheticMarket(
+                seeds,
+                universe_size=self.universe_size,
+                update_rate=self.update_rate,
+                volatility=self.volatility,
+                seed=self.seed,
+                category_scale=self.category_scale,
+            )
+        return self._market
+
+    async def _inject(self) -> None:
+        self.calls += 1
+        if self.latency > 0:
+            await asyncio.sleep(self.latency)
+        if self.error_rate > 0 and self._random.random() < self.error_rate:
+            self.failures += 1
+            raise RuntimeError("Injected synthetic provider failure")
+
+    async def _quotes(self, category: str) -> Mapping[str, Any]:
+        await self._inject()
+        market = await self.market()
+        market.advance()
+        return market.records(category)
+
+    async def fetch_indices(self) -> Mapping[str, Any]:
+        return await self._quotes("indices")
+
+    async def fetch_fx(self) -> Mapping[str, Any]:
+        return await self._quotes("fx")
+
+    async def fetch_rates(self) -> Mapping[str, Any]:
+        return await self._quotes("rates")
+
+    async def fetch_commodities(self) -> Mapping[str, Any]:
+        return await self._quotes("commodities")
+
+    async def fetch_us_stocks(self) -> Mapping[str, Any]:
+        return await self._quotes("us_stocks")
+
+    async def fetch_crypto(self) -> Mapping[str, Any]:
+        return await self._quotes("crypto")
+
+    async def fetch_a_share_universe(self) -> Mapping[str, Any]:
+        if not self.universe_size:
+            return await super().fetch_a_share_universe()
+        await self._inject()
+        market = await self.market()
+        market.advance()
+        return market.universe_columns()
+
+    async def fetch_calendar(self) -> list[Mapping[str, Any]]:
+        await self._inject()
+        return await super().fetch_calendar()
+
+    async def fetch_a_share_short_term(self) -> Mapping[str, Any]:
+        await self._inject()
+        return await super().fetch_a_share_short_term()
+
+    def synthetic_status(self) -> dict[str, Any]:
+        market = self._market
+        return {
+            "instruments": len(market) if market else None,
+            "universe_size": self.universe_size,
+            "category_scale": self.category_scale,
+            "update_rate": self.update_rate,
+            "updates": market.updates if market else 0,
+            "calls": self.calls,
+            "failures": self.failures,
+        }
@@ -0,0 +1,140 @@
+"""Allocation-light parser for Tencent ``qt.gtimg.cn`` quote batches.
+
+Responses look like ``v_sh000001="1~上证指数~000001~3211.40~...";`` with one
+``~``-separated record per symbol. Only the token offsets the wallboard uses are
+read, and the timestamp string (shared by every row of a batch) is converted
+once per distinct value instead of running ``strptime`` per row.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Iterator, NamedTuple
+
+# Token offsets inside a ``~``-separated quote record.
+LAST, PREV_CLOSE, OPEN = 3, 4, 5
+TIMESTAMP, CHANGE, CHANGE_PCT, HIGH, LOW = 30, 31, 32, 33, 34
+_MAX_SPLIT = LOW + 1
+
+
+class TencentQuote(NamedTuple):
+    """Compact quote record; ``None`` marks a missing or non-numeric token."""
+
+    last: float
+    prev_close: float
+    open: float | None
+    change: float | None
+    change_pct: float | None
+    high: float | None
+    low: float | None
+    timestamp: str
+
+
+def iter_entries(text: str) -> Iterator[tuple[str, str]]:
+    """Yield ``(symbol, raw_value)`` for each ``v_<symbol>="<value>"`` assignment."""
+    find = text.find
+    pos = find("v_")
+    while pos != -1:
+        eq = find("=", pos)
+        if eq == -1:
+            return
+        start = eq + 1
+        if text.startswith('"', start):
+            start += 1
+            end = find('"', start)
+        else:
+            end = find(";", start)
+        if end == -1:
+            end = len(text)
+        value = text[start:end].strip()
+        if value:
+            yield text[pos + 2 : eq].strip(), value
+        pos = find("v_", end)
+
+
+def parse_response(text: str) -> dict[str, str]:
+    """Map symbol to raw record for a whole response body."""
+    return dict(iter_entries(text))
+
+
+class TimestampMemo:
+    """Convert Tencent timestamp strings to ISO format, once per distinct string."""
+
+    __slots__ = ("_seen",)
+
+    def __init__(self) -> None:
+        self._seen: dict[str | None, str] = {}
+
+    def __call__(self, raw: str | None) -> str:
+        iso = self._seen.get(raw)
+        if iso is None:
+            iso = self._seen[raw] = _format_timestamp(raw)
+        return iso
+
+
+def _format_timestamp(raw: str | None) -> str:
+    raw = raw.strip() if raw else ""
+    if len(raw) == 14 and raw.isdigit():
+        return f"{raw[0:4]}-{raw[4:6]}-{raw[6:8]}T{raw[8:10]}:{raw[10:12]}:{raw[12:14]}"
+    if len(raw) == 19 and raw[4] == "-" and raw[10] == " ":
+        return f"{raw[:10]}T{raw[11:]}"
+    for fmt in ("%Y%m%d%H%M%S", "%Y-%m-%d %H:%M:%S"):
+        try:
+            return datetime.strptime(raw, fmt).isoformat()
+        except ValueError:
+            continue
+    return datetime.utcnow().isoformat()
+
+
+def _number(token: str) -> float | None:
+    try:
+        return float(token)
+    except ValueError:
+        return None
+
+
+def parse_quote(value: str, timestamps: TimestampMemo | None = None) -> TencentQuote | None:
+    """Parse one raw record; returns ``None`` when last/previous close are unusable."""
+    tokens = value.split("~", _MAX_SPLIT)
+    size = len(tokens)
+    if size < 6:
+        return None
+    last = _number(tokens[LAST])
+    prev_close = _number(tokens[PREV_CLOSE])
+    if last is None or prev_close is None:
+        return None
+    stamp = (timestamps or TimestampMemo())(tokens[TIMESTAMP] if size > TIMESTAMP else None)
+    return TencentQuote(
+        last,
+        prev_close,
+        _number(tokens[OPEN]),
+        _number(tokens[CHANGE]) if size > CHANGE else None,
+        _number(tokens[CHANGE_PCT]) if size > CHANGE_PCT else None,
+        _number(tokens[HIGH]) if size > HIGH else None,
+        _number(tokens[LOW]) if size > LOW else None,
+        stamp,
+    )
+
+
+def to_snapshot(quote: TencentQuote, code: str, label: str, decimals: int = 2) -> dict[str, Any]:
+    """Expand a compact record into the wallboard snapshot schema."""
+    last, prev_close = quote.last, quote.prev_close
+    change = quote.change
+    if change is None:
+        change = last - prev_close
+    change_pct = quote.change_pct
+    if change_pct is None and prev_close:
+        change_pct = change / prev_close * 100
+    return {
+        "code": code,
+        "name": label,
+        "display_name": label,
+        "last": round(last, decimals),
+        "change": round(change or 0.0, decimals),
+        "change_pct": round(change_pct or 0.0, 2),
+        "open": round(quote.open, decimals) if quote.open is not None else None,
+        "high": round(quote.high, decimals) if quote.high is not None else None,
+        "low": round(quote.low, decimals) if quote.low is not None else None,
+        "prev_close": round(prev_close, decimals),
+        "timestamp": quote.timestamp,
+    }
@@ -4,12 +4,20 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import datetime
-from typing import Any, Mapping
-import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Mapping, Sequence
 
+from ..core.settings import settings
+from ..core.telemetry import upstream_telemetry
 from .base import MarketDataProvider
 from .mock import MockProvider
+from .wind_bars import MinuteBarCache
+from .wind_batch import WsqBatcher
+from .wind_frame import PriceFrame, is_all_zero
+from .wind_ticks import WindTickStore
+from .wind_supervisor import WindConnectionSupervisor
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +43,21 @@ class WindProvider(MarketDataProvider):
         "GC.CMX", "SI.CMX", "HG.CMX", "ALI.CMX", "CL.NYM", "PL.NYM", "NG.NYM",
         "TA.CZC", "J.DCE", "SA.CZC", "S.CBT", "C.CBT", "W.CBT", "ZE.CBT", "LH.DCE", "RB.SHF",
     ]
+    # Union of the wsq fields the category fetchers read, used for push subscriptions.
+    SUBSCRIPTION_FIELDS = [
+        "rt_last", "rt_chg", "rt_pct_chg", "rt_open", "rt_high", "rt_low", "rt_pre_close", "rt_vol",
+    ]
+    # Codes that get intraday sparklines: the A-share indices, whose minute bars follow
+    # the exchange session below (global indices trade on other clocks).
+    SPARK_CODES = [code for code in INDEX_CODES if code.endswith((".SH", ".SZ", ".BJ", ".CSI"))]
+    SESSION_OPEN = (9, 30)
+    SESSION_BREAK = ((11, 30), (13, 0))
+    SESSION_CLOSE = (15, 0)
+    # An empty wsi reply this long after the open means the exchange is shut today.
+    NO_SESSION_AFTER = timedelta(minutes=15)
+    # Whole-market universe: wset sector id of "all A shares" and the wss quote fields.
+    UNIVERSE_SECTOR_ID = "a001010100000000"
+    UNIVERSE_FIELDS = ["rt_last", "rt_pre_close", "rt_vol", "rt_amt", "rt_turn", "rt_mkt_cap"]
 
     NAME_MAP = {
         "000001.SH": "上证综指",
@@ -77,41 +100,134 @@ class WindProvider(MarketDataProvider):
     }
 
     def __init__(self):
-        """Initialize Wind provider with connection management."""
+        """Initialize Wind provider; the session itself is opened by the supervisor."""
         self._w = None
-        self._connected = False
+        self._supervisor: WindConnectionSupervisor | None = None
+        # WindPy is not thread-safe: every call goes through this one worker thread.
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="windpy")
+        self._batcher = WsqBatcher(self._call_wsq, window=settings.wind_batch_window)
+        self._ticks = WindTickStore()
+        self._bars = MinuteBarCache()
+        self._universe: tuple[str, list[str], list[str], list[Any]] | None = None
+        self._subscription_id: int | None = None
         self._mock = MockProvider()
         self._initialize_wind()
 
     def _initialize_wind(self) -> None:
-        """Initialize Wind API connection."""
+        """Import WindPy and attach a background connection supervisor.
+
+        No blocking ``w.start()`` happens here: the provider is constructed at import
+        time, so connecting is left to :class:`WindConnectionSupervisor`, which the
+        app starts on the event loop at startup (:meth:`start`).
+        """
         try:
             from WindPy import w
-            self._w = w
-            # Start Wind API connection
-            logger.info("Starting Wind API connection...")
-            result = self._w.start()
-            if result.ErrorCode == 0:
-                self._connected = True
-                logger.info("Wind API connection established successfully")
-            else:
-                logger.error(f"Failed to connect to Wind API: ErrorCode={result.ErrorCode}, Data={result.Data}")
-                self._connected = False
         except ImportError:
             logger.warning("WindPy not available - install WindPy via Wind terminal")
-            self._w = None
-            self._connected = False
+            return
         except Exception as e:
             logger.warning(f"Wind API not available: {e}")
-            self._w = None
-            self._connected = False
+            return
+        self._w = w
+        self._supervisor = WindConnectionSupervisor(
+            w,
+            heartbeat_interval=settings.wind_heartbeat_interval,
+            start_timeout=settings.wind_start_timeout,
+            max_backoff=settings.wind_reconnect_max_backoff,
+            stable_after=settings.wind_stable_after,
+            executor=self._executor,
+        )
+        if settings.wind_subscription_enabled:
+            self._supervisor.add_connect_listener(self._subscribe)
+
+    @property
+    def _connected(self) -> bool:
+        return self._supervisor is not None and self._supervisor.connected
 
     def _ensure_connection(self) -> bool:
-        """Ensure Wind API is connected."""
-        if not self._connected or not self._w:
-            logger.warning("Wind API not connected, attempting reconnection...")
-            self._initialize_wind()
-        return self._connected
+        """Report whether Wind is connected, starting the supervisor if needed.
+
+        Never blocks: while the supervisor is (re)connecting, callers fall back to
+        demo data instead of waiting on ``w.start()``.
+        """
+        if self._supervisor is None:
+            return False
+        try:
+            self._supervisor.ensure_started()
+        except RuntimeError:
+            # No running loop (sync caller); report the last known state.
+            pass
+        return self._supervisor.connected
+
+    def connection_status(self) -> Mapping[str, Any]:
+        """Supervisor state for diagnostics."""
+        if self._supervisor is None:
+            return {"connected": False, "running": False, "available": False}
+        return {
+            "available": True,
+            **self._supervisor.status(),
+            "subscribed": self._subscription_id is not None,
+            "pushed_codes": len(self._ticks),
+            "push_updates": self._ticks.updates,
+        }
+
+    async def start(self) -> None:
+        """Start connecting at app startup rather than on the first fetch."""
+        self._ensure_connection()
+
+    async def close(self) -> None:
+        """Cancel the push subscription, stop the supervisor and close the session."""
+        if self._subscription_id is not None and self._connected:
+            try:
+                await self._call("cancelRequest", self._subscription_id)
+            except Exception as e:
+                logger.warning(f"Failed to cancel Wind subscription: {e}")
+        self._subscription_id = None
+        if self._supervisor is not None:
+            await self._supervisor.stop()
+
+    @property
+    def subscription_codes(self) -> list[str]:
+        return list(
+            dict.fromkeys(
+                self.INDEX_CODES
+                + self.FX_CODES
+                + self.POLICY_RATE_CODES
+                + self.GOVY_CN_CODES
+                + self.GOVY_US_CODES
+                + self.COMMODITY_CODES
+            )
+        )
+
+    async def _subscribe(self) -> None:
+        """Subscribe every snapshot code once; WindPy pushes updates into the tick store."""
+        self._ticks.clear()
+        result = await self._call(
+            "wsq",
+            ",".join(self.subscription_codes),
+            ",".join(self.SUBSCRIPTION_FIELDS),
+            func=self._ticks.on_wind_data,
+        )
+        if result.ErrorCode != 0:
+            self._subscription_id = None
+            logger.error(f"Wind wsq subscription failed: {result.ErrorCode}")
+            return
+        self._subscription_id = getattr(result, "RequestID", None)
+        logger.info(f"Subscribed {len(self.subscription_codes)} Wind codes for push updates")
+
+    def _read_subscribed(self, codes: list[str], fields: list[str]):
+        """Read pushed quotes, or None when the caller should poll ``wsq`` instead.
+
+        That is the case until every code has been pushed, once the subscription has
+        gone ``wind_push_max_age`` seconds without any callback, and after it reported
+        an error that no good push has followed yet. Codes that simply have not
+        changed (daily fixings, closed markets) stay readable.
+        """
+        if self._subscription_id is None:
+            return None
+        if not self._ticks.fresh(codes, settings.wind_push_max_age):
+            return None
+        return self._ticks.read(codes, fields)
 
     async def fetch_indices(self) -> Mapping[str, Any]:
         """Fetch global + A-share indices with unified schema."""
@@ -120,6 +236,9 @@ class WindProvider(MarketDataProvider):
             return self._get_demo_indices_data()
 
         fields = ["rt_last", "rt_chg", "rt_pct_chg", "rt_open", "rt_high", "rt_low", "rt_pre_close"]
+        pushed = self._read_subscribed(self.INDEX_CODES, fields)
+        if pushed is not None:
+            return self._map_price_result(self.INDEX_CODES, fields, pushed, include_volume=False)
         result = await self._wsq(self.INDEX_CODES, fields)
         if result is None or self._is_all_zero(result):
             # Fallback to static snapshot
@@ -138,6 +257,11 @@ class WindProvider(MarketDataProvider):
             return self._get_demo_fx_data()
 
         fields = ["rt_last", "rt_chg", "rt_pct_chg"]
+        pushed = self._read_subscribed(self.FX_CODES, fields)
+        if pushed is not None:
+            return self._map_price_result(
+                self.FX_CODES, fields, pushed, include_volume=False, decimals=4
+            )
         result = await self._wsq(self.FX_CODES, fields)
         if result is None or self._is_all_zero(result):
             wss_fields = ["close", "chg", "pct_chg"]
@@ -146,7 +270,9 @@ class WindProvider(MarketDataProvider):
         if result is None:
             return self._get_demo_fx_data()
 
-        return self._map_price_result(self.FX_CODES, fields, result, include_volume=False, decimals=4)
+        return self._map_price_result(
+            self.FX_CODES, fields, result, include_volume=False, decimals=4
+        )
 
     async def fetch_rates(self) -> Mapping[str, Any]:
         """Fetch policy rates + CN/US govy yields."""
@@ -155,6 +281,11 @@ class WindProvider(MarketDataProvider):
 
         rate_codes = self.POLICY_RATE_CODES + self.GOVY_CN_CODES + self.GOVY_US_CODES
         fields = ["rt_last", "rt_chg"]
+        pushed = self._read_subscribed(rate_codes, fields)
+        if pushed is not None:
+            return self._map_price_result(
+                rate_codes, fields, pushed, include_volume=False, decimals=3
+            )
         result = await self._wsq(rate_codes, fields)
         if result is None or self._is_all_zero(result):
             wss_fields = ["close", "chg"]
@@ -171,15 +302,19 @@ class WindProvider(MarketDataProvider):
             return self._get_demo_commodities_data()
 
         fields = ["rt_last", "rt_chg", "rt_pct_chg", "rt_vol"]
-        result = await self._wsq(self.COMMODITY_CODES, fields)
-        if result is None or self._is_all_zero(result):
-            wss_fields = ["close", "chg", "pct_chg", "pre_close", "volume"]
-            result = await self._wss(self.COMMODITY_CODES, wss_fields)
-            fields = wss_fields
+        result = self._read_subscribed(self.COMMODITY_CODES, fields)
         if result is None:
-            return self._get_demo_commodities_data()
+            result = await self._wsq(self.COMMODITY_CODES, fields)
+            if result is None or self._is_all_zero(result):
+                wss_fields = ["close", "chg", "pct_chg", "pre_close", "volume"]
+                result = await self._wss(self.COMMODITY_CODES, wss_fields)
+                fields = wss_fields
+            if result is None:
+                return self._get_demo_commodities_data()
 
-        data = self._map_price_result(self.COMMODITY_CODES, fields, result, include_volume=True, decimals=2)
+        data = self._map_price_result(
+            self.COMMODITY_CODES, fields, result, include_volume=True, decimals=2
+        )
         # add sector if known
         for code, item in data.items():
             if code in self.COMMODITY_SECTOR:
@@ -205,21 +340,17 @@ class WindProvider(MarketDataProvider):
             ]
 
             # Use consistent field format
-            fields = "rt_last,rt_chg,rt_pct_chg,rt_vol"
+            fields = ["rt_last", "rt_chg", "rt_pct_chg", "rt_vol"]
 
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None,
-                lambda: self._w.wsq(",".join(us_codes), fields)
-            )
+            result = await self._batcher.request(us_codes, fields)
 
             if result.ErrorCode != 0:
-                logger.warning(f"US stocks real-time data failed (ErrorCode: {result.ErrorCode}), trying simplified fields...")
-                # Try with simplified fields if full fields fail
-                result = await loop.run_in_executor(
-                    None,
-                    lambda: self._w.wsq(",".join(us_codes), "rt_last,rt_chg,rt_pct_chg")
+                logger.warning(
+                    f"US stocks real-time data failed (ErrorCode: {result.ErrorCode}), "
+                    "trying simplified fields..."
                 )
+                # Try with simplified fields if full fields fail
+                result = await self._batcher.request(us_codes, ["rt_last", "rt_chg", "rt_pct_chg"])
 
             if result.ErrorCode != 0:
                 logger.error(f"US stocks data fetch failed: {result.ErrorCode}")
@@ -268,14 +399,10 @@ class WindProvider(MarketDataProvider):
 
         try:
             # Get upcoming economic events
-            loop = asyncio.get_event_loop()
             today = datetime.now().strftime("%Y-%m-%d")
 
             # Wind economic calendar function
-            result = await loop.run_in_executor(
-                None,
-                lambda: self._w.wsd("M0000001.SH", "CLOSE", today, today)
-            )
+            result = await self._call("wsd", "M0000001.SH", "CLOSE", today, today)
 
             # Simplified calendar data - Wind's calendar API is complex
             # In production, you'd use Wind's specific calendar functions
@@ -291,6 +418,149 @@ class WindProvider(MarketDataProvider):
         """Placeholder until dedicated Wind board/flow feeds are wired."""
         return await self._mock.fetch_a_share_short_term()
 
+    async def fetch_a_share_universe(self) -> Mapping[str, Any]:
+        """Every A-share stock: constituents from ``wset`` once a day, quotes from one ``wss``."""
+        if not self._ensure_connection():
+            return {}
+        constituents = await self._universe_constituents()
+        if not constituents:
+            return {}
+        codes, names, industries = constituents
+        result = await self._wss(codes, self.UNIVERSE_FIELDS)
+        if result is None or len(result.Data or []) != len(self.UNIVERSE_FIELDS):
+            return {}
+        last, prev_close, volume, amount, turnover_rate, market_cap = (
+            [None if value != value else value for value in column]  # NaN -> None
+            for column in result.Data
+        )
+        return {
+            "timestamp": datetime.now().isoformat(),
+            "source": "wind",
+            "codes": codes,
+            "names": names,
+            "last": last,
+            "prev_close": prev_close,
+            "volume": volume,
+            "amount": amount,
+            "turnover_rate": turnover_rate,
+            "market_cap": market_cap,
+            "industries": industries,
+        }
+
+    async def _universe_constituents(self) -> tuple[list[str], list[str], list[Any]] | None:
+        """Codes, names and SW level-1 industries of all listed A shares, cached for the day."""
+        today = datetime.now().strftime("%Y-%m-%d")
+        if self._universe is not None and self._universe[0] == today:
+            return self._universe[1:]
+        try:
+            result = await self._call(
+                "wset", "sectorconstituent", f"date={today};sectorid={self.UNIVERSE_SECTOR_ID}"
+            )
+        except Exception as e:
+            logger.error(f"Wind WSET call failed: {e}")
+            return None
+        if result.ErrorCode != 0:
+            logger.error(f"Wind WSET failed: {result.ErrorCode}")
+            return None
+        fields = [str(name).lower() for name in (result.Fields or [])]
+        try:
+            codes = list(result.Data[fields.index("wind_code")])
+            names = list(result.Data[fields.index("sec_name")])
+        except (ValueError, IndexError):
+            logger.error(f"Wind WSET returned unexpected fields: {result.Fields}")
+            return None
+        industries: list[Any] = [None] * len(codes)
+        try:
+            classified = await self._call(
+                "wss", ",".join(codes), "industry_sw_2021", f"industryType=1;tradeDate={today}"
+            )
+            if classified.ErrorCode == 0 and classified.Data:
+                industries = [
+                    label if isinstance(label, str) else None for label in classified.Data[0]
+                ]
+            else:
+                logger.warning(f"Wind industry classification failed: {classified.ErrorCode}")
+        except Exception as e:
+            logger.warning(f"Wind industry classification call failed: {e}")
+        self._universe = (today, codes, names, industries)
+        return codes, names, industries
+
+    async def fetch_intraday_bars(self, codes: Sequence[str] | None = None) -> Mapping[str, Any]:
+        """Minute-close sparklines, pulling only bars newer than the cache via wsi.
+
+        Codes are grouped by the first bar each still lacks, so one late or new code
+        does not re-pull the whole session for the others. No call is made while the
+        session has produced nothing new (before the open, over lunch, after the close),
+        nor for the rest of a weekend or a holiday once wsi has come back empty for it.
+        """
+        if not self._ensure_connection():
+            return {}
+
+        codes = list(codes or self.SPARK_CODES)
+        now = datetime.now()
+        self._bars.roll(now.date())
+        if now.weekday() >= 5:
+            self._bars.closed = True
+        if self._bars.closed:
+            return {}
+        session_open = self._at(now, self.SESSION_OPEN)
+        end = self._session_end(now)
+        for begin, group in self._bars.starts(codes, session_open).items():
+            if begin > end:
+                continue
+            try:
+                result = await self._call(
+                    "wsi",
+                    ",".join(group),
+                    "close",
+                    begin.strftime("%Y-%m-%d %H:%M:%S"),
+                    end.strftime("%Y-%m-%d %H:%M:%S"),
+                    "",
+                )
+                if result.ErrorCode == 0:
+                    self._store_bars(group, result)
+                    if not len(self._bars) and end - session_open >= self.NO_SESSION_AFTER:
+                        logger.info(f"Wind WSI has no bars for {now.date()}; market closed today")
+                        self._bars.closed = True
+                        break
+                else:
+                    logger.warning(f"Wind WSI returned no new bars: {result.ErrorCode}")
+            except Exception as e:
+                logger.error(f"Wind WSI call failed: {e}")
+
+        points = settings.wind_spark_points
+        return {
+            code: {"spark": self._bars.spark(code, points), "bars": len(self._bars.closes(code))}
+            for code in codes
+            if len(self._bars.closes(code))
+        }
+
+    @staticmethod
+    def _at(now: datetime, hour_minute: tuple[int, int]) -> datetime:
+        hour, minute = hour_minute
+        return now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+
+    def _session_end(self, now: datetime) -> datetime:
+        """Latest minute bar the session can have produced by ``now``."""
+        end = min(now, self._at(now, self.SESSION_CLOSE))
+        lunch, resume = (self._at(now, moment) for moment in self.SESSION_BREAK)
+        return lunch if lunch < end < resume else end
+
+    def _store_bars(self, codes: list[str], result: Any) -> None:
+        """Append wsi bars; multi-code replies come in long format keyed by ``windcode``."""
+        fields = [str(name).lower() for name in (result.Fields or [])]
+        if fields and fields[0] == "windcode":
+            grouped: dict[str, tuple[list[Any], list[Any]]] = {}
+            rows = zip(result.Data[0], result.Times, result.Data[1], strict=True)
+            for code, stamp, close in rows:
+                times, closes = grouped.setdefault(code, ([], []))
+                times.append(stamp)
+                closes.append(close)
+            for code, (times, closes) in grouped.items():
+                self._bars.extend(code, times, closes)
+        elif codes and result.Data:
+            self._bars.extend(codes[0], result.Times, result.Data[0])
+
     def _get_demo_indices_data(self) -> Mapping[str, Any]:
         """Return demo indices data when Wind API is not available."""
         import random
@@ -328,6 +598,7 @@ class WindProvider(MarketDataProvider):
                 "low": round(info["base"] + random.uniform(-60, 0), 2),
                 "prev_close": info["base"],
                 "timestamp": current_time,
+                "source": "demo",
                 "update_time": current_time,
             }
 
@@ -355,6 +626,7 @@ class WindProvider(MarketDataProvider):
                 "change": round(change, 4),
                 "change_pct": round(change_pct, 2),
                 "timestamp": datetime.now().isoformat(),
+                "source": "demo",
             }
 
         return demo_data
@@ -383,18 +655,15 @@ class WindProvider(MarketDataProvider):
                 "last": round(base + change, 3),
                 "change": round(change, 3),
                 "timestamp": datetime.now().isoformat(),
+                "source": "demo",
             }
 
         return demo_data
 
     async def _wsq(self, codes: list[str], fields: list[str]):
-        """Run wsq in executor and return result or None on error."""
+        """Run wsq through the batcher and return result or None on error."""
         try:
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None,
-                lambda: self._w.wsq(",".join(codes), ",".join(fields))
-            )
+            result = await self._batcher.request(codes, fields)
             if result.ErrorCode != 0:
                 logger.error(f"Wind WSQ failed: {result.ErrorCode}")
                 return None
@@ -406,11 +675,7 @@ class WindProvider(MarketDataProvider):
     async def _wss(self, codes: list[str], fields: list[str]):
         """Run wss snapshot in executor and return result or None on error."""
         try:
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None,
-                lambda: self._w.wss(",".join(codes), ",".join(fields))
-            )
+            result = await self._call("wss", ",".join(codes), ",".join(fields))
             if result.ErrorCode != 0:
                 logger.error(f"Wind WSS failed: {result.ErrorCode}")
                 return None
@@ -419,6 +684,38 @@ class WindProvider(MarketDataProvider):
             logger.error(f"Wind WSS call failed: {e}")
             return None
 
+    async def _call(self, function: str, *args: Any, **kwargs: Any):
+        """Run a WindPy function on the Wind worker thread, recording telemetry."""
+        loop = asyncio.get_running_loop()
+        method = getattr(self._w, function)
+        started = time.perf_counter()
+        try:
+            result = await loop.run_in_executor(self._executor, lambda: method(*args, **kwargs))
+        except Exception:
+            upstream_telemetry.record("wind", "wind", function, "error", time.perf_counter() - started)
+            if self._supervisor is not None:
+                self._supervisor.request_probe()
+            raise
+        upstream_telemetry.record(
+            "wind",
+            "wind",
+            function,
+            getattr(result, "ErrorCode", "error"),
+            time.perf_counter() - started,
+            nbytes=self._payload_size(result),
+        )
+        return result
+
+    async def _call_wsq(self, codes: str, fields: str):
+        """Single merged wsq round trip issued by the batcher."""
+        return await self._call("wsq", codes, fields)
+
+    @staticmethod
+    def _payload_size(result: Any) -> int:
+        """Approximate payload size: 8 bytes per returned data cell."""
+        data = getattr(result, "Data", None) or []
+        return 8 * sum(len(column) for column in data if isinstance(column, (list, tuple)))
+
     def _map_price_result(
         self,
         codes: list[str],
@@ -427,71 +724,17 @@ class WindProvider(MarketDataProvider):
         include_volume: bool = False,
         decimals: int = 2,
     ) -> Mapping[str, Any]:
-        """Map WSQ result to unified schema with common fields."""
-        alias = {
-            "rt_last": "last",
-            "rt_chg": "change",
-            "rt_pct_chg": "change_pct",
-            "rt_open": "open",
-            "rt_high": "high",
-            "rt_low": "low",
-            "rt_pre_close": "prev_close",
-            "rt_vol": "volume",
-            "rt_amt": "amount",
-            "close": "last",
-            "chg": "change",
-            "pct_chg": "change_pct",
-            "open": "open",
-            "high": "high",
-            "low": "low",
-            "pre_close": "prev_close",
-            "volume": "volume",
-            "amt": "amount",
-        }
-        mapped = {}
-        now = datetime.now().isoformat()
-        # result.Data is list per field in order of fields
-        for idx, code in enumerate(codes):
-            item: dict[str, Any] = {"code": code, "timestamp": now}
-            for f_index, field in enumerate(fields):
-                if f_index >= len(result.Data):
-                    continue
-                values = result.Data[f_index]
-                if idx >= len(values):
-                    continue
-                val = values[idx]
-                try:
-                    if val is None or (isinstance(val, float) and math.isnan(val)):
-                        continue
-                except Exception:
-                    continue
-                key = alias.get(field, field)
-                if key in {"last", "change", "open", "high", "low", "prev_close"}:
-                    item[key] = round(val, decimals)
-                elif key == "change_pct":
-                    item[key] = round(val, 2)
-                elif key == "volume" and include_volume:
-                    item[key] = val
-                elif key == "amount" and include_volume:
-                    item[key] = val
-            item["name"] = self.NAME_MAP.get(code, code)
-            # Derive change if missing but we have last/prev_close
-            if "change" not in item and "last" in item and "prev_close" in item and item.get("prev_close"):
-                delta = item["last"] - item["prev_close"]
-                item["change"] = round(delta, decimals)
-                if "change_pct" not in item and item["prev_close"]:
-                    item["change_pct"] = round(delta / item["prev_close"] * 100, 2)
-            mapped[code] = item
-        return mapped
+        """Map WSQ/WSS result to unified schema (vectorised, see ``PriceFrame``)."""
+        frame = PriceFrame.from_wind(
+            codes, fields, result.Data, decimals=decimals, include_volume=include_volume
+        )
+        return frame.to_records(self.NAME_MAP, datetime.now().isoformat())
 
     @staticmethod
     def _is_all_zero(result: Any) -> bool:
         """Detect if result Data is all zeros (common when permission/closed)."""
         try:
-            return all(
-                all((v or 0) == 0 for v in series)
-                for series in result.Data
-            )
+            return is_all_zero(result.Data)
         except Exception:
             return False
 
@@ -521,6 +764,7 @@ class WindProvider(MarketDataProvider):
                 "change_pct": round(change_pct, 2),
                 "volume": random.randint(10000, 100000),
                 "timestamp": datetime.now().isoformat(),
+                "source": "demo",
             }
 
         return demo_data
@@ -569,26 +813,21 @@ class WindProvider(MarketDataProvider):
                 "change_pct": round(change_pct, 2),
                 "volume": random.randint(1000000, 50000000),
                 "timestamp": current_time,
+                "source": "demo",
             }
 
         return demo_data
 
     def _get_demo_crypto_data(self) -> Mapping[str, Any]:
         timestamp = datetime.utcnow().isoformat()
-        return {
+        demo_data = {
             "BTC.CC": {"code": "BTC.CC", "name": "比特币", "last": 63000, "change_pct": 1.2, "timestamp": timestamp},
             "ETH.CC": {"code": "ETH.CC", "name": "以太坊", "last": 3100, "change_pct": -0.8, "timestamp": timestamp},
             "SOL.CC": {"code": "SOL.CC", "name": "Solana", "last": 150, "change_pct": 3.2, "timestamp": timestamp},
         }
-
-    def __del__(self):
-        """Clean up Wind API connection on destruction."""
-        try:
-            if self._w and self._connected:
-                self._w.stop()
-                logger.info("Wind API connection closed")
-        except Exception as e:
-            logger.error(f"Error closing Wind API connection: {e}")
+        for record in demo_data.values():
+            record["source"] = "demo"
+        return demo_data
 
 
 # Factory function for Wind provider
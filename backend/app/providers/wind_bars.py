@@ -0,0 +1,86 @@
+"""Per-code intraday minute-bar cache for incremental Wind ``wsi`` pulls.
+
+Closes and bar times live in compact ``array('d')``/``array('q')`` buffers, one
+pair per code, for the current trading date only. :meth:`MinuteBarCache.starts`
+tells the provider where the next ``wsi`` request should start for each code so
+each refresh only asks Wind for bars it has not seen yet.
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from datetime import date, datetime, timedelta
+from typing import Any, Iterable, Sequence
+
+
+class MinuteBarCache:
+    """Today's minute closes per code; cleared when the trading date rolls."""
+
+    def __init__(self) -> None:
+        self.session: date | None = None
+        self.closed = False  # set once the date turns out not to be a trading day
+        self._times: dict[str, array] = {}
+        self._closes: dict[str, array] = {}
+
+    def roll(self, session: date) -> bool:
+        """Start a new session (drop all bars) if ``session`` differs; True if reset."""
+        if session == self.session:
+            return False
+        self.session = session
+        self.closed = False
+        self._times.clear()
+        self._closes.clear()
+        return True
+
+    def last_time(self, code: str) -> datetime | None:
+        times = self._times.get(code)
+        return datetime.fromtimestamp(times[-1]) if times else None
+
+    def starts(self, codes: Iterable[str], session_open: datetime) -> dict[datetime, list[str]]:
+        """``codes`` grouped by the first bar time each is still missing, earliest first."""
+        groups: dict[datetime, list[str]] = {}
+        for code in codes:
+            last = self.last_time(code)
+            start = last + timedelta(minutes=1) if last else session_open
+            groups.setdefault(start, []).append(code)
+        return dict(sorted(groups.items()))
+
+    def since(self, codes: Iterable[str], session_open: datetime) -> datetime:
+        """Earliest bar time still missing across ``codes``."""
+        return min(self.starts(codes, session_open), default=session_open)
+
+    def extend(self, code: str, times: Sequence[datetime], closes: Sequence[Any]) -> int:
+        """Append bars newer than the last cached one; returns how many were added."""
+        stamps = self._times.setdefault(code, array("q"))
+        values = self._closes.setdefault(code, array("d"))
+        last = stamps[-1] if stamps else None
+        added = 0
+        for stamp, close in zip(times, closes, strict=True):
+            if close is None or (isinstance(close, float) and math.isnan(close)):
+                continue
+            second = int(stamp.timestamp())
+            if last is not None and second <= last:
+                continue
+            stamps.append(second)
+            values.append(float(close))
+            last = second
+            added += 1
+        return added
+
+    def closes(self, code: str) -> array:
+        return self._closes.get(code, array("d"))
+
+    def spark(self, code: str, points: int) -> list[float]:
+        """Evenly spaced closes over the session so far, always ending on the latest."""
+        values = self.closes(code)
+        size = len(values)
+        if size <= points:
+            return [round(value, 4) for value in values]
+        if points <= 1:
+            return [round(values[-1], 4)]
+        step = (size - 1) / (points - 1)
+        return [round(values[round(index * step)], 4) for index in range(points)]
+
+    def __len__(self) -> int:
+        return sum(len(values) for values in self._closes.values())
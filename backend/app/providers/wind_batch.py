@@ -0,0 +1,142 @@
+"""Coalesce concurrent WindPy ``wsq`` requests into a single round trip.
+
+Category fetches that arrive within ``window`` seconds of each other are merged
+into one ``wsq`` call over the union of their codes and fields; the combined
+``WindData`` is then sliced back into per-caller results with the same
+``ErrorCode/Codes/Fields/Times/Data`` shape the provider already consumes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Sequence
+
+logger = logging.getLogger(__name__)
+
+WsqCall = Callable[[str, str], Awaitable[Any]]
+"""``(codes_csv, fields_csv) -> WindData``; expected to run on the Wind worker thread."""
+
+
+@dataclass
+class WindSlice:
+    """Per-caller view of a merged ``WindData`` result."""
+
+    ErrorCode: int
+    Codes: list[str]
+    Fields: list[str]
+    Times: list[Any] = field(default_factory=list)
+    Data: list[list[Any]] = field(default_factory=list)
+
+
+@dataclass
+class _Request:
+    codes: tuple[str, ...]
+    fields: tuple[str, ...]
+    future: asyncio.Future
+
+
+class WsqBatcher:
+    """Merge ``wsq`` requests issued close together; split the answer per caller."""
+
+    def __init__(self, call: WsqCall, window: float = 0.02) -> None:
+        self._call = call
+        self.window = window
+        self._pending: list[_Request] = []
+        self._flush_task: asyncio.Task | None = None
+        self.calls = 0
+        self.requests = 0
+
+    async def request(self, codes: Sequence[str], fields: Sequence[str]) -> Any:
+        loop = asyncio.get_running_loop()
+        request = _Request(tuple(codes), tuple(fields), loop.create_future())
+        self._pending.append(request)
+        self.requests += 1
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = loop.create_task(self._flush_after_window())
+        return await request.future
+
+    async def _flush_after_window(self) -> None:
+        # Requests arriving while a merged call is in flight form the next batch,
+        # so keep flushing until a window passes with nothing queued.
+        while True:
+            await asyncio.sleep(self.window)
+            batch, self._pending = self._pending, []
+            if not batch:
+                return
+            await self._flush(batch)
+
+    async def _flush(self, batch: list[_Request]) -> None:
+        codes = _union(request.codes for request in batch)
+        fields = _union(request.fields for request in batch)
+        try:
+            result = await self._issue(codes, fields)
+        except Exception as exc:
+            for request in batch:
+                if not request.future.done():
+                    request.future.set_exception(exc)
+            return
+        if getattr(result, "ErrorCode", -1) != 0 and len(batch) > 1:
+            # A single bad code/field can fail the whole merged call; retry callers alone.
+            logger.warning(
+                "Merged wsq failed (ErrorCode=%s); retrying %d requests individually",
+                getattr(result, "ErrorCode", None),
+                len(batch),
+            )
+            await asyncio.gather(*(self._issue_alone(request) for request in batch))
+            return
+        for request in batch:
+            if not request.future.done():
+                request.future.set_result(_slice(result, codes, fields, request))
+
+    async def _issue_alone(self, request: _Request) -> None:
+        try:
+            result = await self._issue(list(request.codes), list(request.fields))
+        except Exception as exc:
+            if not request.future.done():
+                request.future.set_exception(exc)
+            return
+        if not request.future.done():
+            request.future.set_result(result)
+
+    async def _issue(self, codes: list[str], fields: list[str]) -> Any:
+        self.calls += 1
+        return await self._call(",".join(codes), ",".join(fields))
+
+
+def _union(groups: Any) -> list[str]:
+    return list(dict.fromkeys(item for group in groups for item in group))
+
+
+def _slice(result: Any, codes: list[str], fields: list[str], request: _Request) -> WindSlice:
+    """Cut ``request``'s codes/fields out of a merged result.
+
+    WindPy echoes ``Codes`` and upper-cased ``Fields``; fall back to the order we
+    asked in when those are missing.
+    """
+    result_codes = list(getattr(result, "Codes", None) or codes)
+    result_fields = [str(name).upper() for name in (getattr(result, "Fields", None) or fields)]
+    code_index = {code: index for index, code in enumerate(result_codes)}
+    field_index = {name: index for index, name in enumerate(result_fields)}
+    data = getattr(result, "Data", None) or []
+
+    columns: list[list[Any]] = []
+    for name in request.fields:
+        position = field_index.get(name.upper())
+        series = data[position] if position is not None and position < len(data) else []
+        columns.append(
+            [
+                series[code_index[code]]
+                if code in code_index and code_index[code] < len(series)
+                else None
+                for code in request.codes
+            ]
+        )
+    return WindSlice(
+        ErrorCode=getattr(result, "ErrorCode", 0),
+        Codes=list(request.codes),
+        Fields=[name.upper() for name in request.fields],
+        Times=list(getattr(result, "Times", None) or []),
+        Data=columns,
+    )
@@ -0,0 +1,192 @@
+"""Vectorised mapping of WindPy ``wsq``/``wss`` results to snapshot records.
+
+WindPy returns ``Data`` as one list per field, each holding one value per code.
+:class:`PriceFrame` loads that into a ``field × code`` float matrix (``None`` and
+non-numeric cells become NaN), applies aliasing, rounding and change derivation
+column-wise, and only builds per-code dicts in :meth:`PriceFrame.to_records`.
+
+Rounding matches Python's :func:`round` exactly (see :func:`round_values`):
+plain ``np.round`` disagrees on halfway prices such as ``2.675``.
+Volume cells are passed through as WindPy returned them, so integers stay ints.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Mapping, Sequence
+
+import numpy as np
+
+FIELD_ALIAS = {
+    "rt_last": "last",
+    "rt_chg": "change",
+    "rt_pct_chg": "change_pct",
+    "rt_open": "open",
+    "rt_high": "high",
+    "rt_low": "low",
+    "rt_pre_close": "prev_close",
+    "rt_vol": "volume",
+    "rt_amt": "amount",
+    "close": "last",
+    "chg": "change",
+    "pct_chg": "change_pct",
+    "open": "open",
+    "high": "high",
+    "low": "low",
+    "pre_close": "prev_close",
+    "volume": "volume",
+    "amt": "amount",
+}
+PRICE_KEYS = frozenset({"last", "change", "open", "high", "low", "prev_close"})
+VOLUME_KEYS = frozenset({"volume", "amount"})
+
+
+def to_matrix(data: Sequence[Sequence[Any]], n_fields: int, n_codes: int) -> np.ndarray:
+    """Pack ``Data`` into a ``(n_fields, n_codes)`` float64 array, NaN-padded."""
+    matrix = np.full((n_fields, n_codes), np.nan)
+    for f_index in range(min(n_fields, len(data))):
+        column = data[f_index]
+        size = min(len(column), n_codes)
+        if not size:
+            continue
+        try:
+            matrix[f_index, :size] = np.asarray(column[:size], dtype=np.float64)
+        except (TypeError, ValueError):
+            matrix[f_index, :size] = [_to_float(value) for value in column[:size]]
+    return matrix
+
+
+def round_values(values: np.ndarray, decimals: int) -> np.ndarray:
+    """``round(value, decimals)`` for every element, exactly as Python rounds (NaN stays).
+
+    Away from a halfway point ``rint(x * 10**d) / 10**d`` is the correctly rounded
+    result, as Python's is; only cells whose scaled value sits within float error
+    of ``.5`` (or beyond exact integers) go through :func:`round` one by one.
+    """
+    scale = 10.0**decimals
+    scaled = values * scale
+    result = np.rint(scaled) / scale
+    with np.errstate(invalid="ignore"):
+        magnitude = np.abs(scaled)
+        halfway = np.abs(scaled - np.floor(scaled) - 0.5) <= 1e-9 * np.maximum(magnitude, 1.0)
+        ambiguous = halfway | (magnitude >= 2.0**52)
+    for index in np.flatnonzero(ambiguous).tolist():
+        result[index] = round(float(values[index]), decimals)
+    return result
+
+
+def is_all_zero(data: Sequence[Sequence[Any]]) -> bool:
+    """True when every cell is zero or missing (Wind's reply without permission/closed).
+
+    Deliberately a short-circuit scan rather than an array op: live data hits a
+    non-zero value within the first few cells, so this costs O(1) in practice.
+    """
+    return all(value is None or value == 0 or value != value for column in data for value in column)
+
+
+@dataclass
+class PriceFrame:
+    """Column-oriented price snapshot; NaN marks a missing value."""
+
+    codes: list[str]
+    columns: dict[str, np.ndarray] = field(default_factory=dict)
+    # Original cells for pass-through columns (volumes), NaN where the column is missing.
+    raw: dict[str, list[Any]] = field(default_factory=dict)
+    derived_change: np.ndarray | None = None
+    derived_change_pct: np.ndarray | None = None
+
+    @classmethod
+    def from_wind(
+        cls,
+        codes: Sequence[str],
+        fields: Sequence[str],
+        data: Sequence[Sequence[Any]],
+        decimals: int = 2,
+        include_volume: bool = False,
+    ) -> PriceFrame:
+        matrix = to_matrix(data, len(fields), len(codes))
+        columns: dict[str, np.ndarray] = {}
+        raw: dict[str, list[Any]] = {}
+        for f_index, name in enumerate(fields):
+            key = FIELD_ALIAS.get(name, name)
+            row = matrix[f_index]
+            if key in PRICE_KEYS:
+                row = round_values(row, decimals)
+            elif key == "change_pct":
+                row = round_values(row, 2)
+            elif key in VOLUME_KEYS and include_volume:
+                cells = data[f_index] if f_index < len(data) else ()
+                before = raw.get(key)
+                raw[key] = [
+                    cells[index] if present else (before[index] if before else np.nan)
+                    for index, present in enumerate((~np.isnan(row)).tolist())
+                ]
+            else:
+                continue
+            previous = columns.get(key)
+            # Later fields aliasing the same key win where they have a value.
+            columns[key] = row if previous is None else np.where(np.isnan(row), previous, row)
+
+        frame = cls(list(codes), columns, raw)
+        last, prev_close = columns.get("last"), columns.get("prev_close")
+        if last is not None and prev_close is not None:
+            change = columns.get("change")
+            derive = ~np.isnan(last) & ~np.isnan(prev_close) & (prev_close != 0)
+            if change is not None:
+                derive &= np.isnan(change)
+            if derive.any():
+                delta = np.where(derive, last - prev_close, np.nan)
+                frame.derived_change = round_values(delta, decimals)
+                change_pct = columns.get("change_pct")
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    pct = round_values(delta / prev_close * 100, 2)
+                if change_pct is not None:
+                    pct = np.where(np.isnan(change_pct), pct, np.nan)
+                frame.derived_change_pct = pct
+        return frame
+
+    def to_records(self, names: Mapping[str, str], timestamp: str) -> dict[str, dict[str, Any]]:
+        """Materialise ``{code: record}`` in the provider's snapshot schema."""
+        keys = list(self.columns)
+        if keys:
+            stacked = np.vstack(list(self.columns.values()))
+            lists = [
+                self.raw[key] if key in self.raw else values
+                for key, values in zip(keys, stacked.tolist(), strict=True)
+            ]
+            rows: Any = zip(*lists, strict=True)
+            complete = (~np.isnan(stacked).any(axis=0)).tolist()
+        else:
+            rows = iter([()] * len(self.codes))
+            complete = [True] * len(self.codes)
+        derived = [
+            (key, values.tolist())
+            for key, values in (
+                ("change", self.derived_change),
+                ("change_pct", self.derived_change_pct),
+            )
+            if values is not None
+        ]
+        records: dict[str, dict[str, Any]] = {}
+        for index, (code, row, full) in enumerate(zip(self.codes, rows, complete, strict=True)):
+            item: dict[str, Any] = {"code": code, "timestamp": timestamp}
+            if full:
+                item.update(zip(keys, row, strict=True))
+            else:
+                item.update(
+                    (key, value) for key, value in zip(keys, row, strict=True) if value == value
+                )
+            item["name"] = names.get(code, code)
+            for key, values in derived:
+                value = values[index]
+                if value == value:
+                    item[key] = value
+            records[code] = item
+        return records
+
+
+def _to_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
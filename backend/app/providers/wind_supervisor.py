@@ -0,0 +1,176 @@
+"""Background WindPy session supervisor (connect, heartbeat, reconnect with backoff)."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from concurrent.futures import Executor
+from typing import Any, Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+
+class WindConnectionSupervisor:
+    """Own the WindPy session lifecycle off the event loop.
+
+    Blocking ``w.start()`` / ``w.isconnected()`` calls run in an executor from a
+    single background task; fetch paths only read :attr:`connected`. A failed
+    connect or heartbeat schedules a reconnect with jittered exponential backoff.
+    The backoff only resets once a session has stayed up for ``stable_after``
+    seconds, so a flapping session does not reconnect at the minimum delay forever.
+    """
+
+    def __init__(
+        self,
+        w: Any,
+        heartbeat_interval: float = 15.0,
+        start_timeout: float = 60.0,
+        initial_backoff: float = 1.0,
+        max_backoff: float = 120.0,
+        stable_after: float = 60.0,
+        executor: Executor | None = None,
+    ) -> None:
+        self._w = w
+        self.heartbeat_interval = heartbeat_interval
+        self.start_timeout = start_timeout
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.stable_after = stable_after
+        self._executor = executor
+        self._connected = False
+        self._task: asyncio.Task | None = None
+        self._probe_requested: asyncio.Event | None = None
+        self.connects = 0
+        self.failures = 0
+        self.last_error: str | None = None
+        self.last_heartbeat: float | None = None
+        self._connected_at: float | None = None
+        self._connect_listeners: list[Callable[[], Awaitable[Any]]] = []
+
+    @property
+    def connected(self) -> bool:
+        return self._connected
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def status(self) -> dict[str, Any]:
+        return {
+            "connected": self._connected,
+            "running": self.running,
+            "connects": self.connects,
+            "failures": self.failures,
+            "last_error": self.last_error,
+            "heartbeat_age": (
+                round(time.monotonic() - self.last_heartbeat, 1)
+                if self.last_heartbeat is not None
+                else None
+            ),
+        }
+
+    def add_connect_listener(self, callback: Callable[[], Awaitable[Any]]) -> None:
+        """Await ``callback()`` after every successful (re)connect, e.g. to resubscribe."""
+        self._connect_listeners.append(callback)
+
+    def ensure_started(self) -> None:
+        """Start the supervisor on the running loop (idempotent)."""
+        loop = asyncio.get_running_loop()
+        if self.running and self._task.get_loop() is loop:
+            return
+        self._probe_requested = asyncio.Event()
+        self._task = loop.create_task(self._run())
+
+    def request_probe(self) -> None:
+        """Ask for an immediate heartbeat, e.g. after a failed data call."""
+        if self._probe_requested is not None:
+            self._probe_requested.set()
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._task = None
+        if self._connected:
+            self._connected = False
+            try:
+                await self._in_executor(self._w.stop)
+            except Exception as exc:
+                logger.error("Error closing Wind API connection: %s", exc)
+
+    async def _run(self) -> None:
+        backoff = self.initial_backoff
+        while True:
+            if not self._connected and not await self._connect():
+                backoff = await self._back_off(backoff)
+                continue
+            await self._wait_heartbeat()
+            if await self._probe():
+                continue
+            logger.warning("Wind heartbeat failed; scheduling reconnect")
+            self._connected = False
+            if time.monotonic() - self._connected_at >= self.stable_after:
+                backoff = self.initial_backoff  # a long healthy session: reconnect at once
+            else:
+                backoff = await self._back_off(backoff)
+
+    async def _back_off(self, backoff: float) -> float:
+        """Sleep a jittered ``backoff`` and return the next, doubled delay."""
+        delay = backoff * random.uniform(0.8, 1.2)
+        logger.info("Wind reconnect in %.1fs", delay)
+        await asyncio.sleep(delay)
+        return min(self.max_backoff, backoff * 2)
+
+    async def _connect(self) -> bool:
+        logger.info("Starting Wind API connection...")
+        try:
+            result = await self._in_executor(self._w.start, waitTime=self.start_timeout)
+        except Exception as exc:
+            return self._record_failure(f"start raised {exc}")
+        if getattr(result, "ErrorCode", -1) != 0:
+            return self._record_failure(f"start ErrorCode={getattr(result, 'ErrorCode', None)}")
+        self._connected = True
+        self.connects += 1
+        self.last_heartbeat = self._connected_at = time.monotonic()
+        logger.info("Wind API connection established")
+        for callback in self._connect_listeners:
+            try:
+                await callback()
+            except Exception as exc:
+                logger.error("Wind connect listener failed: %s", exc)
+        return True
+
+    async def _probe(self) -> bool:
+        try:
+            alive = bool(await self._in_executor(self._w.isconnected))
+        except Exception as exc:
+            self._record_failure(f"isconnected raised {exc}")
+            return False
+        if alive:
+            self.last_heartbeat = time.monotonic()
+        else:
+            self._record_failure("isconnected returned False")
+        return alive
+
+    async def _wait_heartbeat(self) -> None:
+        event = self._probe_requested
+        try:
+            await asyncio.wait_for(event.wait(), timeout=self.heartbeat_interval)
+        except TimeoutError:
+            pass
+        event.clear()
+
+    def _record_failure(self, reason: str) -> bool:
+        self.failures += 1
+        self.last_error = reason
+        logger.warning("Wind connection problem: %s", reason)
+        return False
+
+    async def _in_executor(self, func: Any, *args: Any, **kwargs: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, lambda: func(*args, **kwargs))
@@ -0,0 +1,101 @@
+"""In-memory quote store fed by WindPy ``wsq`` push subscriptions.
+
+WindPy invokes subscription callbacks on its own thread with a ``WindData``
+holding only the codes/fields that changed. :class:`WindTickStore` folds those
+partial updates into a per-code field map under a lock, and hands readers a
+``WindData``-shaped copy so the provider's existing result mapping applies.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from typing import Any, Sequence
+
+from .wind_batch import WindSlice
+
+
+class WindTickStore:
+    """Latest pushed value per ``(code, field)``; safe to update from any thread."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._quotes: dict[str, dict[str, float]] = {}
+        self._updated_at: dict[str, float] = {}
+        # Last good callback of any kind: WindPy only pushes changed values, so a quiet
+        # code is not stale while the subscription as a whole keeps calling back.
+        self._heard_at = -math.inf
+        self.updates = 0
+        self.errors = 0
+        self.last_error_code: int | None = None
+        self._failing = False
+
+    def on_wind_data(self, indata: Any) -> None:
+        """WindPy subscription callback: merge one push into the store."""
+        error_code = getattr(indata, "ErrorCode", 0)
+        if error_code != 0:
+            self.errors += 1
+            self.last_error_code = error_code
+            self._failing = True
+            return
+        codes = list(getattr(indata, "Codes", None) or [])
+        fields = [str(name).lower() for name in (getattr(indata, "Fields", None) or [])]
+        data = getattr(indata, "Data", None) or []
+        now = time.monotonic()
+        with self._lock:
+            for c_index, code in enumerate(codes):
+                row = self._quotes.setdefault(code, {})
+                for f_index, name in enumerate(fields):
+                    if f_index >= len(data) or c_index >= len(data[f_index]):
+                        continue
+                    value = data[f_index][c_index]
+                    if value is None or (isinstance(value, float) and math.isnan(value)):
+                        continue
+                    row[name] = value
+                self._updated_at[code] = now
+            self._heard_at = now
+            self.updates += 1
+            self._failing = False
+
+    def covers(self, codes: Sequence[str]) -> bool:
+        """True once at least one push has arrived for every code."""
+        with self._lock:
+            return all(code in self._quotes for code in codes)
+
+    def fresh(self, codes: Sequence[str], max_age: float) -> bool:
+        """True if every code has been pushed, the subscription called back in the last
+        ``max_age`` seconds and no error followed."""
+        now = time.monotonic()
+        with self._lock:
+            if self._failing or now - self._heard_at > max_age:
+                return False
+            return all(code in self._quotes for code in codes)
+
+    def read(self, codes: Sequence[str], fields: Sequence[str]) -> WindSlice:
+        """Copy the requested codes/fields out as a ``WindData``-shaped result."""
+        names = [name.lower() for name in fields]
+        with self._lock:
+            rows = [self._quotes.get(code, {}) for code in codes]
+            columns = [[row.get(name) for row in rows] for name in names]
+        return WindSlice(
+            ErrorCode=0,
+            Codes=list(codes),
+            Fields=[name.upper() for name in names],
+            Data=columns,
+        )
+
+    def age(self, code: str) -> float | None:
+        with self._lock:
+            updated = self._updated_at.get(code)
+        return None if updated is None else time.monotonic() - updated
+
+    def clear(self) -> None:
+        with self._lock:
+            self._quotes.clear()
+            self._updated_at.clear()
+            self._heard_at = -math.inf
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._quotes)
@@ -0,0 +1,174 @@
+"""Incremental rolling return statistics per instrument.
+
+Each new quote contributes one log return per code whose price was sampled in a
+new ``resolution``-second bucket; the data manager feeds only freshly fetched
+quotes, at their own time, so cached or repeated snapshots add no zero returns.
+The last ``window`` returns live in a per-code ring inside one preallocated
+``(max_codes, window)`` block, next to running sums of ``r`` and ``r**2``. An
+update adds the new return and subtracts the one leaving the window, so it
+costs O(1) per code, vectorised across the codes in a refresh. The sums are
+recomputed from the ring whenever a row wraps, which bounds floating-point
+drift.
+
+Derived fields, added to snapshot records by :meth:`RollingAnalytics.annotate`:
+
+* ``intraday_return``: % change since the first price seen today.
+* ``realized_vol``: ``sqrt(sum r**2)`` over the window, in %.
+* ``zscore``: the latest return against the window's mean and standard deviation
+  before it was added; ``abnormal`` is set when ``|zscore| >= zscore_threshold``.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import Any, Iterable, Mapping
+
+import numpy as np
+
+from .timeseries import snapshot_prices
+
+
+class RollingAnalytics:
+    """Rolling mean/variance/realised volatility and z-scores for up to ``max_codes`` codes."""
+
+    def __init__(
+        self,
+        window: int = 120,
+        max_codes: int = 2048,
+        zscore_threshold: float = 3.0,
+        resolution: float = 1.0,
+    ) -> None:
+        if window < 2 or max_codes < 1:
+            raise ValueError("window must be >= 2 and max_codes positive")
+        self.window = window
+        self.max_codes = max_codes
+        self.zscore_threshold = zscore_threshold
+        self.resolution = resolution
+        self._ring = np.zeros((max_codes, window), dtype=np.float64)
+        self._pos = np.zeros(max_codes, dtype=np.intp)
+        self._count = np.zeros(max_codes, dtype=np.intp)
+        self._sum = np.zeros(max_codes, dtype=np.float64)
+        self._sumsq = np.zeros(max_codes, dtype=np.float64)
+        self._prev = np.full(max_codes, np.nan)
+        self._stamp = np.full(max_codes, -np.inf)
+        self._open = np.full(max_codes, np.nan)
+        self._last = np.full(max_codes, np.nan)
+        self._zscore = np.full(max_codes, np.nan)
+        self._rows: dict[str, int] = {}
+        self._day: date | None = None
+        self.observations = 0
+        self.rejected = 0
+
+    def _row(self, code: str) -> int | None:
+        row = self._rows.get(code)
+        if row is None:
+            if len(self._rows) >= self.max_codes:
+                self.rejected += 1
+                return None
+            row = self._rows[code] = len(self._rows)
+        return row
+
+    def update(self, prices: Mapping[str, float], timestamp: float) -> int:
+        """Fold one price per code into the rolling state; returns returns recorded."""
+        pairs = [
+            (row, price)
+            for code, price in prices.items()
+            if price > 0 and (row := self._row(code)) is not None
+        ]
+        if not pairs:
+            return 0
+        rows = np.fromiter((row for row, _ in pairs), dtype=np.intp, count=len(pairs))
+        values = np.fromiter((price for _, price in pairs), dtype=np.float64, count=len(pairs))
+
+        day = date.fromtimestamp(timestamp)
+        if self._day is None or day > self._day:  # a late quote from yesterday keeps today's opens
+            self._day = day
+            self._open[:] = np.nan
+        unopened = np.isnan(self._open[rows])
+        self._open[rows[unopened]] = values[unopened]
+        self._last[rows] = values
+
+        bucket = np.floor(timestamp / self.resolution)
+        fresh = np.floor(self._stamp[rows] / self.resolution) < bucket
+        rows, values = rows[fresh], values[fresh]
+        previous = self._prev[rows]
+        self._prev[rows] = values
+        self._stamp[rows] = timestamp
+        sampled = ~np.isnan(previous)
+        rows, returns = rows[sampled], np.log(values[sampled] / previous[sampled])
+        if not len(rows):
+            return 0
+
+        count = self._count[rows]
+        mean = self._sum[rows] / np.maximum(count, 1)
+        variance = np.maximum(self._sumsq[rows] / np.maximum(count, 1) - mean * mean, 0.0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            zscore = (returns - mean) / np.sqrt(variance)
+        self._zscore[rows] = np.where((count >= 2) & (variance > 0), zscore, np.nan)
+
+        pos = self._pos[rows]
+        leaving = np.where(count == self.window, self._ring[rows, pos], 0.0)
+        self._ring[rows, pos] = returns
+        self._sum[rows] += returns - leaving
+        self._sumsq[rows] += returns * returns - leaving * leaving
+        self._count[rows] = np.minimum(count + 1, self.window)
+        self._pos[rows] = (pos + 1) % self.window
+
+        wrapped = rows[self._pos[rows] == 0]
+        if len(wrapped):
+            block = self._ring[wrapped]
+            self._sum[wrapped] = block.sum(axis=1)
+            self._sumsq[wrapped] = (block * block).sum(axis=1)
+        self.observations += len(rows)
+        return len(rows)
+
+    def update_snapshot(
+        self, snapshot: Mapping[str, Any], categories: Iterable[str], timestamp: float
+    ) -> int:
+        return self.update(snapshot_prices(snapshot, categories), timestamp)
+
+    def metrics(self, codes: Iterable[str]) -> dict[str, dict[str, Any]]:
+        """Derived fields per known code (fields without enough data are left out)."""
+        known = [(code, row) for code in codes if (row := self._rows.get(code)) is not None]
+        if not known:
+            return {}
+        rows = np.fromiter((row for _, row in known), dtype=np.intp, count=len(known))
+        count = self._count[rows]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            intraday = np.round((self._last[rows] / self._open[rows] - 1.0) * 100.0, 2)
+        vol = np.where(count >= 2, np.round(np.sqrt(self._sumsq[rows]) * 100.0, 3), np.nan)
+        zscore = np.round(self._zscore[rows], 2)
+
+        result: dict[str, dict[str, Any]] = {}
+        columns = zip(intraday.tolist(), vol.tolist(), zscore.tolist(), strict=True)
+        for (code, _), (ret, rv, z) in zip(known, columns, strict=True):
+            fields: dict[str, Any] = {}
+            if ret == ret:  # not NaN
+                fields["intraday_return"] = ret
+            if rv == rv:
+                fields["realized_vol"] = rv
+            if z == z:
+                fields["zscore"] = z
+                fields["abnormal"] = abs(z) >= self.zscore_threshold
+            result[code] = fields
+        return result
+
+    def annotate(self, snapshot: Mapping[str, Any], categories: Iterable[str]) -> None:
+        """Merge :meth:`metrics` into the snapshot records in place."""
+        for category in categories:
+            records = snapshot.get(category)
+            if not isinstance(records, dict):
+                continue
+            for code, fields in self.metrics(records).items():
+                record = records.get(code)
+                if isinstance(record, dict):
+                    record.update(fields)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "codes": len(self._rows),
+            "window": self.window,
+            "observations": self.observations,
+            "rejected": self.rejected,
+            "memory_bytes": self._ring.nbytes,
+        }
@@ -0,0 +1,239 @@
+"""Incremental OHLC bars (1m/5m/15m) rolled from quote updates.
+
+Snapshot sources only report the latest price, so bars are built here as
+quotes arrive instead of being recomputed from raw ticks per request. Exchange
+codes with a trading calendar (``.SH``/``.SZ``/``.BJ``/``.HK``) are bucketed
+from each session's open, ticks outside the sessions are ignored, and the last
+bar of a session ends at the close (a tick stamped exactly at the close joins
+it). Everything else is bucketed on the wall clock, around the clock.
+
+Ticks are stamped with the quote's own time and fed once per new quote (the data
+manager skips refreshes that bring nothing new), so ``ticks`` counts quote
+updates rather than requests. A bar completes when a tick for a later bucket
+arrives or :meth:`flush` passes its end. Completed bars go to a bounded
+per-code history and to listeners (the websocket stream). Ticks older than the
+open bar are counted as late and dropped; a tick repeating the previous
+timestamp and price is a duplicate.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from datetime import time as clock
+from typing import Any, Callable, Iterable, Mapping
+
+logger = logging.getLogger(__name__)
+
+INTERVALS: dict[str, int] = {"1m": 60, "5m": 300, "15m": 900}
+
+_CN_SESSIONS = ((clock(9, 30), clock(11, 30)), (clock(13, 0), clock(15, 0)))
+SESSIONS: dict[str, tuple[tuple[clock, clock], ...]] = {
+    ".SH": _CN_SESSIONS,
+    ".SZ": _CN_SESSIONS,
+    ".BJ": _CN_SESSIONS,
+    ".HK": ((clock(9, 30), clock(12, 0)), (clock(13, 0), clock(16, 0))),
+}
+
+
+@dataclass(slots=True)
+class Bar:
+    code: str
+    interval: str
+    start: float
+    end: float
+    open: float
+    high: float
+    low: float
+    close: float
+    last_ts: float
+    ticks: int = 1
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "code": self.code,
+            "interval": self.interval,
+            "start": datetime.fromtimestamp(self.start).isoformat(),
+            "end": datetime.fromtimestamp(self.end).isoformat(),
+            "open": self.open,
+            "high": self.high,
+            "low": self.low,
+            "close": self.close,
+            "ticks": self.ticks,
+        }
+
+
+BarListener = Callable[[Bar], None]
+
+
+def session_window(code: str, timestamp: float) -> tuple[float, float] | None:
+    """``(open, close)`` epoch bounds of the session containing ``timestamp``.
+
+    Returns ``(-inf, inf)`` for codes traded around the clock and ``None`` when
+    the code's exchange is closed at ``timestamp``.
+    """
+    sessions = SESSIONS.get(code[code.rfind("."):]) if "." in code else None
+    if sessions is None:
+        return -math.inf, math.inf
+    day = datetime.fromtimestamp(timestamp).date()
+    for begin, end in sessions:
+        opens = datetime.combine(day, begin).timestamp()
+        closes = datetime.combine(day, end).timestamp()
+        if opens <= timestamp <= closes:
+            return opens, closes
+    return None
+
+
+def bucket(timestamp: float, seconds: int, window: tuple[float, float]) -> tuple[float, float]:
+    """``(start, end)`` of the ``seconds``-wide bar holding ``timestamp`` inside ``window``."""
+    opens, closes = window
+    if math.isinf(opens):
+        start = timestamp - timestamp % seconds
+        return start, start + seconds
+    last_index = max(0, math.ceil((closes - opens) / seconds) - 1)
+    start = opens + min(int((timestamp - opens) // seconds), last_index) * seconds
+    return start, min(start + seconds, closes)
+
+
+class BarAggregator:
+    """Per-code open bars for each interval plus a bounded history of completed ones."""
+
+    def __init__(self, intervals: Mapping[str, int] | None = None, history: int = 500) -> None:
+        self.intervals = dict(intervals or INTERVALS)
+        self.history_size = history
+        self._open: dict[tuple[str, str], Bar] = {}
+        self._history: dict[tuple[str, str], deque[Bar]] = {}
+        self._last_tick: dict[str, tuple[float, float]] = {}
+        self._listeners: list[BarListener] = []
+        self.completed = 0
+        self.late = 0
+        self.duplicates = 0
+        self.off_session = 0
+
+    def reset(self) -> None:
+        """Drop every open and completed bar and the counters; listeners stay registered."""
+        self._open.clear()
+        self._history.clear()
+        self._last_tick.clear()
+        self.completed = self.late = self.duplicates = self.off_session = 0
+
+    def add_listener(self, listener: BarListener) -> None:
+        """Register a callback invoked with every completed bar."""
+        self._listeners.append(listener)
+
+    def add_tick(self, code: str, timestamp: float, price: float) -> list[Bar]:
+        """Fold one quote into every interval; returns the bars it completed."""
+        if self._last_tick.get(code) == (timestamp, price):
+            self.duplicates += 1
+            return []
+        window = session_window(code, timestamp)
+        if window is None:
+            self.off_session += 1
+            return []
+        self._last_tick[code] = (timestamp, price)
+
+        completed: list[Bar] = []
+        late = False
+        for interval, seconds in self.intervals.items():
+            start, end = bucket(timestamp, seconds, window)
+            key = (code, interval)
+            bar = self._open.get(key)
+            if bar is not None and start >= bar.end:
+                completed.append(self._complete(key, bar))
+                bar = None
+            if bar is None:
+                history = self._history.get(key)
+                if history and start < history[-1].end:
+                    late = True
+                    continue
+                self._open[key] = Bar(
+                    code, interval, start, end, price, price, price, price, timestamp
+                )
+                continue
+            if start < bar.start:
+                late = True
+                continue
+            bar.high = max(bar.high, price)
+            bar.low = min(bar.low, price)
+            bar.ticks += 1
+            if timestamp >= bar.last_ts:
+                bar.close = price
+                bar.last_ts = timestamp
+        self.late += late
+        self._publish(completed)
+        return completed
+
+    def flush(self, now: float | None = None) -> list[Bar]:
+        """Complete every open bar whose end is at or before ``now``."""
+        now = time.time() if now is None else now
+        due = [(key, bar) for key, bar in self._open.items() if bar.end <= now]
+        completed = [self._complete(key, bar) for key, bar in due]
+        self._publish(completed)
+        return completed
+
+    def update_snapshot(
+        self,
+        snapshot: Mapping[str, Any],
+        categories: Iterable[str],
+        timestamp: float | None = None,
+    ) -> list[Bar]:
+        """Feed the ``last`` price of every snapshot record, then flush finished bars."""
+        timestamp = time.time() if timestamp is None else timestamp
+        completed: list[Bar] = []
+        for category in categories:
+            records = snapshot.get(category)
+            if not isinstance(records, dict):
+                continue
+            for code, record in records.items():
+                last = record.get("last") if isinstance(record, dict) else None
+                if isinstance(last, bool) or not isinstance(last, int | float):
+                    continue
+                if math.isfinite(last):
+                    completed.extend(self.add_tick(code, timestamp, float(last)))
+        completed.extend(self.flush(timestamp))
+        return completed
+
+    def bars(
+        self,
+        code: str,
+        interval: str,
+        limit: int | None = None,
+        include_open: bool = True,
+    ) -> list[dict[str, Any]]:
+        """Completed bars oldest first, optionally followed by the bar still forming."""
+        key = (code, interval)
+        rows = [bar.to_dict() for bar in self._history.get(key, ())]
+        current = self._open.get(key)
+        if include_open and current is not None:
+            rows.append({**current.to_dict(), "partial": True})
+        return rows[-limit:] if limit else rows
+
+    def _complete(self, key: tuple[str, str], bar: Bar) -> Bar:
+        del self._open[key]
+        history = self._history.get(key)
+        if history is None:
+            history = self._history[key] = deque(maxlen=self.history_size)
+        history.append(bar)
+        self.completed += 1
+        return bar
+
+    def _publish(self, bars: list[Bar]) -> None:
+        for bar in bars:
+            for listener in self._listeners:
+                try:
+                    listener(bar)
+                except Exception as exc:
+                    logger.warning("Bar listener failed: %s", exc)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "open": len(self._open),
+            "completed": self.completed,
+            "late": self.late,
+            "duplicates": self.duplicates,
+            "off_session": self.off_session,
+        }
@@ -0,0 +1,67 @@
+"""Whole-market breadth (A_SHARES_MARKET_BREADTH) over a :class:`QuoteTable`.
+
+Every statistic is a masked reduction over the table's columns, so a refresh of
+the full ~5,500-stock universe costs well under a millisecond.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+from .universe import BOARDS, QuoteTable
+
+# Change-% buckets for the up/down distribution; unchanged stocks get their own "0" bucket.
+DISTRIBUTION_EDGES = np.array([-7.0, -5.0, -3.0, 0.0, 3.0, 5.0, 7.0])
+DISTRIBUTION_LABELS = ("<-7", "-7~-5", "-5~-3", "-3~0", "0", "0~3", "3~5", "5~7", ">7")
+
+
+def compute_breadth(table: QuoteTable) -> dict[str, Any]:
+    """Advancers/decliners, limit counts, advance/decline volume and the change distribution."""
+    active = table.active
+    up = active & (table.last_cents > table.prev_cents)
+    down = active & (table.last_cents < table.prev_cents)
+    flat = active & ~up & ~down
+    limit_up_price, limit_down_price = table.limit_prices()
+    limit_up = up & (table.last_cents >= limit_up_price)
+    limit_down = down & (table.last_cents <= limit_down_price)
+
+    volume = np.nan_to_num(table.volume)
+    amount = np.nan_to_num(table.amount)
+    moving = up | down
+    buckets = np.bincount(
+        np.digitize(table.change_pct[moving], DISTRIBUTION_EDGES),
+        minlength=len(DISTRIBUTION_EDGES) + 1,
+    ).tolist()
+    buckets.insert(DISTRIBUTION_LABELS.index("0"), int(flat.sum()))
+
+    board_counts = [
+        np.bincount(table.board[mask], minlength=len(BOARDS)).tolist()
+        for mask in (up, down, flat)
+    ]
+    advancers, decliners = int(up.sum()), int(down.sum())
+    return {
+        "total": len(table),
+        "active": int(active.sum()),
+        "advancers": advancers,
+        "decliners": decliners,
+        "unchanged": int(flat.sum()),
+        "limit_up_count": int(limit_up.sum()),
+        "limit_down_count": int(limit_down.sum()),
+        "advance_decline_ratio": round(advancers / decliners, 2) if decliners else None,
+        "advance_volume": float(volume[up].sum()),
+        "decline_volume": float(volume[down].sum()),
+        "total_volume": float(volume.sum()),
+        "total_turnover": float(amount.sum()),
+        "distribution": [
+            {"label": label, "count": count}
+            for label, count in zip(DISTRIBUTION_LABELS, buckets, strict=True)
+        ],
+        "boards": {
+            board: {"advancers": ups, "decliners": downs, "unchanged": flats}
+            for board, ups, downs, flats in zip(BOARDS, *board_counts, strict=True)
+        },
+        "source": table.source,
+        "last_update": table.timestamp,
+    }
@@ -5,12 +5,33 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
-from datetime import datetime, timedelta
+import math
+import time
+from datetime import date, datetime
 from typing import Any, Dict, Optional, Callable
+
+import numpy as np
 
 from ..core.cache import CacheManager
 from ..core.settings import settings
-from ..providers import MarketDataProvider, WindProvider, NullProvider, MockProvider, OpenProvider
+from ..providers import (
+    MarketDataProvider,
+    WindProvider,
+    NullProvider,
+    MockProvider,
+    OpenProvider,
+    ReplayProvider,
+    SyntheticMockProvider,
+)
+from .analytics import RollingAnalytics
+from .bars import BarAggregator
+from .breadth import compute_breadth
+from .heatmap import SectorHeatmap
+from .history import HistorySampler
+from .movers import TopMovers
+from .tick_archive import TickArchive
+from .timeseries import TimeSeriesStore, quote_time, snapshot_prices
+from .universe import QuoteTable
 
 logger = logging.getLogger(__name__)
 
@@ -18,11 +39,62 @@ logger = logging.getLogger(__name__)
 class DataManager:
     """Manages market data fetching, caching, and streaming."""
 
-    def __init__(self, cache_manager: Optional[CacheManager] = None):
+    def __init__(
+        self,
+        cache_manager: Optional[CacheManager] = None,
+        provider: Optional[MarketDataProvider] = None,
+    ):
         """Initialize data manager with cache and provider."""
         self.cache_manager = cache_manager or CacheManager()
-        self.provider = self._create_provider()
-        self._last_fetch_times: Dict[str, datetime] = {}
+        self.provider = provider or self._create_provider()
+        # Fetch times on the session clock (below), so replay expires the cache at its speed.
+        self._last_fetch_times: Dict[str, float] = {}
+        # Replay providers carry their own session clock; everything derived uses it.
+        self.clock = getattr(self.provider, "clock", None)
+        self.timeseries = TimeSeriesStore(
+            capacity=settings.timeseries_capacity,
+            max_codes=settings.timeseries_max_codes,
+        )
+        self.history = HistorySampler(self.timeseries)
+        # Quote time of the last point recorded per code; older or repeated quotes are skipped.
+        self._quote_times: Dict[str, float] = {}
+        # Pass of a looping replay session the derived state belongs to (0 otherwise).
+        self._lap = 0
+        self.analytics = RollingAnalytics(
+            window=settings.analytics_window,
+            max_codes=settings.timeseries_max_codes,
+            zscore_threshold=settings.analytics_zscore_threshold,
+        )
+        self.bars = BarAggregator(history=settings.bar_history_size)
+        stream = getattr(self.provider, "crypto_stream", None)
+        if stream is not None:
+            stream.add_listener(self._on_stream_quote)
+        self.universe: Optional[QuoteTable] = None
+        self.movers = TopMovers(depth=settings.movers_top_k)
+        self.sector_heatmap = SectorHeatmap(
+            aspect_ratio=settings.heatmap_aspect_ratio,
+            stocks_per_industry=settings.heatmap_stocks_per_industry,
+        )
+        self.archive: Optional[TickArchive] = None
+        if settings.tick_archive_enabled and self.clock is None:
+            self.archive = TickArchive(
+                settings.tick_archive_dir,
+                fsync_interval=settings.tick_archive_fsync_interval,
+                retention_days=settings.tick_archive_retention_days,
+                compact_after_days=settings.tick_archive_compact_after_days,
+            )
+
+    async def start(self) -> None:
+        """Reload archived history and start provider background work (app startup)."""
+        if self.archive is not None:
+            await asyncio.to_thread(self._backfill_timeseries)
+        await self.provider.start()
+
+    async def close(self) -> None:
+        """Stop provider background work and flush the tick archive (app shutdown)."""
+        await self.provider.close()
+        if self.archive is not None:
+            await asyncio.to_thread(self.archive.close)
 
     def _create_provider(self) -> MarketDataProvider:
         """Create appropriate provider based on settings."""
@@ -41,27 +113,76 @@ class DataManager:
                 logger.info("Falling back to null provider")
                 return NullProvider()
         elif settings.data_mode == "mock":
+            if settings.mock_universe_size > 0 or settings.mock_category_scale > 1:
+                size = settings.mock_universe_size
+                scale = settings.mock_category_scale
+                logger.info(
+                    f"Using synthetic mock provider with {size} generated codes "
+                    f"and {scale}x snapshot categories"
+                )
+                return SyntheticMockProvider(
+                    universe_size=settings.mock_universe_size,
+                    category_scale=scale,
+                    update_rate=settings.mock_update_rate,
+                    volatility=settings.mock_volatility,
+                    latency=settings.mock_latency,
+                    error_rate=settings.mock_error_rate,
+                    seed=settings.mock_seed,
+                )
             logger.info("Using mock provider for local development")
             return MockProvider()
+        elif settings.data_mode == "replay":
+            root = settings.replay_dir or settings.tick_archive_dir
+            logger.info(f"Replaying recorded ticks from {root} at {settings.replay_speed}x")
+            return ReplayProvider(
+                root,
+                day=date.fromisoformat(settings.replay_day) if settings.replay_day else None,
+                speed=settings.replay_speed,
+                loop=settings.replay_loop,
+            )
         else:
             logger.info("Using open provider (stub) for open data mode")
             return OpenProvider()
 
+    SNAPSHOT_CATEGORIES = (
+        "indices",
+        "fx",
+        "rates",
+        "commodities",
+        "us_stocks",
+        "crypto",
+        "calendar",
+        "a_share_short_term",
+    )
+    # Categories whose records carry a ``last`` price worth keeping history for.
+    SERIES_CATEGORIES = ("indices", "fx", "rates", "commodities", "us_stocks", "crypto")
+
     async def get_market_snapshot(self) -> Dict[str, Any]:
         """Get complete market data snapshot."""
+        # Fetch categories concurrently so providers can coalesce upstream calls
+        # (e.g. Wind merges the per-category wsq requests into one round trip).
+        *results, intraday, universe = await asyncio.gather(
+            *(self._get_cached_or_fetch(category) for category in self.SNAPSHOT_CATEGORIES),
+            self._get_cached_or_fetch("intraday"),
+            self._get_cached_or_fetch("a_share_universe"),
+        )
+        now = self._now()
         snapshot = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.fromtimestamp(now).isoformat(),
             "data_mode": settings.data_mode,
-            "indices": await self._get_cached_or_fetch("indices"),
-            "fx": await self._get_cached_or_fetch("fx"),
-            "rates": await self._get_cached_or_fetch("rates"),
-            "commodities": await self._get_cached_or_fetch("commodities"),
-            "us_stocks": await self._get_cached_or_fetch("us_stocks"),
-            "crypto": await self._get_cached_or_fetch("crypto"),
-            "calendar": await self._get_cached_or_fetch("calendar"),
-            "a_share_short_term": await self._get_cached_or_fetch("a_share_short_term"),
+            **dict(zip(self.SNAPSHOT_CATEGORIES, results, strict=True)),
             "heatmap": None,  # to be filled below
         }
+        self._attach_sparklines(snapshot.get("indices") or {}, intraday or {})
+        self.analytics.annotate(snapshot, self.SERIES_CATEGORIES)
+        self.bars.flush(now)
+
+        table = self._update_universe(universe)
+        snapshot["breadth"] = compute_breadth(table) if table is not None else None
+        snapshot["top_movers"] = self.movers.snapshot(table) if table is not None else None
+        snapshot["sector_heatmap"] = (
+            self.sector_heatmap.overview(table) if table is not None else None
+        )
 
         # Calculate market summary
         snapshot["summary"] = self._calculate_market_summary(snapshot)
@@ -83,7 +204,9 @@ class DataManager:
             if cached_data:
                 # Check if data is still fresh
                 last_fetch = self._last_fetch_times.get(data_type)
-                if last_fetch and datetime.now() - last_fetch < timedelta(seconds=settings.snapshot_cache_ttl):
+                age = self._now() - last_fetch if last_fetch is not None else None
+                # A negative age means the replay clock wrapped around: refetch.
+                if age is not None and 0 <= age < settings.snapshot_cache_ttl:
                     return json.loads(cached_data)
 
         # Fetch fresh data
@@ -105,8 +228,13 @@ class DataManager:
                 data = {"events": calendar_data}
             elif data_type == "a_share_short_term":
                 data = await self.provider.fetch_a_share_short_term()
-            else:
-                data = {}
+            elif data_type == "intraday":
+                data = await self.provider.fetch_intraday_bars()
+            elif data_type == "a_share_universe":
+                data = await self.provider.fetch_a_share_universe()
+            else:
+                data = {}
+            lap = self._session_lap()
 
             # Cache the data
             if self.cache_manager and data:
@@ -117,7 +245,9 @@ class DataManager:
                 )
 
             # Update last fetch time
-            self._last_fetch_times[data_type] = datetime.now()
+            self._last_fetch_times[data_type] = self._now()
+            if data_type in self.SERIES_CATEGORIES:
+                self._record(data_type, data, lap)
 
             logger.info(f"Fetched fresh {data_type} data with {len(data)} items")
             return data
@@ -126,6 +256,92 @@ class DataManager:
             logger.error(f"Error fetching {data_type} data: {e}")
             return {}
 
+    def _session_lap(self) -> int:
+        lap = getattr(self.clock, "lap", None)
+        return lap() if callable(lap) else 0
+
+    def _record(self, category: str, records: Dict[str, Any], lap: int = 0) -> None:
+        """Fold a freshly fetched category into the series, bars and analytics (never a cache hit).
+
+        Each point is stamped with the quote's own time; a quote no newer than the
+        last one recorded for its code carries nothing new and is skipped. When a
+        looping replay wraps (``lap`` moves on), its quotes go back in time, so the
+        previous pass's derived state is dropped first.
+        """
+        if lap < self._lap:
+            return  # fetched before the wrap, recorded after it
+        if lap > self._lap:
+            self._lap = lap
+            self._reset_derived()
+        live = self._live_records(records)
+        fetched_at = self._now()
+        by_time: Dict[float, Dict[str, float]] = {}
+        for code, price in snapshot_prices({category: live}, (category,)).items():
+            stamp = quote_time(live[code], fetched_at)
+            if stamp <= self._quote_times.get(code, -math.inf):
+                continue
+            self._quote_times[code] = stamp
+            by_time.setdefault(stamp, {})[code] = price
+        for stamp, prices in sorted(by_time.items()):
+            self.timeseries.extend(prices, stamp)
+            self.analytics.update(prices, stamp)
+            for code, price in prices.items():
+                self.bars.add_tick(code, stamp, price)
+        if self.archive:
+            # The archive keeps what the board showed when, so rows carry the fetch time.
+            self.archive.submit({category: live}, (category,), fetched_at)
+
+    def _reset_derived(self) -> None:
+        """Start the series, analytics and bars over (a replay session restarted)."""
+        logger.info(f"Replay session restarted (lap {self._lap}); resetting derived history")
+        self._quote_times.clear()
+        self.timeseries = TimeSeriesStore(
+            capacity=self.timeseries.capacity,
+            max_codes=self.timeseries.max_codes,
+            resolution=self.timeseries.resolution,
+        )
+        self.history = HistorySampler(self.timeseries)
+        self.analytics = RollingAnalytics(
+            window=self.analytics.window,
+            max_codes=self.analytics.max_codes,
+            zscore_threshold=self.analytics.zscore_threshold,
+            resolution=self.analytics.resolution,
+        )
+        self.bars.reset()
+
+    @staticmethod
+    def _live_records(records: Any) -> Dict[str, Any]:
+        """Drop placeholder records (``source == "demo"``) that must not enter history."""
+        if not isinstance(records, dict):
+            return {}
+        return {
+            code: record
+            for code, record in records.items()
+            if not (isinstance(record, dict) and record.get("source") == "demo")
+        }
+
+    @staticmethod
+    def _attach_sparklines(records: Dict[str, Any], intraday: Dict[str, Any]) -> None:
+        """Add ``spark`` minute-close arrays to the records that have intraday bars."""
+        for code, series in intraday.items():
+            record = records.get(code)
+            if isinstance(record, dict) and isinstance(series, dict) and series.get("spark"):
+                record["spark"] = series["spark"]
+
+    def _update_universe(self, payload: Dict[str, Any]) -> Optional[QuoteTable]:
+        """Rebuild the universe table when the provider returned a new refresh."""
+        current = self.universe
+        if not payload:
+            return current
+        if current is not None and payload.get("timestamp") == current.timestamp:
+            return current  # cached refresh: keep the table (and its version)
+        table = QuoteTable.from_payload(
+            payload, version=current.version + 1 if current else 1, previous=current
+        )
+        if table is not None:
+            self.universe = table
+        return self.universe
+
     def _calculate_market_summary(self, snapshot: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate market summary statistics."""
         indices = snapshot.get("indices", {}) or {}
@@ -141,6 +357,21 @@ class DataManager:
             "unchanged": 0,
         }
 
+        # Whole-market breadth when the provider serves the stock universe.
+        breadth = snapshot.get("breadth")
+        if breadth:
+            summary.update(
+                breadth_scope="universe",
+                total_stocks=breadth["total"],
+                advancing=breadth["advancers"],
+                declining=breadth["decliners"],
+                unchanged=breadth["unchanged"],
+                limit_up=breadth["limit_up_count"],
+                limit_down=breadth["limit_down_count"],
+            )
+            return summary
+        summary["breadth_scope"] = "indices"
+
         # Count advancing/declining indices
         for code, index_data in snapshot.get("indices", {}).items():
             if not isinstance(index_data, dict):
@@ -180,6 +411,88 @@ class DataManager:
         heatmap.sort(key=lambda x: abs(x["pct_change"]), reverse=True)
         return heatmap[:16]
 
+    def get_top_movers(
+        self,
+        metric: str,
+        k: Optional[int] = None,
+        board: Optional[str] = None,
+        cap: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Top-K ranking over the latest universe refresh; ``None`` before the first one."""
+        table = self.universe
+        if table is None:
+            return None
+        return {
+            "metric": metric,
+            "board": board,
+            "cap": cap,
+            "items": self.movers.select(table, metric, k, board, cap),
+            "version": table.version,
+            "last_update": table.timestamp,
+        }
+
+    def get_sector_heatmap(self, aspect_ratio: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Laid-out sector/industry/stock tree for the latest universe; ``None`` before one."""
+        table = self.universe
+        if table is None:
+            return None
+        return self.sector_heatmap.tree(table, aspect_ratio)
+
+    def get_series(self, code: str, points: Optional[int] = None) -> Dict[str, Any]:
+        """Recent ``(timestamp, price)`` history for one code from the in-memory store."""
+        times, prices = self.timeseries.last(code, points)
+        return {"code": code, "times": times.tolist(), "prices": prices.tolist()}
+
+    def _now(self) -> float:
+        return self.clock.now() if self.clock else time.time()
+
+    def wall_seconds(self, session_seconds: float) -> float:
+        """Real time that ``session_seconds`` take on the session clock (replay runs faster)."""
+        speed = getattr(self.clock, "speed", 1.0) if self.clock else 1.0
+        return session_seconds / speed if speed > 0 else session_seconds
+
+    def _on_stream_quote(self, code: str, quote: Dict[str, Any]) -> None:
+        """Fold streamed quotes into the bars between snapshot refreshes."""
+        last = quote.get("last")
+        if isinstance(last, (int, float)):
+            self.bars.add_tick(code, quote_time(quote, self._now()), float(last))
+
+    def _backfill_timeseries(self) -> None:
+        """Reload today's archived ticks into the in-memory store after a restart."""
+        now = datetime.now()
+        window = self.timeseries.capacity * self.timeseries.resolution
+        start = now.timestamp() - window
+        for category in self.SERIES_CATEGORIES:
+            try:
+                data = self.archive.read(category, now.date(), start=start)
+            except Exception as e:
+                logger.error(f"Error backfilling {category} history: {e}")
+                continue
+            # Points go in at the quote's own time, the same time base as live points,
+            # and like live quotes a row no newer than the code's last point is skipped.
+            codes = data["codes"]
+            order = np.argsort(data["quote_ts"], kind="stable")
+            by_time: Dict[float, Dict[str, float]] = {}
+            for stamp, index, price in zip(
+                data["quote_ts"][order].tolist(),
+                data["code"][order].tolist(),
+                data["last"][order].tolist(),
+                strict=True,
+            ):
+                code = codes[index]
+                if stamp <= self._quote_times.get(code, -math.inf):
+                    continue
+                self._quote_times[code] = stamp
+                by_time.setdefault(stamp, {})[code] = price
+            for stamp, batch in by_time.items():
+                self.timeseries.extend(batch, stamp)
+
+    async def get_archived_snapshot(self, category: str, when: datetime) -> Dict[str, Any]:
+        """What the board showed for ``category`` at ``when``, read off the event loop."""
+        if not self.archive:
+            return {}
+        return await asyncio.to_thread(self.archive.as_of, category, when)
+
     async def start_background_refresh(self) -> None:
         """Start background task to refresh data periodically."""
         logger.info("Starting background data refresh task")
@@ -187,7 +500,7 @@ class DataManager:
         async def refresh_loop():
             while True:
                 try:
-                    await asyncio.sleep(settings.snapshot_cache_ttl)
+                    await asyncio.sleep(self.wall_seconds(settings.snapshot_cache_ttl))
                     logger.info("Running background data refresh")
                     await self.get_market_snapshot()
                 except Exception as e:
@@ -0,0 +1,256 @@
+"""Hierarchical sector -> industry -> stock heatmap with a server-side treemap layout.
+
+:class:`SectorHeatmap` aggregates the universe :class:`QuoteTable` into
+cap-weighted nodes with ``np.bincount``. Each node has a total market cap
+``weight``, a cap-weighted ``pct_change``, a summed ``turnover`` (amount), and
+advancer/decliner counts. Industries are grouped into broad sectors by keyword
+(:func:`sector_of`). Each industry shows its largest ``stocks_per_industry``
+stocks plus one remainder tile.
+
+Every level is laid out with the squarified treemap algorithm (Bruls, Huizing
+and van Wijk) on a ``aspect_ratio x 1`` canvas. ``rect`` is ``[x, y, w, h]`` as
+fractions of the canvas width and height, so the browser only scales and paints
+rectangles. Layouts are cached per (universe version, aspect ratio).
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Sequence
+
+import numpy as np
+
+from .universe import QuoteTable
+
+# Sector -> industry-name keywords, checked in order (so "化学制药" is healthcare,
+# not materials). Covers Eastmoney industry names and SW level-1 names.
+SECTORS = (
+    ("医药", ("医", "药", "生物")),
+    ("金融", ("银行", "证券", "保险", "金融", "信托")),
+    ("科技", ("半导体", "电子", "软件", "计算机", "通信", "传媒", "互联网", "游戏", "光学")),
+    ("消费", (
+        "食品", "饮料", "酒", "家电", "家用电器", "纺织", "服装", "旅游", "酒店", "商贸",
+        "零售", "美容", "珠宝", "农", "牧", "渔", "饲料", "社会服务", "教育", "家居",
+    )),
+    ("制造", ("机械", "设备", "汽车", "电池", "军工", "航天", "航空", "船舶", "仪器", "光伏")),
+    ("周期", (
+        "煤", "钢", "有色", "化", "石油", "石化", "采掘", "建筑材料", "建材", "水泥", "玻璃",
+        "造纸", "金属", "包装",
+    )),
+    ("公用", ("电力", "燃气", "水务", "环保", "公用", "交通", "港口", "航运", "物流", "铁路",
+             "公路", "机场")),
+    ("地产", ("房地产", "建筑", "装修", "工程")),
+)
+OTHER_SECTOR = "其他"
+SECTOR_NAMES = tuple(name for name, _ in SECTORS) + (OTHER_SECTOR,)
+
+
+@lru_cache(maxsize=1024)
+def sector_of(industry: str) -> str:
+    """Broad sector for an industry name (:data:`OTHER_SECTOR` when nothing matches)."""
+    for sector, keywords in SECTORS:
+        if any(keyword in industry for keyword in keywords):
+            return sector
+    return OTHER_SECTOR
+
+
+def _worst(row: list[float], side: float) -> float:
+    total = sum(row)
+    return max(max(row) * side * side / (total * total), total * total / (side * side * min(row)))
+
+
+def squarify(
+    values: Sequence[float], x: float, y: float, width: float, height: float
+) -> list[tuple[float, float, float, float]]:
+    """Squarified treemap rectangles for positive ``values`` sorted in descending order."""
+    total = sum(values)
+    if not values or total <= 0 or width <= 0 or height <= 0:
+        return [(x, y, 0.0, 0.0) for _ in values]
+    areas = [value * width * height / total for value in values]
+    rects: list[tuple[float, float, float, float]] = []
+    index = 0
+    while index < len(areas):
+        side = min(width, height)
+        row = [areas[index]]
+        index += 1
+        while index < len(areas) and _worst(row + [areas[index]], side) <= _worst(row, side):
+            row.append(areas[index])
+            index += 1
+        strip = sum(row)
+        if width >= height:  # a column along the left edge
+            column_width = strip / height
+            offset = y
+            for area in row:
+                rects.append((x, offset, column_width, area / column_width))
+                offset += area / column_width
+            x += column_width
+            width -= column_width
+        else:  # a row along the top edge
+            row_height = strip / width
+            offset = x
+            for area in row:
+                rects.append((offset, y, area / row_height, row_height))
+                offset += area / row_height
+            y += row_height
+            height -= row_height
+    return rects
+
+
+class SectorHeatmap:
+    """Builds and caches the laid-out heatmap tree for each universe refresh."""
+
+    def __init__(
+        self, aspect_ratio: float = 16 / 9, stocks_per_industry: int = 8, cache_size: int = 8
+    ) -> None:
+        self.aspect_ratio = aspect_ratio
+        self.stocks_per_industry = stocks_per_industry
+        self.cache_size = cache_size
+        self._cache: OrderedDict[tuple[int, float], dict[str, Any]] = OrderedDict()
+        self.builds = 0
+
+    def tree(self, table: QuoteTable, aspect_ratio: float | None = None) -> dict[str, Any]:
+        """The full sector/industry/stock tree, laid out for ``aspect_ratio``."""
+        aspect = round(aspect_ratio or self.aspect_ratio, 4)
+        key = (table.version, aspect)
+        cached = self._cache.get(key)
+        if cached is None:
+            cached = self._cache[key] = self._build(table, aspect)
+            self.builds += 1
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(key)
+        return cached
+
+    def overview(self, table: QuoteTable) -> dict[str, Any]:
+        """Sector and industry levels only (no stock tiles), for the market snapshot."""
+        tree = self.tree(table)
+        return {
+            **tree,
+            "sectors": [
+                {
+                    **sector,
+                    "industries": [
+                        {k: v for k, v in industry.items() if k != "stocks"}
+                        for industry in sector["industries"]
+                    ],
+                }
+                for sector in tree["sectors"]
+            ],
+        }
+
+    def _build(self, table: QuoteTable, aspect: float) -> dict[str, Any]:
+        cap = np.where(table.active, np.nan_to_num(table.market_cap), 0.0)
+        if not cap.any():  # no caps from the source: size by turnover instead
+            cap = np.where(table.active, np.nan_to_num(table.amount), 0.0)
+        pct = np.nan_to_num(table.change_pct)
+        amount = np.nan_to_num(table.amount)
+        up = (table.last_cents > table.prev_cents) & table.active
+        down = (table.last_cents < table.prev_cents) & table.active
+
+        ids, size = table.industry_ids, len(table.industry_labels)
+        weight = np.bincount(ids, cap, size)
+        weighted_pct = np.bincount(ids, cap * pct, size)
+        turnover = np.bincount(ids, amount, size)
+        advancers = np.bincount(ids, up, size).astype(int)
+        decliners = np.bincount(ids, down, size).astype(int)
+
+        # Largest stocks first within each industry: one lexsort for the whole universe.
+        order = np.lexsort((-cap, ids))
+        starts = np.searchsorted(ids[order], np.arange(size))
+        industries: dict[str, list[dict[str, Any]]] = {}
+        for industry in np.flatnonzero(weight > 0).tolist():
+            start = starts[industry]
+            rows = [
+                row for row in order[start : start + self.stocks_per_industry].tolist()
+                if ids[row] == industry and cap[row] > 0
+            ]
+            stocks = [
+                self._node(table.codes[row], table.names[row], cap[row], cap[row] * pct[row],
+                           amount[row], symbol=table.codes[row])
+                for row in rows
+            ]
+            rest = weight[industry] - sum(cap[row] for row in rows)
+            if rest > weight[industry] * 1e-9:
+                rest_pct = weighted_pct[industry] - sum(cap[row] * pct[row] for row in rows)
+                rest_amount = turnover[industry] - sum(amount[row] for row in rows)
+                stocks.append(self._node("other", "其他", rest, rest_pct, rest_amount, symbol=None))
+            label = table.industry_labels[industry]
+            node = self._node(label, label, weight[industry], weighted_pct[industry],
+                              turnover[industry], advancers=int(advancers[industry]),
+                              decliners=int(decliners[industry]))
+            node["stocks"] = stocks
+            industries.setdefault(sector_of(label), []).append(node)
+
+        # Sector totals are the same sums one level up, over industry ids.
+        sector_ids = np.fromiter(
+            (SECTOR_NAMES.index(sector_of(label)) for label in table.industry_labels),
+            np.intp,
+            size,
+        )
+        sector_sums = [
+            np.bincount(sector_ids, column, len(SECTOR_NAMES))
+            for column in (weight, weighted_pct, turnover, advancers, decliners)
+        ]
+        sectors = []
+        for index, name in enumerate(SECTOR_NAMES):
+            children = industries.get(name)
+            if not children:
+                continue
+            total, pct_sum, amount_sum, ups, downs = (column[index] for column in sector_sums)
+            node = self._node(
+                name, name, total, pct_sum, amount_sum, advancers=int(ups), decliners=int(downs)
+            )
+            node["industries"] = children
+            sectors.append(node)
+
+        self._layout(sectors, "industries", (0.0, 0.0, aspect, 1.0), aspect)
+        return {
+            "version": table.version,
+            "aspect_ratio": aspect,
+            "source": table.source,
+            "last_update": table.timestamp,
+            "sectors": sectors,
+        }
+
+    @staticmethod
+    def _node(
+        node_id: str,
+        name: str,
+        weight: float,
+        weighted_pct: float,
+        turnover: float,
+        **extra: Any,
+    ) -> dict[str, Any]:
+        return {
+            "id": node_id,
+            "name": name,
+            "weight": float(weight),
+            "pct_change": round(float(weighted_pct / weight), 2) if weight > 0 else 0.0,
+            "turnover": float(turnover),
+            **extra,
+        }
+
+    def _layout(
+        self,
+        nodes: list[dict[str, Any]],
+        child_key: str | None,
+        bounds: tuple[float, float, float, float],
+        aspect: float,
+    ) -> None:
+        """Lay ``nodes`` out inside ``bounds`` (canvas units), then recurse into children."""
+        nodes.sort(key=lambda node: node["weight"], reverse=True)
+        rects = squarify([node["weight"] for node in nodes], *bounds)
+        for node, (x, y, w, h) in zip(nodes, rects, strict=True):
+            node["rect"] = [round(x / aspect, 5), round(y, 5), round(w / aspect, 5), round(h, 5)]
+            if child_key:
+                grandchild = "stocks" if child_key == "industries" else None
+                self._layout(node[child_key], grandchild, (x, y, w, h), aspect)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "cached": len(self._cache),
+            "builds": self.builds,
+            "aspect_ratio": self.aspect_ratio,
+        }
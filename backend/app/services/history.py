@@ -0,0 +1,144 @@
+"""Downsampled price history for sparklines, read from :class:`TimeSeriesStore`.
+
+Two reducers are offered. ``lttb`` (Largest-Triangle-Three-Buckets) keeps the
+visually significant points; bucket edges and next-bucket means are NumPy
+reductions, and the anchor chaining loops once per output point, scoring wide
+buckets as NumPy rows and narrow ones in plain Python. ``minmax`` keeps each
+bucket's low and high in time order and is fully vectorised.
+
+Results are cached per ``(code, window, points, method, version)``, where the
+version is the store's write counter for the code, so a repeat request between
+refreshes costs a dict lookup.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any, Iterable
+
+import numpy as np
+
+from .timeseries import TimeSeriesStore
+
+METHODS = ("lttb", "minmax")
+# Average bucket width above which LTTB scores each bucket as one NumPy row.
+_ROW_THRESHOLD = 32
+
+
+def _edges(n: int, buckets: int) -> np.ndarray:
+    """Edges splitting indices ``1 .. n-2`` into ``buckets`` non-empty ranges."""
+    return np.linspace(1, n - 1, buckets + 1).astype(np.intp)
+
+
+def lttb(x: np.ndarray, y: np.ndarray, points: int) -> np.ndarray:
+    """Indices of the ``points`` samples LTTB keeps (first and last always included)."""
+    n = len(x)
+    if points >= n:
+        return np.arange(n)
+    if points < 3:
+        return np.array([0, n - 1][:points], dtype=np.intp)
+    buckets = points - 2
+    edges = _edges(n, buckets)
+    counts = np.diff(edges)
+    mean_x = np.add.reduceat(x[: n - 1], edges[:-1]) / counts
+    mean_y = np.add.reduceat(y[: n - 1], edges[:-1]) / counts
+    next_x = np.append(mean_x[1:], x[-1])
+    next_y = np.append(mean_y[1:], y[-1])
+
+    selected = np.empty(points, dtype=np.intp)
+    selected[0], selected[-1] = 0, n - 1
+    if n / buckets > _ROW_THRESHOLD:
+        ax, ay = x[0], y[0]
+        for b in range(buckets):
+            lo, hi = edges[b], edges[b + 1]
+            area = np.abs((ax - next_x[b]) * (y[lo:hi] - ay) - (ax - x[lo:hi]) * (next_y[b] - ay))
+            chosen = lo + int(area.argmax())
+            selected[b + 1] = chosen
+            ax, ay = x[chosen], y[chosen]
+        return selected
+
+    # Narrow buckets: per-call NumPy overhead dominates, scalar Python is several times faster.
+    xs, ys, bounds = x.tolist(), y.tolist(), edges.tolist()
+    cxs, cys = next_x.tolist(), next_y.tolist()
+    ax, ay = xs[0], ys[0]
+    for b in range(buckets):
+        dx, dy = ax - cxs[b], cys[b] - ay
+        chosen, best = bounds[b], -1.0
+        for j in range(bounds[b], bounds[b + 1]):
+            area = abs(dx * (ys[j] - ay) - (ax - xs[j]) * dy)
+            if area > best:
+                chosen, best = j, area
+        selected[b + 1] = chosen
+        ax, ay = xs[chosen], ys[chosen]
+    return selected
+
+
+def minmax(x: np.ndarray, y: np.ndarray, points: int) -> np.ndarray:
+    """Indices of each bucket's minimum and maximum, about ``points`` in total."""
+    n = len(x)
+    if points >= n:
+        return np.arange(n)
+    if points < 4:
+        return np.array([0, n - 1][:points], dtype=np.intp)
+    edges = _edges(n, (points - 2) // 2)
+    width = int(np.diff(edges).max())
+    # Pad each bucket to the widest one by repeating its last index.
+    grid = np.minimum(edges[:-1, None] + np.arange(width), edges[1:, None] - 1)
+    values = y[grid]
+    rows = np.arange(len(grid))
+    low = grid[rows, values.argmin(axis=1)]
+    high = grid[rows, values.argmax(axis=1)]
+    inner = np.sort(np.stack([low, high], axis=1), axis=1).ravel()
+    return np.unique(np.concatenate(([0], inner, [n - 1])))
+
+
+class HistorySampler:
+    """Serves windowed, downsampled series for many codes at once."""
+
+    def __init__(self, store: TimeSeriesStore, cache_size: int = 4096) -> None:
+        self.store = store
+        self.cache_size = cache_size
+        self._cache: OrderedDict[tuple, dict[str, list[float]]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def series(
+        self, code: str, window: float, points: int, method: str = "lttb"
+    ) -> dict[str, list[float]] | None:
+        """The last ``window`` seconds of ``code`` (ending at its newest point), downsampled."""
+        if code not in self.store:
+            return None
+        key = (code, window, points, method, self.store.version(code))
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return cached
+        self.misses += 1
+
+        times, prices = self.store.last(code)
+        if len(times):
+            times = times[int(np.searchsorted(times, times[-1] - window, side="left")):]
+            prices = prices[len(prices) - len(times):]
+        reducer = minmax if method == "minmax" else lttb
+        keep = reducer(times, prices, points)
+        result = {"times": times[keep].tolist(), "prices": prices[keep].tolist()}
+
+        self._cache[key] = result
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return result
+
+    def many(
+        self, codes: Iterable[str], window: float, points: int, method: str = "lttb"
+    ) -> dict[str, dict[str, list[float]]]:
+        """:meth:`series` for each known code; unknown codes are left out."""
+        result: dict[str, dict[str, list[float]]] = {}
+        for code in codes:
+            series = self.series(code, window, points, method)
+            if series is not None:
+                result[code] = series
+        return result
+
+    def stats(self) -> dict[str, Any]:
+        return {"entries": len(self._cache), "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,137 @@
+"""Top movers (A_SHARES_TOP_MOVERS_INTRADAY) over the universe :class:`QuoteTable`.
+
+A ranking never sorts the universe: :func:`top_k` picks the best ``k`` rows with
+``np.argpartition`` in O(n) and sorts only those. :class:`TopMovers` also keeps
+the picked rows per (table version, metric, board, cap bucket). Several clients
+and K values within one refresh then share a single selection, and smaller K
+values are prefixes of it.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any
+
+import numpy as np
+
+from .universe import BOARDS, QuoteTable
+
+# Ranking name -> (QuoteTable column, largest first).
+METRICS = {
+    "gainers": ("change_pct", True),
+    "losers": ("change_pct", False),
+    "turnover_rate": ("turnover_rate", True),
+    "amount": ("amount", True),
+}
+# Total market cap buckets in yuan: [low, high).
+CAP_BUCKETS = {
+    "small": (0.0, 5e9),
+    "mid": (5e9, 2e10),
+    "large": (2e10, 1e11),
+    "mega": (1e11, np.inf),
+}
+
+
+def top_k(values: np.ndarray, k: int, largest: bool = True) -> np.ndarray:
+    """Row indices of the ``k`` largest (or smallest) finite values, best first."""
+    rows = np.flatnonzero(np.isfinite(values))
+    keys = -values[rows] if largest else values[rows]
+    if k < len(rows):
+        picked = np.sort(np.argpartition(keys, k - 1)[:k])  # ties keep universe order
+        rows, keys = rows[picked], keys[picked]
+    return rows[np.argsort(keys, kind="stable")]
+
+
+def _finite(value: float, digits: int) -> float | None:
+    return round(value, digits) if value == value else None  # NaN -> None
+
+
+class TopMovers:
+    """Cached top-K rankings with optional board and market-cap filters.
+
+    Each selection keeps at least ``depth`` rows, so every K up to ``depth`` is
+    served from one pass over the universe.
+    """
+
+    def __init__(self, depth: int = 10, cache_size: int = 256) -> None:
+        self.depth = depth
+        self.cache_size = cache_size
+        self._cache: OrderedDict[tuple, tuple[int, np.ndarray]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def rows(
+        self,
+        table: QuoteTable,
+        metric: str,
+        k: int,
+        board: str | None = None,
+        cap: str | None = None,
+    ) -> np.ndarray:
+        """Row indices of the top ``k`` for ``metric`` among the filtered stocks."""
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric {metric!r}; expected one of {list(METRICS)}")
+        if board is not None and board not in BOARDS:
+            raise ValueError(f"Unknown board {board!r}; expected one of {list(BOARDS)}")
+        if cap is not None and cap not in CAP_BUCKETS:
+            raise ValueError(f"Unknown cap bucket {cap!r}; expected one of {list(CAP_BUCKETS)}")
+
+        key = (table.version, metric, board, cap)
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] >= k:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return cached[1][:k]
+        self.misses += 1
+
+        column, largest = METRICS[metric]
+        mask = table.active.copy()
+        if board is not None:
+            mask &= table.board == BOARDS.index(board)
+        if cap is not None:
+            low, high = CAP_BUCKETS[cap]
+            mask &= (table.market_cap >= low) & (table.market_cap < high)
+        depth = max(k, self.depth)
+        selected = top_k(np.where(mask, getattr(table, column), np.nan), depth, largest)
+        self._cache[key] = (depth, selected)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return selected[:k]
+
+    def select(
+        self,
+        table: QuoteTable,
+        metric: str,
+        k: int | None = None,
+        board: str | None = None,
+        cap: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """The top ``k`` (default ``depth``) stocks for ``metric`` as display records."""
+        return [
+            {
+                "symbol": table.codes[row],
+                "name": table.names[row],
+                "board": BOARDS[table.board[row]],
+                "last": _finite(float(table.last[row]), 2),
+                "pct_change": _finite(float(table.change_pct[row]), 2),
+                "amount": _finite(float(table.amount[row]), 2),
+                "turnover_rate": _finite(float(table.turnover_rate[row]), 2),
+                "market_cap": _finite(float(table.market_cap[row]), 0),
+            }
+            for row in self.rows(table, metric, k or self.depth, board, cap).tolist()
+        ]
+
+    def snapshot(self, table: QuoteTable, k: int | None = None) -> dict[str, Any]:
+        """Every unfiltered ranking, as attached to the market snapshot."""
+        return {
+            **{metric: self.select(table, metric, k) for metric in METRICS},
+            "last_update": table.timestamp,
+        }
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "cached": len(self._cache),
+            "hits": self.hits,
+            "misses": self.misses,
+            "depth": self.depth,
+        }
@@ -0,0 +1,405 @@
+"""Append-only on-disk archive of normalized quote updates.
+
+Layout under ``root``::
+
+    2025-01-06/indices/ts.f8          # float64 epoch seconds of the fetch, one per row
+    2025-01-06/indices/quote_ts.f8    # float64 epoch seconds of the quote itself
+    2025-01-06/indices/code.i4        # int32 index into codes.txt
+    2025-01-06/indices/last.f8 ...    # one float64 file per column in COLUMNS
+    2025-01-06/indices/codes.txt      # code dictionary: code<TAB>name<TAB>display_name per line
+    2025-01-05/indices.npz            # an older day after compaction
+
+:meth:`TickArchive.submit` only enqueues; a daemon writer thread encodes rows,
+appends them, flushes every batch and fsyncs at most every ``fsync_interval``
+seconds. Unchanged quotes are skipped so re-fetching a quiet board costs
+nothing. Reads map the column files with :class:`numpy.memmap` and slice by
+time with a binary search, since rows are appended in fetch-time order; each
+row also keeps the quote's own time, the time base of the live series.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import math
+import os
+import queue
+import shutil
+import threading
+import time
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, BinaryIO, Iterable, Mapping
+
+import numpy as np
+
+from .timeseries import quote_time
+
+logger = logging.getLogger(__name__)
+
+COLUMNS = ("last", "change", "change_pct", "volume")
+_LABELS = ("codes", "names", "display_names")
+_FILES = (("ts", "f8"), ("quote_ts", "f8"), ("code", "i4"), *((c, "f8") for c in COLUMNS))
+_STOP = object()
+
+
+def _day_of(timestamp: float) -> date:
+    return datetime.fromtimestamp(timestamp).date()
+
+
+def _number(value: Any) -> float:
+    if isinstance(value, bool) or not isinstance(value, int | float):
+        return math.nan
+    return float(value)
+
+
+def _label(value: Any) -> str:
+    return " ".join(str(value).split()) if value else ""
+
+
+def _parse_codes(lines: Iterable[str]) -> tuple[list[str], list[str], list[str]]:
+    """Split ``codes.txt`` lines into codes, names and display names (older files: codes only)."""
+    codes: list[str] = []
+    names: list[str] = []
+    display_names: list[str] = []
+    for line in lines:
+        code, _, rest = line.partition("\t")
+        name, _, display = rest.partition("\t")
+        codes.append(code)
+        names.append(name or code)
+        display_names.append(display or name or code)
+    return codes, names, display_names
+
+
+def _truncate_to_complete_rows(paths: Mapping[str, Path]) -> None:
+    """Cut every column file back to the shortest one, dropping a torn last batch.
+
+    Appends are not atomic across files, so a crash can leave some columns a
+    partial batch longer than others; appending after that would misalign rows.
+    """
+    sizes = {
+        path: (path.stat().st_size if path.exists() else 0, 4 if path.suffix == ".i4" else 8)
+        for path in paths.values()
+    }
+    rows = min(size // width for size, width in sizes.values())
+    for path, (size, width) in sizes.items():
+        if size > rows * width:
+            logger.warning(f"Truncating {path} from {size} to {rows * width} bytes")
+            os.truncate(path, rows * width)
+
+
+class _Segment:
+    """Open column files and code dictionary for one (day, category)."""
+
+    def __init__(self, directory: Path) -> None:
+        directory.mkdir(parents=True, exist_ok=True)
+        codes_path = directory / "codes.txt"
+        self.codes: dict[str, int] = {}
+        if codes_path.exists():
+            text = codes_path.read_text(encoding="utf-8")
+            if text and not text.endswith("\n"):
+                # A crash mid-write left half a code behind; no row can refer to it yet.
+                text = text[: text.rfind("\n") + 1]
+                codes_path.write_text(text, encoding="utf-8")
+            for code in _parse_codes(text.splitlines())[0]:
+                self.codes.setdefault(code, len(self.codes))
+        self.code_file = codes_path.open("a", encoding="utf-8")
+        paths = {name: directory / f"{name}.{suffix}" for name, suffix in _FILES}
+        if paths["ts"].exists() and not paths["quote_ts"].exists():
+            # Written before quote times were kept: the fetch time is the best there is.
+            shutil.copyfile(paths["ts"], paths["quote_ts"])
+        _truncate_to_complete_rows(paths)
+        self.files: dict[str, BinaryIO] = {name: path.open("ab") for name, path in paths.items()}
+        self.last: dict[str, tuple[float, ...]] = {}
+
+    def code_id(self, code: str, record: Mapping[str, Any]) -> int:
+        index = self.codes.get(code)
+        if index is None:
+            index = self.codes[code] = len(self.codes)
+            name = _label(record.get("name"))
+            display = _label(record.get("display_name"))
+            self.code_file.write("\t".join((code, name, display)).rstrip("\t") + "\n")
+        return index
+
+    def write(self, timestamp: float, records: Mapping[str, Any]) -> tuple[int, int]:
+        """Append changed records; returns ``(written, skipped)``."""
+        ids: list[int] = []
+        rows: list[tuple[float, ...]] = []
+        stamps: list[float] = []
+        skipped = 0
+        for code, record in records.items():
+            if not isinstance(record, dict):
+                continue
+            values = tuple(_number(record.get(column)) for column in COLUMNS)
+            if math.isnan(values[0]):
+                continue
+            if self.last.get(code) == values:
+                skipped += 1
+                continue
+            self.last[code] = values
+            ids.append(self.code_id(code, record))
+            rows.append(values)
+            stamps.append(quote_time(record, timestamp))
+        if not rows:
+            return 0, skipped
+        self.code_file.flush()
+        matrix = np.asarray(rows, dtype="<f8")
+        # Columns first and timestamps last, so a reader never sees a ts without its row.
+        for index, column in enumerate(COLUMNS):
+            self.files[column].write(np.ascontiguousarray(matrix[:, index]).tobytes())
+        self.files["quote_ts"].write(np.asarray(stamps, dtype="<f8").tobytes())
+        self.files["code"].write(np.asarray(ids, dtype="<i4").tobytes())
+        self.files["ts"].write(np.full(len(rows), timestamp, dtype="<f8").tobytes())
+        for handle in self.files.values():
+            handle.flush()
+        return len(rows), skipped
+
+    def fsync(self) -> None:
+        for handle in (*self.files.values(), self.code_file):
+            os.fsync(handle.fileno())
+
+    def close(self) -> None:
+        for handle in (*self.files.values(), self.code_file):
+            handle.close()
+
+
+class TickArchive:
+    """Per-day, per-category columnar tick files with a non-blocking writer."""
+
+    def __init__(
+        self,
+        root: str | Path,
+        fsync_interval: float = 1.0,
+        retention_days: int = 30,
+        compact_after_days: int = 1,
+        max_queue: int = 1024,
+    ) -> None:
+        self.root = Path(root)
+        self.fsync_interval = fsync_interval
+        self.retention_days = retention_days
+        self.compact_after_days = compact_after_days
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._segments: dict[str, _Segment] = {}
+        self._day: date | None = None
+        self._dirty = False
+        self._last_fsync = 0.0
+        self.written = 0
+        self.skipped = 0
+        self.dropped = 0
+        self.fsyncs = 0
+
+    # -- write path -----------------------------------------------------
+
+    def submit(
+        self,
+        snapshot: Mapping[str, Any],
+        categories: Iterable[str],
+        timestamp: float | None = None,
+    ) -> bool:
+        """Queue the given snapshot categories for writing; never waits on the writer."""
+        batch = {
+            category: records
+            for category in categories
+            if isinstance(records := snapshot.get(category), dict) and records
+        }
+        if not batch:
+            return False
+        self._ensure_writer()
+        try:
+            self._queue.put_nowait((time.time() if timestamp is None else timestamp, batch))
+        except queue.Full:
+            self.dropped += 1
+            return False
+        return True
+
+    def _ensure_writer(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="tick-archive", daemon=True
+                )
+                self._thread.start()
+                atexit.register(self.close)
+
+    def _run(self) -> None:
+        while True:
+            try:
+                item = self._queue.get(timeout=self.fsync_interval)
+            except queue.Empty:
+                item = None
+            try:
+                while item is not None:
+                    if item is _STOP:
+                        self._sync(force=True)
+                        self._close_segments()
+                        self._day = None
+                        return
+                    self._write(*item)
+                    item = self._queue.get_nowait()
+            except queue.Empty:
+                pass
+            except Exception as exc:  # keep the writer alive; a bad batch is dropped
+                logger.error(f"Tick archive write failed: {exc}")
+            self._sync()
+
+    def _write(self, timestamp: float, batch: Mapping[str, Mapping[str, Any]]) -> None:
+        day = _day_of(timestamp)
+        if day != self._day:
+            self._sync(force=True)
+            self._close_segments()
+            self._day = day
+            self.maintain(day)
+        for category, records in batch.items():
+            segment = self._segments.get(category)
+            if segment is None:
+                directory = self.root / day.isoformat() / category
+                segment = self._segments[category] = _Segment(directory)
+            written, skipped = segment.write(timestamp, records)
+            self.written += written
+            self.skipped += skipped
+            self._dirty = self._dirty or written > 0
+
+    def _sync(self, force: bool = False) -> None:
+        now = time.monotonic()
+        if not self._dirty or (not force and now - self._last_fsync < self.fsync_interval):
+            return
+        for segment in self._segments.values():
+            segment.fsync()
+        self._dirty = False
+        self._last_fsync = now
+        self.fsyncs += 1
+
+    def _close_segments(self) -> None:
+        for segment in self._segments.values():
+            segment.close()
+        self._segments.clear()
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Drain the queue, fsync and stop the writer thread."""
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            return
+        self._queue.put(_STOP)
+        thread.join(timeout)
+
+    # -- retention ------------------------------------------------------
+
+    def maintain(self, today: date) -> None:
+        """Drop days past retention and compact finished days into ``.npz`` files."""
+        if not self.root.exists():
+            return
+        for path in sorted(self.root.iterdir()):
+            try:
+                day = date.fromisoformat(path.name)
+            except ValueError:
+                continue
+            age = (today - day).days
+            if day == self._day:
+                continue
+            if age > self.retention_days:
+                shutil.rmtree(path, ignore_errors=True)
+            elif age >= self.compact_after_days:
+                for category in [child for child in path.iterdir() if child.is_dir()]:
+                    self._compact(category)
+
+    def _compact(self, directory: Path) -> None:
+        data = {name: np.array(value) for name, value in self._read_raw(directory).items()}
+        target = directory.with_suffix(".npz")
+        partial = directory.with_suffix(".npz.tmp")
+        labels = {name: np.asarray(data.pop(name), dtype=str) for name in _LABELS}
+        with partial.open("wb") as handle:
+            np.savez_compressed(handle, **labels, **data)
+        partial.replace(target)
+        shutil.rmtree(directory)
+
+    # -- read path ------------------------------------------------------
+
+    @staticmethod
+    def _read_raw(directory: Path) -> dict[str, Any]:
+        arrays: dict[str, np.ndarray] = {}
+        for name, suffix in _FILES:
+            path = directory / f"{name}.{suffix}"
+            if name == "quote_ts" and not path.exists():
+                continue  # an older day: fetch times stand in below
+            dtype = f"<{suffix}"
+            size = path.stat().st_size if path.exists() else 0
+            count = size // np.dtype(dtype).itemsize
+            arrays[name] = (
+                np.memmap(path, dtype=dtype, mode="r", shape=(count,))
+                if count
+                else np.empty(0, dtype=dtype)
+            )
+        arrays.setdefault("quote_ts", arrays["ts"])
+        rows = min(len(array) for array in arrays.values())
+        codes_path = directory / "codes.txt"
+        lines = codes_path.read_text(encoding="utf-8").splitlines() if codes_path.exists() else []
+        labels = dict(zip(_LABELS, _parse_codes(lines), strict=True))
+        return {**labels, **{name: array[:rows] for name, array in arrays.items()}}
+
+    def read(
+        self,
+        category: str,
+        day: date,
+        start: float | None = None,
+        end: float | None = None,
+    ) -> dict[str, Any]:
+        """Rows for ``category`` on ``day`` with ``start <= ts <= end``.
+
+        Returns ``ts``, ``quote_ts``, ``code`` (ids), one array per column and the ``codes``
+        dictionary with its aligned ``names`` and ``display_names``. Arrays from
+        uncompacted days are memory-mapped views.
+        """
+        base = self.root / day.isoformat() / category
+        packed = base.with_suffix(".npz")
+        if base.is_dir():
+            data = self._read_raw(base)
+        elif packed.exists():
+            with np.load(packed) as archive:
+                data = {name: archive[name] for name in archive.files}
+            for name in _LABELS:
+                data[name] = data[name].tolist() if name in data else list(data["codes"])
+            data.setdefault("quote_ts", data["ts"])
+        else:
+            data = {**dict.fromkeys(_LABELS, []), "ts": np.empty(0), "code": np.empty(0, "<i4")}
+            data["quote_ts"] = np.empty(0)
+            data.update({column: np.empty(0) for column in COLUMNS})
+        ts = data["ts"]
+        lo = 0 if start is None else int(np.searchsorted(ts, start, side="left"))
+        hi = len(ts) if end is None else int(np.searchsorted(ts, end, side="right"))
+        return {
+            **{name: data[name] for name in _LABELS},
+            **{name: data[name][lo:hi] for name in ("ts", "quote_ts", "code", *COLUMNS)},
+        }
+
+    def as_of(self, category: str, when: datetime) -> dict[str, dict[str, Any]]:
+        """Latest archived quote per code at or before ``when``."""
+        data = self.read(category, when.date(), end=when.timestamp())
+        ids = np.asarray(data["code"])
+        if not len(ids):
+            return {}
+        _, reversed_index = np.unique(ids[::-1], return_index=True)
+        latest = np.sort(len(ids) - 1 - reversed_index)
+        codes = data["codes"]
+        result: dict[str, dict[str, Any]] = {}
+        for row in latest.tolist():
+            record = {
+                column: float(data[column][row])
+                for column in COLUMNS
+                if not math.isnan(data[column][row])
+            }
+            record["timestamp"] = datetime.fromtimestamp(float(data["quote_ts"][row])).isoformat()
+            result[codes[int(ids[row])]] = record
+        return result
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "root": str(self.root),
+            "running": bool(self._thread and self._thread.is_alive()),
+            "queued": self._queue.qsize(),
+            "written": self.written,
+            "skipped": self.skipped,
+            "dropped": self.dropped,
+            "fsyncs": self.fsyncs,
+        }
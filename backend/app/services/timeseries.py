@@ -0,0 +1,179 @@
+"""Fixed-size in-memory price history per instrument, fed by snapshot refreshes.
+
+Every code gets one row of two preallocated NumPy blocks (timestamps and
+prices), so memory is ``max_codes * capacity * 32`` bytes no matter how long the
+process runs. Each row is a mirrored ring: a point is written at ``pos`` and at
+``pos + capacity``, which keeps the most recent ``n`` points contiguous and lets
+:meth:`TimeSeriesStore.last` return views instead of copies.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from datetime import datetime
+from typing import Any, Iterable, Mapping
+
+import numpy as np
+
+
+def snapshot_prices(snapshot: Mapping[str, Any], categories: Iterable[str]) -> dict[str, float]:
+    """Finite numeric ``last`` price per code across the given snapshot categories."""
+    prices: dict[str, float] = {}
+    for category in categories:
+        records = snapshot.get(category)
+        if not isinstance(records, dict):
+            continue
+        for code, record in records.items():
+            if not isinstance(record, dict):
+                continue
+            last = record.get("last")
+            if isinstance(last, bool) or not isinstance(last, int | float):
+                continue
+            if math.isfinite(last):
+                prices[code] = float(last)
+    return prices
+
+
+def quote_time(record: Mapping[str, Any], default: float) -> float:
+    """Epoch seconds of a record's own ``timestamp``, never later than ``default``.
+
+    Naive ISO strings are local time, as the exchange-sourced providers emit them.
+    Records without a parseable timestamp get ``default`` (the fetch time).
+    """
+    value = record.get("timestamp")
+    if isinstance(value, str):
+        try:
+            return min(datetime.fromisoformat(value).timestamp(), default)
+        except ValueError:
+            pass
+    return default
+
+
+class TimeSeriesStore:
+    """Ring-buffered ``(timestamp, price)`` series for up to ``max_codes`` codes.
+
+    A point falling in the same ``resolution``-second bucket as the previous one
+    replaces it rather than appending, so a burst of refreshes costs one slot.
+    """
+
+    def __init__(
+        self, capacity: int = 1800, max_codes: int = 2048, resolution: float = 1.0
+    ) -> None:
+        if capacity < 1 or max_codes < 1:
+            raise ValueError("capacity and max_codes must be positive")
+        self.capacity = capacity
+        self.max_codes = max_codes
+        self.resolution = resolution
+        # np.zeros maps untouched pages lazily; rows are committed as codes arrive.
+        self._times = np.zeros((max_codes, 2 * capacity), dtype=np.float64)
+        self._prices = np.zeros((max_codes, 2 * capacity), dtype=np.float64)
+        self._pos = np.zeros(max_codes, dtype=np.intp)
+        self._size = np.zeros(max_codes, dtype=np.intp)
+        self._version = np.zeros(max_codes, dtype=np.int64)
+        self._rows: dict[str, int] = {}
+        self.appends = 0
+        self.rejected = 0
+
+    @property
+    def memory_bytes(self) -> int:
+        arrays = (self._times, self._prices, self._pos, self._size, self._version)
+        return sum(array.nbytes for array in arrays)
+
+    def _row(self, code: str) -> int | None:
+        row = self._rows.get(code)
+        if row is None:
+            if len(self._rows) >= self.max_codes:
+                self.rejected += 1
+                return None
+            row = self._rows[code] = len(self._rows)
+        return row
+
+    def append(self, code: str, timestamp: float, price: float) -> bool:
+        """Add one point; returns False when the store is full and ``code`` is new."""
+        return self.extend({code: price}, timestamp) == 1
+
+    def extend(self, prices: Mapping[str, float], timestamp: float) -> int:
+        """Add one point per code, all stamped ``timestamp``; returns how many were stored."""
+        pairs = [
+            (row, price)
+            for code, price in prices.items()
+            if (row := self._row(code)) is not None
+        ]
+        if not pairs:
+            return 0
+        rows = np.fromiter((row for row, _ in pairs), dtype=np.intp, count=len(pairs))
+        values = np.fromiter((price for _, price in pairs), dtype=np.float64, count=len(pairs))
+
+        cap = self.capacity
+        pos = self._pos[rows]
+        previous = (pos - 1) % cap
+        bucket = np.floor(timestamp / self.resolution)
+        fresh = (self._size[rows] == 0) | (
+            np.floor(self._times[rows, previous + cap] / self.resolution) < bucket
+        )
+        slot = np.where(fresh, pos, previous)
+        for block, value in ((self._times, timestamp), (self._prices, values)):
+            block[rows, slot] = value
+            block[rows, slot + cap] = value
+
+        advanced = rows[fresh]
+        self._pos[advanced] = (self._pos[advanced] + 1) % cap
+        self._size[advanced] = np.minimum(self._size[advanced] + 1, cap)
+        self._version[rows] += 1
+        self.appends += len(pairs)
+        return len(pairs)
+
+    def record_snapshot(
+        self,
+        snapshot: Mapping[str, Any],
+        categories: Iterable[str],
+        timestamp: float | None = None,
+    ) -> int:
+        """Store the ``last`` price of every record in the given snapshot categories."""
+        prices = snapshot_prices(snapshot, categories)
+        return self.extend(prices, time.time() if timestamp is None else timestamp)
+
+    def last(self, code: str, n: int | None = None) -> tuple[np.ndarray, np.ndarray]:
+        """Read-only views of the newest ``n`` (default: all) timestamps and prices.
+
+        The views alias the ring, so copy them if they must outlive later appends.
+        """
+        row = self._rows.get(code)
+        if row is None:
+            empty = np.empty(0, dtype=np.float64)
+            return empty, empty
+        size = int(self._size[row])
+        count = size if n is None else max(0, min(n, size))
+        end = int(self._pos[row]) + self.capacity
+        times = self._times[row, end - count:end]
+        prices = self._prices[row, end - count:end]
+        times.flags.writeable = False
+        prices.flags.writeable = False
+        return times, prices
+
+    def version(self, code: str) -> int:
+        """Write counter for ``code``; changes whenever its series does."""
+        row = self._rows.get(code)
+        return -1 if row is None else int(self._version[row])
+
+    def codes(self) -> list[str]:
+        return list(self._rows)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "codes": len(self._rows),
+            "max_codes": self.max_codes,
+            "capacity": self.capacity,
+            "resolution": self.resolution,
+            "points": int(self._size.sum()),
+            "memory_bytes": self.memory_bytes,
+            "appends": self.appends,
+            "rejected": self.rejected,
+        }
+
+    def __contains__(self, code: object) -> bool:
+        return code in self._rows
+
+    def __len__(self) -> int:
+        return len(self._rows)
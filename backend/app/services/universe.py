@@ -0,0 +1,166 @@
+"""Columnar quote table for the full A-share stock universe.
+
+Providers return the universe column-wise (``fetch_a_share_universe``), one list
+per field aligned with ``codes``. :class:`QuoteTable` converts that into NumPy
+arrays once per provider refresh, so whole-market statistics are array
+operations instead of per-record loops.
+
+Prices are compared in integer cents, the exchanges' tick size. Daily price
+limits follow the board: 10% on the main boards (5% for ST names), 20% on
+ChiNext and STAR, 30% on the Beijing exchange.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Mapping
+
+import numpy as np
+
+BOARDS = ("sh_main", "sz_main", "chinext", "star", "bj")
+# Daily price limits per board, in whole percent so limit prices are exact in cents.
+LIMIT_PCTS = np.array([10, 10, 20, 20, 30])
+ST_LIMIT_PCT = 5
+UNCLASSIFIED = "未分类"
+
+
+@lru_cache(maxsize=65536)
+def board_of(code: str) -> int:
+    """Index into :data:`BOARDS` for a ``600000.SH``-style stock code."""
+    symbol, _, market = code.partition(".")
+    if market == "BJ" or symbol.startswith(("4", "8", "92")):
+        return 4
+    if symbol.startswith(("688", "689")):
+        return 3
+    if symbol.startswith(("300", "301")):
+        return 2
+    if market == "SH" or symbol.startswith("6"):
+        return 0
+    return 1
+
+
+def _column(payload: Mapping[str, Any], name: str, size: int) -> np.ndarray:
+    values = payload.get(name)
+    if not isinstance(values, list) or len(values) != size:
+        return np.full(size, np.nan)
+    # ``None`` becomes NaN; anything non-numeric invalidates the column.
+    try:
+        return np.array(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        return np.full(size, np.nan)
+
+
+class QuoteTable:
+    """One immutable refresh of the universe as aligned NumPy columns."""
+
+    def __init__(
+        self,
+        codes: list[str],
+        names: list[str],
+        last: np.ndarray,
+        prev_close: np.ndarray,
+        volume: np.ndarray,
+        amount: np.ndarray,
+        timestamp: str | None = None,
+        source: str | None = None,
+        version: int = 0,
+        previous: QuoteTable | None = None,
+        turnover_rate: np.ndarray | None = None,
+        market_cap: np.ndarray | None = None,
+        industries: list[str] | None = None,
+    ) -> None:
+        self.codes = codes
+        self.names = names
+        self.industries = industries if industries is not None else [UNCLASSIFIED] * len(codes)
+        self.last = last
+        self.prev_close = prev_close
+        self.volume = volume
+        self.amount = amount
+        missing = np.full(len(codes), np.nan)
+        self.turnover_rate = missing if turnover_rate is None else turnover_rate
+        self.market_cap = missing if market_cap is None else market_cap
+        self.timestamp = timestamp
+        self.source = source
+        self.version = version
+
+        if (
+            previous is not None
+            and previous.codes == codes
+            and previous.names == names
+            and previous.industries == self.industries
+        ):
+            # Same listing as last refresh: the per-code static columns carry over.
+            self.board = previous.board
+            self.limit_pct = previous.limit_pct
+            self.industry_labels = previous.industry_labels
+            self.industry_ids = previous.industry_ids
+        else:
+            self.board = np.fromiter((board_of(code) for code in codes), np.int8, len(codes))
+            st = np.fromiter(("ST" in name for name in names), bool, len(names))
+            self.limit_pct = np.where(st & (self.board < 2), ST_LIMIT_PCT, LIMIT_PCTS[self.board])
+            ids: dict[str, int] = {}
+            self.industry_ids = np.fromiter(
+                (ids.setdefault(label, len(ids)) for label in self.industries),
+                np.intp,
+                len(codes),
+            )
+            self.industry_labels = list(ids)
+        # Halted or not-yet-traded stocks have no usable last or previous close.
+        self.active = (last > 0) & (prev_close > 0)
+        with np.errstate(invalid="ignore"):
+            self.last_cents = np.rint(last * 100)
+            self.prev_cents = np.rint(prev_close * 100)
+            self.change_pct = np.where(
+                self.active, (last - prev_close) / prev_close * 100, np.nan
+            )
+
+    @classmethod
+    def from_payload(
+        cls,
+        payload: Mapping[str, Any],
+        version: int = 0,
+        previous: QuoteTable | None = None,
+    ) -> QuoteTable | None:
+        """Build from a provider payload; ``None`` when it has no codes.
+
+        Passing the ``previous`` table lets an unchanged listing reuse its static columns.
+        """
+        codes = payload.get("codes")
+        if not isinstance(codes, list) or not codes:
+            return None
+        size = len(codes)
+        names = payload.get("names")
+        if not isinstance(names, list) or len(names) != size:
+            names = list(codes)
+        industries = payload.get("industries")
+        if not isinstance(industries, list) or len(industries) != size:
+            industries = [None] * size
+        return cls(
+            [str(code) for code in codes],
+            [str(name or code) for name, code in zip(names, codes, strict=True)],
+            _column(payload, "last", size),
+            _column(payload, "prev_close", size),
+            _column(payload, "volume", size),
+            _column(payload, "amount", size),
+            timestamp=payload.get("timestamp"),
+            source=payload.get("source"),
+            version=version,
+            previous=previous,
+            turnover_rate=_column(payload, "turnover_rate", size),
+            market_cap=_column(payload, "market_cap", size),
+            industries=[str(label) if label else UNCLASSIFIED for label in industries],
+        )
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def limit_prices(self) -> tuple[np.ndarray, np.ndarray]:
+        """Limit-up and limit-down prices in cents, rounded half-up like the exchanges.
+
+        ``cents * (100 ± pct) + 50`` is an exact integer in float64, so the floor
+        division rounds exactly where ``cents * (1 - rate)`` could land a cent low.
+        """
+        with np.errstate(invalid="ignore"):
+            up = (self.prev_cents * (100 + self.limit_pct) + 50) // 100
+            down = (self.prev_cents * (100 - self.limit_pct) + 50) // 100
+        return up, down
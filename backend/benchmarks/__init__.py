@@ -0,0 +1 @@
+"""Offline benchmark harnesses for providers and services (run with ``python -m``)."""
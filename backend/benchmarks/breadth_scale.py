@@ -0,0 +1,86 @@
+"""Time whole-market breadth, top movers and the sector heatmap over synthetic universes.
+
+For each size, random-walks a ``SyntheticMarket`` universe and times, separately,
+building the ``QuoteTable`` from the provider payload (reusing the previous
+table's static columns, as ``DataManager`` does), running ``compute_breadth``,
+and selecting the top 20 of every movers ranking fresh (argpartition) next to a
+full ``argsort`` of each ranking column, then building and laying out the sector
+heatmap tree (uncached).
+
+Usage (from ``backend/``)::
+
+    uv run python -m benchmarks.breadth_scale --sizes 5500 20000 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+
+from app.providers.synthetic import SyntheticMarket
+from app.services.breadth import compute_breadth
+from app.services.heatmap import SectorHeatmap
+from app.services.movers import METRICS, TopMovers
+from app.services.universe import QuoteTable
+
+
+def run(size: int, iterations: int) -> dict[str, float]:
+    market = SyntheticMarket(
+        {}, universe_size=size, update_rate=1.0, volatility=0.02, clock=lambda: 0.0
+    )
+    build: list[float] = []
+    breadth: list[float] = []
+    movers: list[float] = []
+    sorting: list[float] = []
+    heatmap: list[float] = []
+    table = None
+    for step in range(1, iterations + 1):
+        market.advance(float(step))
+        payload = market.universe_columns()
+        started = time.perf_counter()
+        table = QuoteTable.from_payload(payload, previous=table)
+        build.append(time.perf_counter() - started)
+        started = time.perf_counter()
+        compute_breadth(table)
+        breadth.append(time.perf_counter() - started)
+        started = time.perf_counter()
+        selector = TopMovers(depth=20)
+        for metric in METRICS:
+            selector.rows(table, metric, 20)
+        movers.append(time.perf_counter() - started)
+        started = time.perf_counter()
+        for column, _ in METRICS.values():
+            getattr(table, column).argsort()
+        sorting.append(time.perf_counter() - started)
+        started = time.perf_counter()
+        SectorHeatmap().tree(table)
+        heatmap.append(time.perf_counter() - started)
+    return {
+        "build": statistics.median(build),
+        "breadth": statistics.median(breadth),
+        "movers": statistics.median(movers),
+        "argsort": statistics.median(sorting),
+        "heatmap": statistics.median(heatmap),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5500, 20000, 100000])
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        result = run(size, args.iterations)
+        print(
+            f"  universe {size:>7}  table build p50 {result['build'] * 1000:7.2f} ms"
+            f"  breadth p50 {result['breadth'] * 1000:7.2f} ms"
+            f"  movers p50 {result['movers'] * 1000:7.2f} ms"
+            f"  (full argsorts {result['argsort'] * 1000:7.2f} ms)"
+            f"  heatmap p50 {result['heatmap'] * 1000:7.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,525 @@
+"""Offline stand-in for the ``WindPy`` module.
+
+Exposes a module-level ``w`` implementing the subset of the WindPy API the
+provider uses: ``start/isconnected/stop``, ``wsq`` (snapshot and ``func=``
+callback subscriptions), ``cancelRequest``, ``wss``, ``wsi`` (minute bars),
+``wsd`` (daily series) and ``wset("sectorconstituent")``. Prices follow a seeded
+random walk. Per-call latency, injected error codes, NaN cells and the size of
+the synthetic A-share universe are configurable.
+
+Install programmatically before constructing ``WindProvider``::
+
+    from benchmarks import fake_windpy
+    fake_windpy.install(latency=0.03, nan_rate=0.01)
+
+or run the real server against it by putting the shim directory first on the
+path (settings come from ``FAKE_WIND_*`` environment variables)::
+
+    PYTHONPATH=benchmarks/windpy_shim DATA_MODE=wind uv run uvicorn app.main:app
+"""
+
+from __future__ import annotations
+
+import itertools
+import math
+import os
+import random
+import sys
+import threading
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from typing import Any, Callable, Mapping, Sequence
+
+# A few real WindPy error codes, for realistic failure injection.
+ERR_NO_DATA = -40520007
+ERR_TIMEOUT = -40521009
+ERR_NOT_CONNECTED = -40520009
+
+SESSION_BREAKS = ((time(9, 30), time(11, 30)), (time(13, 0), time(15, 0)))
+
+
+@dataclass
+class WindData:
+    """Mirror of ``WindPy.w.WindData`` (only the attributes the provider reads)."""
+
+    ErrorCode: int = 0
+    Codes: list[str] = field(default_factory=list)
+    Fields: list[str] = field(default_factory=list)
+    Times: list[Any] = field(default_factory=list)
+    Data: list[list[Any]] = field(default_factory=list)
+    RequestID: int = 0
+
+
+@dataclass
+class _Subscription:
+    request_id: int
+    codes: list[str]
+    fields: list[str]
+    callback: Callable[[WindData], Any]
+
+
+class FakeWind:
+    """Seeded quote generator speaking the WindPy call conventions.
+
+    ``latency``/``jitter`` set the simulated round trip, optionally overridden per
+    function via ``function_latency``. ``error_rate`` makes that share of calls
+    return ``error_code``; ``nan_rate`` blanks that share of numeric cells and
+    codes listed in ``halted`` always come back NaN. ``universe_size`` controls
+    how many synthetic A-share codes ``wset("sectorconstituent")`` returns.
+    """
+
+    def __init__(
+        self,
+        seed: int = 7,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        push_interval: float | None = None,
+        error_rate: float = 0.0,
+        error_code: int = ERR_TIMEOUT,
+        nan_rate: float = 0.0,
+        halted: Sequence[str] = (),
+        universe_size: int = 5000,
+        function_latency: Mapping[str, float] | None = None,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.push_interval = push_interval
+        self.error_rate = error_rate
+        self.error_code = error_code
+        self.nan_rate = nan_rate
+        self.halted = set(halted)
+        self.universe_size = universe_size
+        self.function_latency = dict(function_latency or {})
+        self._rng = random.Random(seed)
+        self._lock = threading.RLock()
+        self._prices: dict[str, tuple[float, float]] = {}
+        self._subscriptions: dict[int, _Subscription] = {}
+        self._ids = itertools.count(1)
+        self._connected = False
+        self._pusher: threading.Thread | None = None
+        self._stop_pushing = threading.Event()
+        self._forced: dict[str, list[int]] = {}
+        self._paths: dict[tuple[str, date], list[float]] = {}
+        self._active = 0
+        self.max_concurrency = 0
+        self.service_time = 0.0
+        self.calls: list[tuple[str, str, str]] = []
+
+    @classmethod
+    def from_env(cls, environ: Mapping[str, str] = os.environ) -> FakeWind:
+        """Build from ``FAKE_WIND_*`` variables (used by the import shim)."""
+
+        def number(name: str, default: float) -> float:
+            return float(environ.get(f"FAKE_WIND_{name}", default))
+
+        return cls(
+            seed=int(number("SEED", 7)),
+            latency=number("LATENCY", 0.0),
+            jitter=number("JITTER", 0.0),
+            push_interval=number("PUSH_INTERVAL", 0.0) or None,
+            error_rate=number("ERROR_RATE", 0.0),
+            nan_rate=number("NAN_RATE", 0.0),
+            universe_size=int(number("UNIVERSE", 5000)),
+        )
+
+    # --- session ---------------------------------------------------------------
+
+    def start(self, waitTime: int = 60, *args: Any, **kwargs: Any) -> WindData:
+        forced = self._take_forced("start")
+        if forced:
+            return WindData(ErrorCode=forced)
+        self._connected = True
+        if self.push_interval and self._pusher is None:
+            self._stop_pushing.clear()
+            self._pusher = threading.Thread(target=self._push_loop, name="windpy-cb", daemon=True)
+            self._pusher.start()
+        return WindData(ErrorCode=0)
+
+    def isconnected(self) -> bool:
+        return self._connected
+
+    def stop(self) -> None:
+        self._connected = False
+        self._stop_pushing.set()
+        if self._pusher is not None:
+            self._pusher.join(timeout=1)
+            self._pusher = None
+        with self._lock:
+            self._subscriptions.clear()
+
+    def fail_next(self, function: str, error_code: int = ERR_TIMEOUT, times: int = 1) -> None:
+        """Make the next ``times`` calls of ``function`` return ``error_code``."""
+        self._forced.setdefault(function, []).extend([error_code] * times)
+
+    # --- data ------------------------------------------------------------------
+
+    def wsq(
+        self,
+        codes: str | Sequence[str],
+        fields: str | Sequence[str],
+        options: str = "",
+        func: Callable[[WindData], Any] | None = None,
+    ) -> WindData:
+        code_list, field_list = _split(codes), _split(fields)
+        error = self._enter("wsq", code_list, field_list)
+        try:
+            if error:
+                return WindData(ErrorCode=error, Codes=code_list)
+            if func is None:
+                return self._quote(code_list, field_list)
+            request_id = next(self._ids)
+            with self._lock:
+                self._subscriptions[request_id] = _Subscription(
+                    request_id, code_list, field_list, func
+                )
+            # WindPy delivers a full image first, then incremental pushes.
+            func(self._quote(code_list, field_list, request_id))
+            return WindData(ErrorCode=0, RequestID=request_id)
+        finally:
+            self._leave()
+
+    def wss(
+        self, codes: str | Sequence[str], fields: str | Sequence[str], options: str = ""
+    ) -> WindData:
+        code_list, field_list = _split(codes), _split(fields)
+        error = self._enter("wss", code_list, field_list)
+        try:
+            if error:
+                return WindData(ErrorCode=error, Codes=code_list)
+            return self._quote(code_list, field_list)
+        finally:
+            self._leave()
+
+    def wsi(
+        self,
+        codes: str | Sequence[str],
+        fields: str | Sequence[str],
+        beginTime: Any = None,
+        endTime: Any = None,
+        options: str = "",
+    ) -> WindData:
+        """Minute bars within ``[beginTime, endTime]`` for today's trading sessions.
+
+        Single code: ``Times`` per bar, ``Data[field][bar]``. Several codes: long
+        format with a leading ``windcode`` field, as WindPy does.
+        """
+        code_list, field_list = _split(codes), _split(fields)
+        error = self._enter("wsi", code_list, field_list)
+        try:
+            if error:
+                return WindData(ErrorCode=error, Codes=code_list)
+            begin = _as_datetime(beginTime) or datetime.combine(date.today(), time(9, 30))
+            end = _as_datetime(endTime) or datetime.now()
+            minutes = [stamp for stamp in _session_minutes(begin.date()) if begin <= stamp <= end]
+            times: list[datetime] = []
+            windcodes: list[str] = []
+            columns: list[list[Any]] = [[] for _ in field_list]
+            for code in code_list:
+                for stamp in minutes:
+                    bar = self._bar(code, stamp)
+                    times.append(stamp)
+                    windcodes.append(code)
+                    for f_index, name in enumerate(field_list):
+                        columns[f_index].append(self._maybe_nan(code, bar.get(name.lower())))
+            if len(code_list) == 1:
+                return WindData(
+                    Codes=code_list,
+                    Fields=[name.upper() for name in field_list],
+                    Times=times,
+                    Data=columns,
+                )
+            return WindData(
+                Codes=["MultiCodes"],
+                Fields=["windcode"] + [name.lower() for name in field_list],
+                Times=times,
+                Data=[windcodes] + columns,
+            )
+        finally:
+            self._leave()
+
+    def wsd(
+        self,
+        codes: str | Sequence[str],
+        fields: str | Sequence[str],
+        beginTime: Any = None,
+        endTime: Any = None,
+        options: str = "",
+    ) -> WindData:
+        """Daily series: one code × many fields, or many codes × one field."""
+        code_list, field_list = _split(codes), _split(fields)
+        error = self._enter("wsd", code_list, field_list)
+        try:
+            if error:
+                return WindData(ErrorCode=error, Codes=code_list)
+            end = (_as_datetime(endTime) or datetime.now()).date()
+            begin = (_as_datetime(beginTime) or datetime.combine(end, time())).date()
+            days = [
+                begin + timedelta(days=offset)
+                for offset in range((end - begin).days + 1)
+                if (begin + timedelta(days=offset)).weekday() < 5
+            ]
+            series = {
+                code: [self._daily_close(code, day) for day in days] for code in code_list
+            }
+            if len(code_list) == 1:
+                code = code_list[0]
+                data = [
+                    [self._maybe_nan(code, _daily_field(name, close)) for close in series[code]]
+                    for name in field_list
+                ]
+            else:
+                data = [
+                    [self._maybe_nan(code, _daily_field(field_list[0], close)) for close in closes]
+                    for code, closes in series.items()
+                ]
+            return WindData(
+                Codes=code_list,
+                Fields=[name.upper() for name in field_list],
+                Times=days,
+                Data=data,
+            )
+        finally:
+            self._leave()
+
+    def wset(self, tablename: str, options: str = "") -> WindData:
+        """``sectorconstituent``: the synthetic A-share universe as date/code/name."""
+        error = self._enter("wset", [tablename], [options])
+        try:
+            if error:
+                return WindData(ErrorCode=error)
+            codes = universe(self.universe_size)
+            today = datetime.combine(date.today(), time())
+            return WindData(
+                Codes=[str(index + 1) for index in range(len(codes))],
+                Fields=["date", "wind_code", "sec_name"],
+                Data=[[today] * len(codes), codes, [f"股票{code[:6]}" for code in codes]],
+            )
+        finally:
+            self._leave()
+
+    def cancelRequest(self, request_id: int = 0) -> None:  # noqa: N802 - WindPy name
+        with self._lock:
+            if request_id:
+                self._subscriptions.pop(request_id, None)
+            else:
+                self._subscriptions.clear()
+
+    def push(self, count: int = 1, fraction: float = 0.3) -> int:
+        """Move prices and deliver ``count`` incremental callbacks per subscription."""
+        delivered = 0
+        for _ in range(count):
+            with self._lock:
+                subscriptions = list(self._subscriptions.values())
+            for subscription in subscriptions:
+                size = max(1, int(len(subscription.codes) * fraction))
+                codes = self._rng.sample(subscription.codes, size)
+                self._walk(codes)
+                subscription.callback(
+                    self._quote(codes, subscription.fields, subscription.request_id)
+                )
+                delivered += 1
+        return delivered
+
+    # --- internals -------------------------------------------------------------
+
+    def _enter(self, function: str, codes: Sequence[str], fields: Sequence[str]) -> int:
+        """Book-keep a call, sleep the simulated latency and pick an error code."""
+        with self._lock:
+            self._active += 1
+            self.max_concurrency = max(self.max_concurrency, self._active)
+            self.calls.append((function, ",".join(codes), ",".join(fields)))
+            delay = self.function_latency.get(function, self.latency)
+            if delay and self.jitter:
+                delay = max(0.0, delay + self._rng.uniform(-self.jitter, self.jitter))
+            failed = self.error_rate and self._rng.random() < self.error_rate
+        if delay:
+            threading.Event().wait(delay)
+            self.service_time += delay
+        forced = self._take_forced(function)
+        if forced:
+            return forced
+        if not self._connected:
+            return ERR_NOT_CONNECTED
+        return self.error_code if failed else 0
+
+    def _leave(self) -> None:
+        with self._lock:
+            self._active -= 1
+
+    def _take_forced(self, function: str) -> int:
+        queue = self._forced.get(function)
+        return queue.pop(0) if queue else 0
+
+    def _push_loop(self) -> None:
+        while not self._stop_pushing.wait(self.push_interval):
+            self.push()
+
+    def _state(self, code: str) -> tuple[float, float]:
+        state = self._prices.get(code)
+        if state is None:
+            prev_close = round(self._rng.uniform(1, 5000), 2)
+            state = self._prices[code] = (prev_close, prev_close)
+        return state
+
+    def _walk(self, codes: Sequence[str]) -> None:
+        with self._lock:
+            for code in codes:
+                last, prev_close = self._state(code)
+                self._prices[code] = (round(last * (1 + self._rng.gauss(0, 0.002)), 4), prev_close)
+
+    def _maybe_nan(self, code: str, value: Any) -> Any:
+        if code in self.halted:
+            return math.nan
+        if self.nan_rate and isinstance(value, float) and self._rng.random() < self.nan_rate:
+            return math.nan
+        return value
+
+    def _quote(self, codes: Sequence[str], fields: Sequence[str], request_id: int = 0) -> WindData:
+        with self._lock:
+            states = [self._state(code) for code in codes]
+            columns = [
+                [
+                    self._maybe_nan(code, _field_value(name, last, prev))
+                    for code, (last, prev) in zip(codes, states, strict=True)
+                ]
+                for name in fields
+            ]
+        return WindData(
+            ErrorCode=0,
+            Codes=list(codes),
+            Fields=[name.upper() for name in fields],
+            Times=[datetime.now()],
+            Data=columns,
+            RequestID=request_id,
+        )
+
+    def _bar(self, code: str, stamp: datetime) -> dict[str, float]:
+        """Deterministic bar for ``(code, minute)`` so re-fetches return equal values."""
+        price = self._path(code, stamp.date())[_minute_index(stamp)]
+        bar_rng = random.Random(f"{code}|{stamp:%Y%m%d%H%M}")
+        open_price = price * (1 + bar_rng.gauss(0, 0.0003))
+        return {
+            "open": round(open_price, 4),
+            "high": round(max(open_price, price) * (1 + abs(bar_rng.gauss(0, 0.0004))), 4),
+            "low": round(min(open_price, price) * (1 - abs(bar_rng.gauss(0, 0.0004))), 4),
+            "close": round(price, 4),
+            "volume": float(bar_rng.randint(10**3, 10**6)),
+            "amt": round(price * bar_rng.randint(10**3, 10**6), 2),
+        }
+
+    def _path(self, code: str, day: date) -> list[float]:
+        """Seeded intraday close path (one point per session minute) for a code/day."""
+        key = (code, day)
+        path = self._paths.get(key)
+        if path is None:
+            with self._lock:
+                _, prev_close = self._state(code)
+            rng = random.Random(f"{code}|{day:%Y%m%d}")
+            path, price = [], prev_close
+            for _ in range(len(_session_minutes(day))):
+                price *= 1 + rng.gauss(0, 0.0008)
+                path.append(price)
+            self._paths[key] = path
+        return path
+
+    def _daily_close(self, code: str, day: date) -> float:
+        with self._lock:
+            _, prev_close = self._state(code)
+        rng = random.Random(f"{code}|{day:%Y%m%d}")
+        return round(prev_close * (1 + rng.gauss(0, 0.015)), 4)
+
+
+BOARDS = ((600000, "SH"), (1, "SZ"), (300000, "SZ"), (688000, "SH"), (830000, "BJ"))
+
+
+def universe(size: int) -> list[str]:
+    """Synthetic A-share codes spread over SH/SZ main boards, ChiNext, STAR and BJ."""
+    codes = []
+    for index in range(size):
+        base, market = BOARDS[index % len(BOARDS)]
+        codes.append(f"{base + index // len(BOARDS):06d}.{market}")
+    return codes
+
+
+def install(**kwargs: Any) -> FakeWind:
+    """Create a :class:`FakeWind`, expose it as ``w`` and register ``WindPy``."""
+    global w
+    w = FakeWind(**kwargs)
+    sys.modules["WindPy"] = sys.modules[__name__]
+    return w
+
+
+def _field_value(name: str, last: float, prev_close: float) -> float:
+    name = name.lower()
+    if name in ("rt_last", "close"):
+        return last
+    if name in ("rt_pre_close", "pre_close"):
+        return prev_close
+    if name in ("rt_chg", "chg"):
+        return last - prev_close
+    if name in ("rt_pct_chg", "pct_chg"):
+        return (last - prev_close) / prev_close * 100
+    if name in ("rt_open", "open"):
+        return prev_close
+    if name in ("rt_high", "high"):
+        return max(last, prev_close)
+    if name in ("rt_low", "low"):
+        return min(last, prev_close)
+    if name in ("rt_vol", "volume"):
+        return float(int(prev_close * 1000))
+    if name in ("rt_amt", "amt"):
+        return float(int(prev_close * 1000)) * last
+    return math.nan
+
+
+def _daily_field(name: str, close: float) -> float:
+    name = name.lower()
+    if name in ("close", "open", "high", "low", "pre_close"):
+        return close
+    if name == "volume":
+        return float(int(close * 1000))
+    return math.nan
+
+
+def _session_minutes(day: date) -> list[datetime]:
+    stamps = []
+    for start, end in SESSION_BREAKS:
+        cursor = datetime.combine(day, start) + timedelta(minutes=1)
+        stop = datetime.combine(day, end)
+        while cursor <= stop:
+            stamps.append(cursor)
+            cursor += timedelta(minutes=1)
+    return stamps
+
+
+def _minute_index(stamp: datetime) -> int:
+    minutes = stamp.hour * 60 + stamp.minute
+    morning = minutes - (9 * 60 + 30)
+    if minutes <= 11 * 60 + 30:
+        return max(0, morning - 1)
+    return 120 + max(0, minutes - 13 * 60 - 1)
+
+
+def _as_datetime(value: Any) -> datetime | None:
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime.combine(value, time())
+    text = str(value).strip()
+    for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%d", "%Y%m%d"):
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def _split(value: str | Sequence[str]) -> list[str]:
+    if isinstance(value, str):
+        return [item.strip() for item in value.split(",") if item.strip()]
+    return list(value)
+
+
+w = FakeWind()
@@ -0,0 +1,123 @@
+"""Benchmark OpenProvider against recorded fixtures served by the replay transport.
+
+Usage (from ``backend/``)::
+
+    uv run python -m benchmarks.open_provider --latency 0.08 --jitter 0.04 --iterations 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections import Counter
+from pathlib import Path
+
+from app.providers.http_replay import ReplayTransport
+from app.providers.open import OpenProvider
+from app.services.data_manager import DataManager
+
+DEFAULT_FIXTURES = Path(__file__).resolve().parents[2] / "tests" / "fixtures" / "open"
+
+METHODS = (
+    "fetch_indices",
+    "fetch_fx",
+    "fetch_rates",
+    "fetch_commodities",
+    "fetch_us_stocks",
+    "fetch_crypto",
+    "fetch_calendar",
+    "fetch_a_share_short_term",
+)
+
+
+def _transport(args: argparse.Namespace) -> ReplayTransport:
+    return ReplayTransport(
+        args.fixtures,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        timeout_rate=args.timeout_rate,
+        seed=args.seed,
+    )
+
+
+async def bench_methods(args: argparse.Namespace) -> list[tuple[str, list[float], Counter]]:
+    results = []
+    for name in METHODS:
+        timings: list[float] = []
+        requests: Counter[str] = Counter()
+        for _ in range(args.iterations):
+            transport = _transport(args)
+            provider = OpenProvider(transport=transport)
+            started = time.perf_counter()
+            await getattr(provider, name)()
+            timings.append(time.perf_counter() - started)
+            requests.update(transport.request_counts)
+        results.append((name, timings, requests))
+    return results
+
+
+async def bench_snapshot(args: argparse.Namespace) -> tuple[list[float], list[float], Counter]:
+    cold: list[float] = []
+    warm: list[float] = []
+    requests: Counter[str] = Counter()
+    for _ in range(args.iterations):
+        transport = _transport(args)
+        manager = DataManager(provider=OpenProvider(transport=transport))
+        started = time.perf_counter()
+        await manager.get_market_snapshot()
+        cold.append(time.perf_counter() - started)
+        requests.update(transport.request_counts)
+        started = time.perf_counter()
+        await manager.get_market_snapshot()
+        warm.append(time.perf_counter() - started)
+    return cold, warm, requests
+
+
+def _fmt(timings: list[float]) -> str:
+    ordered = sorted(timings)
+    p95 = ordered[min(len(ordered) - 1, round(0.95 * (len(ordered) - 1)))]
+    return (
+        f"mean {statistics.mean(ordered) * 1000:8.1f} ms  "
+        f"p50 {statistics.median(ordered) * 1000:8.1f} ms  "
+        f"p95 {p95 * 1000:8.1f} ms"
+    )
+
+
+async def main(args: argparse.Namespace) -> None:
+    print(
+        f"fixtures={args.fixtures} latency={args.latency}s jitter={args.jitter}s "
+        f"error_rate={args.error_rate} timeout_rate={args.timeout_rate} "
+        f"iterations={args.iterations}"
+    )
+    print("\nper provider method (cold cache)")
+    for name, timings, requests in await bench_methods(args):
+        per_call = sum(requests.values()) / args.iterations
+        hosts = ", ".join(
+            f"{host}={count // args.iterations}" for host, count in requests.most_common()
+        )
+        print(f"  {name:<26} {_fmt(timings)}  requests/call {per_call:5.1f}  [{hosts}]")
+
+    cold, warm, requests = await bench_snapshot(args)
+    print("\nend-to-end DataManager.get_market_snapshot")
+    per_snapshot = sum(requests.values()) / args.iterations
+    print(f"  cold  {_fmt(cold)}  requests/snapshot {per_snapshot:5.1f}")
+    print(f"  warm  {_fmt(warm)}")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="OpenProvider replay benchmark")
+    parser.add_argument("--fixtures", type=Path, default=DEFAULT_FIXTURES)
+    parser.add_argument("--iterations", type=int, default=3)
+    parser.add_argument("--latency", type=float, default=0.05, help="base per-request latency (s)")
+    parser.add_argument("--jitter", type=float, default=0.02, help="uniform extra latency (s)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of 503 responses")
+    parser.add_argument("--timeout-rate", type=float, default=0.0, help="share of read timeouts")
+    parser.add_argument("--seed", type=int, default=42)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
@@ -0,0 +1,108 @@
+"""Measure end-to-end refresh and websocket fan-out throughput in replay mode.
+
+Records a synthetic random-walk session into a temporary tick archive, then
+replays it through ``DataManager.get_market_snapshot()`` at ``--speed`` and
+broadcasts every snapshot to ``--clients`` in-process websocket stand-ins. The
+snapshot cache expires on the replay clock, so ``--speed`` drives the refresh
+rate the same way with or without Redis.
+
+Usage (from ``backend/``)::
+
+    uv run python -m benchmarks.replay_throughput --codes 2000 --minutes 30 --speed 600
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+
+from app.api.websocket import ConnectionManager
+from app.providers.replay import ReplayProvider
+from app.services.data_manager import DataManager
+from app.services.tick_archive import TickArchive
+
+
+class _Client:
+    """Websocket stand-in that serialises nothing and just counts messages."""
+
+    def __init__(self) -> None:
+        self.received = 0
+
+    async def send_json(self, message: dict) -> None:
+        self.received += 1
+
+
+def record_session(root: str, codes: int, minutes: int, seed: int = 0) -> None:
+    rng = np.random.default_rng(seed)
+    names = [f"{600000 + i:06d}.SH" for i in range(codes)]
+    prices = rng.uniform(5, 50, codes)
+    start = datetime(2025, 1, 6, 9, 30).timestamp()
+    archive = TickArchive(root, fsync_interval=5.0, max_queue=1 << 16)
+    for second in range(0, minutes * 60, 3):
+        moving = rng.random(codes) < 0.4
+        prices[moving] *= 1 + rng.normal(0, 0.001, moving.sum())
+        quotes = {name: {"last": float(p)} for name, p in zip(names, prices, strict=True)}
+        archive.submit({"indices": quotes}, ["indices"], start + second)
+    archive.close(timeout=60)
+
+
+async def run(args: argparse.Namespace, root: str) -> dict[str, float]:
+    provider = ReplayProvider(root, speed=args.speed, loop=True)
+    manager = DataManager(provider=provider)
+    fanout = ConnectionManager()
+    fanout._data_manager = manager
+    clients = [_Client() for _ in range(args.clients)]
+    fanout.active_connections.update(clients)
+
+    refresh: list[float] = []
+    started = time.perf_counter()
+    for _ in range(args.iterations):
+        began = time.perf_counter()
+        snapshot = await manager.get_market_snapshot()
+        await fanout.send_to_all({"type": "update", "data": snapshot})
+        refresh.append(time.perf_counter() - began)
+        await asyncio.sleep(args.interval)
+    elapsed = time.perf_counter() - started
+    return {
+        "refresh_p50": statistics.median(refresh),
+        "refresh_max": max(refresh),
+        "refresh_per_s": args.iterations / elapsed,
+        "messages": sum(client.received for client in clients),
+        "series": len(manager.timeseries),
+        "bars": manager.bars.stats()["completed"],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--codes", type=int, default=2000)
+    parser.add_argument("--minutes", type=int, default=30, help="recorded session length")
+    parser.add_argument("--speed", type=float, default=600.0)
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument(
+        "--interval", type=float, default=0.05, help="wall seconds between refreshes"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        record_session(root, args.codes, args.minutes)
+        result = asyncio.run(run(args, root))
+    print(
+        f"codes={args.codes} speed={args.speed}x clients={args.clients}"
+        f"  refresh p50 {result['refresh_p50'] * 1000:7.1f} ms"
+        f"  max {result['refresh_max'] * 1000:7.1f} ms"
+        f"  {result['refresh_per_s']:5.1f} refresh/s"
+        f"  messages {result['messages']}"
+        f"  series {result['series']}  completed bars {result['bars']}"
+    )
+
+
+if __name__ == "__main__":
+    main()
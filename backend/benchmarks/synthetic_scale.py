@@ -0,0 +1,86 @@
+"""Scale test of the snapshot pipeline on the synthetic mock provider.
+
+For each size, builds a ``DataManager`` on ``SyntheticMockProvider`` (cache
+off) with a whole-market universe of that many stocks and enough copies of the
+mock instruments (``category_scale``) for the snapshot to carry about as many
+quotes, and times full ``get_market_snapshot()`` refreshes, including the
+history store, bar aggregator and derived views, plus the JSON encoding a
+websocket broadcast would pay once per refresh.
+
+Usage (from ``backend/``)::
+
+    uv run python -m benchmarks.synthetic_scale --sizes 100 1000 10000 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import statistics
+import time
+
+from app.core.settings import settings
+from app.providers.synthetic import SyntheticMockProvider
+from app.services.data_manager import DataManager
+
+
+async def run(size: int, args: argparse.Namespace) -> dict[str, float]:
+    # Track every code, with a shorter ring so 100k codes stay within a few GiB of address space.
+    settings.timeseries_max_codes = max(settings.timeseries_max_codes, size + 64)
+    settings.timeseries_capacity = min(settings.timeseries_capacity, 600)
+    seeds = len(await SyntheticMockProvider(universe_size=0).market())
+    provider = SyntheticMockProvider(
+        universe_size=size,
+        category_scale=max(1, math.ceil(size / seeds)),
+        update_rate=args.update_rate,
+        latency=args.latency,
+        error_rate=args.error_rate,
+    )
+    manager = DataManager(provider=provider)
+    manager.cache_manager = None
+
+    refresh: list[float] = []
+    encode: list[float] = []
+    payload = 0
+    for _ in range(args.iterations):
+        started = time.perf_counter()
+        snapshot = await manager.get_market_snapshot()
+        refresh.append(time.perf_counter() - started)
+        started = time.perf_counter()
+        payload = len(json.dumps({"type": "update", "data": snapshot}, default=str))
+        encode.append(time.perf_counter() - started)
+        await asyncio.sleep(args.interval)
+    status = provider.synthetic_status()
+    return {
+        "refresh_p50": statistics.median(refresh),
+        "encode_p50": statistics.median(encode),
+        "payload_kb": payload / 1024,
+        "updates": status["updates"],
+        "failures": status["failures"],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000, 100000])
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--interval", type=float, default=0.2, help="seconds between refreshes")
+    parser.add_argument("--update-rate", type=float, default=0.5)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        result = asyncio.run(run(size, args))
+        print(
+            f"  universe {size:>7}  refresh p50 {result['refresh_p50'] * 1000:8.1f} ms"
+            f"  json p50 {result['encode_p50'] * 1000:8.1f} ms"
+            f"  payload {result['payload_kb']:9.1f} KiB"
+            f"  price moves {result['updates']:>8}  injected failures {result['failures']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""Micro-benchmark the Tencent quote parser against the previous per-row implementation.
+
+Usage (from ``backend/``)::
+
+    uv run python -m benchmarks.tencent_parser --rows 6000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import time
+from datetime import datetime
+from typing import Any, Callable, Mapping, Sequence
+
+from app.providers import tencent_parser
+
+
+def synthetic_response(rows: int, seed: int = 7, timestamp: str = "20250106150002") -> str:
+    """Build a GBK-decoded style response body with ``rows`` A-share/HK records."""
+    rng = random.Random(seed)
+    lines = []
+    for index in range(rows):
+        market = ("sh", "sz", "hk")[index % 3]
+        symbol = f"{market}{index:06d}" if market != "hk" else f"hk{index:05d}"
+        prev_close = round(rng.uniform(2, 300), 2)
+        change = round(prev_close * rng.uniform(-0.1, 0.1), 2)
+        last = round(prev_close + change, 2)
+        tokens = ["1", f"股票{index}", symbol[2:], f"{last}", f"{prev_close}", f"{prev_close}"]
+        tokens += [str(rng.randint(1, 10**6)) for _ in range(24)]
+        tokens += [
+            timestamp,
+            f"{change}",
+            f"{round(change / prev_close * 100, 2)}",
+            f"{max(last, prev_close)}",
+            f"{min(last, prev_close)}",
+        ]
+        tokens += [str(rng.random()) for _ in range(40)]
+        lines.append(f'v_{symbol}="{"~".join(tokens)}";')
+    return "\n".join(lines)
+
+
+# --- previous implementation, kept verbatim for comparison --------------------
+
+
+def _legacy_safe_float(value: Any) -> float | None:
+    if value in (None, "", "N/D"):
+        return None
+    try:
+        return float(value)
+    except Exception:
+        return None
+
+
+def _legacy_parse_response(text: str) -> dict[str, str]:
+    entries: dict[str, str] = {}
+    for line in text.strip().split(";"):
+        line = line.strip()
+        if not line or "=" not in line:
+            continue
+        prefix, rest = line.split("=", 1)
+        symbol = prefix.split("v_")[-1]
+        value = rest.strip().strip(";").strip("\"")
+        if value:
+            entries[symbol] = value
+    return entries
+
+
+def _legacy_parse_timestamp(raw: str | None) -> str:
+    if not raw:
+        return datetime.utcnow().isoformat()
+    raw = raw.strip()
+    for fmt in ("%Y%m%d%H%M%S", "%Y-%m-%d %H:%M:%S"):
+        try:
+            dt = datetime.strptime(raw, fmt)
+            return dt.isoformat()
+        except Exception:
+            continue
+    return datetime.utcnow().isoformat()
+
+
+def _legacy_tokens_to_snapshot(
+    tokens: Sequence[str], code: str, label: str, decimals: int = 2
+) -> dict[str, Any] | None:
+    if len(tokens) < 5:
+        return None
+    last = _legacy_safe_float(tokens[3])
+    prev_close = _legacy_safe_float(tokens[4])
+    open_price = _legacy_safe_float(tokens[5])
+    if last is None or prev_close is None:
+        return None
+    change = _legacy_safe_float(tokens[31]) if len(tokens) > 31 else None
+    change_pct = _legacy_safe_float(tokens[32]) if len(tokens) > 32 else None
+    high = _legacy_safe_float(tokens[33]) if len(tokens) > 33 else None
+    low = _legacy_safe_float(tokens[34]) if len(tokens) > 34 else None
+    timestamp_raw = tokens[30] if len(tokens) > 30 else None
+    timestamp = _legacy_parse_timestamp(timestamp_raw)
+
+    if change is None:
+        change = last - prev_close
+    if change_pct is None and prev_close:
+        change_pct = (change / prev_close * 100) if prev_close else None
+
+    return {
+        "code": code,
+        "name": label,
+        "display_name": label,
+        "last": round(last, decimals),
+        "change": round(change or 0.0, decimals),
+        "change_pct": round(change_pct or 0.0, 2),
+        "open": round(open_price, decimals) if open_price is not None else None,
+        "high": round(high, decimals) if high is not None else None,
+        "low": round(low, decimals) if low is not None else None,
+        "prev_close": round(prev_close, decimals),
+        "timestamp": timestamp,
+    }
+
+
+def legacy_parse(text: str, mapping: Mapping[str, tuple[str, str]]) -> dict[str, Any]:
+    entries = _legacy_parse_response(text)
+    snapshots: dict[str, Any] = {}
+    for symbol, (code, label) in mapping.items():
+        raw = entries.get(symbol)
+        if not raw:
+            continue
+        snapshot = _legacy_tokens_to_snapshot(raw.split("~"), code, label)
+        if snapshot:
+            snapshots[code] = snapshot
+    return snapshots
+
+
+# --- current implementation ----------------------------------------------------
+
+
+def fast_parse(text: str, mapping: Mapping[str, tuple[str, str]]) -> dict[str, Any]:
+    entries = tencent_parser.parse_response(text)
+    timestamps = tencent_parser.TimestampMemo()
+    snapshots: dict[str, Any] = {}
+    for symbol, (code, label) in mapping.items():
+        raw = entries.get(symbol)
+        if not raw:
+            continue
+        record = tencent_parser.parse_quote(raw, timestamps)
+        if record:
+            snapshots[code] = tencent_parser.to_snapshot(record, code, label)
+    return snapshots
+
+
+def fast_records(text: str) -> list[tencent_parser.TencentQuote]:
+    timestamps = tencent_parser.TimestampMemo()
+    records = []
+    for _, raw in tencent_parser.iter_entries(text):
+        record = tencent_parser.parse_quote(raw, timestamps)
+        if record:
+            records.append(record)
+    return records
+
+
+def _measure(func: Callable[[], Any], repeat: int) -> list[float]:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=6000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    text = synthetic_response(args.rows)
+    symbols = list(_legacy_parse_response(text))
+    mapping = {symbol: (symbol.upper(), symbol) for symbol in symbols}
+    assert legacy_parse(text, mapping) == fast_parse(text, mapping)
+
+    cases = {
+        "legacy: response split": lambda: _legacy_parse_response(text),
+        "fast:   response scan": lambda: tencent_parser.parse_response(text),
+        "legacy: parse + snapshot": lambda: legacy_parse(text, mapping),
+        "fast:   parse + snapshot": lambda: fast_parse(text, mapping),
+        "fast:   compact records": lambda: fast_records(text),
+    }
+    print(f"rows={args.rows} repeat={args.repeat} bytes={len(text.encode('utf-8'))}")
+    for name, func in cases.items():
+        samples = _measure(func, args.repeat)
+        best = min(samples)
+        median = statistics.median(samples)
+        print(
+            f"  {name:<26} best {best * 1000:8.2f} ms  median {median * 1000:8.2f} ms"
+            f"  {best / args.rows * 1e6:6.2f} us/row"
+        )
+
+
+if __name__ == "__main__":
+    main()
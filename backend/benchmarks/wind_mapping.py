@@ -0,0 +1,181 @@
+"""Benchmark the vectorised Wind result mapping against the previous per-cell loops.
+
+Usage (from ``backend/``)::
+
+    uv run python -m benchmarks.wind_mapping --codes 5000 50000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import statistics
+import time
+from datetime import datetime
+from typing import Any, Callable, Mapping
+
+from app.providers.wind_frame import FIELD_ALIAS, PriceFrame, is_all_zero
+
+FIELDS = [
+    "rt_last", "rt_chg", "rt_pct_chg", "rt_open", "rt_high", "rt_low", "rt_pre_close", "rt_vol",
+]
+
+
+def synthetic_result(
+    codes: int, seed: int = 5, missing: float = 0.02, ticks: bool = False
+) -> tuple[list[str], list[list[Any]]]:
+    """Wind-shaped ``(codes, Data)`` with NaN/None holes and a few missing changes.
+
+    With ``ticks``, prices sit on a 0.001 grid (so many land on rounding halfway
+    points such as ``2.675``) and volumes are ints, as WindPy returns them.
+    """
+    rng = random.Random(seed)
+    code_list = [f"{index:06d}.{'SH' if index % 2 else 'SZ'}" for index in range(codes)]
+    columns: list[list[Any]] = [[] for _ in FIELDS]
+    for _ in code_list:
+        prev_close = rng.uniform(2, 300)
+        last = prev_close * (1 + rng.uniform(-0.1, 0.1))
+        row = [
+            last,
+            last - prev_close,
+            (last - prev_close) / prev_close * 100,
+            prev_close * (1 + rng.uniform(-0.02, 0.02)),
+            max(last, prev_close) * 1.01,
+            min(last, prev_close) * 0.99,
+            prev_close,
+            float(rng.randint(10**4, 10**8)),
+        ]
+        if ticks:
+            row = [round(value, 3) for value in row[:-1]] + [int(row[-1])]
+        for f_index, value in enumerate(row):
+            roll = rng.random()
+            if roll < missing / 2:
+                value = None
+            elif roll < missing:
+                value = math.nan
+            columns[f_index].append(value)
+    return code_list, columns
+
+
+# --- previous implementation, kept for comparison -----------------------------
+
+
+def legacy_map(
+    codes: list[str],
+    fields: list[str],
+    data: list[list[Any]],
+    names: Mapping[str, str],
+    include_volume: bool = False,
+    decimals: int = 2,
+    now: str | None = None,
+) -> dict[str, Any]:
+    mapped = {}
+    now = now or datetime.now().isoformat()
+    for idx, code in enumerate(codes):
+        item: dict[str, Any] = {"code": code, "timestamp": now}
+        for f_index, field in enumerate(fields):
+            if f_index >= len(data):
+                continue
+            values = data[f_index]
+            if idx >= len(values):
+                continue
+            val = values[idx]
+            try:
+                if val is None or (isinstance(val, float) and math.isnan(val)):
+                    continue
+            except Exception:
+                continue
+            key = FIELD_ALIAS.get(field, field)
+            if key in {"last", "change", "open", "high", "low", "prev_close"}:
+                item[key] = round(val, decimals)
+            elif key == "change_pct":
+                item[key] = round(val, 2)
+            elif key == "volume" and include_volume:
+                item[key] = val
+            elif key == "amount" and include_volume:
+                item[key] = val
+        item["name"] = names.get(code, code)
+        if (
+            "change" not in item
+            and "last" in item
+            and "prev_close" in item
+            and item.get("prev_close")
+        ):
+            delta = item["last"] - item["prev_close"]
+            item["change"] = round(delta, decimals)
+            if "change_pct" not in item and item["prev_close"]:
+                item["change_pct"] = round(delta / item["prev_close"] * 100, 2)
+        mapped[code] = item
+    return mapped
+
+
+def legacy_is_all_zero(data: list[list[Any]]) -> bool:
+    return all(all((v or 0) == 0 for v in series) for series in data)
+
+
+# --- current implementation ----------------------------------------------------
+
+
+def fast_map(
+    codes: list[str],
+    fields: list[str],
+    data: list[list[Any]],
+    names: Mapping[str, str],
+    include_volume: bool = False,
+    decimals: int = 2,
+    now: str | None = None,
+) -> dict[str, Any]:
+    frame = PriceFrame.from_wind(
+        codes, fields, data, decimals=decimals, include_volume=include_volume
+    )
+    return frame.to_records(names, now or datetime.now().isoformat())
+
+
+def _cases(codes: list[str], data: list[list[Any]]) -> dict[str, Callable[[], Any]]:
+    names: dict[str, str] = {}
+    return {
+        "legacy: map": lambda: legacy_map(codes, FIELDS, data, names, include_volume=True),
+        "fast:   map": lambda: fast_map(codes, FIELDS, data, names, include_volume=True),
+        "fast:   frame only": lambda: PriceFrame.from_wind(
+            codes, FIELDS, data, include_volume=True
+        ),
+        "legacy: all-zero scan": lambda: legacy_is_all_zero(data),
+        "fast:   all-zero scan": lambda: is_all_zero(data),
+    }
+
+
+def _measure(func: Callable[[], Any], repeat: int) -> list[float]:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--codes", type=int, nargs="+", default=[5000, 50000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for size in args.codes:
+        codes, data = synthetic_result(size)
+        cases = _cases(codes, data)
+        print(f"codes={size} fields={len(FIELDS)} repeat={args.repeat}")
+        baseline = None
+        for name, func in cases.items():
+            best = min(_measure(func, args.repeat))
+            median = statistics.median(_measure(func, args.repeat))
+            if name == "legacy: map":
+                baseline = best
+            speedup = f"  x{baseline / best:5.1f}" if baseline and name.endswith("map") else ""
+            print(
+                f"  {name:<22} best {best * 1000:9.2f} ms"
+                f"  median {median * 1000:9.2f} ms{speedup}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""Benchmark Wind-edition refresh cycles against the fake WindPy module.
+
+Each iteration runs a full ``DataManager.get_market_snapshot()`` (cache off) on a
+``WindProvider`` backed by :mod:`benchmarks.fake_windpy`, while small probe jobs
+run on the default thread pool to expose executor contention. Modes:
+
+* ``dedicated``: WindPy calls on the provider's single Wind worker thread.
+* ``shared``: WindPy calls on the default pool (the pre-worker behaviour).
+* ``subscribe``: push subscription; fetches read the tick store.
+
+Usage (from ``backend/``)::
+
+    uv run python -m benchmarks.wind_refresh --latency 0.03 --jitter 0.01 --iterations 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections import Counter
+
+from app.core.cache import CacheManager
+from app.core.settings import settings
+from app.core.telemetry import upstream_telemetry
+from benchmarks import fake_windpy
+
+MODES = ("dedicated", "shared", "subscribe")
+
+
+def _percentile(samples: list[float], q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def _probe(loop: asyncio.AbstractEventLoop) -> float:
+    """Latency of a trivial job on the default executor (queueing shows up here)."""
+    started = time.perf_counter()
+    await loop.run_in_executor(None, time.sleep, 0.001)
+    return time.perf_counter() - started - 0.001
+
+
+async def run_mode(mode: str, args: argparse.Namespace) -> dict[str, float]:
+    fake = fake_windpy.install(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        nan_rate=args.nan_rate,
+        universe_size=args.universe,
+    )
+    settings.wind_subscription_enabled = mode == "subscribe"
+    upstream_telemetry.reset()
+
+    from app.providers.wind import WindProvider
+    from app.services.data_manager import DataManager
+
+    provider = WindProvider()
+    if mode == "shared":
+        provider._executor = None  # run_in_executor(None, ...) as before the Wind worker
+    provider._ensure_connection()
+    while not provider._connected or (mode == "subscribe" and provider._subscription_id is None):
+        await asyncio.sleep(0.001)
+    manager = DataManager(cache_manager=CacheManager(), provider=provider)
+
+    loop = asyncio.get_running_loop()
+    refresh: list[float] = []
+    probes: list[float] = []
+    calls_before = len(fake.calls)
+    for _ in range(args.iterations):
+        fake.push(fraction=0.3)
+        probe_tasks = [asyncio.ensure_future(_probe(loop)) for _ in range(args.probes)]
+        started = time.perf_counter()
+        await manager.get_market_snapshot()
+        refresh.append(time.perf_counter() - started)
+        probes.extend(await asyncio.gather(*probe_tasks))
+    calls = Counter(function for function, *_ in fake.calls[calls_before:])
+    await provider.close()
+
+    rows = upstream_telemetry.snapshot()
+    wind_latency = [row for row in rows if row.get("host") == "wind"]
+    return {
+        "refresh_p50": statistics.median(refresh),
+        "refresh_p90": _percentile(refresh, 0.9),
+        "calls_per_refresh": sum(calls.values()) / args.iterations,
+        "wsq_per_refresh": calls.get("wsq", 0) / args.iterations,
+        "max_concurrency": fake.max_concurrency,
+        "probe_p90": _percentile(probes, 0.9) if probes else 0.0,
+        "wind_p90": max((row["latency_p90"] or 0.0 for row in wind_latency), default=0.0),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency", type=float, default=0.03, help="fake WindPy round trip (s)")
+    parser.add_argument("--jitter", type=float, default=0.01)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--nan-rate", type=float, default=0.0)
+    parser.add_argument("--universe", type=int, default=5000)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--probes", type=int, default=64, help="default-pool jobs per refresh")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    args = parser.parse_args()
+
+    print(
+        f"latency={args.latency}s jitter={args.jitter}s error_rate={args.error_rate}"
+        f" nan_rate={args.nan_rate} iterations={args.iterations} probes={args.probes}"
+    )
+    for mode in args.modes:
+        result = asyncio.run(run_mode(mode, args))
+        print(
+            f"  {mode:<10} refresh p50 {result['refresh_p50'] * 1000:7.1f} ms"
+            f"  p90 {result['refresh_p90'] * 1000:7.1f} ms"
+            f"  wind calls/refresh {result['calls_per_refresh']:4.1f}"
+            f" (wsq {result['wsq_per_refresh']:3.1f})"
+            f"  max concurrent WindPy calls {result['max_concurrency']}"
+            f"  pool probe p90 {result['probe_p90'] * 1000:6.2f} ms"
+            f"  wind call p90 {result['wind_p90'] * 1000:6.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
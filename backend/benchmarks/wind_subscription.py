@@ -0,0 +1,65 @@
+"""Compare Wind snapshot refreshes in poll mode versus push-subscription mode.
+
+Runs entirely against :mod:`benchmarks.fake_windpy`, with a configurable
+per-call latency standing in for the Wind terminal round trip.
+
+Usage (from ``backend/``)::
+
+    uv run python -m benchmarks.wind_subscription --latency 0.03 --iterations 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from app.core.settings import settings
+from benchmarks import fake_windpy
+
+CATEGORIES = ("fetch_indices", "fetch_fx", "fetch_rates", "fetch_commodities")
+
+
+async def _refresh_times(subscribe: bool, args: argparse.Namespace) -> tuple[list[float], int]:
+    fake = fake_windpy.install(latency=args.latency)
+    settings.wind_subscription_enabled = subscribe
+
+    from app.providers.wind import WindProvider
+
+    provider = WindProvider()
+    provider._ensure_connection()
+    while not provider._connected or (subscribe and provider._subscription_id is None):
+        await asyncio.sleep(0.001)
+
+    samples = []
+    calls_before = len(fake.calls)
+    for _ in range(args.iterations):
+        fake.push(fraction=args.fraction)
+        started = time.perf_counter()
+        await asyncio.gather(*(getattr(provider, name)() for name in CATEGORIES))
+        samples.append(time.perf_counter() - started)
+    calls = len(fake.calls) - calls_before
+    await provider.close()
+    return samples, calls
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency", type=float, default=0.03, help="fake wsq round trip (s)")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--fraction", type=float, default=0.3, help="share of codes per push")
+    args = parser.parse_args()
+
+    print(f"latency={args.latency}s iterations={args.iterations}")
+    for label, subscribe in (("poll (batched wsq)", False), ("push subscription", True)):
+        samples, calls = asyncio.run(_refresh_times(subscribe, args))
+        print(
+            f"  {label:<20} median {statistics.median(samples) * 1000:8.2f} ms"
+            f"  p90 {sorted(samples)[int(len(samples) * 0.9) - 1] * 1000:8.2f} ms"
+            f"  wind calls {calls}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,9 @@
+"""``import WindPy`` shim backed by :mod:`benchmarks.fake_windpy`.
+
+Put this directory first on ``PYTHONPATH`` (from ``backend/``) to run the Wind
+edition without a Wind terminal; configure it with ``FAKE_WIND_*`` variables.
+"""
+
+from benchmarks.fake_windpy import FakeWind, WindData  # noqa: F401
+
+w = FakeWind.from_env()
@@ -0,0 +1,118 @@
+import math
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from app.providers.mock import MockProvider
+from app.services.analytics import RollingAnalytics
+from app.services.data_manager import DataManager
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+START = datetime(2025, 1, 6, 10, 0).timestamp()
+
+
+def test_rolling_window_matches_a_full_recomputation():
+    rng = np.random.default_rng(7)
+    prices = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, 301)))
+    analytics = RollingAnalytics(window=50)
+    for second, price in enumerate(prices):
+        analytics.update({"A": float(price)}, START + second)
+
+    returns = np.diff(np.log(prices))
+    window = returns[-50:]
+    fields = analytics.metrics(["A"])["A"]
+    assert fields["realized_vol"] == pytest.approx(
+        round(math.sqrt((window**2).sum()) * 100, 3)
+    )
+    before = returns[-51:-1]
+    expected = (returns[-1] - before.mean()) / before.std()
+    assert fields["zscore"] == pytest.approx(round(expected, 2))
+    assert fields["intraday_return"] == pytest.approx(round((prices[-1] / prices[0] - 1) * 100, 2))
+    assert analytics.stats()["observations"] == 300
+
+
+def test_same_second_updates_and_new_day():
+    analytics = RollingAnalytics(window=10, zscore_threshold=2.0)
+    for second in range(10):
+        analytics.update({"A": 100.0 + (second % 2) * 0.1}, START + second)
+    assert analytics.update({"A": 120.0}, START + 9.5) == 0  # same bucket: no new return
+    assert analytics.update({"A": 130.0}, START + 10) == 1
+    fields = analytics.metrics(["A", "unknown"])
+    assert fields["A"]["abnormal"] is True and "unknown" not in fields
+
+    analytics.update({"A": 130.0}, START + 86400)
+    assert analytics.metrics(["A"])["A"]["intraday_return"] == 0.0
+
+
+def test_capacity_is_bounded():
+    analytics = RollingAnalytics(window=4, max_codes=2)
+    analytics.update({"A": 1.0, "B": 1.0, "C": 1.0}, START)
+    assert analytics.stats()["codes"] == 2 and analytics.rejected == 1
+
+
+@pytest.mark.anyio
+async def test_snapshot_records_carry_analytics():
+    manager = DataManager(cache_manager=None)
+    manager.cache_manager = None
+    await manager.get_market_snapshot()
+    snapshot = await manager.get_market_snapshot()
+    record = next(iter(snapshot["indices"].values()))
+    assert "intraday_return" in record
+
+
+class _MemoryCache:
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ttl=300):
+        self.data[key] = value
+        return True
+
+
+class _SteppingProvider(MockProvider):
+    def __init__(self):
+        super().__init__()
+        now = datetime.now()  # same day as the other mock categories
+        self.quotes = [
+            ((now - timedelta(seconds=10)).isoformat(), 100.0),
+            ((now - timedelta(seconds=5)).isoformat(), 101.0),
+        ]
+
+    async def fetch_indices(self):
+        stamp, last = self.quotes.pop(0) if len(self.quotes) > 1 else self.quotes[0]
+        return {"A.SH": {"last": last, "timestamp": stamp}}
+
+
+@pytest.mark.anyio
+async def test_only_refetched_quotes_feed_analytics():
+    manager = DataManager(cache_manager=_MemoryCache(), provider=_SteppingProvider())
+    for _ in range(5):
+        await manager.get_market_snapshot()  # cache hits: no zero returns
+    assert manager.analytics.observations == 0
+
+    manager._last_fetch_times.clear()
+    await manager.get_market_snapshot()
+    for _ in range(3):
+        manager._last_fetch_times.clear()
+        snapshot = await manager.get_market_snapshot()  # repeated quote: nothing new
+
+    assert manager.analytics.observations == 1
+    assert manager.analytics.metrics(["A.SH"])["A.SH"]["intraday_return"] == 1.0
+    assert snapshot["indices"]["A.SH"]["intraday_return"] == 1.0
+
+
+def test_late_quotes_do_not_roll_the_day_back():
+    analytics = RollingAnalytics(window=4)
+    analytics.update({"A": 100.0}, START)
+    analytics.update({"B": 50.0}, START - 86400)  # yesterday's close arriving late
+    analytics.update({"A": 102.0}, START + 1)
+    assert analytics.metrics(["A"])["A"]["intraday_return"] == 2.0
@@ -0,0 +1,86 @@
+from datetime import datetime
+
+import pytest
+
+from app.core.cache import CacheManager
+from app.providers.mock import MockProvider
+from app.services.bars import BarAggregator, bucket, session_window
+from app.services.data_manager import DataManager
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def _at(hour, minute, second=0):
+    return datetime(2025, 1, 6, hour, minute, second).timestamp()
+
+
+def test_a_share_buckets_follow_sessions():
+    assert session_window("000001.SH", _at(12, 0)) is None
+    window = session_window("000001.SH", _at(15, 0))
+    assert bucket(_at(15, 0), 900, window) == (_at(14, 45), _at(15, 0))
+    afternoon = session_window("600000.SH", _at(13, 7))
+    assert bucket(_at(13, 7), 300, afternoon) == (_at(13, 5), _at(13, 10))
+    assert session_window("BTCUSDT", _at(3, 0)) is not None  # no calendar: around the clock
+
+
+def test_ticks_roll_into_bars_with_late_and_duplicate_handling():
+    aggregator = BarAggregator(intervals={"1m": 60, "5m": 300})
+    published = []
+    aggregator.add_listener(published.append)
+
+    aggregator.add_tick("000001.SH", _at(9, 30, 5), 10.0)
+    aggregator.add_tick("000001.SH", _at(9, 30, 40), 12.0)
+    aggregator.add_tick("000001.SH", _at(9, 30, 20), 9.0)  # out of order, same bar: low only
+    aggregator.add_tick("000001.SH", _at(9, 30, 20), 9.0)  # duplicate
+    done = aggregator.add_tick("000001.SH", _at(9, 31, 1), 11.0)
+
+    assert [(bar.interval, bar.open, bar.high, bar.low, bar.close) for bar in done] == [
+        ("1m", 10.0, 12.0, 9.0, 12.0)
+    ]
+    aggregator.add_tick("000001.SH", _at(9, 30, 59), 50.0)  # late for 1m, still fits the 5m bar
+    assert aggregator.late == 1 and aggregator.duplicates == 1
+    assert aggregator.add_tick("000001.SH", _at(11, 45), 11.0) == []
+    assert aggregator.off_session == 1
+
+    # The lunch break closes both open bars at 11:30 at the latest.
+    flushed = aggregator.flush(_at(11, 31))
+    assert {bar.interval for bar in flushed} == {"1m", "5m"}
+    assert [bar.high for bar in published if bar.interval == "5m"] == [50.0]
+
+    rows = aggregator.bars("000001.SH", "1m")
+    assert [row["start"][11:16] for row in rows] == ["09:30", "09:31"]
+    assert "partial" not in rows[-1]
+
+
+def test_snapshot_updates_keep_a_partial_bar():
+    aggregator = BarAggregator()
+    snapshot = {"fx": {"USDCNH.FX": {"last": 7.1}, "BAD": {"last": None}}}
+    aggregator.update_snapshot(snapshot, ["fx"], _at(10, 0, 1))
+    snapshot["fx"]["USDCNH.FX"]["last"] = 7.2
+    aggregator.update_snapshot(snapshot, ["fx"], _at(10, 0, 31))
+
+    (bar,) = aggregator.bars("USDCNH.FX", "15m")
+    assert bar["partial"] and (bar["open"], bar["close"], bar["ticks"]) == (7.1, 7.2, 2)
+    assert aggregator.bars("BAD", "1m") == []
+
+
+class _QuietProvider(MockProvider):
+    """A closed overseas market: every refresh repeats the last quote."""
+
+    async def fetch_us_stocks(self):
+        return {"QUIET.GI": {"last": 5000.0, "timestamp": "2025-01-06T05:00:00"}}
+
+
+@pytest.mark.anyio
+async def test_bars_count_quote_updates_not_refreshes():
+    manager = DataManager(cache_manager=CacheManager(), provider=_QuietProvider())
+    for _ in range(5):
+        manager._last_fetch_times.clear()
+        await manager.get_market_snapshot()
+
+    (bar,) = manager.bars.bars("QUIET.GI", "1m")
+    assert bar["ticks"] == 1
+    assert bar["start"] == "2025-01-06T05:00:00"  # the quote's time, not the request's
@@ -0,0 +1,160 @@
+import asyncio
+import sys
+
+import httpx
+import pytest
+
+from app.providers.mock import MockProvider
+from app.providers.open import OpenProvider
+from app.providers.synthetic import SyntheticMockProvider
+from app.services.breadth import DISTRIBUTION_LABELS, compute_breadth
+from app.services.data_manager import DataManager
+from app.services.universe import BOARDS, QuoteTable, board_of
+from benchmarks import fake_windpy
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def _table(rows):
+    codes, names, last, prev = zip(*rows, strict=True)
+    return QuoteTable.from_payload(
+        {
+            "codes": list(codes),
+            "names": list(names),
+            "last": list(last),
+            "prev_close": list(prev),
+            "volume": [100.0] * len(rows),
+            "amount": [1000.0] * len(rows),
+        }
+    )
+
+
+def test_boards_and_limits():
+    assert [BOARDS[board_of(code)] for code in (
+        "600000.SH", "000001.SZ", "300750.SZ", "688981.SH", "830799.BJ"
+    )] == list(BOARDS)
+    table = _table([
+        ("600000.SH", "浦发银行", 11.0, 10.0),  # +10%: limit up
+        ("000001.SZ", "*ST平安", 10.5, 10.0),  # ST: 5% limit
+        ("300750.SZ", "宁德时代", 11.0, 10.0),  # ChiNext: 20% limit, not reached
+        ("688981.SH", "中芯国际", 8.0, 10.0),  # STAR limit down
+        ("830799.BJ", "艾融软件", 10.0, 10.0),
+        ("600001.SH", "停牌", None, 10.0),
+    ])
+    breadth = compute_breadth(table)
+    assert (breadth["advancers"], breadth["decliners"], breadth["unchanged"]) == (3, 1, 1)
+    assert (breadth["limit_up_count"], breadth["limit_down_count"]) == (2, 1)
+    assert breadth["total"] == 6 and breadth["active"] == 5
+    assert breadth["advance_volume"] == 300.0 and breadth["decline_volume"] == 100.0
+    distribution = {bucket["label"]: bucket["count"] for bucket in breadth["distribution"]}
+    assert list(distribution) == list(DISTRIBUTION_LABELS)
+    expected = {"<-7": 1, "0": 1, "5~7": 1, ">7": 2}
+    assert distribution == {**dict.fromkeys(DISTRIBUTION_LABELS, 0), **expected}
+    assert breadth["boards"]["star"] == {"advancers": 0, "decliners": 1, "unchanged": 0}
+
+
+def test_limit_prices_round_half_up_exactly():
+    table = _table([
+        ("830799.BJ", "艾融软件", 1.16, 1.65),  # 1.65 * 0.7 = 1.155 -> 1.16, not 1.15
+        ("830800.BJ", "北交样本", 1.17, 1.65),
+        ("600000.SH", "浦发银行", 1.82, 1.65),  # 1.65 * 1.1 = 1.815 -> 1.82
+    ])
+    up, down = table.limit_prices()
+    assert (down[0], up[2]) == (116.0, 182.0)
+    breadth = compute_breadth(table)
+    assert (breadth["limit_up_count"], breadth["limit_down_count"]) == (1, 1)
+
+@pytest.mark.anyio
+async def test_summary_counts_the_whole_universe():
+    manager = DataManager(cache_manager=None, provider=MockProvider())
+    manager.cache_manager = None
+    snapshot = await manager.get_market_snapshot()
+    breadth, summary = snapshot["breadth"], snapshot["summary"]
+    assert breadth["total"] == MockProvider.UNIVERSE_SIZE
+    assert summary["breadth_scope"] == "universe"
+    assert summary["advancing"] + summary["declining"] + summary["unchanged"] == breadth["active"]
+    assert summary["limit_up"] > 0
+
+    version = manager.universe.version
+    await manager.get_market_snapshot()
+    assert manager.universe.version == version  # unchanged refresh keeps the table
+
+
+@pytest.mark.anyio
+async def test_synthetic_universe_is_served_column_wise():
+    provider = SyntheticMockProvider(universe_size=50)
+    payload = await provider.fetch_a_share_universe()
+    assert len(payload["codes"]) == len(payload["last"]) == 50
+    assert compute_breadth(QuoteTable.from_payload(payload))["active"] == 50
+
+
+@pytest.mark.anyio
+async def test_open_universe_pages_eastmoney_list():
+    rows = [
+        {"f12": f"{600000 + i}", "f13": 1, "f14": f"S{i}", "f2": 10.5, "f18": 10.0, "f5": 3}
+        for i in range(250)
+    ]
+    rows[0]["f2"] = "-"  # suspended
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page, size = int(request.url.params["pn"]), int(request.url.params["pz"])
+        diff = rows[(page - 1) * size : page * size]
+        return httpx.Response(200, json={"data": {"total": len(rows), "diff": diff}})
+
+    provider = OpenProvider(transport=httpx.MockTransport(handler))
+    payload = await provider.fetch_a_share_universe()
+    assert len(payload["codes"]) == 250 and payload["codes"][1] == "600001.SH"
+    assert payload["last"][0] is None and payload["volume"][1] == 300.0
+    assert await provider.fetch_a_share_universe() is payload  # served from the TTL cache
+
+
+@pytest.mark.anyio
+async def test_open_universe_with_a_missing_page_keeps_the_previous_table():
+    rows = [{"f12": f"{600000 + i}", "f13": 1, "f2": 10.5, "f18": 10.0} for i in range(250)]
+    failing = {"page": None}
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page, size = int(request.url.params["pn"]), int(request.url.params["pz"])
+        requests.append(page)
+        if page == failing["page"]:
+            return httpx.Response(502)
+        diff = rows[(page - 1) * size : page * size]
+        return httpx.Response(200, json={"data": {"total": len(rows), "diff": diff}})
+
+    provider = OpenProvider(transport=httpx.MockTransport(handler))
+    manager = DataManager(provider=provider)
+    manager.cache_manager = None
+    table = manager._update_universe(await provider.fetch_a_share_universe())
+    assert len(table.codes) == 250
+
+    failing["page"] = 2
+    provider._cache.invalidate("eastmoney_universe")
+    assert await provider.fetch_a_share_universe() == {}
+    attempts = len(requests)
+    assert manager._update_universe(await provider.fetch_a_share_universe()) is table
+    assert len(requests) == attempts  # the failed load is negatively cached
+
+
+@pytest.mark.anyio
+async def test_wind_universe_uses_wset_and_wss(monkeypatch):
+    monkeypatch.setattr(fake_windpy, "w", fake_windpy.w)
+    monkeypatch.delitem(sys.modules, "WindPy", raising=False)
+    fake = fake_windpy.install(universe_size=40, nan_rate=0.0)
+    from app.providers.wind import WindProvider
+
+    provider = WindProvider()
+    provider._ensure_connection()
+    deadline = asyncio.get_running_loop().time() + 2
+    while not provider._connected:
+        assert asyncio.get_running_loop().time() < deadline
+        await asyncio.sleep(0.005)
+    await provider.fetch_a_share_universe()
+    payload = await provider.fetch_a_share_universe()
+    await provider.close()
+
+    assert [call[0] for call in fake.calls].count("wset") == 1  # constituents cached per day
+    assert len(payload["codes"]) == 40 and all(price > 0 for price in payload["last"])
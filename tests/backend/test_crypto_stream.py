@@ -0,0 +1,103 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+websockets = pytest.importorskip("websockets")
+
+from app.providers.crypto_stream import CryptoStreamConsumer  # noqa: E402
+from app.providers.open import OpenProvider  # noqa: E402
+
+FRAMES = Path(__file__).resolve().parents[1] / "fixtures" / "crypto" / "binance_ticker_frames.jsonl"
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+async def _stand_in():
+    """Local exchange stand-in: replay recorded frames, then drop the connection."""
+    frames = FRAMES.read_text(encoding="utf-8").splitlines()
+    paths: list[str] = []
+
+    async def handler(ws):
+        request = getattr(ws, "request", None)
+        paths.append(request.path if request is not None else getattr(ws, "path", ""))
+        for frame in frames:
+            await ws.send(frame)
+        await ws.send("not json")
+        await ws.close()
+
+    server = await websockets.serve(handler, "127.0.0.1", 0)
+    port = list(server.sockets)[0].getsockname()[1]
+    return server, f"ws://127.0.0.1:{port}/stream", paths
+
+
+def _consumer(url: str) -> CryptoStreamConsumer:
+    symbols = {
+        symbol: OpenProvider.COINGECKO_IDS[asset_id]
+        for asset_id, symbol in OpenProvider.BINANCE_STREAM_SYMBOLS.items()
+    }
+    return CryptoStreamConsumer(symbols, url, initial_backoff=0.01, max_backoff=0.05)
+
+
+async def _wait_for(predicate, timeout: float = 3.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.anyio
+async def test_stream_keeps_latest_ticker_per_asset_and_reconnects():
+    server, url, paths = await _stand_in()
+    consumer = _consumer(url)
+    events: list[tuple[str, float]] = []
+    consumer.add_listener(lambda code, quote: events.append((code, quote["last"])))
+    try:
+        consumer.start()
+        await _wait_for(lambda: consumer.connections >= 2)
+    finally:
+        await consumer.stop()
+        server.close()
+        await server.wait_closed()
+
+    snapshot = consumer.snapshot()
+    assert set(snapshot) == {"BTC.CC", "ETH.CC", "SOL.CC", "BNB.CC", "XRP.CC"}
+    assert snapshot["BTC.CC"]["last"] == 97262.8
+    assert snapshot["BTC.CC"]["change_pct"] == 1.95
+    assert snapshot["ETH.CC"]["prev_close"] == 3453.75
+    assert snapshot["BTC.CC"]["source"] == "binance_ws"
+    assert events[:2] == [("BTC.CC", 97250.12), ("ETH.CC", 3412.55)]
+    assert "btcusdt@ticker/ethusdt@ticker" in paths[0]
+
+
+@pytest.mark.anyio
+async def test_fetch_crypto_prefers_fresh_stream_state():
+    provider = OpenProvider()
+    provider.crypto_stream = _consumer("ws://127.0.0.1:9/stream")
+    provider.crypto_stream.start = lambda: None
+    for frame in FRAMES.read_text(encoding="utf-8").splitlines():
+        provider.crypto_stream.handle_message(frame)
+
+    payload = await provider.fetch_crypto()
+
+    assert payload["SOL.CC"]["last"] == 198.31
+    assert all(quote["source"] == "binance_ws" for quote in payload.values())
+
+
+@pytest.mark.anyio
+async def test_app_shutdown_stops_the_stream(monkeypatch):
+    from app import main
+    from app.services.data_manager import DataManager
+
+    provider = OpenProvider()
+    provider.crypto_stream = _consumer("ws://127.0.0.1:9/stream")
+    monkeypatch.setattr(main, "get_data_manager", lambda: DataManager(provider=provider))
+    app = main.create_app()
+
+    async with app.router.lifespan_context(app):
+        provider.crypto_stream.start()
+        assert provider.crypto_stream.running
+    assert not provider.crypto_stream.running
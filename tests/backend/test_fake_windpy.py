@@ -0,0 +1,74 @@
+import asyncio
+import math
+import sys
+
+import pytest
+
+from benchmarks import fake_windpy
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+async def _connected_provider():
+    from app.providers.wind import WindProvider
+
+    provider = WindProvider()
+    provider._ensure_connection()
+    deadline = asyncio.get_running_loop().time() + 2
+    while not provider._connected:
+        assert asyncio.get_running_loop().time() < deadline
+        await asyncio.sleep(0.005)
+    return provider
+
+
+@pytest.mark.anyio
+async def test_wsq_error_falls_back_to_wss_and_halted_codes_stay_blank(monkeypatch):
+    monkeypatch.setattr(fake_windpy, "w", fake_windpy.w)
+    monkeypatch.delitem(sys.modules, "WindPy", raising=False)
+    fake = fake_windpy.install(halted=["399006.SZ"])
+    provider = await _connected_provider()
+
+    fake.fail_next("wsq", fake_windpy.ERR_TIMEOUT)
+    indices = await provider.fetch_indices()
+    await provider.close()
+
+    assert [call[0] for call in fake.calls] == ["wsq", "wss"]
+    assert indices["000001.SH"]["last"] > 0
+    assert "last" not in indices["399006.SZ"]
+    assert fake.max_concurrency == 1
+
+
+def test_minute_and_daily_series_shapes():
+    fake = fake_windpy.FakeWind(nan_rate=0.0)
+    fake.start()
+    single = fake.wsi("600000.SH", "close,volume", "2025-01-06 09:30:00", "2025-01-06 13:02:00")
+    assert single.Fields == ["CLOSE", "VOLUME"] and len(single.Times) == 122
+    assert single.Times[0].strftime("%H:%M") == "09:31"
+    again = fake.wsi("600000.SH", "close", "2025-01-06 11:00:00", "2025-01-06 11:00:00")
+    assert again.Data[0] == [single.Data[0][89]]  # bars are stable across re-fetches
+
+    multi = fake.wsi("600000.SH,000001.SZ", "close", "2025-01-06 09:30:00", "2025-01-06 09:35:00")
+    assert multi.Codes == ["MultiCodes"] and multi.Fields == ["windcode", "close"]
+    assert multi.Data[0] == ["600000.SH"] * 5 + ["000001.SZ"] * 5
+
+    daily = fake.wsd("600000.SH,000001.SZ", "close", "2025-01-06", "2025-01-10")
+    assert len(daily.Times) == 5 and len(daily.Data) == 2
+
+    constituents = fake_windpy.FakeWind(universe_size=12)
+    constituents.start()
+    table = constituents.wset("sectorconstituent", "sectorid=a001010100000000")
+    assert len(set(table.Data[1])) == 12
+
+
+def test_error_rate_and_nan_rate_are_applied():
+    fake = fake_windpy.FakeWind(seed=1, error_rate=0.5, nan_rate=0.5)
+    fake.start()
+    results = [fake.wss(["A", "B", "C", "D"], ["close"]) for _ in range(40)]
+    errors = sum(result.ErrorCode != 0 for result in results)
+    assert 5 < errors < 35
+    cells = [value for result in results if result.ErrorCode == 0 for value in result.Data[0]]
+    assert any(math.isnan(value) for value in cells)
+    assert any(not math.isnan(value) for value in cells)
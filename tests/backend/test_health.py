@@ -16,3 +16,11 @@ def test_health_endpoints():
     assert payload["status"] == "ok"
     assert payload["data_mode"] in {"wind", "open", "mock"}
     assert payload["cache_enabled"] is False
+
+
+def test_cache_stats_endpoint():
+    client = TestClient(create_app())
+
+    resp = client.get("/health/cache")
+    assert resp.status_code == 200
+    assert isinstance(resp.json()["namespaces"], dict)
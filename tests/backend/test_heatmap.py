@@ -0,0 +1,112 @@
+import numpy as np
+import pytest
+from httpx import AsyncClient
+
+from app.main import create_app
+from app.providers.mock import MockProvider
+from app.services.data_manager import get_data_manager
+from app.services.heatmap import SectorHeatmap, sector_of, squarify
+from app.services.universe import QuoteTable
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def _overlap(a, b):
+    width = min(a[0] + a[2], b[0] + b[2]) - max(a[0], b[0])
+    height = min(a[1] + a[3], b[1] + b[3]) - max(a[1], b[1])
+    return max(width, 0) * max(height, 0)
+
+
+def test_squarify_tiles_the_area_proportionally():
+    values = [60, 30, 24, 12, 8, 6, 3, 1]
+    rects = squarify(values, 0, 0, 16, 9)
+    areas = [w * h for _, _, w, h in rects]
+    assert np.allclose(areas, np.array(values) * 144 / sum(values))
+    assert all(x >= -1e-9 and y >= -1e-9 and x + w <= 16 + 1e-9 and y + h <= 9 + 1e-9
+               for x, y, w, h in rects)
+    assert all(_overlap(a, b) < 1e-9 for i, a in enumerate(rects) for b in rects[i + 1 :])
+    # Squarified tiles stay close to square.
+    assert max(max(w / h, h / w) for _, _, w, h in rects) < 4
+
+
+def test_sector_keywords():
+    assert sector_of("化学制药") == "医药"
+    assert sector_of("银行") == "金融"
+    assert sector_of("半导体") == "科技"
+    assert sector_of("煤炭行业") == "周期"
+    assert sector_of("未分类") == "其他"
+
+
+def _table(version=1):
+    payload = {
+        "codes": ["600000.SH", "601398.SH", "000001.SZ", "688981.SH", "300750.SZ"],
+        "names": ["浦发银行", "工商银行", "平安银行", "中芯国际", "宁德时代"],
+        "industries": ["银行", "银行", "银行", "半导体", None],
+        "last": [11.0, 5.0, 10.0, 50.0, 200.0],
+        "prev_close": [10.0, 5.0, 10.5, 50.0, 200.0],
+        "volume": [1.0] * 5,
+        "amount": [100.0, 200.0, 300.0, 400.0, 500.0],
+        "market_cap": [1e11, 3e11, 1e11, 4e11, 0.0],
+        "timestamp": "2026-10-19T10:00:00",
+    }
+    return QuoteTable.from_payload(payload, version=version)
+
+
+def test_cap_weighted_aggregation_and_layout():
+    heatmap = SectorHeatmap(aspect_ratio=2.0, stocks_per_industry=2)
+    tree = heatmap.tree(_table())
+    sectors = {sector["name"]: sector for sector in tree["sectors"]}
+    assert list(sectors) == ["金融", "科技"]  # zero-cap stock has no tile
+
+    finance = sectors["金融"]
+    assert finance["weight"] == 5e11
+    # (1e11 * 10% + 3e11 * 0% + 1e11 * -4.76%) / 5e11
+    assert finance["pct_change"] == pytest.approx(1.05, abs=0.01)
+    assert finance["turnover"] == 600.0
+    assert (finance["advancers"], finance["decliners"]) == (1, 1)
+
+    bank = finance["industries"][0]
+    assert [stock["symbol"] for stock in bank["stocks"]] == ["601398.SH", "600000.SH", None]
+    assert bank["stocks"][-1]["weight"] == 1e11
+
+    # Sector rects split the canvas by weight (as fractions of width and height).
+    total = sum(s["rect"][2] * s["rect"][3] for s in tree["sectors"])
+    assert total == pytest.approx(1.0, abs=1e-4)
+    assert finance["rect"][2] * finance["rect"][3] == pytest.approx(5 / 9, abs=1e-4)
+    # Children stay inside their parent.
+    x, y, w, h = finance["rect"]
+    for stock in bank["stocks"]:
+        sx, sy, sw, sh = stock["rect"]
+        assert x - 1e-5 <= sx and sx + sw <= x + w + 1e-5
+        assert y - 1e-5 <= sy and sy + sh <= y + h + 1e-5
+
+
+def test_layout_cached_per_version_and_aspect():
+    heatmap = SectorHeatmap()
+    table = _table(version=1)
+    first = heatmap.tree(table)
+    assert heatmap.tree(table) is first
+    assert heatmap.tree(table, 1.0) is not first
+    assert heatmap.tree(_table(version=2)) is not first
+    assert heatmap.stats()["builds"] == 3
+    overview = heatmap.overview(table)
+    assert all("stocks" not in industry
+               for sector in overview["sectors"] for industry in sector["industries"])
+
+
+@pytest.mark.anyio
+async def test_heatmap_endpoint():
+    app = create_app()
+    manager = get_data_manager()
+    manager.universe = QuoteTable.from_payload(
+        await MockProvider().fetch_a_share_universe(), version=7
+    )
+    async with AsyncClient(app=app, base_url="http://testserver") as client:
+        resp = await client.get("/data/heatmap", params={"aspect": 1.5})
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["version"] == 7 and body["aspect_ratio"] == 1.5
+    assert body["sectors"] and body["sectors"][0]["industries"][0]["stocks"]
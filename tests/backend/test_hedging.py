@@ -0,0 +1,70 @@
+import asyncio
+import time
+
+import pytest
+
+from app.core.hedging import LatencyTracker, hedged, race
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def _source(value, delay):
+    async def run():
+        await asyncio.sleep(delay)
+        return value
+
+    return run
+
+
+@pytest.mark.anyio
+async def test_hedged_fires_fallback_when_primary_hangs():
+    started = time.perf_counter()
+    result = await hedged(
+        [_source("primary", 5.0), _source("fallback", 0.01)],
+        delays=0.05,
+        timeout=1.0,
+    )
+    assert result == "fallback"
+    assert time.perf_counter() - started < 0.5
+
+
+@pytest.mark.anyio
+async def test_hedged_skips_invalid_results_immediately():
+    result = await hedged(
+        [_source(None, 0.0), _source([], 0.0), _source(["ok"], 0.0)],
+        delays=10.0,
+        timeout=1.0,
+    )
+    assert result == ["ok"]
+
+
+@pytest.mark.anyio
+async def test_a_raising_validator_counts_as_a_failed_attempt():
+    def is_valid(value):
+        if value == "garbled":
+            raise KeyError("payload")
+        return bool(value)
+
+    result = await hedged(
+        [_source("garbled", 0.0), _source("ok", 0.0)], delays=10.0, timeout=1.0, is_valid=is_valid
+    )
+    assert result == "ok"
+
+@pytest.mark.anyio
+async def test_race_is_bounded_by_timeout():
+    started = time.perf_counter()
+    result = await race([_source("slow", 5.0), _source("slower", 6.0)], timeout=0.1)
+    assert result is None
+    assert time.perf_counter() - started < 0.5
+
+
+def test_latency_tracker_percentile():
+    tracker = LatencyTracker(percentile=90.0, default=2.0, floor=0.0)
+    assert tracker.threshold() == 2.0
+    for value in range(1, 11):
+        tracker.observe(value / 10)
+    assert tracker.threshold() == pytest.approx(0.9)
+    assert tracker.threshold(ceiling=0.5) == 0.5
@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+from httpx import AsyncClient
+
+from app.main import create_app
+from app.services.data_manager import get_data_manager
+from app.services.history import HistorySampler, lttb, minmax
+from app.services.timeseries import TimeSeriesStore
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def _reference_lttb(x, y, points):
+    """Textbook LTTB with the same bucket edges, one point at a time."""
+    n = len(x)
+    edges = np.linspace(1, n - 1, points - 1).astype(int)
+    chosen, a = [0], 0
+    for b in range(points - 2):
+        lo, hi = edges[b], edges[b + 1]
+        if b + 2 < len(edges):
+            cx, cy = x[hi:edges[b + 2]].mean(), y[hi:edges[b + 2]].mean()
+        else:
+            cx, cy = x[-1], y[-1]
+        best, best_area = lo, -1.0
+        for j in range(lo, hi):
+            area = abs((x[a] - cx) * (y[j] - y[a]) - (x[a] - x[j]) * (cy - y[a]))
+            if area > best_area:
+                best, best_area = j, area
+        chosen.append(best)
+        a = best
+    return chosen + [n - 1]
+
+
+def test_lttb_matches_reference_and_minmax_keeps_extremes():
+    rng = np.random.default_rng(7)
+    for size in (1000, 5000):  # narrow (scalar) and wide (row-wise) buckets
+        x = np.arange(size, dtype=float)
+        y = np.cumsum(rng.normal(size=size))
+        assert lttb(x, y, 50).tolist() == _reference_lttb(x, y, 50)
+    assert lttb(x, y, 6000).tolist() == list(range(5000))
+
+    keep = minmax(x, y, 60)
+    assert len(keep) <= 60 and np.all(np.diff(keep) > 0)
+    assert y.argmax() in keep and y.argmin() in keep
+
+
+def test_sampler_windows_and_caches_per_version():
+    store = TimeSeriesStore(capacity=600, max_codes=2)
+    for second in range(500):
+        store.append("A", 1000.0 + second, float(second % 37))
+    sampler = HistorySampler(store)
+
+    first = sampler.series("A", window=100, points=20)
+    assert len(first["prices"]) == 20 and first["times"][0] == 1399.0
+    assert sampler.series("A", window=100, points=20) is first and sampler.hits == 1
+
+    store.append("A", 1500.0, 99.0)
+    assert sampler.series("A", window=100, points=20)["prices"][-1] == 99.0
+    assert sampler.many(["A", "missing"], 100, 20).keys() == {"A"}
+
+
+@pytest.mark.anyio
+async def test_history_endpoint_serves_many_codes():
+    app = create_app()
+    manager = get_data_manager()
+    manager.timeseries.append("TEST.A", 1.0, 10.0)
+    manager.timeseries.append("TEST.A", 2.0, 11.0)
+    async with AsyncClient(app=app, base_url="http://testserver") as client:
+        resp = await client.get("/data/history", params={"codes": "TEST.A,NOPE", "points": 10})
+        bad = await client.get("/data/history", params={"codes": "TEST.A", "method": "mean"})
+    assert resp.status_code == 200
+    assert resp.json()["series"] == {"TEST.A": {"times": [1.0, 2.0], "prices": [10.0, 11.0]}}
+    assert bad.status_code == 400
@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+from httpx import AsyncClient
+
+from app.main import create_app
+from app.providers.mock import MockProvider
+from app.services.data_manager import get_data_manager
+from app.services.movers import TopMovers, top_k
+from app.services.universe import QuoteTable
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def test_top_k_matches_a_full_sort():
+    rng = np.random.default_rng(3)
+    values = rng.normal(size=5000)
+    values[rng.integers(0, 5000, 200)] = np.nan
+    finite = np.flatnonzero(np.isfinite(values))
+    expected = finite[np.argsort(-values[finite], kind="stable")]
+    assert top_k(values, 25).tolist() == expected[:25].tolist()
+    assert top_k(values, 25, largest=False).tolist() == expected[::-1][:25].tolist()
+    assert len(top_k(values, 10_000)) == len(finite)
+
+
+@pytest.mark.anyio
+async def test_filters_and_shared_selections():
+    table = QuoteTable.from_payload(await MockProvider().fetch_a_share_universe(), version=1)
+    movers = TopMovers(depth=20)
+
+    gainers = movers.select(table, "gainers", 5)
+    assert [row["pct_change"] for row in gainers] == sorted(
+        (row["pct_change"] for row in gainers), reverse=True
+    )
+    assert gainers[0]["pct_change"] == round(float(np.nanmax(table.change_pct)), 2)
+    assert movers.select(table, "gainers", 20)[:5] == gainers  # served from one selection
+    assert movers.stats()["misses"] == 1 and movers.stats()["hits"] == 1
+
+    star_large = movers.select(table, "amount", 50, board="star", cap="large")
+    assert star_large and all(row["board"] == "star" for row in star_large)
+    assert all(2e10 <= row["market_cap"] < 1e11 for row in star_large)
+    with pytest.raises(ValueError):
+        movers.select(table, "volume")
+
+
+@pytest.mark.anyio
+async def test_movers_endpoint():
+    app = create_app()
+    manager = get_data_manager()
+    manager.universe = QuoteTable.from_payload(
+        await MockProvider().fetch_a_share_universe(), version=99
+    )
+    async with AsyncClient(app=app, base_url="http://testserver") as client:
+        resp = await client.get("/data/movers", params={"metric": "losers", "k": 3})
+        bad = await client.get("/data/movers", params={"board": "nasdaq"})
+    assert resp.status_code == 200
+    body = resp.json()
+    assert len(body["items"]) == 3 and body["version"] == 99
+    assert body["items"][0]["pct_change"] <= body["items"][-1]["pct_change"]
+    assert bad.status_code == 400
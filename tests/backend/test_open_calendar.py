@@ -0,0 +1,67 @@
+from collections import Counter
+from datetime import UTC, datetime
+
+import httpx
+import pytest
+
+from app.providers.open import OpenProvider
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def _nasdaq_transport(requests: Counter, release: dict):
+    today = datetime.now(UTC).date().isoformat()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        day = request.url.params["date"]
+        requests[day] += 1
+        rows = [{"gmt": "23:59", "country": "Japan", "eventName": "Tankan", "impact": "low"}]
+        if day == today:
+            rows.append({
+                "gmt": release["gmt"],
+                "country": "United States",
+                "eventName": "Nonfarm Payrolls",
+                "actual": release["actual"],
+                "impact": "high",
+            })
+        return httpx.Response(200, json={"data": {"rows": rows}})
+
+    return httpx.MockTransport(handler), today
+
+
+@pytest.mark.anyio
+async def test_days_are_cached_individually():
+    requests: Counter = Counter()
+    release = {"gmt": "00:00", "actual": "256K"}
+    transport, _ = _nasdaq_transport(requests, release)
+    provider = OpenProvider(transport=transport)
+
+    first = await provider._fetch_nasdaq_calendar()
+    second = await provider._fetch_nasdaq_calendar()
+
+    assert len(requests) == OpenProvider.NASDAQ_LOOKAHEAD_DAYS
+    assert sum(requests.values()) == OpenProvider.NASDAQ_LOOKAHEAD_DAYS
+    assert len(second) == len(first) == OpenProvider.NASDAQ_LOOKAHEAD_DAYS + 1
+
+
+@pytest.mark.anyio
+async def test_release_watch_repolls_only_the_release_day_until_actual_arrives():
+    requests: Counter = Counter()
+    release = {"gmt": datetime.now(UTC).strftime("%H:%M"), "actual": ""}
+    transport, today = _nasdaq_transport(requests, release)
+    provider = OpenProvider(transport=transport)
+    provider.RELEASE_WATCH_TTL = 0.0
+
+    await provider._fetch_nasdaq_calendar()
+    await provider._fetch_nasdaq_calendar()
+    assert requests[today] == 2
+    assert sum(requests.values()) == OpenProvider.NASDAQ_LOOKAHEAD_DAYS + 1
+
+    release["actual"] = "256K"
+    events = await provider._fetch_nasdaq_calendar()
+    await provider._fetch_nasdaq_calendar()
+    assert requests[today] == 3
+    assert any(event["actual"] == "256K" for event in events)
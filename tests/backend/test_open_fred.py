@@ -0,0 +1,43 @@
+import asyncio
+
+import pytest
+
+from app.providers.open import OpenProvider
+
+WIDE_CSV = """observation_date,DGS10,DGS2,SOFR,IUDSOIA,EFFR,DCOILWTICO
+2025-01-02,4.57,4.25,4.49,.,4.33,73.10
+2025-01-03,4.60,4.28,.,4.70,4.33,.
+2025-01-06,4.62,,4.31,4.70,,74.20
+"""
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.mark.anyio
+async def test_fred_rates_use_single_multi_series_download(monkeypatch):
+    provider = OpenProvider()
+    calls = []
+
+    async def fake_download(series_ids):
+        calls.append(list(series_ids))
+        return WIDE_CSV
+
+    monkeypatch.setattr(provider, "_download_fred_series", fake_download)
+
+    rates, commodities = await asyncio.gather(
+        provider._fetch_fred_rates(), provider._fetch_fred_commodities()
+    )
+    assert calls == [list(OpenProvider.FRED_SERIES_IDS)]  # one download for both
+    assert commodities["CL.NYM"]["last"] == 74.2 and "NG.NYM" not in commodities
+    assert rates["UST10Y.GBM"]["last"] == 4.62
+    assert rates["UST10Y.GBM"]["change"] == pytest.approx(0.02)
+    assert rates["UST2Y.GBM"]["timestamp"] == "2025-01-03"
+    assert rates["SOFR.IR"]["change"] == pytest.approx(4.31 - 4.49)
+    assert rates["SONIA.IR"]["change"] == 0.0
+
+    await provider._fetch_fred_rates()
+    await provider._fetch_fred_commodities()
+    assert len(calls) == 1
@@ -0,0 +1,94 @@
+import json
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from app.providers import open as open_module
+from app.providers.http_replay import ReplayTransport
+from app.providers.open import OpenProvider
+
+FIXTURES = Path(__file__).resolve().parents[1] / "fixtures" / "open"
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.mark.anyio
+async def test_indices_served_from_recorded_fixtures():
+    transport = ReplayTransport(FIXTURES)
+    provider = OpenProvider(transport=transport)
+
+    indices = await provider.fetch_indices()
+
+    assert indices["000001.SH"]["name"] == "上证综指"
+    assert indices["000001.SH"]["timestamp"] == "2025-01-06T15:00:02"
+    assert "N225.GI" in indices
+    assert transport.request_counts == {"qt.gtimg.cn": 1, "stooq.com": 1}
+    assert not transport.unmatched
+
+
+@pytest.mark.anyio
+async def test_calendar_replays_date_keyed_requests():
+    transport = ReplayTransport(FIXTURES)
+    events = await OpenProvider(transport=transport).fetch_calendar()
+    assert events
+    assert {event["source"] for event in events} == {"Nasdaq"}
+
+
+@pytest.mark.anyio
+async def test_injected_errors_fall_back_to_mock():
+    transport = ReplayTransport(FIXTURES, error_rate=1.0, seed=1)
+    provider = OpenProvider(transport=transport)
+    provider.MAX_RETRIES = 1
+
+    crypto = await provider.fetch_crypto()
+
+    assert crypto == await provider._mock.fetch_crypto()
+    assert transport.request_counts["api.coingecko.com"] == 1
+
+
+class _FrozenDatetime(datetime):
+    """Pins "now" to the week the calendar fallback fixtures cover."""
+
+    NOW = datetime(2025, 1, 6, 12, 0, tzinfo=UTC)
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls.NOW.astimezone(tz) if tz else cls.NOW.replace(tzinfo=None)
+
+    @classmethod
+    def utcnow(cls):
+        return cls.NOW.replace(tzinfo=None)
+
+
+def _entries_without(*hosts):
+    return [
+        entry
+        for path in sorted(FIXTURES.glob("*.json"))
+        if path.stem not in hosts
+        for entry in json.loads(path.read_text(encoding="utf-8"))["entries"]
+    ]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    ("down", "source"),
+    [
+        (("api.nasdaq.com",), "FXStreet"),
+        (("api.nasdaq.com", "r.jina.ai"), "ForexFactory"),
+        (("api.nasdaq.com", "r.jina.ai", "nfs.faireconomy.media"), "TradingEconomics"),
+    ],
+)
+async def test_calendar_falls_back_in_priority_order(monkeypatch, down, source):
+    monkeypatch.setattr(open_module, "datetime", _FrozenDatetime)
+    transport = ReplayTransport(_entries_without(*down))
+    provider = OpenProvider(transport=transport)
+    provider.MAX_RETRIES = 1
+
+    events = await provider.fetch_calendar()
+
+    assert events
+    assert {event["source"] for event in events} == {source}
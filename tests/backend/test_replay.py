@@ -0,0 +1,134 @@
+from datetime import date, datetime
+
+import pytest
+
+from app.providers.replay import ReplayProvider
+from app.services.data_manager import DataManager
+from app.services.tick_archive import TickArchive
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def _at(minute, second=0):
+    return datetime(2025, 1, 6, 10, minute, second).timestamp()
+
+
+@pytest.fixture
+def recorded(tmp_path):
+    archive = TickArchive(tmp_path)
+    for minute, (a, b) in enumerate([(1.0, 2.0), (1.5, 2.0), (1.7, 2.4)]):
+        indices = {
+            code: {"name": f"Index {code}", "last": last} for code, last in (("A.SH", a), ("B", b))
+        }
+        snapshot = {"indices": indices, "fx": {"USDCNH.FX": {"last": 7.0 + minute}}}
+        archive.submit(snapshot, ["indices", "fx"], _at(minute))
+    archive.close()
+    return tmp_path
+
+
+class ManualClock:
+    def __init__(self):
+        self.value = 0.0
+
+    def __call__(self):
+        return self.value
+
+
+@pytest.mark.anyio
+async def test_replay_serves_quotes_in_effect_at_the_clock(recorded):
+    monotonic = ManualClock()
+    provider = ReplayProvider(recorded, speed=60.0, monotonic=monotonic)
+    assert provider.day == date(2025, 1, 6)
+
+    first = await provider.fetch_indices()
+    assert first["A.SH"]["last"] == 1.0 and first["A.SH"]["timestamp"] == "2025-01-06T10:00:00"
+    assert first["A.SH"]["code"] == "A.SH" and first["A.SH"]["display_name"] == "Index A.SH"
+    assert (await provider.fetch_fx())["USDCNH.FX"]["name"] == "USDCNH.FX"  # no name recorded
+
+    monotonic.value = 1.5  # 90 session seconds at 60x
+    indices = await provider.fetch_indices()
+    assert (indices["A.SH"]["last"], indices["B"]["last"]) == (1.5, 2.0)
+    assert (await provider.fetch_fx())["USDCNH.FX"]["last"] == 8.0
+
+    monotonic.value = 2.0
+    assert (await provider.fetch_indices())["B"]["last"] == 2.4
+    monotonic.value = 121 / 60  # wrapped past the end: back to the opening quotes
+    assert (await provider.fetch_indices())["A.SH"]["last"] == 1.0
+    assert provider.replay_status()["lap"] == 1
+    assert await provider.fetch_calendar() == []
+
+
+@pytest.mark.anyio
+async def test_pipeline_runs_on_the_replay_clock(recorded):
+    monotonic = ManualClock()
+    provider = ReplayProvider(recorded, speed=60.0, loop=False, monotonic=monotonic)
+    manager = DataManager(cache_manager=_MemoryCache(), provider=provider)
+
+    for step in range(4):
+        monotonic.value = step * 0.5
+        snapshot = await manager.get_market_snapshot()
+    assert snapshot["timestamp"] == "2025-01-06T10:01:30"
+    # One point per recorded tick, stamped with the tick's own time.
+    assert manager.get_series("A.SH") == {
+        "code": "A.SH", "times": [_at(0), _at(1)], "prices": [1.0, 1.5]
+    }
+
+    monotonic.value = 100.0  # no loop: the clock parks on the last tick
+    await manager.get_market_snapshot()
+    (done,) = [bar for bar in manager.bars.bars("A.SH", "1m") if not bar.get("partial")][:1]
+    assert (done["open"], done["close"]) == (1.0, 1.0)
+    assert provider.replay_status()["progress"] == 1.0
+
+
+class _MemoryCache:
+    """Stands in for the Redis snapshot cache; entries never expire on their own."""
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ttl=300):
+        self.data[key] = value
+        return True
+
+
+@pytest.mark.anyio
+async def test_snapshot_cache_and_broadcast_follow_the_replay_clock(recorded):
+    monotonic = ManualClock()
+    provider = ReplayProvider(recorded, speed=60.0, loop=False, monotonic=monotonic)
+    manager = DataManager(cache_manager=_MemoryCache(), provider=provider)
+    assert manager.wall_seconds(15) == 0.25
+
+    await manager.get_market_snapshot()
+    monotonic.value = 0.2  # 12 session seconds: still inside the 15 s cache window
+    assert (await manager.get_market_snapshot())["indices"]["A.SH"]["last"] == 1.0
+    monotonic.value = 1.0  # 60 session seconds: the cache has expired
+    assert (await manager.get_market_snapshot())["indices"]["A.SH"]["last"] == 1.5
+
+
+@pytest.mark.anyio
+async def test_looped_replay_restarts_history_on_each_pass(recorded):
+    monotonic = ManualClock()
+    provider = ReplayProvider(recorded, speed=60.0, loop=True, monotonic=monotonic)
+    manager = DataManager(cache_manager=_MemoryCache(), provider=provider)
+
+    for step in range(5):  # first pass: 10:00:00 .. 10:02:00
+        monotonic.value = step * 0.5
+        await manager.get_market_snapshot()
+    assert manager.get_series("B")["prices"] == [2.0, 2.4]
+
+    for value in (2.1, 3.1):  # second pass: 10:00:05, then 10:01:05
+        monotonic.value = value
+        snapshot = await manager.get_market_snapshot()
+    assert snapshot["indices"]["A.SH"]["name"] == "Index A.SH"
+    assert manager.get_series("A.SH") == {
+        "code": "A.SH", "times": [_at(0), _at(1)], "prices": [1.0, 1.5]
+    }
+    done = [bar for bar in manager.bars.bars("A.SH", "1m") if not bar.get("partial")]
+    assert [bar["start"] for bar in done] == ["2025-01-06T10:00:00"]
+    assert manager.bars.stats()["late"] == 0
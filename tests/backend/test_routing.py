@@ -0,0 +1,91 @@
+import asyncio
+import time
+
+import pytest
+
+from app.providers.routing import InstrumentRegistry, SourceResolver
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def _source(calls, name, quotes, delay=0.0):
+    async def fetch(routes):
+        calls.append((name, sorted(routes)))
+        await asyncio.sleep(delay)
+        return {
+            route.code: {"code": route.code, **quotes[symbol]}
+            for symbol, route in routes.items()
+            if symbol in quotes
+        }
+
+    return fetch
+
+
+@pytest.mark.anyio
+async def test_primaries_run_in_parallel_and_secondaries_fill_gaps():
+    registry = InstrumentRegistry.from_sources(
+        ("a", {"a1": ("X", "x"), "a2": ("Y", "y")}),
+        ("b", {"b3": ("Z", "z")}),
+        ("c", {"c1": ("X", "x"), "c2": ("Y", "y")}),
+    )
+    calls: list = []
+    resolver = SourceResolver({
+        "a": _source(calls, "a", {"a1": {"last": 1.0}}, delay=0.1),
+        "b": _source(calls, "b", {"b3": {"last": 3.0}}, delay=0.1),
+        "c": _source(calls, "c", {"c1": {"last": -1.0}, "c2": {"last": 2.0}}),
+    })
+
+    started = time.perf_counter()
+    resolved = await resolver.resolve(registry)
+
+    assert time.perf_counter() - started < 0.18
+    lasts = {code: quote["last"] for code, quote in resolved.items()}
+    assert lasts == {"X": 1.0, "Y": 2.0, "Z": 3.0}
+    assert ("c", ["c2"]) in calls
+    assert len(calls) == 3
+
+
+@pytest.mark.anyio
+async def test_parallel_primaries_keep_the_freshest_quote():
+    registry = InstrumentRegistry.from_sources(
+        ("live", {"L": ("UST10Y", "10y")}),
+        ("daily", {"D10": ("UST10Y", "10y"), "D2": ("UST2Y", "2y")}),
+        primaries=2,
+        prefer_recent=True,
+    )
+    calls: list = []
+    resolver = SourceResolver({
+        "live": _source(calls, "live", {"L": {"last": 4.1, "timestamp": "2025-01-06T15:00:00"}}),
+        "daily": _source(calls, "daily", {
+            "D10": {"last": 4.0, "timestamp": "2025-01-03T00:00:00"},
+            "D2": {"last": 4.3, "timestamp": "2025-01-03T00:00:00"},
+        }),
+    })
+
+    resolved = await resolver.resolve(registry)
+
+    assert resolved["UST10Y"]["last"] == 4.1
+    assert resolved["UST2Y"]["last"] == 4.3
+    assert sorted(calls) == [("daily", ["D10", "D2"]), ("live", ["L"])]
+
+
+@pytest.mark.anyio
+async def test_secondaries_are_only_asked_for_gaps():
+    registry = InstrumentRegistry.from_sources(
+        ("a", {"a1": ("X", "x")}),
+        ("b", {"b1": ("Y", "y"), "b2": ("X", "x")}),
+    )
+    calls: list = []
+    resolver = SourceResolver({
+        "a": _source(calls, "a", {"a1": {"last": 1.0}}),
+        "b": _source(calls, "b", {"b1": {"last": 2.0}, "b2": {"last": -1.0}}),
+    })
+
+    resolved = await resolver.resolve(registry)
+
+    assert {code: quote["last"] for code, quote in resolved.items()} == {"X": 1.0, "Y": 2.0}
+    # "b" is called for its primary Y anyway, but X's secondary route does not ride along.
+    assert sorted(calls) == [("a", ["a1"]), ("b", ["b1"])]
@@ -0,0 +1,67 @@
+import pytest
+
+from app.core.settings import settings
+from app.providers.mock import MockProvider
+from app.providers.synthetic import SyntheticMarket, SyntheticMockProvider, universe_codes
+from app.services.data_manager import DataManager
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def test_random_walk_moves_about_update_rate_of_the_universe():
+    clock = {"now": 1000.0}
+    market = SyntheticMarket(
+        {"fx": {"USDCNH.FX": {"last": 7.1, "change": 0.1}}},
+        universe_size=5000,
+        update_rate=0.2,
+        seed=3,
+        clock=lambda: clock["now"],
+    )
+    assert len(market) == 5001 and len(set(universe_codes(5000))) == 5000
+    assert list(market.records("fx")) == ["USDCNH.FX"]  # the universe stays out of categories
+    before = market.last.copy()
+
+    clock["now"] += 1.0
+    moved = market.advance()
+    assert 800 < moved < 1200
+    assert (market.last != before).sum() == moved
+    assert (market.high >= market.last).all() and (market.low <= market.last).all()
+    assert market.records("fx")["USDCNH.FX"]["prev_close"] == 7.0
+
+
+@pytest.mark.anyio
+async def test_synthetic_provider_matches_mock_schema_and_injects_failures():
+    classic = await MockProvider().fetch_indices()
+    provider = SyntheticMockProvider(universe_size=50, seed=1)
+    indices = await provider.fetch_indices()
+    assert set(indices) == set(classic)
+    for code, record in classic.items():
+        assert set(record) <= set(indices[code])
+    assert len((await provider.fetch_a_share_universe())["codes"]) == 50
+
+    scaled = await SyntheticMockProvider(category_scale=3, seed=1).fetch_indices()
+    assert len(scaled) == 3 * len(classic)
+    assert scaled["000001_3.SH"]["name"] == f"{classic['000001.SH']['name']} #3"
+
+    failing = SyntheticMockProvider(universe_size=10, error_rate=1.0)
+    with pytest.raises(RuntimeError):
+        await failing.fetch_fx()
+    manager = DataManager(provider=failing)
+    manager.cache_manager = None
+    snapshot = await manager.get_market_snapshot()
+    assert snapshot["fx"] == {} and failing.synthetic_status()["failures"] > 1
+
+
+def test_mock_mode_selects_synthetic_provider_when_sized(monkeypatch):
+    monkeypatch.setattr(settings, "data_mode", "mock")
+    monkeypatch.setattr(settings, "mock_universe_size", 200)
+    provider = DataManager().provider
+    assert isinstance(provider, SyntheticMockProvider) and provider.universe_size == 200
+
+    monkeypatch.setattr(settings, "mock_universe_size", 0)
+    monkeypatch.setattr(settings, "mock_category_scale", 4)
+    provider = DataManager().provider
+    assert isinstance(provider, SyntheticMockProvider) and provider.category_scale == 4
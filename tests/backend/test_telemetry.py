@@ -0,0 +1,53 @@
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.telemetry import UpstreamTelemetry, upstream_telemetry
+from app.main import create_app
+from app.providers.http_replay import ReplayTransport
+from app.providers.open import OpenProvider
+
+FIXTURES = Path(__file__).resolve().parents[1] / "fixtures" / "open"
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def test_histograms_and_prometheus_rendering():
+    telemetry = UpstreamTelemetry(latency_buckets=(0.1, 1.0), size_buckets=(100, 1000))
+    telemetry.record("open", "fred.stlouisfed.org", "/graph/fredgraph.csv", 200, 0.05, nbytes=500)
+    telemetry.record("open", "fred.stlouisfed.org", "/graph/fredgraph.csv", 503, 2.0, attempt=2)
+
+    (row,) = telemetry.snapshot()
+    assert row["calls"] == 2
+    assert row["errors"] == 1
+    assert row["retries"] == 1
+    assert row["statuses"] == {"200": 1, "503": 1}
+    assert row["bytes_total"] == 500
+
+    text = telemetry.render_prometheus()
+    labels = 'provider="open",host="fred.stlouisfed.org",endpoint="/graph/fredgraph.csv"'
+    assert f'upstream_requests_total{{{labels},status="503"}} 1' in text
+    assert f'upstream_request_duration_seconds_bucket{{{labels},le="0.1"}} 1' in text
+    assert f'upstream_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in text
+
+
+@pytest.mark.anyio
+async def test_open_provider_calls_are_recorded_per_upstream():
+    upstream_telemetry.reset()
+    transport = ReplayTransport(FIXTURES, error_rate=1.0, seed=3)
+    await OpenProvider(transport=transport).fetch_crypto()
+
+    rows = {(row["host"], row["endpoint"]): row for row in upstream_telemetry.snapshot()}
+    row = rows[("api.coingecko.com", "/api/v3/simple/price")]
+    assert row["calls"] == OpenProvider.MAX_RETRIES
+    assert row["statuses"] == {"503": OpenProvider.MAX_RETRIES}
+    assert row["retries"] == OpenProvider.MAX_RETRIES - 1
+
+    client = TestClient(create_app())
+    assert 'host="api.coingecko.com"' in client.get("/metrics").text
+    upstreams = client.get("/metrics/upstreams").json()["upstreams"]
+    assert any(item["host"] == "api.coingecko.com" for item in upstreams)
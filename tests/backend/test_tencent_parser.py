@@ -0,0 +1,31 @@
+from app.providers import tencent_parser
+from benchmarks.tencent_parser import fast_parse, legacy_parse, synthetic_response
+
+
+def test_fast_parser_matches_previous_implementation():
+    text = synthetic_response(300, seed=11)
+    mapping = {symbol: (symbol.upper(), symbol) for symbol in tencent_parser.parse_response(text)}
+    assert len(mapping) == 300
+    assert tencent_parser.parse_response(text).keys() == mapping.keys()
+
+    assert fast_parse(text, mapping) == legacy_parse(text, mapping)
+
+
+def test_timestamps_are_memoized_and_formats_normalized():
+    memo = tencent_parser.TimestampMemo()
+    assert memo("20250106150002") == "2025-01-06T15:00:02"
+    assert memo("2025-01-06 15:00:02") == "2025-01-06T15:00:02"
+    assert memo("20250106150002") is memo("20250106150002")
+
+
+def test_short_or_malformed_records_are_skipped():
+    text = (
+        'v_sh000001="1~上证~000001~3211.4~3200.0~3205.1";\n'
+        'v_bad="1~x~y~N/D~3.0~3.0";v_pv_none_match="1";'
+    )
+    entries = tencent_parser.parse_response(text)
+    quote = tencent_parser.parse_quote(entries["sh000001"])
+    assert quote.last == 3211.4 and quote.change is None
+    assert tencent_parser.to_snapshot(quote, "000001.SH", "上证")["change"] == 11.4
+    assert tencent_parser.parse_quote(entries["bad"]) is None
+    assert tencent_parser.parse_quote(entries["pv_none_match"]) is None
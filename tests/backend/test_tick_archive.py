@@ -0,0 +1,139 @@
+from datetime import date, datetime
+
+import numpy as np
+import pytest
+
+from app.core.cache import CacheManager
+from app.core.settings import settings
+from app.providers.mock import MockProvider
+from app.services.data_manager import DataManager
+from app.services.tick_archive import TickArchive
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def _stamp(hour, minute, second=0, day=6):
+    return datetime(2025, 1, day, hour, minute, second).timestamp()
+
+
+def _quotes(**prices):
+    return {"indices": {code: {"last": last, "change_pct": 0.5} for code, last in prices.items()}}
+
+
+def test_writer_appends_changes_and_answers_point_in_time_reads(tmp_path):
+    archive = TickArchive(tmp_path, fsync_interval=0.01)
+    archive.submit(_quotes(A=1.0, B=2.0), ["indices"], _stamp(10, 30))
+    archive.submit(_quotes(A=1.0, B=2.5), ["indices"], _stamp(10, 31))  # A unchanged
+    archive.submit(_quotes(A=1.5, B=2.5), ["indices"], _stamp(10, 33))
+    archive.close()
+
+    assert archive.written == 4 and archive.skipped == 2 and archive.fsyncs >= 1
+    day = date(2025, 1, 6)
+    rows = archive.read("indices", day, start=_stamp(10, 31))
+    assert isinstance(rows["ts"], np.memmap)
+    assert [rows["codes"][i] for i in rows["code"]] == ["B", "A"]
+
+    board = archive.as_of("indices", datetime(2025, 1, 6, 10, 32))
+    assert board["A"]["last"] == 1.0 and board["B"]["last"] == 2.5
+    assert board["B"]["timestamp"] == "2025-01-06T10:31:00"
+
+
+def test_old_days_are_compacted_then_expired(tmp_path):
+    archive = TickArchive(tmp_path, retention_days=3, compact_after_days=1)
+    archive.submit(_quotes(A=1.0), ["indices"], _stamp(10, 0, day=6))
+    archive.submit(_quotes(A=2.0), ["indices"], _stamp(10, 0, day=7))  # day roll compacts the 6th
+    archive.close()
+
+    assert (tmp_path / "2025-01-06" / "indices.npz").exists()
+    assert not (tmp_path / "2025-01-06" / "indices").exists()
+    assert archive.as_of("indices", datetime(2025, 1, 6, 15, 0))["A"]["last"] == 1.0
+
+    archive.maintain(date(2025, 1, 10))
+    assert not (tmp_path / "2025-01-06").exists()
+    assert (tmp_path / "2025-01-07" / "indices.npz").exists()
+
+
+def test_torn_writes_are_truncated_before_appending(tmp_path):
+    archive = TickArchive(tmp_path)
+    archive.submit(_quotes(A=1.0, B=2.0), ["indices"], _stamp(10, 30))
+    archive.close()
+    segment = tmp_path / "2025-01-06" / "indices"
+    with (segment / "last.f8").open("ab") as handle:  # a crash after one column of a batch
+        handle.write(np.array([9.0, 9.5]).tobytes())
+    with (segment / "codes.txt").open("a", encoding="utf-8") as handle:
+        handle.write("HALF")
+
+    archive = TickArchive(tmp_path)
+    archive.submit(_quotes(A=1.5, C=3.0), ["indices"], _stamp(10, 31))
+    archive.close()
+
+    rows = archive.read("indices", date(2025, 1, 6))
+    assert [rows["codes"][i] for i in rows["code"]] == ["A", "B", "A", "C"]
+    assert rows["last"].tolist() == [1.0, 2.0, 1.5, 3.0]
+    assert len(rows["ts"]) == len(rows["change_pct"]) == 4
+
+
+@pytest.mark.anyio
+async def test_data_manager_backfills_history_from_todays_archive(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "tick_archive_enabled", True)
+    monkeypatch.setattr(settings, "tick_archive_dir", str(tmp_path))
+    now = datetime.now().timestamp()
+    archive = TickArchive(tmp_path)
+    archive.submit(_quotes(A=1.0, B=2.0), ["indices"], now - 2)
+    archive.submit(_quotes(A=1.5, B=2.0), ["indices"], now - 1)
+    archive.close()
+
+    manager = DataManager(cache_manager=CacheManager(), provider=MockProvider())
+    assert len(manager.timeseries) == 0  # nothing is read until startup
+    await manager.start()
+    assert manager.get_series("A")["prices"] == [1.0, 1.5]
+    assert manager.get_series("B")["prices"] == [2.0]
+    await manager.close()
+
+
+class _LaterQuoteProvider(MockProvider):
+    def __init__(self, stamp):
+        super().__init__()
+        self.stamp = stamp
+
+    async def fetch_indices(self):
+        return {"A": {"last": 1.2, "timestamp": datetime.fromtimestamp(self.stamp).isoformat()}}
+
+
+@pytest.mark.anyio
+async def test_backfill_uses_quote_times_like_live_points(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "tick_archive_enabled", True)
+    monkeypatch.setattr(settings, "tick_archive_dir", str(tmp_path))
+    now = round(datetime.now().timestamp()) - 1
+    quoted = datetime.fromtimestamp(now - 30).isoformat()
+    archive = TickArchive(tmp_path)
+    archive.submit({"indices": {"A": {"last": 1.0, "timestamp": quoted}}}, ["indices"], now - 2)
+    archive.close()
+    assert archive.as_of("indices", datetime.fromtimestamp(now))["A"]["timestamp"] == quoted
+
+    # Quoted after the archived quote but before it was fetched: still a new point.
+    manager = DataManager(cache_manager=CacheManager(), provider=_LaterQuoteProvider(now - 20))
+    await manager.start()
+    await manager.get_market_snapshot()
+    assert manager.get_series("A") == {
+        "code": "A", "times": [now - 30, now - 20], "prices": [1.0, 1.2]
+    }
+    await manager.close()
+
+
+def test_days_archived_without_quote_times_still_load(tmp_path):
+    archive = TickArchive(tmp_path)
+    archive.submit(_quotes(A=1.0), ["indices"], _stamp(10, 0))
+    archive.close()
+    segment = tmp_path / "2025-01-06" / "indices"
+    (segment / "quote_ts.f8").unlink()
+    assert archive.read("indices", date(2025, 1, 6))["quote_ts"].tolist() == [_stamp(10, 0)]
+
+    archive = TickArchive(tmp_path)
+    archive.submit(_quotes(A=2.0), ["indices"], _stamp(10, 1))
+    archive.close()
+    rows = archive.read("indices", date(2025, 1, 6))
+    assert rows["quote_ts"].tolist() == rows["ts"].tolist() == [_stamp(10, 0), _stamp(10, 1)]
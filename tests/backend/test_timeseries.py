@@ -0,0 +1,79 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from app.core.cache import CacheManager
+from app.providers.mock import MockProvider
+from app.services.data_manager import DataManager
+from app.services.timeseries import TimeSeriesStore
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def test_ring_wraps_and_last_points_are_contiguous_views():
+    store = TimeSeriesStore(capacity=4, max_codes=2)
+    for second in range(6):
+        store.extend({"A": 10.0 + second, "B": 20.0 + second}, float(second))
+
+    times, prices = store.last("A")
+    assert times.tolist() == [2.0, 3.0, 4.0, 5.0]
+    assert prices.tolist() == [12.0, 13.0, 14.0, 15.0]
+    assert np.shares_memory(prices, store._prices) and not prices.flags.writeable
+    assert store.last("B", 2)[1].tolist() == [24.0, 25.0]
+
+    assert not store.append("C", 6.0, 1.0)  # full: new codes are rejected, memory is fixed
+    assert store.stats()["rejected"] == 1
+    assert store.memory_bytes == store.stats()["memory_bytes"]
+
+
+def test_points_within_resolution_replace_the_latest():
+    store = TimeSeriesStore(capacity=8, max_codes=1)
+    store.append("A", 100.0, 1.0)
+    store.append("A", 100.4, 2.0)
+    store.append("A", 101.0, 3.0)
+    times, prices = store.last("A")
+    assert times.tolist() == [100.4, 101.0] and prices.tolist() == [2.0, 3.0]
+
+
+@pytest.mark.anyio
+async def test_snapshot_refresh_feeds_store_and_series_endpoint_data():
+    manager = DataManager(cache_manager=CacheManager(), provider=MockProvider())
+    snapshot = await manager.get_market_snapshot()
+
+    code, record = next(iter(snapshot["indices"].items()))
+    series = manager.get_series(code)
+    assert series["prices"] == [record["last"]]
+    assert "calendar" not in manager.timeseries
+
+
+class _ScriptedProvider(MockProvider):
+    def __init__(self):
+        super().__init__()
+        self.quotes = [
+            ("2025-01-06T10:00:00", 1.0),
+            ("2025-01-06T10:00:00", 1.0),  # unchanged upstream quote
+            ("2025-01-06T10:00:05", 1.2),
+            ("2025-01-06T09:59:00", 0.9),  # older than what was recorded
+        ]
+
+    async def fetch_indices(self):
+        stamp, last = self.quotes.pop(0) if len(self.quotes) > 1 else self.quotes[0]
+        return {"A.SH": {"last": last, "timestamp": stamp}}
+
+
+@pytest.mark.anyio
+async def test_series_records_fresh_quotes_at_their_own_time():
+    manager = DataManager(cache_manager=CacheManager(), provider=_ScriptedProvider())
+    for _ in range(3):
+        await manager.get_market_snapshot()  # cache hits do not add points
+    for _ in range(4):
+        manager._last_fetch_times.clear()
+        await manager.get_market_snapshot()  # repeated and older quotes do not either
+
+    times, prices = manager.timeseries.last("A.SH")
+    assert prices.tolist() == [1.0, 1.2]
+    assert times[-1] == datetime(2025, 1, 6, 10, 0, 5).timestamp()
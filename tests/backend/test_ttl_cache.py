@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+
+from app.core.ttl_cache import MISS, AsyncTTLCache, CachePolicy
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def test_ttl_and_negative_ttl():
+    clock = FakeClock()
+    cache = AsyncTTLCache({"quotes": CachePolicy(ttl=10.0, negative_ttl=2.0)}, clock=clock)
+    cache.set("quotes", "AAPL", {"last": 1.0})
+    cache.set_negative("quotes", "BAD", {})
+
+    assert cache.get("quotes", "AAPL") == {"last": 1.0}
+    assert cache.get("quotes", "BAD") == {}
+    clock.now = 3.0
+    assert cache.get("quotes", "BAD") is MISS
+    assert cache.get("quotes", "AAPL") == {"last": 1.0}
+    clock.now = 11.0
+    assert cache.get("quotes", "AAPL") is MISS
+
+    stats = cache.stats()["quotes"]
+    assert stats["hits"] == 2
+    assert stats["negative_hits"] == 1
+    assert stats["misses"] == 2
+
+
+def test_stale_reads_within_grace_window():
+    clock = FakeClock()
+    cache = AsyncTTLCache({"calendar": CachePolicy(ttl=5.0, max_stale=60.0)}, clock=clock)
+    cache.set("calendar", "events", ["nfp"])
+    clock.now = 30.0
+    assert cache.get("calendar", "events") is MISS
+    assert cache.get("calendar", "events", allow_stale=True) == ["nfp"]
+    clock.now = 100.0
+    assert cache.get("calendar", "events", allow_stale=True) is MISS
+    assert len(cache) == 0
+
+
+def test_lru_eviction_respects_entry_and_byte_bounds():
+    cache = AsyncTTLCache(max_entries=3)
+    for key in "abcd":
+        cache.set("ns", key, key)
+    assert cache.get("ns", "a") is MISS
+    assert cache.stats()["ns"]["evictions"] == 1
+
+    small = AsyncTTLCache(max_bytes=2000)
+    for idx in range(50):
+        small.set("ns", idx, "x" * 200)
+    assert small.total_bytes <= 2000
+    assert small.get("ns", 49) == "x" * 200
+
+
+@pytest.mark.anyio
+async def test_get_or_load_coalesces_concurrent_loads():
+    cache = AsyncTTLCache()
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"value": 1}
+
+    results = await asyncio.gather(*(cache.get_or_load("ns", "k", loader) for _ in range(5)))
+    assert results == [{"value": 1}] * 5
+    assert calls == 1
+
+
+@pytest.mark.anyio
+async def test_get_or_load_waiters_survive_a_cancelled_loader():
+    cache = AsyncTTLCache()
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return {"value": calls}
+
+    owner = asyncio.create_task(cache.get_or_load("ns", "k", loader))
+    await asyncio.sleep(0)
+    waiters = [asyncio.create_task(cache.get_or_load("ns", "k", loader)) for _ in range(3)]
+    await asyncio.sleep(0.01)
+    owner.cancel()
+
+    results = await asyncio.gather(*waiters)
+    assert owner.cancelled()
+    assert results == [{"value": 2}] * 3  # one retry shared by every waiter
+    assert calls == 2
@@ -0,0 +1,146 @@
+import asyncio
+import math
+import sys
+from datetime import date, datetime
+
+import pytest
+
+from app.core.cache import CacheManager
+from app.providers import wind as wind_module
+from app.providers.wind_bars import MinuteBarCache
+from app.services.data_manager import DataManager
+from benchmarks import fake_windpy
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def test_minute_bar_cache_appends_only_new_bars_and_rolls_daily():
+    cache = MinuteBarCache()
+    cache.roll(date(2025, 1, 6))
+    stamps = [datetime(2025, 1, 6, 9, 31 + minute) for minute in range(5)]
+    assert cache.extend("A", stamps, [1.0, 2.0, math.nan, 4.0, 5.0]) == 4
+    assert cache.extend("A", stamps[3:] + [datetime(2025, 1, 6, 9, 36)], [4.0, 5.0, 6.0]) == 1
+    assert list(cache.closes("A")) == [1.0, 2.0, 4.0, 5.0, 6.0]
+
+    session_open = datetime(2025, 1, 6, 9, 30)
+    assert cache.since(["A"], session_open) == datetime(2025, 1, 6, 9, 37)
+    assert cache.since(["A", "B"], session_open) == session_open
+
+    assert cache.spark("A", 3) == [1.0, 4.0, 6.0]
+    assert not cache.roll(date(2025, 1, 6))
+    assert cache.roll(date(2025, 1, 7)) and len(cache) == 0
+
+
+@pytest.mark.anyio
+async def test_wsi_is_pulled_incrementally_and_feeds_snapshot_sparklines(monkeypatch):
+    monkeypatch.setattr(fake_windpy, "w", fake_windpy.w)
+    monkeypatch.delitem(sys.modules, "WindPy", raising=False)
+    fake = fake_windpy.install()
+    wsi_windows = []
+    original_wsi = fake.wsi
+
+    def recording_wsi(codes, fields, begin, end, options=""):
+        wsi_windows.append((begin[11:16], end[11:16]))
+        return original_wsi(codes, fields, begin, end, options)
+
+    fake.wsi = recording_wsi
+
+    clock = {"now": datetime(2025, 1, 6, 10, 0)}
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return clock["now"]
+
+    monkeypatch.setattr(wind_module, "datetime", FrozenDatetime)
+
+    provider = wind_module.WindProvider()
+    provider._ensure_connection()
+    deadline = asyncio.get_running_loop().time() + 2
+    while not provider._connected:
+        assert asyncio.get_running_loop().time() < deadline
+        await asyncio.sleep(0.005)
+
+    assert "000001.SH" in provider.SPARK_CODES and "SPX.GI" not in provider.SPARK_CODES
+    codes = ["000001.SH", "399001.SZ"]
+    first = await provider.fetch_intraday_bars(codes)
+    assert first["000001.SH"]["bars"] == 30
+
+    clock["now"] = datetime(2025, 1, 6, 10, 5)
+    second = await provider.fetch_intraday_bars(codes)
+    assert second["399001.SZ"]["bars"] == 35
+    assert wsi_windows == [("09:30", "10:00"), ("10:01", "10:05")]
+    assert second["000001.SH"]["spark"][-1] == round(provider._bars.closes("000001.SH")[-1], 4)
+
+    clock["now"] = datetime(2025, 1, 6, 12, 10)  # lunch: pull up to 11:30 once, then wait
+    await provider.fetch_intraday_bars(codes)
+    clock["now"] = datetime(2025, 1, 6, 12, 40)
+    await provider.fetch_intraday_bars(codes)
+    clock["now"] = datetime(2025, 1, 6, 16, 0)  # a new code gets its own window
+    await provider.fetch_intraday_bars([*codes, "000300.SH"])
+    await provider.fetch_intraday_bars([*codes, "000300.SH"])  # after the close: no call
+    assert wsi_windows[2:] == [("10:06", "11:30"), ("09:30", "15:00"), ("11:31", "15:00")]
+
+    clock["now"] = datetime(2025, 1, 7, 9, 0)  # next day, before the open: reset, no call
+    assert await provider.fetch_intraday_bars(codes) == {}
+    assert len(wsi_windows) == 5
+
+    clock["now"] = datetime(2025, 1, 7, 9, 45)
+    manager = DataManager(cache_manager=CacheManager(), provider=provider)
+    snapshot = await manager.get_market_snapshot()
+    await provider.close()
+
+    spark = snapshot["indices"]["000001.SH"]["spark"]
+    assert len(spark) == 15 and all(value > 0 for value in spark)
+
+
+@pytest.mark.anyio
+async def test_wsi_is_skipped_for_the_rest_of_a_weekend_or_holiday(monkeypatch):
+    monkeypatch.setattr(fake_windpy, "w", fake_windpy.w)
+    monkeypatch.delitem(sys.modules, "WindPy", raising=False)
+    fake = fake_windpy.install()
+    wsi_windows = []
+
+    def empty_wsi(codes, fields, begin, end, options=""):
+        wsi_windows.append((begin[:16], end[:16]))
+        return fake_windpy.WindData(ErrorCode=0, Codes=[codes], Fields=[fields])
+
+    fake.wsi = empty_wsi
+    clock = {"now": datetime(2025, 1, 4, 10, 0)}  # a Saturday
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return clock["now"]
+
+    monkeypatch.setattr(wind_module, "datetime", FrozenDatetime)
+
+    provider = wind_module.WindProvider()
+    provider._ensure_connection()
+    deadline = asyncio.get_running_loop().time() + 2
+    while not provider._connected:
+        assert asyncio.get_running_loop().time() < deadline
+        await asyncio.sleep(0.005)
+
+    codes = ["000001.SH", "399001.SZ"]
+    assert await provider.fetch_intraday_bars(codes) == {}
+    assert wsi_windows == []
+
+    clock["now"] = datetime(2025, 1, 29, 9, 35)  # a holiday: too early to tell, ask again
+    await provider.fetch_intraday_bars(codes)
+    clock["now"] = datetime(2025, 1, 29, 10, 0)  # still empty: remembered for the day
+    await provider.fetch_intraday_bars(codes)
+    clock["now"] = datetime(2025, 1, 29, 14, 0)
+    await provider.fetch_intraday_bars(codes)
+    assert wsi_windows == [
+        ("2025-01-29 09:30", "2025-01-29 09:35"),
+        ("2025-01-29 09:30", "2025-01-29 10:00"),
+    ]
+
+    clock["now"] = datetime(2025, 2, 5, 10, 0)  # the next day asks again
+    await provider.fetch_intraday_bars(codes)
+    await provider.close()
+    assert len(wsi_windows) == 3
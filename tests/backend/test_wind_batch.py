@@ -0,0 +1,153 @@
+import asyncio
+import sys
+import threading
+import types
+
+import pytest
+
+from app.core.cache import CacheManager
+from app.providers.wind import WindProvider
+from app.providers.wind_batch import WsqBatcher
+from app.services.data_manager import DataManager
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+class RecordingWind:
+    """``WindPy.w`` stand-in whose wsq answers ``rt_*`` fields deterministically."""
+
+    def __init__(self):
+        self.wsq_calls: list[tuple[list[str], list[str]]] = []
+        self.threads: set[str] = set()
+        self.busy = threading.Lock()
+
+    def start(self, waitTime=60):
+        return types.SimpleNamespace(ErrorCode=0, Data=[])
+
+    def isconnected(self):
+        return True
+
+    def stop(self):
+        pass
+
+    def wsq(self, codes, fields):
+        assert self.busy.acquire(blocking=False), "concurrent WindPy call"
+        try:
+            self.threads.add(threading.current_thread().name)
+            code_list, field_list = codes.split(","), fields.split(",")
+            self.wsq_calls.append((code_list, field_list))
+            data = [
+                [float(len(code) * 10 + f_index + 1) for code in code_list]
+                for f_index, _ in enumerate(field_list)
+            ]
+            return types.SimpleNamespace(
+                ErrorCode=0,
+                Codes=code_list,
+                Fields=[name.upper() for name in field_list],
+                Times=[],
+                Data=data,
+            )
+        finally:
+            self.busy.release()
+
+
+@pytest.mark.anyio
+async def test_batcher_merges_and_splits_requests():
+    calls = []
+
+    async def wsq(codes, fields):
+        calls.append((codes, fields))
+        code_list, field_list = codes.split(","), fields.split(",")
+        return types.SimpleNamespace(
+            ErrorCode=0,
+            Codes=code_list,
+            Fields=[name.upper() for name in field_list],
+            Data=[[f"{code}:{name}" for code in code_list] for name in field_list],
+        )
+
+    batcher = WsqBatcher(wsq, window=0.01)
+    first, second = await asyncio.gather(
+        batcher.request(["A", "B"], ["rt_last", "rt_chg"]),
+        batcher.request(["B", "C"], ["rt_last", "rt_vol"]),
+    )
+    assert calls == [("A,B,C", "rt_last,rt_chg,rt_vol")]
+    assert first.Data == [["A:rt_last", "B:rt_last"], ["A:rt_chg", "B:rt_chg"]]
+    assert second.Data == [["B:rt_last", "C:rt_last"], ["B:rt_vol", "C:rt_vol"]]
+    assert second.Codes == ["B", "C"] and second.Fields == ["RT_LAST", "RT_VOL"]
+
+
+@pytest.mark.anyio
+async def test_batcher_retries_individually_when_merged_call_fails():
+    calls = []
+
+    async def wsq(codes, fields):
+        calls.append(codes)
+        code_list, field_list = codes.split(","), fields.split(",")
+        error = -40522017 if "BAD" in code_list and len(code_list) > 1 else 0
+        return types.SimpleNamespace(
+            ErrorCode=error, Codes=code_list, Data=[[1.0] * len(code_list) for _ in field_list]
+        )
+
+    batcher = WsqBatcher(wsq, window=0.01)
+    good, bad = await asyncio.gather(
+        batcher.request(["A", "B"], ["rt_last"]),
+        batcher.request(["BAD"], ["rt_last"]),
+    )
+    assert calls[0] == "A,B,BAD" and sorted(calls[1:]) == ["A,B", "BAD"]
+    assert good.ErrorCode == 0 and good.Data == [[1.0, 1.0]]
+    assert bad.ErrorCode == 0
+
+
+@pytest.mark.anyio
+async def test_request_arriving_during_an_inflight_call_is_flushed():
+    calls = []
+    release = asyncio.Event()
+
+    async def wsq(codes, fields):
+        calls.append(codes)
+        if len(calls) == 1:
+            await release.wait()
+        code_list = codes.split(",")
+        return types.SimpleNamespace(ErrorCode=0, Codes=code_list, Data=[[1.0] * len(code_list)])
+
+    batcher = WsqBatcher(wsq, window=0.01)
+    first = asyncio.ensure_future(batcher.request(["A"], ["rt_last"]))
+    while not calls:
+        await asyncio.sleep(0.005)
+    second = asyncio.ensure_future(batcher.request(["B"], ["rt_last"]))
+    await asyncio.sleep(0.03)
+    release.set()
+
+    results = await asyncio.wait_for(asyncio.gather(first, second), timeout=1)
+    assert calls == ["A", "B"]
+    assert [result.Codes for result in results] == [["A"], ["B"]]
+
+
+@pytest.mark.anyio
+async def test_snapshot_refresh_costs_one_wsq_round_trip(monkeypatch):
+    w = RecordingWind()
+    monkeypatch.setitem(sys.modules, "WindPy", types.SimpleNamespace(w=w))
+    provider = WindProvider()
+    provider._ensure_connection()
+    deadline = asyncio.get_running_loop().time() + 2
+    while not provider._connected:
+        assert asyncio.get_running_loop().time() < deadline
+        await asyncio.sleep(0.005)
+
+    manager = DataManager(cache_manager=CacheManager(), provider=provider)
+    snapshot = await manager.get_market_snapshot()
+    await provider.close()
+
+    assert len(w.wsq_calls) == 1
+    codes, fields = w.wsq_calls[0]
+    assert set(WindProvider.INDEX_CODES + WindProvider.FX_CODES) <= set(codes)
+    assert {"rt_last", "rt_pre_close", "rt_vol"} <= set(fields)
+    assert w.threads and all(name.startswith("windpy") for name in w.threads)
+
+    index = snapshot["indices"][WindProvider.INDEX_CODES[0]]
+    expected_last = float(len(WindProvider.INDEX_CODES[0]) * 10 + fields.index("rt_last") + 1)
+    assert index["last"] == expected_last
+    assert snapshot["us_stocks"]["AAPL.O"]["last"] == float(6 * 10 + fields.index("rt_last") + 1)
@@ -0,0 +1,53 @@
+import math
+
+import pytest
+
+from app.providers.wind_frame import PriceFrame, is_all_zero
+from benchmarks.wind_mapping import FIELDS, fast_map, legacy_map, synthetic_result
+
+
+@pytest.mark.parametrize("ticks", [False, True])
+@pytest.mark.parametrize("missing", [0.0, 0.1, 0.6])
+@pytest.mark.parametrize("include_volume", [False, True])
+def test_vectorised_mapping_matches_previous_implementation(missing, include_volume, ticks):
+    codes, data = synthetic_result(2000, seed=3, missing=missing, ticks=ticks)
+    names = {codes[0]: "First"}
+    expected = legacy_map(codes, FIELDS, data, names, include_volume=include_volume, now="t")
+    actual = fast_map(codes, FIELDS, data, names, include_volume=include_volume, now="t")
+    assert actual == expected
+    assert all(list(actual[code]) == list(expected[code]) for code in codes)  # key order too
+
+
+def test_halfway_prices_and_integer_volumes_map_like_python():
+    fields = ["rt_last", "rt_pre_close", "rt_vol"]
+    data = [[2.675, 3.145, 2046.765], [2.6, 3.0, 2046.0], [12345, None, 7.0]]
+    codes = ["A", "B", "C"]
+    expected = legacy_map(codes, fields, data, {}, include_volume=True, now="t")
+    records = fast_map(codes, fields, data, {}, include_volume=True, now="t")
+    assert records == expected
+    assert [records[code]["last"] for code in codes] == [2.67, 3.15, 2046.77]
+    assert type(records["A"]["volume"]) is int and "volume" not in records["B"]
+
+
+def test_change_is_derived_only_where_missing():
+    fields = ["rt_last", "rt_pre_close", "rt_chg"]
+    data = [[10.5, 20.0, 5.0, None], [10.0, 0.0, 4.0, 3.0], [None, None, 0.7, None]]
+    records = PriceFrame.from_wind(["A", "B", "C", "D"], fields, data).to_records({}, "t")
+    assert records["A"]["change"] == 0.5 and records["A"]["change_pct"] == 5.0
+    assert "change" not in records["B"]  # zero prev_close: nothing to derive from
+    assert records["C"]["change"] == 0.7 and "change_pct" not in records["C"]
+    assert records["D"] == {"code": "D", "timestamp": "t", "prev_close": 3.0, "name": "D"}
+
+
+def test_short_and_non_numeric_columns_are_tolerated():
+    records = PriceFrame.from_wind(["A", "B"], ["rt_last", "rt_vol"], [[1.234, "x"]]).to_records(
+        {}, "t"
+    )
+    assert records["A"]["last"] == 1.23 and "last" not in records["B"]
+    assert "volume" not in records["A"]
+
+
+def test_all_zero_detection():
+    assert is_all_zero([[0.0, None], [0, math.nan]])
+    assert not is_all_zero([[0.0, 0.0], [0.0, 1.5]])
+    assert is_all_zero([])
@@ -0,0 +1,141 @@
+import asyncio
+import sys
+import threading
+import time
+import types
+
+import pytest
+
+from app import main
+from app.providers.wind import WindProvider
+from app.providers.wind_supervisor import WindConnectionSupervisor
+from app.services.data_manager import DataManager
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+class FakeWind:
+    """Stand-in for ``WindPy.w``: slow ``start()``, scripted failures, switchable link."""
+
+    def __init__(self, start_codes, start_delay=0.0):
+        self.start_codes = list(start_codes)
+        self.start_delay = start_delay
+        self.starts = 0
+        self.alive = True
+        self.stopped = False
+        self.threads: set[str] = set()
+
+    def start(self, waitTime=60):
+        self.threads.add(threading.current_thread().name)
+        self.starts += 1
+        threading.Event().wait(self.start_delay)
+        code = self.start_codes.pop(0) if self.start_codes else 0
+        self.alive = code == 0
+        return types.SimpleNamespace(ErrorCode=code, Data=[])
+
+    def isconnected(self):
+        return self.alive
+
+    def stop(self):
+        self.stopped = True
+
+
+async def _wait_for(predicate, timeout=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline
+        await asyncio.sleep(0.005)
+
+
+@pytest.mark.anyio
+async def test_supervisor_reconnects_with_backoff():
+    w = FakeWind(start_codes=[-40520009, -40520009, 0])
+    supervisor = WindConnectionSupervisor(
+        w, heartbeat_interval=0.02, initial_backoff=0.01, max_backoff=0.05
+    )
+    supervisor.ensure_started()
+    await _wait_for(lambda: supervisor.connected)
+    assert w.starts == 3
+    assert supervisor.failures == 2
+    assert "ErrorCode=-40520009" in supervisor.last_error
+    assert threading.main_thread().name not in w.threads
+
+    w.alive = False  # link drops; the next heartbeat notices and reconnects
+    await _wait_for(lambda: w.starts == 4 and supervisor.connected)
+    assert supervisor.connects == 2
+
+    await supervisor.stop()
+    assert w.stopped and not supervisor.running
+
+
+@pytest.mark.anyio
+async def test_fetch_does_not_wait_for_wind_start(monkeypatch):
+    w = FakeWind(start_codes=[0], start_delay=0.3)
+    monkeypatch.setitem(sys.modules, "WindPy", types.SimpleNamespace(w=w))
+    provider = WindProvider()
+    assert w.starts == 0  # construction no longer connects
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    indices = await provider.fetch_indices()
+    assert loop.time() - started < 0.2
+    assert indices  # demo data while the session is still coming up
+    assert provider.connection_status()["running"]
+
+    await _wait_for(lambda: provider._connected)
+    await provider.close()
+    assert w.stopped
+
+
+@pytest.mark.anyio
+async def test_flapping_session_keeps_backing_off():
+    w = FakeWind(start_codes=[])
+    starts: list[float] = []
+    connect = w.start
+
+    def start(waitTime=60):
+        starts.append(time.monotonic())
+        result = connect(waitTime)
+        w.alive = False  # the session drops right after every connect
+        return result
+
+    w.start = start
+    supervisor = WindConnectionSupervisor(
+        w, heartbeat_interval=0.005, initial_backoff=0.02, max_backoff=0.5, stable_after=60
+    )
+    supervisor.ensure_started()
+    await _wait_for(lambda: len(starts) >= 4)
+    await supervisor.stop()
+
+    gaps = [later - earlier for earlier, later in zip(starts, starts[1:], strict=False)]
+    assert gaps[2] > 1.5 * gaps[0]  # backoff kept doubling instead of resetting
+
+
+@pytest.mark.anyio
+async def test_app_startup_starts_the_supervisor(monkeypatch):
+    w = FakeWind(start_codes=[0])
+    monkeypatch.setitem(sys.modules, "WindPy", types.SimpleNamespace(w=w))
+    provider = WindProvider()
+    monkeypatch.setattr(main, "get_data_manager", lambda: DataManager(provider=provider))
+    app = main.create_app()
+
+    async with app.router.lifespan_context(app):
+        assert provider.connection_status()["running"]
+        await _wait_for(lambda: provider._connected)
+    assert w.stopped and not provider.connection_status()["running"]
+
+
+@pytest.mark.anyio
+async def test_demo_records_stay_out_of_history(monkeypatch):
+    monkeypatch.setitem(sys.modules, "WindPy", types.SimpleNamespace(w=FakeWind([-1] * 10)))
+    manager = DataManager(provider=WindProvider())
+
+    snapshot = await manager.get_market_snapshot()
+    await manager.close()
+
+    assert snapshot["indices"]["000001.SH"]["source"] == "demo"
+    assert len(manager.timeseries) == 0
+    assert manager.bars.bars("000001.SH", "1m") == []
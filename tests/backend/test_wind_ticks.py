@@ -0,0 +1,121 @@
+import asyncio
+import math
+import sys
+import threading
+
+import pytest
+
+from app.core.settings import settings
+from app.providers import wind_ticks
+from app.providers.wind import WindProvider
+from app.providers.wind_ticks import WindTickStore
+from benchmarks import fake_windpy
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def test_tick_store_merges_partial_pushes_from_threads():
+    store = WindTickStore()
+    store.on_wind_data(
+        fake_windpy.WindData(
+            Codes=["A", "B"], Fields=["RT_LAST", "RT_CHG"], Data=[[1.0, 2.0], [0.1, 0.2]]
+        )
+    )
+
+    def push(value):
+        for _ in range(200):
+            store.on_wind_data(
+                fake_windpy.WindData(Codes=["B"], Fields=["RT_LAST"], Data=[[value]])
+            )
+
+    threads = [threading.Thread(target=push, args=(float(n),)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    store.on_wind_data(fake_windpy.WindData(Codes=["A"], Fields=["RT_LAST"], Data=[[math.nan]]))
+    store.on_wind_data(fake_windpy.WindData(ErrorCode=-40520010))
+
+    result = store.read(["A", "B", "C"], ["rt_last", "rt_chg"])
+    assert result.Data[0][0] == 1.0  # NaN push ignored
+    assert result.Data[0][1] in {0.0, 1.0, 2.0, 3.0}
+    assert result.Data[1] == [0.1, 0.2, None]  # unchanged field survives partial pushes
+    assert store.updates == 802 and store.errors == 1
+    assert store.covers(["A", "B"]) and not store.covers(["A", "C"])
+    assert not store.fresh(["A"], max_age=60)  # the last push was an error
+
+    store.on_wind_data(fake_windpy.WindData(Codes=["A"], Fields=["RT_LAST"], Data=[[1.5]]))
+    assert store.fresh(["A", "B"], max_age=60)
+    assert not store.fresh(["A", "B"], max_age=0) and not store.fresh(["C"], max_age=60)
+
+
+
+def test_quiet_codes_stay_fresh_while_the_subscription_calls_back(monkeypatch):
+    clock = {"now": 1000.0}
+    monkeypatch.setattr(wind_ticks.time, "monotonic", lambda: clock["now"])
+    store = WindTickStore()
+    store.on_wind_data(
+        fake_windpy.WindData(Codes=["LPR1Y.IR", "SPX.GI"], Fields=["RT_LAST"], Data=[[3.1, 1.0]])
+    )
+    for _ in range(9):  # the fixing never changes; the index keeps ticking
+        clock["now"] += 20
+        store.on_wind_data(fake_windpy.WindData(Codes=["SPX.GI"], Fields=["RT_LAST"], Data=[[1.0]]))
+    assert store.fresh(["LPR1Y.IR"], max_age=30)
+    assert store.read(["LPR1Y.IR"], ["rt_last"]).Data == [[3.1]]
+    assert not store.fresh(["SHIBORON.IR"], max_age=30)  # never pushed
+
+    clock["now"] += 31  # the subscription itself went quiet
+    assert not store.fresh(["LPR1Y.IR", "SPX.GI"], max_age=30)
+
+
+@pytest.mark.anyio
+async def test_subscription_mode_serves_fetches_from_pushes(monkeypatch):
+    fake = fake_windpy.FakeWind(seed=3)
+    monkeypatch.setattr(fake_windpy, "w", fake)
+    monkeypatch.setitem(sys.modules, "WindPy", fake_windpy)
+    monkeypatch.setattr(settings, "wind_subscription_enabled", True)
+
+    provider = WindProvider()
+    provider._ensure_connection()
+    deadline = asyncio.get_running_loop().time() + 2
+    while provider._subscription_id is None:
+        assert asyncio.get_running_loop().time() < deadline
+        await asyncio.sleep(0.005)
+
+    assert len(fake.calls) == 1  # one subscription call covers every bucket
+    subscribed_codes = fake.calls[0][1].split(",")
+    assert set(WindProvider.INDEX_CODES + WindProvider.COMMODITY_CODES) <= set(subscribed_codes)
+
+    before = (await provider.fetch_indices())["000001.SH"]["last"]
+    fake.push(count=20, fraction=1.0)
+    indices = await provider.fetch_indices()
+    fx = await provider.fetch_fx()
+    rates = await provider.fetch_rates()
+    commodities = await provider.fetch_commodities()
+    assert len(fake.calls) == 1  # reads never went back to WindPy
+
+    assert indices["000001.SH"]["last"] != before
+    assert set(fx) == set(WindProvider.FX_CODES)
+    assert "TB10Y.WI" in rates
+    assert commodities["GC.CMX"]["sector"] == "PreciousMetals"
+    assert "volume" in commodities["GC.CMX"]
+    assert provider.connection_status()["subscribed"]
+
+    fake.push(count=1, fraction=1.0)
+    provider._ticks.on_wind_data(fake_windpy.WindData(ErrorCode=-40520010))
+    await provider.fetch_indices()
+    assert fake.calls[-1][0] == "wsq" and len(fake.calls) == 2  # push error: polled instead
+
+    fake.push(count=1, fraction=1.0)
+    await provider.fetch_indices()
+    assert len(fake.calls) == 2
+    monkeypatch.setattr(settings, "wind_push_max_age", 0.0)
+    await provider.fetch_indices()
+    assert len(fake.calls) == 3  # stale pushes: polled instead
+
+    await provider.close()
+    assert not fake._subscriptions